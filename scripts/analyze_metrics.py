@@ -7,8 +7,11 @@ Analyzes session metrics JSONL files to identify patterns and suggest
 optimal configuration values per TDD Section 3.10.6.
 
 Features:
-- Parse session metrics JSONL files
-- Compute aggregate statistics across sessions
+- Parse session metrics JSONL files, streaming compressed segments rotated
+  out of a log (skipping segments outside --since/--until via the manifest)
+- Compute aggregate statistics across sessions, merging the per-session
+  quantile sketches into exact-rank percentiles over all samples (sessions
+  written without sketches fall back to the median of per-session values)
 - Identify outliers and patterns
 - Suggest optimal configuration values
 - Human-readable report output
@@ -16,6 +19,8 @@ Features:
 Usage:
     python scripts/analyze_metrics.py ~/.cross_file_context/session_metrics/*.jsonl
     python scripts/analyze_metrics.py path/to/metrics1.jsonl path/to/metrics2.jsonl
+    python scripts/analyze_metrics.py ~/.cross_file_context/session_metrics/ \
+        --since 2025-12-01 --until 2025-12-08
 
 Related Requirements:
 - FR-48 (metrics analysis tool)
@@ -30,6 +35,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from xfile_context.log_segments import (
+    in_time_range,
+    iter_log_lines,
+    list_logs,
+    log_exists,
+    parse_timestamp,
+)
+from xfile_context.quantile_sketch import QuantileSketch
+
 
 @dataclass
 class AggregateStatistics:
@@ -45,6 +59,7 @@ class AggregateStatistics:
     token_min: int = 0
     token_median: int = 0
     token_p95: int = 0
+    token_p99: int = 0
     token_max: int = 0
     total_injections: int = 0
     total_threshold_exceedances: int = 0
@@ -52,8 +67,10 @@ class AggregateStatistics:
     # Performance
     parsing_median_ms: int = 0
     parsing_p95_ms: int = 0
+    parsing_p99_ms: int = 0
     injection_median_ms: int = 0
     injection_p95_ms: int = 0
+    injection_p99_ms: int = 0
 
     # Warnings
     total_warnings: int = 0
@@ -96,11 +113,15 @@ class AnalysisReport:
     performance_status: Dict[str, bool]
 
 
-def parse_session_metrics(file_path: Path) -> List[Dict[str, Any]]:
-    """Parse session metrics from a JSONL file.
+def parse_session_metrics(
+    file_path: Path, since: Optional[str] = None, until: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """Parse session metrics from a JSONL file and its segments.
 
     Args:
         file_path: Path to the session_metrics.jsonl file.
+        since: Optional ISO 8601 timestamp; skip entries that ended earlier.
+        until: Optional ISO 8601 timestamp; skip entries that ended later.
 
     Returns:
         List of session metrics dictionaries.
@@ -109,27 +130,73 @@ def parse_session_metrics(file_path: Path) -> List[Dict[str, Any]]:
         FileNotFoundError: If the file doesn't exist.
         ValueError: If the file contains no valid entries.
     """
-    if not file_path.exists():
+    if not log_exists(file_path):
         raise FileNotFoundError(f"Metrics file not found: {file_path}")
 
     sessions: List[Dict[str, Any]] = []
+    since_time = parse_timestamp(since)
+    until_time = parse_timestamp(until)
 
-    with open(file_path, encoding="utf-8") as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
+    for line_num, line in enumerate(iter_log_lines(file_path, since_time, until_time), 1):
+        line = line.strip()
+        if not line:
+            continue
 
-            try:
-                data = json.loads(line)
-                sessions.append(data)
-            except json.JSONDecodeError as e:
-                print(f"Warning: Skipping malformed entry at line {line_num}: {e}", file=sys.stderr)
-                continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            print(f"Warning: Skipping malformed entry at line {line_num}: {e}", file=sys.stderr)
+            continue
+        if in_time_range(data.get("end_time"), since_time, until_time):
+            sessions.append(data)
 
     return sessions
 
 
+def merge_sketches(distributions: List[Dict[str, Any]]) -> Optional[QuantileSketch]:
+    """Merge the quantile sketches of per-session distributions.
+
+    Args:
+        distributions: Serialized statistics (token_counts, parsing_time_ms or
+            injection_latency_ms) of the sessions to merge.
+
+    Returns:
+        Merged sketch, or None if a distribution has no valid sketch (metrics
+        written before sketches were recorded).
+    """
+    merged: Optional[QuantileSketch] = None
+    for distribution in distributions:
+        data = distribution.get("sketch")
+        if not isinstance(data, dict):
+            return None
+        try:
+            sketch = QuantileSketch.from_dict(data)
+            if merged is None:
+                merged = sketch
+            else:
+                merged.merge(sketch)
+        except ValueError as e:
+            print(f"Warning: Ignoring invalid quantile sketch: {e}", file=sys.stderr)
+            return None
+    return merged
+
+
+def _aggregate_percentiles(distributions: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """Compute the median, p95 and p99 across per-session distributions.
+
+    Uses the merged sketches when every session has one, otherwise the median
+    of the per-session values.
+    """
+    merged = merge_sketches(distributions)
+    if merged is not None and merged.get_count() > 0:
+        return merged.median(), merged.quantile(0.95), merged.quantile(0.99)
+    return (
+        int(statistics.median(d.get("median", 0) for d in distributions)),
+        int(statistics.median(d.get("p95", 0) for d in distributions)),
+        int(statistics.median(d.get("p99", d.get("p95", 0)) for d in distributions)),
+    )
+
+
 def compute_aggregate_statistics(sessions: List[Dict[str, Any]]) -> AggregateStatistics:
     """Compute aggregate statistics across all sessions.
 
@@ -163,41 +230,33 @@ def compute_aggregate_statistics(sessions: List[Dict[str, Any]]) -> AggregateSta
     stats.total_evictions_lru = total_evictions
 
     # Token count aggregation
-    all_token_mins: List[int] = []
-    all_token_maxs: List[int] = []
-    all_token_medians: List[int] = []
-    all_token_p95s: List[int] = []
+    token_distributions: List[Dict[str, Any]] = []
     total_injections = 0
     total_exceedances = 0
 
     for session in sessions:
         ci = session.get("context_injection", {})
-        tc = ci.get("token_counts", {})
 
         # Only include sessions with actual injections
         if ci.get("total_injections", 0) > 0:
-            all_token_mins.append(tc.get("min", 0))
-            all_token_maxs.append(tc.get("max", 0))
-            all_token_medians.append(tc.get("median", 0))
-            all_token_p95s.append(tc.get("p95", 0))
+            token_distributions.append(ci.get("token_counts", {}))
 
         total_injections += ci.get("total_injections", 0)
         total_exceedances += ci.get("threshold_exceedances", 0)
 
-    if all_token_mins:
-        stats.token_min = min(all_token_mins)
-        stats.token_max = max(all_token_maxs)
-        stats.token_median = int(statistics.median(all_token_medians))
-        stats.token_p95 = int(statistics.median(all_token_p95s))
+    if token_distributions:
+        stats.token_min = min(tc.get("min", 0) for tc in token_distributions)
+        stats.token_max = max(tc.get("max", 0) for tc in token_distributions)
+        stats.token_median, stats.token_p95, stats.token_p99 = _aggregate_percentiles(
+            token_distributions
+        )
 
     stats.total_injections = total_injections
     stats.total_threshold_exceedances = total_exceedances
 
     # Performance aggregation
-    parsing_medians: List[int] = []
-    parsing_p95s: List[int] = []
-    injection_medians: List[int] = []
-    injection_p95s: List[int] = []
+    parsing_distributions: List[Dict[str, Any]] = []
+    injection_distributions: List[Dict[str, Any]] = []
 
     for session in sessions:
         perf = session.get("performance", {})
@@ -206,20 +265,20 @@ def compute_aggregate_statistics(sessions: List[Dict[str, Any]]) -> AggregateSta
 
         # Only include sessions with actual parsing
         if parsing.get("median", 0) > 0:
-            parsing_medians.append(parsing.get("median", 0))
-            parsing_p95s.append(parsing.get("p95", 0))
+            parsing_distributions.append(parsing)
 
         if injection.get("median", 0) > 0:
-            injection_medians.append(injection.get("median", 0))
-            injection_p95s.append(injection.get("p95", 0))
+            injection_distributions.append(injection)
 
-    if parsing_medians:
-        stats.parsing_median_ms = int(statistics.median(parsing_medians))
-        stats.parsing_p95_ms = int(statistics.median(parsing_p95s))
+    if parsing_distributions:
+        stats.parsing_median_ms, stats.parsing_p95_ms, stats.parsing_p99_ms = (
+            _aggregate_percentiles(parsing_distributions)
+        )
 
-    if injection_medians:
-        stats.injection_median_ms = int(statistics.median(injection_medians))
-        stats.injection_p95_ms = int(statistics.median(injection_p95s))
+    if injection_distributions:
+        stats.injection_median_ms, stats.injection_p95_ms, stats.injection_p99_ms = (
+            _aggregate_percentiles(injection_distributions)
+        )
 
     # Warning aggregation
     warnings_by_type: Dict[str, int] = {}
@@ -539,7 +598,7 @@ def format_report(report: AnalysisReport) -> str:
         tc = stats
         lines.append(
             f"  Token counts: min={tc.token_min}, median={tc.token_median}, "
-            f"p95={tc.token_p95}, max={tc.token_max}"
+            f"p95={tc.token_p95}, p99={tc.token_p99}, max={tc.token_max}"
         )
         exceedance_pct = (
             stats.total_threshold_exceedances / stats.total_injections * 100
@@ -570,17 +629,23 @@ def format_report(report: AnalysisReport) -> str:
     )
 
     if stats.parsing_p95_ms > 0:
-        pmed, pp95 = stats.parsing_median_ms, stats.parsing_p95_ms
+        pmed, pp95, pp99 = stats.parsing_median_ms, stats.parsing_p95_ms, stats.parsing_p99_ms
         lines.append(
-            f"  Parsing: median={pmed}ms, p95={pp95}ms (target: <200ms) [{parsing_status}]"
+            f"  Parsing: median={pmed}ms, p95={pp95}ms, p99={pp99}ms "
+            f"(target: <200ms) [{parsing_status}]"
         )
     else:
         lines.append("  Parsing: No data")
 
     if stats.injection_p95_ms > 0:
-        imed, ip95 = stats.injection_median_ms, stats.injection_p95_ms
+        imed, ip95, ip99 = (
+            stats.injection_median_ms,
+            stats.injection_p95_ms,
+            stats.injection_p99_ms,
+        )
         lines.append(
-            f"  Injection: median={imed}ms, p95={ip95}ms (target: <50ms) [{injection_status}]"
+            f"  Injection: median={imed}ms, p95={ip95}ms, p99={ip99}ms "
+            f"(target: <50ms) [{injection_status}]"
         )
     else:
         lines.append("  Injection: No data")
@@ -668,11 +733,16 @@ def format_report(report: AnalysisReport) -> str:
     return "\n".join(lines)
 
 
-def analyze_metrics(file_paths: List[Path]) -> AnalysisReport:
+def analyze_metrics(
+    file_paths: List[Path], since: Optional[str] = None, until: Optional[str] = None
+) -> AnalysisReport:
     """Analyze metrics from one or more JSONL files.
 
     Args:
-        file_paths: List of paths to session_metrics.jsonl files.
+        file_paths: List of paths to session_metrics.jsonl files, or to
+                    directories of them.
+        since: Optional ISO 8601 timestamp; skip sessions that ended earlier.
+        until: Optional ISO 8601 timestamp; skip sessions that ended later.
 
     Returns:
         Complete analysis report.
@@ -680,9 +750,13 @@ def analyze_metrics(file_paths: List[Path]) -> AnalysisReport:
     # Collect all sessions from all files
     all_sessions: List[Dict[str, Any]] = []
 
+    expanded: List[Path] = []
     for file_path in file_paths:
+        expanded.extend(list_logs(file_path) if file_path.is_dir() else [file_path])
+
+    for file_path in expanded:
         try:
-            sessions = parse_session_metrics(file_path)
+            sessions = parse_session_metrics(file_path, since, until)
             all_sessions.extend(sessions)
         except FileNotFoundError as e:
             print(f"Warning: {e}", file=sys.stderr)
@@ -742,13 +816,22 @@ def main() -> int:
 Examples:
     python analyze_metrics.py ~/.cross_file_context/session_metrics/*.jsonl
     python analyze_metrics.py path/to/metrics1.jsonl path/to/metrics2.jsonl
+    python analyze_metrics.py ~/.cross_file_context/session_metrics/ --since 2025-12-01
         """,
     )
     parser.add_argument(
         "files",
         nargs="+",
         type=Path,
-        help="Path(s) to session_metrics.jsonl file(s)",
+        help="Path(s) to session_metrics.jsonl file(s) or directories of them",
+    )
+    parser.add_argument(
+        "--since",
+        help="Only analyze sessions that ended at or after this ISO 8601 date/time",
+    )
+    parser.add_argument(
+        "--until",
+        help="Only analyze sessions that ended at or before this ISO 8601 date/time",
     )
     parser.add_argument(
         "--json",
@@ -759,7 +842,7 @@ Examples:
     args = parser.parse_args()
 
     try:
-        report = analyze_metrics(args.files)
+        report = analyze_metrics(args.files, since=args.since, until=args.until)
 
         if report.sessions_analyzed == 0:
             print("No valid session metrics found in the provided files.", file=sys.stderr)
@@ -781,14 +864,17 @@ Examples:
                         "token_min": report.statistics.token_min,
                         "token_median": report.statistics.token_median,
                         "token_p95": report.statistics.token_p95,
+                        "token_p99": report.statistics.token_p99,
                         "token_max": report.statistics.token_max,
                         "threshold_exceedances": report.statistics.total_threshold_exceedances,
                     },
                     "performance": {
                         "parsing_median_ms": report.statistics.parsing_median_ms,
                         "parsing_p95_ms": report.statistics.parsing_p95_ms,
+                        "parsing_p99_ms": report.statistics.parsing_p99_ms,
                         "injection_median_ms": report.statistics.injection_median_ms,
                         "injection_p95_ms": report.statistics.injection_p95_ms,
+                        "injection_p99_ms": report.statistics.injection_p99_ms,
                     },
                     "warnings": {
                         "total": report.statistics.total_warnings,
@@ -0,0 +1,492 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Reproducible benchmark suite on seeded synthetic projects.
+
+Generates a synthetic project (scripts/synthetic_project.py) and measures the
+service end to end on it. Unlike benchmark_analysis.py, which compares two
+analysis modes on up to 100 local files, the suite scales to 20K generated
+files and covers the whole request and update path.
+
+Scenarios:
+- cold_analyze: analyze_directory() on a fresh service
+- cold_read: first read_file_with_context() of files on a fresh service
+  (lazy analysis of each file's dependency closure)
+- first_read / warm_read: first read and re-read of files after analysis
+  (context assembly, then memoized contexts)
+- incremental_update: edits of single files applied through the file watcher
+  and GraphUpdater, then a read of each edited file
+- branch_switch: a checkout-like burst of rewritten, created and deleted files
+  applied as one coalesced batch, then reads of a sample of files
+- Peak memory: peak RSS of the process after each scenario, and the traced
+  peak of cold_analyze with --trace-memory
+
+Results are written as JSON (flat metric names, lower is better). With
+--baseline, metrics are compared against a stored result of the same project
+spec and regressions beyond --tolerance fail the run.
+
+Usage:
+    python scripts/benchmark_suite.py --files 2000 --output results.json
+    python scripts/benchmark_suite.py --files 20000 --fan-out 8 --depth 4 --repeat 3
+    python scripts/benchmark_suite.py --files 2000 --baseline baseline.json --tolerance 0.25
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Add src and scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from synthetic_project import (  # noqa: E402
+    ProjectSpec,
+    SyntheticProject,
+    edit_module,
+    generate_project,
+    switch_branch,
+)
+
+from xfile_context.config import Config  # noqa: E402
+from xfile_context.event_coalescer import FileEventType  # noqa: E402
+from xfile_context.file_watcher import FileWatcher  # noqa: E402
+from xfile_context.service import CrossFileContextService  # noqa: E402
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+# Version of the result format
+RESULT_VERSION = 1
+
+# Metrics below this many milliseconds are not reported as regressions (noise)
+MIN_COMPARED_MS = 1.0
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Get the peak resident set size of this process in MiB (None if unknown)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def _percentiles(prefix: str, samples_ms: List[float]) -> Dict[str, float]:
+    """Summarize latency samples as p50/p95/max metrics."""
+    if not samples_ms:
+        return {}
+    ordered = sorted(samples_ms)
+    p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+    return {
+        f"{prefix}_p50_ms": round(statistics.median(ordered), 3),
+        f"{prefix}_p95_ms": round(p95, 3),
+        f"{prefix}_max_ms": round(ordered[-1], 3),
+    }
+
+
+def _timed_reads(service: CrossFileContextService, paths: List[str]) -> List[float]:
+    """Read files one at a time and return each read's latency in ms."""
+    samples = []
+    for path in paths:
+        start = time.perf_counter()
+        service.read_file_with_context(path)
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+class BenchmarkRun:
+    """One run of all scenarios on a freshly generated project.
+
+    Args:
+        spec: Project to generate.
+        workdir: Directory for the project and the service's data root.
+        sample: Number of files read per read scenario.
+        edits: Number of single-file edits for incremental_update.
+        churn: Fraction of files touched by branch_switch.
+        trace_memory: Measure the traced peak of cold_analyze (slows it down).
+    """
+
+    def __init__(
+        self,
+        spec: ProjectSpec,
+        workdir: Path,
+        sample: int,
+        edits: int,
+        churn: float,
+        trace_memory: bool,
+    ):
+        self.spec = spec
+        self.workdir = workdir
+        self.sample = sample
+        self.edits = edits
+        self.churn = churn
+        self.trace_memory = trace_memory
+        self.metrics: Dict[str, float] = {}
+        self._rng = random.Random(spec.seed + 1)
+        self._revision = 0
+
+    def run(self) -> Dict[str, float]:
+        """Generate the project and run every scenario.
+
+        Returns:
+            Metrics by name.
+        """
+        start = time.perf_counter()
+        project = generate_project(self.workdir / "project", self.spec)
+        self.metrics["generate_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        sample = self._rng.sample(project.modules, min(self.sample, len(project.modules)))
+
+        self._scenario("cold_read", lambda: self._cold_read(project, sample))
+        service, watcher = self._create_service(project, "warm")
+        try:
+            self._scenario("cold_analyze", lambda: self._cold_analyze(service))
+            self._scenario("read", lambda: self._reads(service, sample))
+            self._scenario(
+                "incremental_update", lambda: self._incremental_update(service, watcher, project)
+            )
+            self._scenario(
+                "branch_switch", lambda: self._branch_switch(service, watcher, project, sample)
+            )
+        finally:
+            service.shutdown()
+        return self.metrics
+
+    def _scenario(self, name: str, body: Callable[[], None]) -> None:
+        """Run a scenario and record the peak RSS after it."""
+        gc.collect()
+        body()
+        rss = peak_rss_mb()
+        if rss is not None:
+            self.metrics[f"{name}_peak_rss_mb"] = rss
+
+    def _create_service(
+        self, project: SyntheticProject, name: str
+    ) -> Tuple[CrossFileContextService, FileWatcher]:
+        """Create a service on the project with a watcher that is fed manually."""
+        config = Config(config_path=self.workdir / "missing.yml")
+        # Coalesce a burst of events until flush(), like a debounced watcher
+        watcher = FileWatcher(project_root=str(project.root), debounce_window=3600.0)
+        service = CrossFileContextService(
+            config,
+            project_root=str(project.root),
+            file_watcher=watcher,
+            data_root=self.workdir / f"data-{name}",
+        )
+        return service, watcher
+
+    def _cold_read(self, project: SyntheticProject, sample: List[str]) -> None:
+        service, _ = self._create_service(project, "cold")
+        try:
+            self.metrics.update(_percentiles("cold_read", _timed_reads(service, sample)))
+        finally:
+            service.shutdown()
+
+    def _cold_analyze(self, service: CrossFileContextService) -> None:
+        if self.trace_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        stats = service.analyze_directory()
+        self.metrics["cold_analyze_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        if self.trace_memory:
+            self.metrics["cold_analyze_traced_peak_mb"] = round(
+                tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1
+            )
+            tracemalloc.stop()
+        self.metrics["cold_analyze_per_file_ms"] = round(
+            self.metrics["cold_analyze_ms"] / max(stats["total"], 1), 4
+        )
+
+    def _reads(self, service: CrossFileContextService, sample: List[str]) -> None:
+        self.metrics.update(_percentiles("first_read", _timed_reads(service, sample)))
+        self.metrics.update(_percentiles("warm_read", _timed_reads(service, sample)))
+
+    def _apply_events(
+        self, service: CrossFileContextService, watcher: FileWatcher, events: List[Tuple[str, Any]]
+    ) -> float:
+        """Feed events to the watcher, publish them and apply them to the graph (ms)."""
+        start = time.perf_counter()
+        for path, event_type in events:
+            watcher.record_event(path, event_type)
+        watcher.flush()
+        service.process_pending_changes()
+        return (time.perf_counter() - start) * 1000
+
+    def _next_mtime(self, paths: List[str]) -> None:
+        """Move modification times forward so edits are seen on coarse clocks."""
+        stamp = time.time() + self._revision
+        for path in paths:
+            os.utime(path, (stamp, stamp))
+
+    def _incremental_update(
+        self, service: CrossFileContextService, watcher: FileWatcher, project: SyntheticProject
+    ) -> None:
+        update_ms = []
+        read_ms = []
+        for index in self._rng.sample(
+            range(len(project.modules)), min(self.edits, len(project.modules))
+        ):
+            self._revision += 1
+            path = edit_module(project, index, self._revision)
+            self._next_mtime([path])
+            update_ms.append(self._apply_events(service, watcher, [(path, FileEventType.MODIFIED)]))
+            read_ms.extend(_timed_reads(service, [path]))
+        self.metrics.update(_percentiles("incremental_update", update_ms))
+        self.metrics.update(_percentiles("read_after_edit", read_ms))
+
+    def _branch_switch(
+        self,
+        service: CrossFileContextService,
+        watcher: FileWatcher,
+        project: SyntheticProject,
+        sample: List[str],
+    ) -> None:
+        self._revision += 1
+        switch = switch_branch(project, self.churn, self._revision, self._rng)
+        self._next_mtime(switch.changed + switch.created)
+        events: List[Tuple[str, Any]] = []
+        for path in switch.changed:
+            events += [
+                (path, FileEventType.DELETED),
+                (path, FileEventType.CREATED),
+                (path, FileEventType.MODIFIED),
+            ]
+        events += [(path, FileEventType.CREATED) for path in switch.created]
+        events += [(path, FileEventType.DELETED) for path in switch.deleted]
+        self.metrics["branch_switch_files"] = len(switch.changed + switch.created + switch.deleted)
+        self.metrics["branch_switch_ms"] = round(self._apply_events(service, watcher, events), 3)
+        remaining = [path for path in sample if path not in set(switch.deleted)]
+        self.metrics.update(_percentiles("read_after_switch", _timed_reads(service, remaining)))
+
+
+def run_suite(
+    spec: ProjectSpec,
+    repeat: int = 1,
+    sample: int = 50,
+    edits: int = 20,
+    churn: float = 0.1,
+    trace_memory: bool = False,
+    workdir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Run the benchmark suite.
+
+    Each repetition generates the project again in a new directory. Timing
+    metrics keep the best (lowest) value over the repetitions.
+
+    Args:
+        spec: Project to generate.
+        repeat: Number of repetitions.
+        sample: Files read per read scenario.
+        edits: Single-file edits in incremental_update.
+        churn: Fraction of files touched by branch_switch.
+        trace_memory: Measure the traced peak of cold_analyze.
+        workdir: Directory for projects and logs (default: a temporary directory).
+
+    Returns:
+        Result dictionary with the spec, settings, environment and metrics.
+    """
+    runs: List[Dict[str, float]] = []
+    for i in range(repeat):
+        with tempfile.TemporaryDirectory(dir=workdir) as tmpdir:
+            metrics = BenchmarkRun(spec, Path(tmpdir), sample, edits, churn, trace_memory).run()
+            runs.append(metrics)
+            print(
+                f"  run {i + 1}/{repeat}: cold_analyze {metrics['cold_analyze_ms']:.0f}ms, "
+                f"warm_read p50 {metrics.get('warm_read_p50_ms', 0):.2f}ms",
+                file=sys.stderr,
+            )
+
+    metrics = {name: min(run[name] for run in runs if name in run) for name in runs[0]}
+    return {
+        "version": RESULT_VERSION,
+        "spec": spec.to_dict(),
+        "settings": {
+            "repeat": repeat,
+            "sample": sample,
+            "edits": edits,
+            "churn": churn,
+            "trace_memory": trace_memory,
+        },
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "metrics": metrics,
+    }
+
+
+def compare_results(
+    result: Dict[str, Any], baseline: Dict[str, Any], tolerance: float
+) -> List[Dict[str, Any]]:
+    """Compare the metrics of a result with a baseline.
+
+    Args:
+        result: Result of run_suite().
+        baseline: Stored result of run_suite() for the same spec and settings.
+        tolerance: Allowed relative increase (e.g. 0.2 for 20%).
+
+    Returns:
+        One entry per metric in both results, with baseline and current
+        values, their ratio and whether it is a regression.
+
+    Raises:
+        ValueError: If the results were produced for different specs or settings.
+    """
+    for key in ("spec", "settings"):
+        if result.get(key) != baseline.get(key):
+            raise ValueError(
+                f"Baseline {key} differs from this run: {baseline.get(key)} != {result.get(key)}"
+            )
+
+    comparison = []
+    for name, current in result["metrics"].items():
+        previous = baseline.get("metrics", {}).get(name)
+        if previous is None:
+            continue
+        ratio = current / previous if previous else (1.0 if current == previous else float("inf"))
+        # Sub-millisecond timings are too noisy to gate on
+        noise = name.endswith("_ms") and max(current, previous) < MIN_COMPARED_MS
+        comparison.append(
+            {
+                "metric": name,
+                "baseline": previous,
+                "current": current,
+                "ratio": round(ratio, 3),
+                "regression": ratio > 1 + tolerance and not noise,
+            }
+        )
+    return comparison
+
+
+def format_comparison(comparison: List[Dict[str, Any]], tolerance: float) -> str:
+    """Format a comparison for humans."""
+    lines = [f"{'metric':<36} {'baseline':>12} {'current':>12} {'ratio':>8}"]
+    for entry in comparison:
+        flag = "  REGRESSION" if entry["regression"] else ""
+        lines.append(
+            f"{entry['metric']:<36} {entry['baseline']:>12.3f} {entry['current']:>12.3f} "
+            f"{entry['ratio']:>8.3f}{flag}"
+        )
+    regressions = sum(entry["regression"] for entry in comparison)
+    lines.append(f"{regressions} regression(s) beyond {tolerance:.0%}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main entry point for the benchmark suite.
+
+    Returns:
+        Exit code (0 for success, 1 for regressions or errors).
+    """
+    defaults = ProjectSpec()
+    parser = argparse.ArgumentParser(
+        description="Benchmark the service on a seeded synthetic project",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--files", type=int, default=defaults.files, help="Modules to generate")
+    parser.add_argument("--fan-out", type=int, default=defaults.fan_out, help="Imports per module")
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="Package depth")
+    parser.add_argument(
+        "--cycle-ratio",
+        type=float,
+        default=defaults.cycle_ratio,
+        help="Fraction of modules closing an import cycle",
+    )
+    parser.add_argument(
+        "--functions",
+        type=int,
+        default=defaults.functions_per_file,
+        help="Functions per module (file size)",
+    )
+    parser.add_argument(
+        "--lines",
+        type=int,
+        default=defaults.lines_per_function,
+        help="Lines per function (file size)",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed")
+    parser.add_argument("--repeat", type=int, default=1, help="Repetitions (best value kept)")
+    parser.add_argument("--sample", type=int, default=50, help="Files read per read scenario")
+    parser.add_argument("--edits", type=int, default=20, help="Single-file edits")
+    parser.add_argument(
+        "--churn", type=float, default=0.1, help="Fraction of files touched by the branch switch"
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="Measure the tracemalloc peak of cold analysis (slows it down)",
+    )
+    parser.add_argument("--output", type=Path, help="Write the result JSON to this file")
+    parser.add_argument("--baseline", type=Path, help="Compare with a stored result JSON")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative increase over the baseline. Default: 0.2",
+    )
+    parser.add_argument("--workdir", type=Path, help="Directory for generated projects")
+    args = parser.parse_args()
+
+    # The service logs every analysis at INFO level
+    logging.basicConfig(level=logging.WARNING)
+
+    spec = ProjectSpec(
+        files=args.files,
+        fan_out=args.fan_out,
+        depth=args.depth,
+        cycle_ratio=args.cycle_ratio,
+        functions_per_file=args.functions,
+        lines_per_function=args.lines,
+        seed=args.seed,
+    )
+    try:
+        spec.validate()
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, encoding="utf-8") as f:
+                baseline = json.load(f)
+        print(f"Benchmarking synthetic project: {spec.to_dict()}", file=sys.stderr)
+        result = run_suite(
+            spec,
+            repeat=args.repeat,
+            sample=args.sample,
+            edits=args.edits,
+            churn=args.churn,
+            trace_memory=args.trace_memory,
+            workdir=args.workdir,
+        )
+        comparison = compare_results(result, baseline, args.tolerance) if baseline else None
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if comparison is not None:
+        result["comparison"] = comparison
+    output = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n", encoding="utf-8")
+    print(output)
+
+    if comparison is not None:
+        print(format_comparison(comparison, args.tolerance), file=sys.stderr)
+        if any(entry["regression"] for entry in comparison):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
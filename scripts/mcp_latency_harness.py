@@ -0,0 +1,359 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""End-to-end latency harness for the MCP server over stdio.
+
+Launches `python -m xfile_context.mcp_server` as a subprocess, connects to it
+as an MCP client over stdio (the transport Claude Code uses) and drives
+read_with_context calls from a workload. Unlike benchmark_suite.py, which calls
+the service in-process, the measured latency includes JSON-RPC framing, FastMCP
+argument validation and result serialization, context logging notifications
+and response formatting (_format_content_with_context).
+
+Features:
+- Synthetic workloads: a seeded project is generated with
+  scripts/synthetic_project.py and files are sampled from it (fully offline)
+- Recorded workloads: a file of paths to read, one per line, or JSONL records
+  with a "file_path" or "target_file" field (e.g. injection logs)
+- Configurable concurrency: N client tasks share one server session, like an
+  agent issuing parallel tool calls
+- Unmeasured warm-up requests before the measured run
+- Reports p50/p95/p99/max latency, throughput, errors and response size
+
+Usage:
+    python scripts/mcp_latency_harness.py --files 2000 --requests 500 --concurrency 4
+    python scripts/mcp_latency_harness.py --project ~/src/app --workload reads.txt --json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import AsyncExitStack
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add src and scripts to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+
+from mcp import ClientSession  # noqa: E402
+from mcp.client.stdio import StdioServerParameters, stdio_client  # noqa: E402
+from synthetic_project import ProjectSpec, generate_project  # noqa: E402
+
+# Tool driven by the harness
+READ_TOOL = "read_with_context"
+
+# Server log file written to the data root (the server logs every call)
+SERVER_LOG = "mcp_server.log"
+
+
+def load_workload(path: Path) -> List[str]:
+    """Load a recorded workload.
+
+    Each non-empty line is either a file path or a JSON object with a
+    "file_path" or "target_file" field. Lines starting with "#" are comments.
+    Consecutive records of the same file are one read (injection logs write a
+    record per injected snippet).
+
+    Args:
+        path: Workload file.
+
+    Returns:
+        File paths in request order.
+
+    Raises:
+        ValueError: If a JSON record has no file path.
+    """
+    paths: List[str] = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if line.startswith("{"):
+                record = json.loads(line)
+                file_path = record.get("file_path") or record.get("target_file")
+                if not file_path:
+                    raise ValueError(f"{path}:{line_number}: record has no file path")
+            else:
+                file_path = line
+            if not paths or paths[-1] != file_path:
+                paths.append(file_path)
+    return paths
+
+
+def synthetic_workload(modules: List[str], requests: int, seed: int) -> List[str]:
+    """Sample a read sequence from the modules of a project.
+
+    Args:
+        modules: Module paths to read.
+        requests: Number of reads.
+        seed: Random seed of the sample.
+
+    Returns:
+        File paths in request order.
+    """
+    return random.Random(seed).choices(modules, k=requests)
+
+
+def summarize(latencies_ms: List[float], errors: int, elapsed_s: float) -> Dict[str, float]:
+    """Summarize the latencies of a run.
+
+    Args:
+        latencies_ms: Latency of each successful call.
+        errors: Number of failed calls.
+        elapsed_s: Wall-clock duration of the run.
+
+    Returns:
+        Request counts, p50/p95/p99/max/mean latency in ms and throughput in
+        requests per second (successful and failed).
+    """
+    requests = len(latencies_ms) + errors
+    summary: Dict[str, float] = {
+        "requests": requests,
+        "errors": errors,
+        "elapsed_s": round(elapsed_s, 3),
+        "throughput_rps": round(requests / elapsed_s, 2) if elapsed_s > 0 else 0.0,
+    }
+    if latencies_ms:
+        ordered = sorted(latencies_ms)
+        for name, quantile in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+            # Nearest-rank percentile
+            rank = max(1, math.ceil(quantile * len(ordered)))
+            summary[f"{name}_ms"] = round(ordered[rank - 1], 3)
+        summary["max_ms"] = round(ordered[-1], 3)
+        summary["mean_ms"] = round(statistics.fmean(ordered), 3)
+    return summary
+
+
+async def _drive(
+    session: ClientSession, paths: List[str], concurrency: int
+) -> Tuple[List[float], int, int, float]:
+    """Issue reads of paths from concurrency client tasks.
+
+    Returns:
+        Latencies of successful calls in ms, the number of failed calls, the
+        total response size in characters and the elapsed time in seconds.
+    """
+    latencies: List[float] = []
+    errors = 0
+    response_chars = 0
+    queue = iter(paths)
+
+    async def worker() -> None:
+        nonlocal errors, response_chars
+        for file_path in queue:
+            start = time.perf_counter()
+            try:
+                result = await session.call_tool(READ_TOOL, {"file_path": file_path})
+            except Exception as e:  # Transport failure, not a tool error
+                print(f"Error reading {file_path}: {e}", file=sys.stderr)
+                errors += 1
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if result.isError:
+                errors += 1
+                continue
+            latencies.append(elapsed_ms)
+            response_chars += sum(len(getattr(block, "text", "")) for block in result.content)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    return latencies, errors, response_chars, time.perf_counter() - start
+
+
+async def run_harness(
+    project_root: Path,
+    paths: List[str],
+    concurrency: int = 1,
+    warmup: int = 0,
+    data_root: Optional[Path] = None,
+    server_args: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Start the MCP server on a project and measure reads of a workload.
+
+    Args:
+        project_root: Project the server runs in (its working directory).
+        paths: Files to read, absolute or relative to project_root.
+        concurrency: Concurrent client tasks.
+        warmup: Reads from the start of the workload issued (sequentially)
+            before the measured run and not measured.
+        data_root: Server data root (default: a temporary directory, removed
+            after the run).
+        server_args: Extra server command-line arguments (e.g. profiling flags).
+
+    Returns:
+        Settings and the summary of the measured run.
+    """
+    with tempfile.TemporaryDirectory(prefix="xfile_context_mcp_") as tmp:
+        data_root = data_root or Path(tmp)
+        data_root.mkdir(parents=True, exist_ok=True)
+        # Run the server from this checkout even if the package is not installed
+        src = str(Path(__file__).parent.parent / "src")
+        pythonpath = os.pathsep.join(filter(None, [src, os.environ.get("PYTHONPATH")]))
+        params = StdioServerParameters(
+            command=sys.executable,
+            args=[
+                "-m",
+                "xfile_context.mcp_server",
+                "--data-root",
+                str(data_root),
+                *(server_args or []),
+            ],
+            env={**os.environ, "PYTHONPATH": pythonpath},
+            cwd=str(project_root),
+        )
+
+        with open(data_root / SERVER_LOG, "w", encoding="utf-8") as errlog:
+            async with AsyncExitStack() as stack:
+                streams = await stack.enter_async_context(stdio_client(params, errlog=errlog))
+                session = await stack.enter_async_context(ClientSession(*streams))
+                # Includes the server's imports and service startup
+                start = time.perf_counter()
+                await session.initialize()
+                startup_ms = (time.perf_counter() - start) * 1000
+                await _drive(session, paths[:warmup], 1)
+                latencies, errors, chars, elapsed = await _drive(session, paths, concurrency)
+
+    summary = summarize(latencies, errors, elapsed)
+    summary["startup_ms"] = round(startup_ms, 3)
+    summary["mean_response_kb"] = round(chars / len(latencies) / 1024, 3) if latencies else 0.0
+    return {
+        "settings": {
+            "project_root": str(project_root),
+            "concurrency": concurrency,
+            "warmup": warmup,
+            "server_args": server_args or [],
+        },
+        "summary": summary,
+    }
+
+
+def format_summary(result: Dict[str, Any]) -> str:
+    """Format a harness result for display."""
+    summary = result["summary"]
+    settings = result["settings"]
+    lines = [
+        f"MCP read_with_context latency ({summary['requests']} requests, "
+        f"concurrency {settings['concurrency']}, warm-up {settings['warmup']})",
+        f"  Server startup:  {summary['startup_ms']:.1f}ms",
+    ]
+    if "p50_ms" in summary:
+        lines.append(
+            f"  Latency:         p50 {summary['p50_ms']:.2f}ms  p95 {summary['p95_ms']:.2f}ms  "
+            f"p99 {summary['p99_ms']:.2f}ms  max {summary['max_ms']:.2f}ms"
+        )
+    lines.append(f"  Throughput:      {summary['throughput_rps']:.1f} requests/s")
+    lines.append(f"  Mean response:   {summary['mean_response_kb']:.1f} KiB")
+    lines.append(f"  Errors:          {summary['errors']}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main entry point for the MCP latency harness.
+
+    Returns:
+        Exit code (0 for success, 1 for errors or failed requests).
+    """
+    defaults = ProjectSpec()
+    parser = argparse.ArgumentParser(
+        description="Measure end-to-end read_with_context latency of the MCP server over stdio",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "--project",
+        type=Path,
+        help="Existing project to serve (default: generate a synthetic project)",
+    )
+    parser.add_argument(
+        "--workload",
+        type=Path,
+        help="Recorded workload: file paths or JSONL records (default: synthetic)",
+    )
+    parser.add_argument("--files", type=int, default=1000, help="Synthetic project modules")
+    parser.add_argument("--fan-out", type=int, default=defaults.fan_out, help="Imports per module")
+    parser.add_argument("--depth", type=int, default=defaults.depth, help="Package depth")
+    parser.add_argument("--seed", type=int, default=defaults.seed, help="Random seed")
+    parser.add_argument(
+        "--requests", type=int, default=200, help="Reads of a synthetic workload. Default: 200"
+    )
+    parser.add_argument(
+        "--concurrency", type=int, default=1, help="Concurrent client tasks. Default: 1"
+    )
+    parser.add_argument(
+        "--warmup", type=int, default=0, help="Unmeasured reads before the run. Default: 0"
+    )
+    parser.add_argument(
+        "--server-arg",
+        action="append",
+        default=[],
+        help="Extra server argument (repeatable), e.g. --server-arg=--profile-every=50",
+    )
+    parser.add_argument("--data-root", type=Path, help="Server data root (default: temporary)")
+    parser.add_argument("--workdir", type=Path, help="Directory for the generated project")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    if args.project is None and args.workload is not None:
+        print("Error: --workload requires --project", file=sys.stderr)
+        return 1
+
+    project = None
+    workdir = None
+    try:
+        if args.project is not None:
+            project_root = args.project.resolve()
+            if args.workload is not None:
+                paths = load_workload(args.workload)
+            else:
+                modules = sorted(str(p) for p in project_root.rglob("*.py"))
+                paths = synthetic_workload(modules, args.requests, args.seed)
+        else:
+            spec = ProjectSpec(
+                files=args.files, fan_out=args.fan_out, depth=args.depth, seed=args.seed
+            )
+            workdir = Path(tempfile.mkdtemp(prefix="xfile_context_harness_", dir=args.workdir))
+            print(f"Generating synthetic project: {spec.to_dict()}", file=sys.stderr)
+            project = generate_project(workdir / "project", spec)
+            project_root = project.root
+            paths = synthetic_workload(project.modules, args.requests, args.seed)
+        if not paths:
+            print("Error: Workload is empty", file=sys.stderr)
+            return 1
+
+        result = asyncio.run(
+            run_harness(
+                project_root,
+                paths,
+                concurrency=args.concurrency,
+                warmup=args.warmup,
+                data_root=args.data_root,
+                server_args=args.server_arg,
+            )
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if workdir is not None:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    if project is not None:
+        result["spec"] = project.spec.to_dict()
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_summary(result))
+    return 1 if result["summary"]["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,321 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Profile Report Tool for request profiles dumped by the MCP server.
+
+Aggregates the cProfile dumps written with --profile-every/--profile-slow-ms
+(profile_* configuration) and reports the functions that took the most time
+across all of them.
+
+Features:
+- Merge the .prof dumps of one or more session directories (or single files)
+- Rank functions by cumulative or own (tottime) time over all dumps, with the
+  number of dumps each function appears in
+- List the dumped requests from the profiles.jsonl manifests (slowest first)
+- Optionally rank source lines by memory held at the end of profiled requests,
+  over the tracemalloc snapshots
+- Human-readable or JSON output
+
+Usage:
+    python scripts/profile_report.py ~/.cross_file_context/profiles/<session-id>/
+    python scripts/profile_report.py ~/.cross_file_context/profiles/ --top 30 --sort tottime
+    python scripts/profile_report.py path/to/0001-read_file_with_context.prof --memory
+"""
+
+import argparse
+import json
+import pstats
+import sys
+import tracemalloc
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+# Manifest written next to the dumps (request_profiler.PROFILE_MANIFEST)
+PROFILE_MANIFEST = "profiles.jsonl"
+
+SORT_KEYS = ("cumulative", "tottime")
+
+
+@dataclass
+class FunctionStatistics:
+    """Time spent in one function over all dumps."""
+
+    function: str
+    calls: int
+    tottime_ms: float
+    cumulative_ms: float
+    dumps: int
+
+
+@dataclass
+class ProfileReport:
+    """Aggregated profile report."""
+
+    dumps_analyzed: int = 0
+    total_ms: float = 0.0
+    functions: List[FunctionStatistics] = field(default_factory=list)
+    requests: List[Dict[str, Any]] = field(default_factory=list)
+    memory: List[Tuple[str, int, int]] = field(default_factory=list)
+
+
+def find_dumps(paths: List[Path], suffix: str = ".prof") -> List[Path]:
+    """Find dump files in files and directories (searched recursively).
+
+    Args:
+        paths: Dump files or directories containing them.
+        suffix: Dump file suffix (".prof" or ".tracemalloc").
+
+    Returns:
+        Dump files in path order, sorted within each directory.
+    """
+    dumps: List[Path] = []
+    for path in paths:
+        if path.is_dir():
+            dumps.extend(sorted(path.rglob(f"*{suffix}")))
+        elif path.suffix == suffix:
+            dumps.append(path)
+    return dumps
+
+
+def read_manifests(paths: List[Path]) -> List[Dict[str, Any]]:
+    """Read the dump records of the manifests in the given directories.
+
+    Args:
+        paths: Session directories (or parents of them).
+
+    Returns:
+        Dump records, slowest request first. Malformed lines are skipped.
+    """
+    records: List[Dict[str, Any]] = []
+    for path in paths:
+        if not path.is_dir():
+            continue
+        for manifest in sorted(path.rglob(PROFILE_MANIFEST)):
+            with open(manifest, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if isinstance(record, dict):
+                        record["session"] = manifest.parent.name
+                        records.append(record)
+    return sorted(records, key=lambda r: r.get("elapsed_ms", 0), reverse=True)
+
+
+def _format_function(key: Tuple[str, int, str]) -> str:
+    """Format a pstats function key as file:line(function)."""
+    filename, line, name = key
+    if filename == "~" and line == 0:
+        # Built-in function
+        return name
+    return f"{filename}:{line}({name})"
+
+
+def aggregate_profiles(
+    dumps: List[Path], top: int, sort: str
+) -> Tuple[float, List[FunctionStatistics]]:
+    """Merge cProfile dumps and rank their functions.
+
+    Args:
+        dumps: cProfile dump files.
+        top: Number of functions to report.
+        sort: Ranking key, "cumulative" or "tottime".
+
+    Returns:
+        Tuple of total profiled time in ms and the top FunctionStatistics.
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f"sort must be one of {SORT_KEYS}, got {sort}")
+
+    merged: Dict[Tuple[str, int, str], List[float]] = {}
+    total_ms = 0.0
+    for dump in dumps:
+        stats = pstats.Stats(str(dump))
+        total_ms += stats.total_tt * 1000
+        for key, (_, calls, tottime, cumulative, _) in stats.stats.items():
+            entry = merged.setdefault(key, [0, 0.0, 0.0, 0])
+            entry[0] += calls
+            entry[1] += tottime
+            entry[2] += cumulative
+            entry[3] += 1
+
+    index = 2 if sort == "cumulative" else 1
+    ranked = sorted(merged.items(), key=lambda item: item[1][index], reverse=True)[:top]
+    return total_ms, [
+        FunctionStatistics(
+            function=_format_function(key),
+            calls=int(calls),
+            tottime_ms=round(tottime * 1000, 3),
+            cumulative_ms=round(cumulative * 1000, 3),
+            dumps=int(dumps_seen),
+        )
+        for key, (calls, tottime, cumulative, dumps_seen) in ranked
+    ]
+
+
+def aggregate_memory(snapshots: List[Path], top: int) -> List[Tuple[str, int, int]]:
+    """Rank source lines by memory held in tracemalloc snapshots.
+
+    Args:
+        snapshots: tracemalloc snapshot files.
+        top: Number of lines to report.
+
+    Returns:
+        (file:line, total bytes, allocation count) tuples, largest first.
+    """
+    totals: Dict[str, List[int]] = {}
+    for path in snapshots:
+        snapshot = tracemalloc.Snapshot.load(str(path))
+        for stat in snapshot.statistics("lineno"):
+            frame = stat.traceback[0]
+            entry = totals.setdefault(f"{frame.filename}:{frame.lineno}", [0, 0])
+            entry[0] += stat.size
+            entry[1] += stat.count
+    ranked = sorted(totals.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return [(location, size, count) for location, (size, count) in ranked]
+
+
+def build_report(
+    paths: List[Path], top: int = 20, sort: str = "cumulative", memory: bool = False
+) -> ProfileReport:
+    """Build a report over the dumps found in the given paths.
+
+    Args:
+        paths: Dump files or directories containing them.
+        top: Number of functions (and memory lines) to report.
+        sort: Function ranking key, "cumulative" or "tottime".
+        memory: Also aggregate tracemalloc snapshots.
+
+    Returns:
+        ProfileReport (with dumps_analyzed 0 if no dump was found).
+    """
+    report = ProfileReport()
+    dumps = find_dumps(paths)
+    if not dumps:
+        return report
+    report.dumps_analyzed = len(dumps)
+    report.total_ms, report.functions = aggregate_profiles(dumps, top, sort)
+    report.requests = read_manifests(paths)
+    if memory:
+        report.memory = aggregate_memory(find_dumps(paths, ".tracemalloc"), top)
+    return report
+
+
+def format_report(report: ProfileReport, sort: str = "cumulative") -> str:
+    """Format a report for humans.
+
+    Args:
+        report: Report to format.
+        sort: Ranking key the functions were sorted by.
+
+    Returns:
+        Multi-line report.
+    """
+    lines = [
+        "=" * 80,
+        "REQUEST PROFILE REPORT",
+        "=" * 80,
+        f"Dumps analyzed: {report.dumps_analyzed} ({report.total_ms:.1f}ms profiled)",
+        "",
+    ]
+    if report.requests:
+        lines.append("Slowest profiled requests:")
+        for record in report.requests[:10]:
+            line = (
+                f"  {record.get('elapsed_ms', 0):>10.1f}ms  {record.get('reason', '?'):<8} "
+                f"{record.get('request', '?')} {record.get('target', '')}"
+            )
+            if record.get("all_threads") and record.get("concurrent_requests"):
+                # The profile also contains the work of the concurrent requests
+                line += f" (+{record['concurrent_requests']} concurrent)"
+            lines.append(line)
+        lines.append("")
+
+    lines.append(f"Top functions by {sort} time:")
+    lines.append(f"  {'cumulative':>12} {'tottime':>12} {'calls':>9} {'dumps':>6}  function")
+    for stats in report.functions:
+        lines.append(
+            f"  {stats.cumulative_ms:>10.1f}ms {stats.tottime_ms:>10.1f}ms "
+            f"{stats.calls:>9} {stats.dumps:>6}  {stats.function}"
+        )
+
+    if report.memory:
+        lines.append("")
+        lines.append("Top lines by memory held at the end of profiled requests:")
+        for location, size, count in report.memory:
+            lines.append(f"  {size / 1024:>10.1f}KiB {count:>9} blocks  {location}")
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main entry point for the profile report tool.
+
+    Returns:
+        Exit code (0 for success, 1 for error).
+    """
+    parser = argparse.ArgumentParser(
+        description="Aggregate request profiles dumped by the cross-file context MCP server",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+    python profile_report.py ~/.cross_file_context/profiles/<session-id>/
+    python profile_report.py ~/.cross_file_context/profiles/ --top 30 --sort tottime
+        """,
+    )
+    parser.add_argument(
+        "paths",
+        nargs="+",
+        type=Path,
+        help="Profile dumps (.prof) or directories of them (searched recursively)",
+    )
+    parser.add_argument("--top", type=int, default=20, help="Number of functions to report")
+    parser.add_argument(
+        "--sort",
+        choices=SORT_KEYS,
+        default="cumulative",
+        help="Rank functions by cumulative or own time. Default: cumulative",
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="Also rank source lines over the tracemalloc snapshots",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output report as JSON instead of human-readable text",
+    )
+
+    args = parser.parse_args()
+
+    try:
+        report = build_report(args.paths, top=args.top, sort=args.sort, memory=args.memory)
+    except (OSError, ValueError, EOFError) as e:
+        print(f"Error reading profiles: {e}", file=sys.stderr)
+        return 1
+
+    if report.dumps_analyzed == 0:
+        print("No profile dumps found in the provided paths.", file=sys.stderr)
+        return 1
+
+    if args.json:
+        output = {
+            "dumps_analyzed": report.dumps_analyzed,
+            "total_ms": round(report.total_ms, 3),
+            "functions": [vars(stats) for stats in report.functions],
+            "requests": report.requests,
+            "memory": [
+                {"location": location, "bytes": size, "blocks": count}
+                for location, size, count in report.memory
+            ],
+        }
+        print(json.dumps(output, indent=2))
+    else:
+        print(format_report(report, args.sort))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
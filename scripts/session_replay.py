@@ -0,0 +1,514 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Replay recorded sessions against the service as a load generator.
+
+Reconstructs the file-read sequence of recorded sessions and replays it
+against CrossFileContextService, so cache and prefetch changes can be
+evaluated against real traffic instead of synthetic workloads.
+
+Recorded sessions are read from:
+- Injection logs ({data_root}/injections/*.jsonl, including rotated
+  segments): a read is a run of records for one target file with an
+  increasing context_token_total. Logs of the same session (one per UTC day)
+  are merged. Reads that injected no context leave no record and are not
+  replayed.
+- Claude Code session transcripts, parsed with
+  retrospective_analysis/session_analyzer.py: read_with_context,
+  read_many_with_context and Read calls of Python files.
+
+Features:
+- Multiple concurrent simulated agents sharing one service (sessions are
+  assigned to agents round-robin; with fewer sessions than agents, sessions
+  are replayed by several agents)
+- Time compression: the recorded gaps between reads are divided by --speed
+  (0 replays as fast as possible) and capped by --max-gap
+- Recorded paths under --rewrite-prefix are mapped into the replayed project
+- Reports latency distributions (all, first and repeated reads of a file),
+  throughput, and file, symbol and context cache hit rates
+
+Usage:
+    python scripts/session_replay.py ~/.cross_file_context/injections/ --project ~/src/app
+    python scripts/session_replay.py session.jsonl --project . --agents 4 --speed 20 --json
+    python scripts/session_replay.py injections/ --project . --rewrite-prefix /home/ci/app \\
+        --since 2025-12-01 --until 2025-12-08
+"""
+
+import argparse
+import json
+import logging
+import re
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+# Add src, scripts and the session analyzer to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "retrospective_analysis"))
+
+from mcp_latency_harness import summarize  # noqa: E402
+from session_analyzer import SessionAnalyzer  # noqa: E402
+
+from xfile_context.config import Config  # noqa: E402
+from xfile_context.log_segments import iter_log_lines, list_logs, parse_timestamp  # noqa: E402
+from xfile_context.service import CrossFileContextService  # noqa: E402
+
+# Read tools replayed from session transcripts
+MCP_READ_TOOL = "mcp__xfile_context__read_with_context"
+MCP_READ_MANY_TOOL = "mcp__xfile_context__read_many_with_context"
+DEFAULT_READ_TOOL = "Read"
+
+# Injection log names: <YYYY-MM-DD>-<session id>.jsonl
+_LOG_NAME_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}-(?P<session>.+)\.jsonl$")
+
+
+@dataclass
+class RecordedRead:
+    """A file read of a recorded session."""
+
+    timestamp: datetime
+    file_path: str
+
+
+@dataclass
+class RecordedSession:
+    """The file-read sequence of a recorded session.
+
+    Attributes:
+        session_id: Recorded session ID.
+        source: "injections" or "transcript".
+        reads: Reads in recorded order.
+    """
+
+    session_id: str
+    source: str
+    reads: List[RecordedRead] = field(default_factory=list)
+
+
+def is_injection_log(path: Path) -> bool:
+    """Check whether a JSONL file is an injection log (rather than a transcript)."""
+    for line in iter_log_lines(path):
+        if line.strip():
+            return bool(json.loads(line).get("event_type") == "context_injection")
+    return False
+
+
+def load_injection_reads(log_path: Path) -> List[RecordedRead]:
+    """Reconstruct the reads of an injection log, including its rotated segments.
+
+    Each read logs one record per injected snippet, with a running token
+    total, so a new read starts when the target file changes or the total
+    does not increase.
+
+    Args:
+        log_path: Path to the active log file.
+
+    Returns:
+        Reads in log order.
+    """
+    reads: List[RecordedRead] = []
+    previous_target = None
+    previous_total = 0
+    for line in iter_log_lines(log_path):
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        timestamp = parse_timestamp(record.get("timestamp"))
+        target = record.get("target_file")
+        if record.get("event_type") != "context_injection" or not target or timestamp is None:
+            continue
+        total = int(record.get("context_token_total") or 0)
+        if target != previous_target or total <= previous_total:
+            reads.append(RecordedRead(timestamp=timestamp, file_path=target))
+        previous_target = target
+        previous_total = total
+    return reads
+
+
+def load_transcript_session(path: Path) -> RecordedSession:
+    """Reconstruct the reads of a Claude Code session transcript.
+
+    Args:
+        path: Session transcript (.jsonl).
+
+    Returns:
+        The session's reads of Python files.
+    """
+    analyzer = SessionAnalyzer(path)
+    analyzer.parse()
+    session = RecordedSession(session_id=analyzer.session_id or path.stem, source="transcript")
+    for call in analyzer.tool_calls:
+        if call.tool_name == MCP_READ_MANY_TOOL:
+            file_paths = list(call.inputs.get("file_paths") or [])
+        elif call.tool_name in (MCP_READ_TOOL, DEFAULT_READ_TOOL):
+            file_paths = [call.get_file_path() or ""]
+        else:
+            continue
+        for file_path in file_paths:
+            if file_path.endswith(".py"):
+                session.reads.append(RecordedRead(timestamp=call.timestamp, file_path=file_path))
+    return session
+
+
+def load_sessions(inputs: List[Path]) -> List[RecordedSession]:
+    """Load recorded sessions from injection logs and session transcripts.
+
+    Args:
+        inputs: Log files, or directories of them.
+
+    Returns:
+        Sessions with at least one read, injection log days of one session merged.
+    """
+    logs: List[Path] = []
+    for path in inputs:
+        logs.extend(list_logs(path) if path.is_dir() else [path])
+
+    sessions: Dict[str, RecordedSession] = {}
+    for log_path in logs:
+        if is_injection_log(log_path):
+            match = _LOG_NAME_PATTERN.match(log_path.name)
+            session_id = match.group("session") if match else log_path.stem
+            session = sessions.setdefault(
+                f"injections:{session_id}", RecordedSession(session_id, "injections")
+            )
+            session.reads.extend(load_injection_reads(log_path))
+        else:
+            transcript = load_transcript_session(log_path)
+            sessions[f"transcript:{log_path}"] = transcript
+
+    for session in sessions.values():
+        session.reads.sort(key=lambda read: read.timestamp)
+    return [session for session in sessions.values() if session.reads]
+
+
+def filter_reads(
+    sessions: List[RecordedSession],
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> List[RecordedSession]:
+    """Keep the reads within [since, until], dropping sessions left without reads."""
+    for session in sessions:
+        session.reads = [
+            read
+            for read in session.reads
+            if (since is None or read.timestamp >= since)
+            and (until is None or read.timestamp <= until)
+        ]
+    return [session for session in sessions if session.reads]
+
+
+def rewrite_paths(sessions: List[RecordedSession], prefix: str, project_root: Path) -> None:
+    """Map recorded paths under prefix (the recorded project root) into project_root."""
+    prefix = prefix.rstrip("/")
+    for session in sessions:
+        for read in session.reads:
+            if read.file_path == prefix or read.file_path.startswith(prefix + "/"):
+                relative = read.file_path[len(prefix) :].lstrip("/")
+                read.file_path = str(project_root / relative)
+
+
+def schedule(reads: List[RecordedRead], speed: float, max_gap_s: float) -> List[float]:
+    """Compute when each read is issued, relative to the start of the replay.
+
+    Args:
+        reads: Recorded reads in order.
+        speed: Time compression factor (recorded gaps are divided by it);
+            0 issues every read as soon as the previous one finished.
+        max_gap_s: Longest recorded gap replayed (idle time is cut).
+
+    Returns:
+        Offset of each read in seconds.
+    """
+    offsets: List[float] = []
+    offset = 0.0
+    for i, read in enumerate(reads):
+        if i and speed > 0:
+            gap = (read.timestamp - reads[i - 1].timestamp).total_seconds()
+            offset += min(max(gap, 0.0), max_gap_s) / speed
+        offsets.append(offset)
+    return offsets
+
+
+def _hit_rate(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """Hits, misses and hit rate (0.0-1.0) between two cache statistics snapshots."""
+    hits = after["hits"] - before["hits"]
+    misses = after["misses"] - before["misses"]
+    return {
+        "hits": hits,
+        "misses": misses,
+        "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+    }
+
+
+class SessionReplay:
+    """Replays recorded sessions against a service from simulated agents.
+
+    Thread Safety:
+        Each agent runs on its own thread; results are collected under a lock.
+    """
+
+    def __init__(
+        self,
+        service: CrossFileContextService,
+        sessions: List[RecordedSession],
+        agents: int = 1,
+        speed: float = 0.0,
+        max_gap_s: float = 60.0,
+    ):
+        """Initialize the replay.
+
+        Args:
+            service: Service to replay reads against.
+            sessions: Recorded sessions, assigned to agents round-robin.
+            agents: Number of concurrent simulated agents.
+            speed: Time compression factor (0 = no waiting between reads).
+            max_gap_s: Longest recorded gap between reads that is replayed.
+        """
+        self._service = service
+        self._sessions = sessions
+        self._agents = max(1, agents)
+        self._speed = speed
+        self._max_gap_s = max_gap_s
+        self._lock = threading.Lock()
+        self._read_files: Set[str] = set()
+        self._latencies: Dict[str, List[float]] = {"first_read": [], "repeat_read": []}
+        self._errors: Dict[str, int] = {}
+
+    def run(self) -> Dict[str, Any]:
+        """Replay the sessions and report latencies and cache hit rates.
+
+        Returns:
+            Latency summaries (all, first_read, repeat_read), errors by type,
+            and file, symbol and context cache hit rates during the replay.
+        """
+        caches_before = self._cache_statistics()
+        assignments = [self._sessions[agent % len(self._sessions)] for agent in range(self._agents)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self._agents, thread_name_prefix="ReplayAgent") as pool:
+            for future in [pool.submit(self._replay, s, start) for s in assignments]:
+                future.result()
+        elapsed = time.perf_counter() - start
+        caches_after = self._cache_statistics()
+
+        errors = sum(self._errors.values())
+        all_reads = self._latencies["first_read"] + self._latencies["repeat_read"]
+        return {
+            "latency": {
+                "all": summarize(all_reads, errors, elapsed),
+                **{
+                    kind: summarize(samples, 0, elapsed)
+                    for kind, samples in self._latencies.items()
+                },
+            },
+            "errors": dict(sorted(self._errors.items())),
+            "cache_hit_rates": {
+                name: _hit_rate(caches_before[name], caches_after[name]) for name in caches_after
+            },
+        }
+
+    def _replay(self, session: RecordedSession, start: float) -> None:
+        """Issue the reads of one session on schedule (one simulated agent)."""
+        for read, offset in zip(
+            session.reads, schedule(session.reads, self._speed, self._max_gap_s)
+        ):
+            delay = start + offset - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            read_start = time.perf_counter()
+            try:
+                self._service.read_file_with_context(read.file_path)
+            except (OSError, ValueError) as e:
+                with self._lock:
+                    self._errors[type(e).__name__] = self._errors.get(type(e).__name__, 0) + 1
+                continue
+            elapsed_ms = (time.perf_counter() - read_start) * 1000
+            with self._lock:
+                kind = "repeat_read" if read.file_path in self._read_files else "first_read"
+                self._read_files.add(read.file_path)
+                self._latencies[kind].append(elapsed_ms)
+
+    def _cache_statistics(self) -> Dict[str, Dict[str, Any]]:
+        """Snapshot the hit and miss counts of the service's caches."""
+        return {
+            "file_cache": self._service.cache.get_statistics().to_dict(),
+            "symbol_cache": self._service.get_symbol_cache_statistics(),
+            "context_cache": self._service.get_context_cache_statistics(),
+        }
+
+
+def run_replay(
+    project_root: Path,
+    sessions: List[RecordedSession],
+    agents: int = 1,
+    speed: float = 0.0,
+    max_gap_s: float = 60.0,
+    analyze: bool = False,
+    data_root: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """Replay recorded sessions against a fresh service on a project.
+
+    Args:
+        project_root: Project to serve.
+        sessions: Recorded sessions to replay.
+        agents: Concurrent simulated agents.
+        speed: Time compression factor (0 = no waiting between reads).
+        max_gap_s: Longest recorded gap between reads that is replayed.
+        analyze: Analyze the whole project before the replay (otherwise files
+            are analyzed lazily by the replayed reads, as after a server start).
+        data_root: Service data root (default: a temporary directory, removed
+            after the replay, so replayed reads do not mix with real logs).
+
+    Returns:
+        Settings and the replay report.
+    """
+    with tempfile.TemporaryDirectory(prefix="xfile_context_replay_") as tmp:
+        service = CrossFileContextService(
+            Config(config_path=project_root / ".cross_file_context_links.yml"),
+            project_root=str(project_root),
+            data_root=data_root or Path(tmp),
+        )
+        try:
+            if analyze:
+                service.analyze_directory()
+            report = SessionReplay(service, sessions, agents, speed, max_gap_s).run()
+        finally:
+            service.shutdown()
+
+    return {
+        "settings": {
+            "project_root": str(project_root),
+            "sessions": [
+                {"session_id": s.session_id, "source": s.source, "reads": len(s.reads)}
+                for s in sessions
+            ],
+            "agents": agents,
+            "speed": speed,
+            "max_gap_s": max_gap_s,
+            "analyze": analyze,
+        },
+        **report,
+    }
+
+
+def format_report(result: Dict[str, Any]) -> str:
+    """Format a replay result for display."""
+    settings = result["settings"]
+    speed = f"{settings['speed']}x" if settings["speed"] else "unthrottled"
+    lines = [
+        f"Session replay: {len(settings['sessions'])} session(s), "
+        f"{settings['agents']} agent(s), {speed}",
+        "",
+        "Latency:",
+    ]
+    for kind, summary in result["latency"].items():
+        if "p50_ms" not in summary:
+            lines.append(f"  {kind:<12} no reads")
+            continue
+        lines.append(
+            f"  {kind:<12} {summary['requests']:>6} reads  p50 {summary['p50_ms']:.2f}ms  "
+            f"p95 {summary['p95_ms']:.2f}ms  p99 {summary['p99_ms']:.2f}ms  "
+            f"max {summary['max_ms']:.2f}ms"
+        )
+    lines.append(f"  Throughput:  {result['latency']['all']['throughput_rps']:.1f} reads/s")
+    lines.append("")
+    lines.append("Cache hit rates:")
+    for name, stats in result["cache_hit_rates"].items():
+        lines.append(
+            f"  {name:<14} {stats['hit_rate'] * 100:5.1f}%  "
+            f"({stats['hits']} hits, {stats['misses']} misses)"
+        )
+    if result["errors"]:
+        lines.append("")
+        lines.append("Errors: " + ", ".join(f"{k}: {v}" for k, v in result["errors"].items()))
+    return "\n".join(lines)
+
+
+def main() -> int:
+    """Main entry point for the session replay tool.
+
+    Returns:
+        Exit code (0 for success, 1 for errors).
+    """
+    parser = argparse.ArgumentParser(
+        description="Replay recorded sessions against the service",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "logs",
+        nargs="+",
+        type=Path,
+        help="Injection logs or session transcripts (.jsonl), or directories of them",
+    )
+    parser.add_argument("--project", type=Path, required=True, help="Project to replay against")
+    parser.add_argument(
+        "--rewrite-prefix",
+        help="Recorded project root; paths under it are mapped into --project",
+    )
+    parser.add_argument("--agents", type=int, default=1, help="Concurrent agents. Default: 1")
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=0.0,
+        help="Time compression factor (0 = as fast as possible). Default: 0",
+    )
+    parser.add_argument(
+        "--max-gap",
+        type=float,
+        default=60.0,
+        help="Longest recorded gap between reads in seconds. Default: 60",
+    )
+    parser.add_argument(
+        "--analyze", action="store_true", help="Analyze the project before replaying"
+    )
+    parser.add_argument("--since", help="Replay reads at or after this date/time")
+    parser.add_argument("--until", help="Replay reads at or before this date/time")
+    parser.add_argument("--data-root", type=Path, help="Service data root (default: temporary)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+    args = parser.parse_args()
+
+    # The service logs every analysis at INFO level
+    logging.basicConfig(level=logging.WARNING)
+
+    since = parse_timestamp(args.since) if args.since else None
+    until = parse_timestamp(args.until) if args.until else None
+    if (args.since and since is None) or (args.until and until is None):
+        print("Error: --since/--until must be ISO 8601 dates or timestamps", file=sys.stderr)
+        return 1
+
+    project_root = args.project.resolve()
+    try:
+        sessions = filter_reads(load_sessions(args.logs), since, until)
+        if not sessions:
+            print("Error: No reads found in the recorded sessions", file=sys.stderr)
+            return 1
+        if args.rewrite_prefix:
+            rewrite_paths(sessions, args.rewrite_prefix, project_root)
+        result = run_replay(
+            project_root,
+            sessions,
+            agents=args.agents,
+            speed=args.speed,
+            max_gap_s=args.max_gap,
+            analyze=args.analyze,
+            data_root=args.data_root,
+        )
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        print(format_report(result))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
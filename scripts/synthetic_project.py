@@ -0,0 +1,285 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Seeded synthetic Python project generator for benchmarks.
+
+Generates reproducible projects of any size (up to MAX_FILES modules) with a
+controlled import structure, so benchmarks measure the same work on every
+machine and run.
+
+Features:
+- Deterministic: the same ProjectSpec (including its seed) always produces
+  byte-identical files
+- Packages nested up to a configurable depth, each with an __init__.py
+- Configurable import fan-out: each module imports functions from that many
+  earlier modules (mostly nearby ones, like real layered code) and calls them
+- Import cycles: a configurable fraction of modules also import a later module
+- Configurable file size (functions per module, lines per function)
+- Edits that keep a module's imports, and branch-switch churn (rewritten,
+  created and deleted modules)
+
+Usage:
+    from synthetic_project import ProjectSpec, generate_project
+    project = generate_project(Path("/tmp/project"), ProjectSpec(files=5000, seed=7))
+    project.modules  # module paths in generation order
+"""
+
+import random
+import shutil
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Largest supported project
+MAX_FILES = 20_000
+
+# Standard library modules imported by generated modules
+_STDLIB_IMPORTS = ("os", "json", "logging", "re", "typing")
+
+
+@dataclass
+class ProjectSpec:
+    """Shape of a synthetic project.
+
+    Attributes:
+        files: Number of modules (1 to MAX_FILES), not counting __init__.py files.
+        fan_out: Imports of other project modules per module.
+        depth: Package nesting depth (0 = all modules at the project root).
+        packages_per_level: Subpackages per package.
+        cycle_ratio: Fraction of modules that also import a later module,
+            closing an import cycle.
+        functions_per_file: Functions defined per module.
+        lines_per_function: Body lines per function.
+        seed: Random seed of the import structure and edits.
+    """
+
+    files: int = 1000
+    fan_out: int = 5
+    depth: int = 3
+    packages_per_level: int = 4
+    cycle_ratio: float = 0.02
+    functions_per_file: int = 10
+    lines_per_function: int = 4
+    seed: int = 42
+
+    def validate(self) -> None:
+        """Check that the spec describes a project that can be generated.
+
+        Raises:
+            ValueError: If a value is out of range.
+        """
+        if not 1 <= self.files <= MAX_FILES:
+            raise ValueError(f"files must be between 1 and {MAX_FILES}, got {self.files}")
+        if self.fan_out < 0 or self.depth < 0 or self.packages_per_level < 1:
+            raise ValueError("fan_out and depth must be >= 0 and packages_per_level >= 1")
+        if not 0.0 <= self.cycle_ratio <= 1.0:
+            raise ValueError(f"cycle_ratio must be between 0 and 1, got {self.cycle_ratio}")
+        if self.functions_per_file < 1 or self.lines_per_function < 1:
+            raise ValueError("functions_per_file and lines_per_function must be >= 1")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return asdict(self)
+
+
+@dataclass
+class SyntheticProject:
+    """A generated project.
+
+    Attributes:
+        root: Project root directory.
+        spec: Spec the project was generated from.
+        modules: Absolute module paths in generation order (module i may
+            import modules before it, and later ones through cycles).
+        dependencies: Indices of the modules each module imports.
+        relationships: Number of project-internal imports written.
+    """
+
+    root: Path
+    spec: ProjectSpec
+    modules: List[str] = field(default_factory=list)
+    dependencies: List[List[int]] = field(default_factory=list)
+    relationships: int = 0
+
+
+@dataclass
+class BranchSwitch:
+    """Module paths changed by switch_branch()."""
+
+    changed: List[str] = field(default_factory=list)
+    created: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+
+def _module_name(index: int) -> str:
+    return f"module_{index}"
+
+
+def _package_parts(index: int, spec: ProjectSpec) -> List[str]:
+    """Package path of a module: consecutive modules share packages."""
+    parts = []
+    bucket = index
+    for level in reversed(range(spec.depth)):
+        bucket //= spec.packages_per_level
+        parts.append(f"pkg{level}_{bucket % spec.packages_per_level}")
+    return parts[::-1]
+
+
+def _import_path(index: int, spec: ProjectSpec) -> str:
+    return ".".join(_package_parts(index, spec) + [_module_name(index)])
+
+
+def _module_path(root: Path, index: int, spec: ProjectSpec) -> Path:
+    return root.joinpath(*_package_parts(index, spec), f"{_module_name(index)}.py")
+
+
+def _pick_dependencies(index: int, spec: ProjectSpec, rng: random.Random) -> List[int]:
+    """Earlier modules imported by a module, mostly from its neighborhood."""
+    if index == 0 or spec.fan_out == 0:
+        return []
+    picks = set()
+    for _ in range(min(spec.fan_out, index)):
+        if rng.random() < 0.7:
+            # Nearby module (same or adjacent package)
+            picks.add(max(0, index - 1 - int(rng.expovariate(1 / 8))))
+        else:
+            picks.add(rng.randrange(index))
+    return sorted(picks)
+
+
+def render_module(index: int, spec: ProjectSpec, dependencies: List[int], revision: int = 0) -> str:
+    """Render the source of a module.
+
+    Args:
+        index: Module index.
+        spec: Project spec.
+        dependencies: Indices of the modules it imports.
+        revision: Edit revision; changes function bodies, not the interface.
+
+    Returns:
+        Module source.
+    """
+    lines = [f'"""Synthetic module {index} (revision {revision})."""', ""]
+    lines.append(f"import {_STDLIB_IMPORTS[index % len(_STDLIB_IMPORTS)]}")
+    for dep in dependencies:
+        lines.append(f"from {_import_path(dep, spec)} import func_{dep}_0")
+    lines.append("")
+    for f in range(spec.functions_per_file):
+        lines.append("")
+        lines.append(f"def func_{index}_{f}(value):")
+        lines.append(f'    """Function {f} of module {index}."""')
+        for line in range(spec.lines_per_function - 1):
+            lines.append(f"    value = value + {line + revision}")
+        if f == 0 and dependencies:
+            calls = " + ".join(f"func_{dep}_0(value)" for dep in dependencies[:3])
+            lines.append(f"    return value + {calls}")
+        else:
+            lines.append("    return value")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def generate_project(root: Path, spec: ProjectSpec) -> SyntheticProject:
+    """Write a synthetic project below root.
+
+    Args:
+        root: Project directory (created if missing, must be empty).
+        spec: Project shape.
+
+    Returns:
+        The generated project.
+
+    Raises:
+        ValueError: If the spec is invalid or root is not empty.
+    """
+    spec.validate()
+    root.mkdir(parents=True, exist_ok=True)
+    if any(root.iterdir()):
+        raise ValueError(f"Project directory is not empty: {root}")
+
+    rng = random.Random(spec.seed)
+    dependencies = [_pick_dependencies(i, spec, rng) for i in range(spec.files)]
+    # Cycles: an import of a later module, which (transitively) imports this one
+    for i in range(spec.files - 1):
+        if rng.random() < spec.cycle_ratio:
+            later = rng.randrange(i + 1, min(spec.files, i + 1 + 8 * max(spec.fan_out, 1)))
+            dependencies[i].append(later)
+
+    project = SyntheticProject(root=root, spec=spec, dependencies=dependencies)
+    for i in range(spec.files):
+        path = _module_path(root, i, spec)
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True)
+            for parent in [path.parent, *path.parent.parents]:
+                if parent == root:
+                    break
+                (parent / "__init__.py").touch()
+        path.write_text(render_module(i, spec, dependencies[i]), encoding="utf-8")
+        project.modules.append(str(path))
+        project.relationships += len(dependencies[i])
+
+    return project
+
+
+def edit_module(project: SyntheticProject, index: int, revision: int) -> str:
+    """Rewrite a module with new function bodies and the same imports.
+
+    Args:
+        project: Generated project.
+        index: Module index.
+        revision: Edit revision (use a new one for each edit of a module).
+
+    Returns:
+        Path of the edited module.
+    """
+    path = project.modules[index]
+    Path(path).write_text(
+        render_module(index, project.spec, project.dependencies[index], revision),
+        encoding="utf-8",
+    )
+    return path
+
+
+def switch_branch(
+    project: SyntheticProject, fraction: float, revision: int, rng: random.Random
+) -> BranchSwitch:
+    """Apply the file changes of a branch switch touching a fraction of the modules.
+
+    Of the touched modules, 60% are rewritten, 20% are deleted, and as many
+    new modules as 20% of them are created (importing existing modules).
+    Imports of deleted modules are left dangling, as after a real checkout.
+
+    Args:
+        project: Generated project; new modules are appended to its modules.
+        fraction: Fraction of the modules to touch (0-1).
+        revision: Edit revision of the rewritten modules.
+        rng: Random generator choosing the modules.
+
+    Returns:
+        The changed, created and deleted module paths.
+    """
+    live = [i for i, path in enumerate(project.modules) if Path(path).exists()]
+    touched = rng.sample(live, min(len(live), int(len(project.modules) * fraction)))
+    switch = BranchSwitch()
+    for n, index in enumerate(touched):
+        if n % 5 < 3:
+            switch.changed.append(edit_module(project, index, revision))
+        elif n % 5 == 3:
+            Path(project.modules[index]).unlink()
+            switch.deleted.append(project.modules[index])
+        else:
+            new_index = len(project.modules)
+            dependencies = sorted(rng.sample(live, min(len(live), project.spec.fan_out)))
+            path = project.root / f"{_module_name(new_index)}.py"
+            path.write_text(
+                render_module(new_index, project.spec, dependencies, revision), encoding="utf-8"
+            )
+            project.modules.append(str(path))
+            project.dependencies.append(dependencies)
+            switch.created.append(str(path))
+    return switch
+
+
+def remove_project(project: SyntheticProject) -> None:
+    """Delete a generated project."""
+    shutil.rmtree(project.root, ignore_errors=True)
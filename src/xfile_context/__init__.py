@@ -5,12 +5,15 @@
 
 from xfile_context.cache import WorkingMemoryCache
 from xfile_context.config import Config
+from xfile_context.io_counters import IOCounters, track_io
 from xfile_context.metrics_collector import (
     MetricsCollector,
     SessionMetrics,
     calculate_percentile_statistics,
+    calculate_sketch_statistics,
     read_session_metrics,
 )
+from xfile_context.quantile_sketch import QuantileSketch
 from xfile_context.query_api import QueryAPI
 from xfile_context.service import CrossFileContextService, ReadResult
 from xfile_context.storage import GraphExport, InMemoryStore, RelationshipStore
@@ -29,9 +32,13 @@ __all__ = [
     "ReadResult",
     "Config",
     "MetricsCollector",
+    "IOCounters",
+    "track_io",
     "SessionMetrics",
     "calculate_percentile_statistics",
+    "calculate_sketch_statistics",
     "read_session_metrics",
+    "QuantileSketch",
     "QueryAPI",
     "StructuredWarning",
     "WarningEmitter",
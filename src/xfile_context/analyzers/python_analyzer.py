@@ -19,10 +19,11 @@ import concurrent.futures
 import logging
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 from xfile_context.detectors.dynamic_pattern_detector import DynamicPatternDetector
 from xfile_context.detectors.registry import DetectorRegistry
+from xfile_context.io_counters import IO_READ, IO_STAT, count_io
 from xfile_context.models import (
     FileMetadata,
     FileSymbolData,
@@ -158,12 +159,14 @@ class PythonAnalyzer:
         try:
             # Check file exists and size limits (EC-17)
             path = Path(filepath)
+            count_io(IO_STAT)
             if not path.exists():
                 logger.error(f"File not found: {filepath}")
                 return None
 
             # Check file size in bytes to prevent memory exhaustion from files
             # with extremely long lines (security: memory exhaustion attack)
+            count_io(IO_STAT)
             file_size = path.stat().st_size
             if file_size > self.MAX_FILE_SIZE_BYTES:
                 logger.warning(
@@ -173,6 +176,7 @@ class PythonAnalyzer:
                 return None
 
             # Count lines before reading entire file
+            count_io(IO_READ)
             with open(filepath, encoding="utf-8", errors="ignore") as f:
                 line_count = sum(1 for _ in f)
 
@@ -184,12 +188,14 @@ class PythonAnalyzer:
                 return None
 
             # Try UTF-8 encoding first
+            count_io(IO_READ)
             try:
                 with open(filepath, encoding="utf-8") as f:
                     return f.read()
             except UnicodeDecodeError:
                 # Fallback to latin-1 (accepts all byte values)
                 logger.warning(f"⚠️ File {filepath} is not UTF-8, using latin-1 fallback encoding")
+                count_io(IO_READ)
                 with open(filepath, encoding="latin-1") as f:
                     return f.read()
 
@@ -310,7 +316,9 @@ class PythonAnalyzer:
 
         return all_relationships
 
-    def _store_relationships(self, filepath: str, relationships: List[Relationship]) -> None:
+    def _store_relationships(
+        self, filepath: str, relationships: List[Relationship], replace_existing: bool = True
+    ) -> None:
         """Store detected relationships in graph.
 
         Implements relationship storage stage from TDD Section 3.5.1.
@@ -318,6 +326,8 @@ class PythonAnalyzer:
         Args:
             filepath: Path to file that was analyzed.
             relationships: List of detected relationships to store.
+            replace_existing: Remove the file's existing relationships first. Batch
+                callers pass False after removing relationships for all files at once.
 
         Side Effects:
             - Adds relationships to self.graph
@@ -325,7 +335,8 @@ class PythonAnalyzer:
             - Deduplicates relationships automatically (graph handles this)
         """
         # Remove old relationships for this file (incremental update)
-        self.graph.remove_relationships_for_file(filepath)
+        if replace_existing:
+            self.graph.remove_relationships_for_file(filepath)
 
         # Add new relationships
         for rel in relationships:
@@ -418,6 +429,48 @@ class PythonAnalyzer:
         Returns:
             FileSymbolData containing all symbols, or None if file couldn't be parsed.
         """
+        return self._symbols_from_module(filepath, self._load_module(filepath))
+
+    def extract_symbols_batch(
+        self, filepaths: List[str], max_workers: int = 1
+    ) -> Dict[str, Optional[FileSymbolData]]:
+        """Extract FileSymbolData for many files (Phase 1 for a batch of files).
+
+        Files are read and parsed on up to max_workers threads. The symbol walk
+        runs serially afterwards because detectors keep per-file state
+        (import maps, cached file paths) and are not thread-safe.
+
+        Args:
+            filepaths: Absolute paths to Python files.
+            max_workers: Number of threads for reading and parsing (1 = serial).
+
+        Returns:
+            Dict mapping each filepath to its FileSymbolData (None if the file
+            couldn't be read), in input order.
+        """
+        if max_workers > 1 and len(filepaths) > 1:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="xfile-parse"
+            ) as executor:
+                modules = list(executor.map(self._load_module, filepaths))
+        else:
+            modules = [self._load_module(filepath) for filepath in filepaths]
+
+        return {
+            filepath: self._symbols_from_module(filepath, module)
+            for filepath, module in zip(filepaths, modules)
+        }
+
+    def _load_module(self, filepath: str) -> Union[ast.Module, FileSymbolData, None]:
+        """Read and parse a file for symbol extraction.
+
+        Args:
+            filepath: Absolute path to Python file.
+
+        Returns:
+            The parsed module, an invalid FileSymbolData if parsing failed, or
+            None if the file couldn't be read.
+        """
         # Stage 1: File Reading
         file_content = self._read_file(filepath)
         if file_content is None:
@@ -445,9 +498,17 @@ class PythonAnalyzer:
                 is_valid=False,
                 error_message=f"AST parsing timeout ({self.timeout_seconds}s)",
             )
+        return module_ast
+
+    def _symbols_from_module(
+        self, filepath: str, module: Union[ast.Module, FileSymbolData, None]
+    ) -> Optional[FileSymbolData]:
+        """Run symbol extraction on a loaded module (see _load_module)."""
+        if not isinstance(module, ast.Module):
+            return module
 
         # Stage 3: Symbol Extraction
-        definitions, references = self._extract_symbols(filepath, module_ast)
+        definitions, references = self._extract_symbols(filepath, module)
 
         # Collect dynamic pattern info
         dynamic_pattern_types = self._collect_dynamic_patterns()
@@ -540,6 +601,28 @@ class PythonAnalyzer:
         if symbol_data is None:
             symbol_data = self.extract_file_symbols(filepath)
 
+        return self.apply_symbol_data(filepath, symbol_data, relationship_builder)
+
+    def apply_symbol_data(
+        self,
+        filepath: str,
+        symbol_data: Optional[FileSymbolData],
+        relationship_builder: Optional[RelationshipBuilder] = None,
+        replace_existing: bool = True,
+    ) -> bool:
+        """Build and store relationships from extracted symbol data (Phase 2).
+
+        Args:
+            filepath: Absolute path to the analyzed Python file.
+            symbol_data: FileSymbolData from Phase 1 (None if the file couldn't be read).
+            relationship_builder: Optional RelationshipBuilder to use for cross-file resolution.
+                                  If None, creates a single-file builder (less accurate).
+            replace_existing: Remove the file's existing relationships before storing
+                the new ones (False when the caller already removed them).
+
+        Returns:
+            True if relationships were stored, False if the file was skipped or invalid.
+        """
         if symbol_data is None:
             return False
 
@@ -566,7 +649,7 @@ class PythonAnalyzer:
         relationships = relationship_builder.build_relationships_for_file(filepath)
 
         # Store relationships in graph
-        self._store_relationships(filepath, relationships)
+        self._store_relationships(filepath, relationships, replace_existing=replace_existing)
 
         return True
 
@@ -637,10 +720,14 @@ class PythonAnalyzer:
         if cache_hits > 0:
             logger.debug(f"Symbol cache: {cache_hits} hits out of {len(filepaths)} files")
 
-        # Phase 2: Build relationships for all files with cross-file resolution
+        # Phase 2: Build relationships for all files with cross-file resolution.
+        # Old relationships are removed in one pass up front: removing them per
+        # file would be O(files x relationships) and would also drop edges that
+        # files stored earlier in this loop have to files stored later.
+        self.graph.remove_relationships_for_files(set(symbol_data_map))
         for filepath in symbol_data_map:
             relationships = relationship_builder.build_relationships_for_file(filepath)
-            self._store_relationships(filepath, relationships)
+            self._store_relationships(filepath, relationships, replace_existing=False)
             success_count += 1
 
         return (success_count, failed_count, relationship_builder)
@@ -687,6 +774,7 @@ class PythonAnalyzer:
                 continue
 
             # Skip if file doesn't exist
+            count_io(IO_STAT)
             if not Path(target_file).exists():
                 continue
 
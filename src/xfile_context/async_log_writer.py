@@ -0,0 +1,315 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Background writer for JSONL event logs.
+
+InjectionLogger and WarningLogger write one JSON line per event. Written
+synchronously, every event costs a json.dumps() and a flush() on the request
+path, up to ten times per read. With an AsyncLogWriter the request path only
+appends the event to a bounded queue; a background thread serializes and
+writes queued events in batches and flushes them per a durability policy.
+
+Key features:
+- Bounded queue: memory stays bounded if the disk falls behind
+- Batching: everything queued since the last write is serialized and written
+  with one call
+- Durability policy: flush every N events, every T milliseconds, or only when
+  flushed explicitly or closed (both limits 0); close() always drains the queue
+- Backpressure: when the queue is full, the request path waits up to a
+  configured time for space, then drops the event; waits and drops are counted
+- flush() waits until every event queued before the call is written and
+  flushed (read-your-writes for log queries)
+
+Usage:
+    writer = AsyncLogWriter(
+        serialize=lambda event: json.dumps(event.to_dict()),
+        write_lines=write_lines,
+        flush=flush_file,
+        policy=LogWritePolicy(flush_every_events=100, flush_interval_ms=200),
+        name="injections",
+    )
+    writer.submit(event)  # Returns immediately
+    writer.flush()  # Wait until the event is on disk
+    writer.close()
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class LogWritePolicy:
+    """Queue bounds and durability policy for an AsyncLogWriter.
+
+    Attributes:
+        flush_every_events: Flush after this many events were written since
+            the last flush (0 disables).
+        flush_interval_ms: Flush written events at most this long after they
+            were written (0 disables).
+        max_queue_events: Maximum number of queued events.
+        max_block_ms: Maximum time the request path waits for queue space
+            before dropping an event (0 drops immediately).
+    """
+
+    flush_every_events: int = 100
+    flush_interval_ms: int = 200
+    max_queue_events: int = 10000
+    max_block_ms: int = 100
+
+
+class AsyncLogWriter:
+    """Serializes and writes log events on a background thread.
+
+    The writer is agnostic of the log format and file handling: the owning
+    logger supplies callbacks, which run on the writer thread only.
+
+    Thread Safety:
+        All public methods are thread-safe. Events from all threads are
+        written in the order they were queued.
+    """
+
+    def __init__(
+        self,
+        serialize: Callable[[Any], str],
+        write_lines: Callable[[List[str], List[Any]], None],
+        flush: Callable[[], None],
+        policy: Optional[LogWritePolicy] = None,
+        name: str = "log",
+    ) -> None:
+        """Initialize the writer and start its thread.
+
+        Args:
+            serialize: Converts a queued event to one line (without newline).
+            write_lines: Writes serialized lines (newline-terminated). Also
+                receives the events the lines were serialized from.
+            flush: Flushes written lines to the file.
+            policy: Queue bounds and durability policy. Defaults to
+                LogWritePolicy().
+            name: Name used for the thread and log messages.
+        """
+        self._serialize = serialize
+        self._write_lines = write_lines
+        self._flush = flush
+        self._policy = policy or LogWritePolicy()
+        self._name = name
+
+        self._condition = threading.Condition(threading.Lock())
+        self._queue: Deque[Any] = deque()
+        self._closing = False
+        self._flush_requested = False
+
+        # Sequence numbers: events queued so far, and events written and flushed
+        self._queued_seq = 0
+        self._durable_seq = 0
+
+        # Statistics
+        self._events_queued = 0
+        self._events_written = 0
+        self._events_dropped = 0
+        self._blocked_submits = 0
+        self._blocked_ms = 0.0
+        self._max_queue_depth = 0
+        self._batches = 0
+        self._flushes = 0
+        self._write_errors = 0
+
+        self._thread = threading.Thread(
+            target=self._run, name=f"AsyncLogWriter-{name}", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, event: Any) -> bool:
+        """Queue an event for writing.
+
+        If the queue is full, waits up to policy.max_block_ms for space and
+        then drops the event (counted in events_dropped).
+
+        Args:
+            event: Event to write (passed to serialize on the writer thread).
+
+        Returns:
+            False if the writer is closed (the caller should write the event
+            itself), True otherwise, including when the event was dropped.
+        """
+        with self._condition:
+            if self._closing:
+                return False
+            if len(self._queue) >= self._policy.max_queue_events:
+                self._blocked_submits += 1
+                start = time.monotonic()
+                deadline = start + self._policy.max_block_ms / 1000
+                while len(self._queue) >= self._policy.max_queue_events and not self._closing:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                self._blocked_ms += (time.monotonic() - start) * 1000
+                if self._closing:
+                    return False
+                if len(self._queue) >= self._policy.max_queue_events:
+                    self._events_dropped += 1
+                    if self._events_dropped == 1:
+                        logger.warning(f"{self._name} log queue full, dropping events")
+                    return True
+
+            self._queue.append(event)
+            self._queued_seq += 1
+            self._events_queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, len(self._queue))
+            if len(self._queue) == 1:
+                self._condition.notify_all()
+            return True
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until all events queued before the call are written and flushed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if the events are flushed, False if the wait timed out.
+        """
+        with self._condition:
+            target = self._queued_seq
+            if self._durable_seq >= target:
+                return True
+            self._flush_requested = True
+            self._condition.notify_all()
+            return self._condition.wait_for(lambda: self._durable_seq >= target, timeout)
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Write and flush all queued events, then stop the writer thread.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to finish.
+        """
+        with self._condition:
+            self._closing = True
+            self._condition.notify_all()
+        self._thread.join(timeout=timeout)
+
+    def is_closed(self) -> bool:
+        """Check whether close() was called."""
+        with self._condition:
+            return self._closing
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get queueing, batching and backpressure statistics.
+
+        Returns:
+            Dictionary with events_queued, events_written, events_dropped,
+            blocked_submits (submits that waited for queue space), blocked_ms
+            (total time spent waiting), queue_depth, max_queue_depth, batches,
+            flushes and write_errors.
+        """
+        with self._condition:
+            return {
+                "events_queued": self._events_queued,
+                "events_written": self._events_written,
+                "events_dropped": self._events_dropped,
+                "blocked_submits": self._blocked_submits,
+                "blocked_ms": round(self._blocked_ms, 3),
+                "queue_depth": len(self._queue),
+                "max_queue_depth": self._max_queue_depth,
+                "batches": self._batches,
+                "flushes": self._flushes,
+                "write_errors": self._write_errors,
+            }
+
+    def _wait_for_work(self, flush_deadline: Optional[float]) -> List[Any]:
+        """Wait until there is something to do and take the queued events.
+
+        Returns when events are queued, a flush or close was requested, or the
+        flush deadline passed.
+        """
+        with self._condition:
+            while not (self._queue or self._closing or self._flush_requested):
+                if flush_deadline is None:
+                    self._condition.wait()
+                    continue
+                remaining = flush_deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self._condition.wait(remaining)
+            batch = list(self._queue)
+            self._queue.clear()
+            if batch:
+                # Wake request threads waiting for queue space
+                self._condition.notify_all()
+            return batch
+
+    def _run(self) -> None:
+        """Write queued events in batches until closed and drained."""
+        policy = self._policy
+        unflushed = 0  # Events written since the last flush
+        written_seq = 0  # Sequence number of the last event written
+        flush_deadline: Optional[float] = None
+
+        while True:
+            batch = self._wait_for_work(flush_deadline)
+
+            if batch:
+                lines = []
+                events = []
+                errors = 0
+                for event in batch:
+                    try:
+                        lines.append(self._serialize(event) + "\n")
+                        events.append(event)
+                    except Exception as e:
+                        errors += 1
+                        logger.warning(f"Failed to serialize {self._name} log event: {e}")
+                try:
+                    self._write_lines(lines, events)
+                except Exception as e:
+                    errors += 1
+                    logger.warning(f"Failed to write {len(lines)} {self._name} log events: {e}")
+                if errors:
+                    with self._condition:
+                        self._write_errors += errors
+                unflushed += len(batch)
+                written_seq += len(batch)
+                if flush_deadline is None and policy.flush_interval_ms > 0:
+                    flush_deadline = time.monotonic() + policy.flush_interval_ms / 1000
+
+            with self._condition:
+                flush_requested = self._flush_requested
+                if not self._queue:
+                    # Events queued after the batch was taken are part of the
+                    # requested flush too
+                    self._flush_requested = False
+                closing = self._closing and not self._queue
+                self._events_written += len(batch)
+                if batch:
+                    self._batches += 1
+
+            flush_due = unflushed > 0 and (
+                flush_requested
+                or closing
+                or (policy.flush_every_events > 0 and unflushed >= policy.flush_every_events)
+                or (flush_deadline is not None and time.monotonic() >= flush_deadline)
+            )
+            if flush_due:
+                try:
+                    self._flush()
+                except Exception as e:
+                    with self._condition:
+                        self._write_errors += 1
+                    logger.warning(f"Failed to flush {self._name} log: {e}")
+                unflushed = 0
+                flush_deadline = None
+
+            with self._condition:
+                if flush_due:
+                    self._flushes += 1
+                if unflushed == 0:
+                    self._durable_seq = written_seq
+                    self._condition.notify_all()
+                if closing:
+                    return
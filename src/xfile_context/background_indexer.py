@@ -0,0 +1,338 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Background project indexing with read-driven priorities.
+
+Analysis is lazy by default (Issue #114): the first read of a file pays for
+analyzing it and its transitive dependencies. The background indexer warms the
+graph up instead. It walks the project once and analyzes files one at a time
+from a priority queue while the session is otherwise idle.
+
+Key features:
+- Priority queue: files requested by reads go first, then idle files with
+  the most recently modified first (the files a session is likely to touch)
+- Promotion: ensure_indexed() moves a file to the front and waits for it, so
+  reads and the indexer share one work path instead of analyzing the same
+  files twice
+- One file per step: the indexer releases the service's lock between files,
+  so reads never wait for more than one file's analysis
+- Files already analyzed by someone else (e.g. a read that timed out waiting
+  and analyzed the file itself) are skipped, not analyzed again
+- Progress reporting for the Query API
+
+Usage:
+    indexer = BackgroundIndexer(
+        discover=lambda: scan_files(...).files,
+        index_file=service_analyze,
+        needs_indexing=service_needs_analysis,
+    )
+    indexer.start()
+    indexer.ensure_indexed("/project/main.py", timeout=5.0)
+    indexer.get_progress()
+"""
+
+import heapq
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Queue tiers (lower runs first)
+PRIORITY_REQUESTED = 0  # Needed by a read right now
+PRIORITY_IDLE = 1  # Discovered by the project walk
+
+# Progress states
+STATE_STOPPED = "stopped"
+STATE_DISCOVERING = "discovering"
+STATE_INDEXING = "indexing"
+STATE_COMPLETE = "complete"
+
+# Queue entry: (tier, order within tier, sequence number, path)
+_QueueEntry = Tuple[int, float, int, str]
+
+
+class BackgroundIndexer:
+    """Analyzes project files on a background thread in priority order.
+
+    The indexer is agnostic of how files are analyzed: the service supplies
+    callbacks that take its own locks.
+
+    Thread Safety:
+        All public methods are thread-safe. Callbacks run on the indexer
+        thread only, one at a time.
+    """
+
+    def __init__(
+        self,
+        discover: Callable[[], List[str]],
+        index_file: Callable[[str], bool],
+        needs_indexing: Callable[[str], bool],
+    ):
+        """Initialize the indexer.
+
+        Args:
+            discover: Returns the project files to index. Called once on the
+                indexer thread.
+            index_file: Analyzes a file (and whatever it depends on). Returns
+                False if analysis failed.
+            needs_indexing: Returns True if a file has not been analyzed since
+                it last changed.
+        """
+        self._discover = discover
+        self._index_file = index_file
+        self._needs_indexing = needs_indexing
+
+        self._condition = threading.Condition(threading.Lock())
+        self._queue: List[_QueueEntry] = []
+        self._queued_tier: Dict[str, int] = {}  # Best queued tier per path
+        self._done: Set[str] = set()
+        self._discovered_files: Set[str] = set()
+        self._done_events: Dict[str, threading.Event] = {}
+        # Waiters completed by the run in progress (registered before it started)
+        self._running_event: Optional[threading.Event] = None
+        self._sequence = 0
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = False
+        self._state = STATE_STOPPED
+        self._discovered = False
+
+        # Statistics
+        self._files_indexed = 0
+        self._files_skipped = 0
+        self._files_failed = 0
+        self._promotions = 0
+        self._started_at: Optional[float] = None
+        self._completed_at: Optional[float] = None
+
+    def start(self) -> None:
+        """Start indexing on a daemon thread (no-op if already running)."""
+        with self._condition:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop = False
+            self._state = STATE_DISCOVERING
+            self._started_at = time.monotonic()
+            self._thread = threading.Thread(target=self._run, name="BackgroundIndexer", daemon=True)
+            self._thread.start()
+        logger.info("Background indexing started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the indexer thread after the file in progress.
+
+        Args:
+            timeout: Maximum seconds to wait for the thread to finish.
+        """
+        with self._condition:
+            thread = self._thread
+            if thread is None:
+                return
+            self._stop = True
+            self._condition.notify_all()
+        thread.join(timeout=timeout)
+        with self._condition:
+            self._thread = None
+            self._state = STATE_STOPPED
+            # Wake readers waiting on files that will not be indexed now
+            for event in self._done_events.values():
+                event.set()
+            self._done_events = {}
+            if self._running_event is not None:
+                self._running_event.set()
+        logger.info("Background indexing stopped")
+
+    def is_running(self) -> bool:
+        """Check whether the indexer thread is running."""
+        with self._condition:
+            return self._thread is not None and not self._stop
+
+    def ensure_indexed(self, path: str, timeout: Optional[float] = None) -> bool:
+        """Promote a file and wait until the indexer has processed it.
+
+        Args:
+            path: File needed by a read.
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if the indexer processed the file. False if the indexer is not
+            running or the wait timed out; the caller should then analyze the
+            file itself.
+        """
+        with self._condition:
+            if self._thread is None or self._stop:
+                return False
+            event = self._done_events.get(path)
+            if event is None:
+                event = threading.Event()
+                self._done_events[path] = event
+            # A read always re-runs the file's analysis step, even if it was
+            # indexed before (its dependencies may have changed since) or is
+            # being indexed right now: a run that started before the read
+            # completes only the waiters registered before it started.
+            self._done.discard(path)
+            self._push(path, PRIORITY_REQUESTED, 0.0)
+            self._promotions += 1
+            self._condition.notify_all()
+
+        if not event.wait(timeout):
+            return False
+        with self._condition:
+            return path in self._done
+
+    def enqueue(self, paths: List[str]) -> None:
+        """Queue files for another indexing pass, ahead of other idle files.
+
+        Used for files whose analysis went out of date because of work on
+        other files (e.g. dependents that lost their relationships when a
+        dependency was re-analyzed). No-op if the indexer is not running.
+
+        Args:
+            paths: Files to index again.
+        """
+        with self._condition:
+            if self._thread is None or self._stop:
+                return
+            for path in paths:
+                self._done.discard(path)
+                self._push(path, PRIORITY_IDLE, float("-inf"))
+            self._condition.notify_all()
+
+    def get_progress(self) -> Dict[str, Any]:
+        """Get indexing progress.
+
+        Returns:
+            Dictionary with state, files_discovered, files_current (discovered
+            files that are analyzed and up to date), files_indexed (analysis
+            runs, including files requested by reads), files_skipped (already
+            analyzed elsewhere), files_failed, files_queued, promotions,
+            percent_complete and elapsed_ms.
+        """
+        with self._condition:
+            discovered = len(self._discovered_files)
+            current = len(self._done & self._discovered_files)
+            if discovered:
+                percent = 100.0 * current / discovered
+            else:
+                percent = 100.0 if self._state == STATE_COMPLETE else 0.0
+            elapsed_ms = 0.0
+            if self._started_at is not None:
+                end = self._completed_at if self._completed_at is not None else time.monotonic()
+                elapsed_ms = (end - self._started_at) * 1000
+            return {
+                "state": self._state,
+                "files_discovered": discovered,
+                "files_current": current,
+                "files_indexed": self._files_indexed,
+                "files_skipped": self._files_skipped,
+                "files_failed": self._files_failed,
+                "files_queued": len(self._queued_tier),
+                "promotions": self._promotions,
+                "percent_complete": round(percent, 1),
+                "elapsed_ms": elapsed_ms,
+            }
+
+    def _push(self, path: str, tier: int, order: float) -> None:
+        """Queue a path unless it is already queued at the same or a better tier.
+
+        Caller must hold the condition. Superseded heap entries are skipped
+        when popped.
+        """
+        queued = self._queued_tier.get(path)
+        if queued is not None and queued <= tier:
+            return
+        self._queued_tier[path] = tier
+        self._sequence += 1
+        heapq.heappush(self._queue, (tier, order, self._sequence, path))
+
+    def _pop(self) -> Optional[Tuple[str, int]]:
+        """Wait for the next queued path. Returns None when stopping.
+
+        Takes over the path's current waiters: reads registering afterwards
+        wait for the run their promotion queued.
+        """
+        with self._condition:
+            while True:
+                if self._stop:
+                    return None
+                while self._queue:
+                    tier, _, _, path = heapq.heappop(self._queue)
+                    if self._queued_tier.get(path) != tier:
+                        continue  # Superseded by a promotion
+                    del self._queued_tier[path]
+                    if tier == PRIORITY_IDLE and path in self._done:
+                        continue
+                    self._running_event = self._done_events.pop(path, None)
+                    return path, tier
+                if self._discovered and self._state != STATE_COMPLETE:
+                    self._state = STATE_COMPLETE
+                    self._completed_at = time.monotonic()
+                    logger.info(
+                        f"Background indexing complete: {self._files_indexed} indexed, "
+                        f"{self._files_skipped} already current, {self._files_failed} failed "
+                        f"({len(self._discovered_files)} files discovered)"
+                    )
+                self._condition.wait()
+
+    def _enqueue_discovered(self, files: List[str]) -> None:
+        """Queue discovered files, most recently modified first."""
+        ordered: List[Tuple[float, str]] = []
+        for path in files:
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            ordered.append((-mtime, path))
+
+        with self._condition:
+            for order, path in ordered:
+                if path not in self._done:
+                    self._push(path, PRIORITY_IDLE, order)
+            self._discovered_files = {path for _, path in ordered}
+            self._discovered = True
+            self._state = STATE_INDEXING
+            self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Discover project files, then index queued files until stopped."""
+        try:
+            files = self._discover()
+        except Exception as e:
+            logger.error(f"Background indexing discovery failed: {e}")
+            files = []
+        self._enqueue_discovered(files)
+        logger.info(f"Background indexing: {len(files)} files discovered")
+
+        while True:
+            item = self._pop()
+            if item is None:
+                return
+            path, tier = item
+
+            indexed = False
+            try:
+                # Idle files someone else already analyzed need no work; reads
+                # always run the analysis step (it also checks dependencies).
+                if tier == PRIORITY_REQUESTED or self._needs_indexing(path):
+                    indexed = self._index_file(path)
+                    outcome = "indexed" if indexed else "failed"
+                else:
+                    outcome = "skipped"
+            except Exception as e:
+                logger.warning(f"Background indexing failed for {path}: {e}")
+                outcome = "failed"
+
+            with self._condition:
+                if outcome == "indexed":
+                    self._files_indexed += 1
+                elif outcome == "skipped":
+                    self._files_skipped += 1
+                else:
+                    self._files_failed += 1
+                if outcome != "failed":
+                    self._done.add(path)
+                event, self._running_event = self._running_event, None
+                if event is not None:
+                    event.set()
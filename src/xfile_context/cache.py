@@ -21,6 +21,8 @@ Design Decisions:
 
 Thread Safety:
 - Single _cache_lock protects: _cache, _file_last_read_timestamps, _stats
+- Disk reads on a miss or refresh happen outside _cache_lock, so a slow read
+  does not block lookups for other files
 - file_event_timestamps (FileWatcher) read without lock (GIL protection)
 - No deadlock risk: Single lock, no nested locking
 """
@@ -32,6 +34,7 @@ from collections import OrderedDict
 from threading import Lock
 from typing import Dict, Optional, Tuple
 
+from xfile_context.io_counters import IO_READ, IO_STAT, count_io
 from xfile_context.models import CacheEntry, CacheStatistics
 
 logger = logging.getLogger(__name__)
@@ -150,89 +153,14 @@ class WorkingMemoryCache:
         # Security: Validate filepath before use
         self._validate_filepath(filepath)
 
-        with self._cache_lock:
-            cache_key = (filepath, line_range)
+        cache_key = (filepath, line_range)
 
+        with self._cache_lock:
             # Check if entry exists and is stale
             is_cache_miss = cache_key not in self._cache
             is_stale = not is_cache_miss and self._is_stale(filepath)
 
-            if is_cache_miss or is_stale:
-                # Miss or stale - refresh from disk
-                t = time.time()  # Capture timestamp BEFORE read
-
-                # Read file content (with retry logic)
-                full_content = self._read_from_disk_with_retry(filepath)
-
-                # Extract snippet if line_range specified
-                if line_range:
-                    lines = full_content.splitlines(keepends=True)
-                    start, end = line_range
-                    # Convert 1-based to 0-based indexing, clamp to valid range
-                    start_idx = max(0, start - 1)
-                    end_idx = min(len(lines), end)
-                    content = "".join(lines[start_idx:end_idx])
-                else:
-                    content = full_content
-
-                # Calculate size
-                size_bytes = len(content.encode("utf-8"))
-
-                # Check if file is larger than cache limit
-                if size_bytes > self._size_limit_bytes:
-                    # File too large to cache - evict everything and skip caching
-                    logger.warning(
-                        f"File {filepath} ({size_bytes}B) exceeds cache limit "
-                        f"({self._size_limit_bytes}B). Skipping cache."
-                    )
-                    # Update miss count and return content without caching
-                    if is_cache_miss:
-                        self._stats.misses += 1
-                    else:
-                        self._stats.staleness_refreshes += 1
-                    return content
-
-                # Evict LRU entries if needed to make space
-                if self._stats.current_size_bytes + size_bytes > self._size_limit_bytes:
-                    self._evict_lru(size_bytes)
-
-                # Create cache entry
-                entry = CacheEntry(
-                    filepath=filepath,
-                    line_start=line_range[0] if line_range else 1,
-                    line_end=line_range[1] if line_range else len(full_content.splitlines()),
-                    content=content,
-                    last_accessed=t,
-                    access_count=1,
-                    size_bytes=size_bytes,
-                    symbol_name=None,  # Can be enhanced in future versions
-                )
-
-                # Update cache (OrderedDict maintains insertion order)
-                self._cache[cache_key] = entry
-
-                # Synchronize timestamp (uses start time for correctness)
-                self._file_last_read_timestamps[filepath] = t
-
-                # Update statistics
-                if is_stale:
-                    self._stats.staleness_refreshes += 1
-                else:
-                    self._stats.misses += 1
-                self._stats.current_size_bytes += size_bytes
-                self._stats.current_entry_count = len(self._cache)
-
-                # Update peaks
-                if self._stats.current_size_bytes > self._stats.peak_size_bytes:
-                    self._stats.peak_size_bytes = self._stats.current_size_bytes
-                if self._stats.current_entry_count > self._stats.peak_entry_count:
-                    self._stats.peak_entry_count = self._stats.current_entry_count
-
-                logger.debug(
-                    f"Cache {'refresh' if is_stale else 'miss'}: {filepath} "
-                    f"(size={size_bytes}B, total={self._stats.current_size_bytes}B)"
-                )
-            else:
+            if not (is_cache_miss or is_stale):
                 # Cache hit - update access time for LRU
                 entry = self._cache[cache_key]
                 entry.last_accessed = time.time()
@@ -243,8 +171,93 @@ class WorkingMemoryCache:
                 self._cache.move_to_end(cache_key)
 
                 logger.debug(f"Cache hit: {filepath} (access_count={entry.access_count})")
+                return entry.content
+
+        # Miss or stale - refresh from disk outside the lock so that slow reads
+        # (and retry backoff) do not block other files' lookups
+        t = time.time()  # Capture timestamp BEFORE read
+
+        # Read file content (with retry logic)
+        full_content = self._read_from_disk_with_retry(filepath)
+
+        # Extract snippet if line_range specified
+        if line_range:
+            lines = full_content.splitlines(keepends=True)
+            start, end = line_range
+            # Convert 1-based to 0-based indexing, clamp to valid range
+            start_idx = max(0, start - 1)
+            end_idx = min(len(lines), end)
+            content = "".join(lines[start_idx:end_idx])
+        else:
+            content = full_content
+
+        # Calculate size
+        size_bytes = len(content.encode("utf-8"))
+
+        with self._cache_lock:
+            # Check if file is larger than cache limit
+            if size_bytes > self._size_limit_bytes:
+                # File too large to cache - evict everything and skip caching
+                logger.warning(
+                    f"File {filepath} ({size_bytes}B) exceeds cache limit "
+                    f"({self._size_limit_bytes}B). Skipping cache."
+                )
+                # Update miss count and return content without caching
+                if is_cache_miss:
+                    self._stats.misses += 1
+                else:
+                    self._stats.staleness_refreshes += 1
+                return content
+
+            # Another thread may have stored this key while we were reading
+            previous = self._cache.pop(cache_key, None)
+            if previous is not None:
+                self._stats.current_size_bytes -= previous.size_bytes
+
+            # Evict LRU entries if needed to make space
+            if self._stats.current_size_bytes + size_bytes > self._size_limit_bytes:
+                self._evict_lru(size_bytes)
+
+            # Create cache entry
+            entry = CacheEntry(
+                filepath=filepath,
+                line_start=line_range[0] if line_range else 1,
+                line_end=line_range[1] if line_range else len(full_content.splitlines()),
+                content=content,
+                last_accessed=t,
+                access_count=1,
+                size_bytes=size_bytes,
+                symbol_name=None,  # Can be enhanced in future versions
+            )
+
+            # Update cache (OrderedDict maintains insertion order)
+            self._cache[cache_key] = entry
+
+            # Synchronize timestamp (uses start time for correctness: if a
+            # concurrent read stored newer content, an older read landing last
+            # records its earlier start time and is refreshed on next access)
+            self._file_last_read_timestamps[filepath] = t
+
+            # Update statistics
+            if is_stale:
+                self._stats.staleness_refreshes += 1
+            else:
+                self._stats.misses += 1
+            self._stats.current_size_bytes += size_bytes
+            self._stats.current_entry_count = len(self._cache)
+
+            # Update peaks
+            if self._stats.current_size_bytes > self._stats.peak_size_bytes:
+                self._stats.peak_size_bytes = self._stats.current_size_bytes
+            if self._stats.current_entry_count > self._stats.peak_entry_count:
+                self._stats.peak_entry_count = self._stats.current_entry_count
+
+            logger.debug(
+                f"Cache {'refresh' if is_stale else 'miss'}: {filepath} "
+                f"(size={size_bytes}B, total={self._stats.current_size_bytes}B)"
+            )
 
-            return self._cache[cache_key].content
+            return content
 
     def _is_stale(self, filepath: str) -> bool:
         """Check if cached file is stale (modified since last read).
@@ -260,7 +273,9 @@ class WorkingMemoryCache:
         # File never tracked by watcher - treat as stale
         if filepath not in self._file_event_timestamps:
             # Fallback: Check if file exists and use mtime
+            count_io(IO_STAT)
             if os.path.exists(filepath):
+                count_io(IO_STAT)
                 try:
                     file_mtime = os.path.getmtime(filepath)
                     last_read = self._file_last_read_timestamps.get(filepath, 0)
@@ -296,6 +311,7 @@ class WorkingMemoryCache:
             PermissionError: If file is not readable.
         """
         for attempt in range(self._max_retries):
+            count_io(IO_READ)
             try:
                 with open(filepath, encoding="utf-8") as f:
                     return f.read()
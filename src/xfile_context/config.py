@@ -9,6 +9,8 @@ from typing import Any, Dict, List, Optional
 
 import yaml
 
+from xfile_context.log_segments import SEGMENT_COMPRESSIONS
+
 logger = logging.getLogger(__name__)
 
 
@@ -29,6 +31,8 @@ class Config:
         "cache_expiry_minutes": 10,
         "cache_size_limit_kb": 50,
         "context_token_limit": 500,
+        # Budget-aware assembly: pack snippets greedily up to context_token_limit
+        "enforce_context_token_limit": False,
         "enable_context_injection": True,
         "warn_on_wildcards": False,
         "suppress_warnings": [],
@@ -47,6 +51,52 @@ class Config:
         # Symbol cache configuration (Issue #125 Phase 3)
         # Note: Two-phase analysis is always enabled (Issue #133 fix requirement)
         "symbol_cache_max_entries": 1000,  # Maximum cached files
+        # Memoized context injection results (one entry per target file)
+        "context_cache_max_entries": 256,
+        # Local tiktoken BPE ranks file for offline exact token counting ("" = download cache)
+        "tokenizer_bpe_path": "",
+        # Worker threads for MCP tool calls (service work runs off the event loop)
+        "tool_executor_max_workers": 4,
+        # Watch the project and apply changes to the graph in the background (MCP server)
+        "enable_file_watcher": True,
+        # Quiet period before coalesced file events are applied (0 = apply each event)
+        "file_event_debounce_ms": 50,
+        # Threads assembling contexts for read_many_with_context (1 = assemble serially)
+        "batch_read_max_workers": 4,
+        # Threads listing directories during project discovery (1 = walk serially)
+        "directory_scan_workers": 1,
+        # Analyze the whole project in the background at MCP server start
+        "enable_background_indexing": False,
+        # Write injection and warning logs on a background thread (False = write and
+        # flush each event on the request path)
+        "async_log_writes": True,
+        # Durability of background log writes: flush every N events and at most T ms
+        # after a write (0 disables either; queued events are always written on shutdown)
+        "log_flush_every_events": 100,
+        "log_flush_interval_ms": 200,
+        # Bound on queued log events, and how long logging waits for space before
+        # dropping an event
+        "log_queue_max_events": 10000,
+        "log_queue_max_block_ms": 100,
+        # Recent injection events kept in memory for recent-injection queries (0 = off)
+        "recent_injections_buffer_size": 1000,
+        # Offsets of the latest injection events per target file kept in the log's
+        # sidecar index (0 = no index; queries read the log backwards from its end)
+        "injection_index_entries_per_target": 50,
+        # Rotate injection, warning and metrics logs into compressed segments once
+        # they reach this size (0 = rotate by date only)
+        "log_segment_max_kb": 10240,
+        # Segment compression: "gzip", or "zstd" (requires the zstandard package)
+        "log_segment_compression": "gzip",
+        # Opt-in request profiling: dump a cProfile profile of every Nth read and
+        # of reads taking at least the threshold (0 disables either), to
+        # <data root>/profiles/<session id>/
+        "profile_every_n_requests": 0,
+        "profile_slow_request_ms": 0,
+        # Also dump tracemalloc snapshots of profiled reads
+        "profile_trace_memory": False,
+        # Maximum number of profile dumps per session
+        "profile_max_dumps": 100,
     }
 
     def __init__(self, config_path: Optional[Path] = None):
@@ -121,6 +171,17 @@ class Config:
 
             self._config[key] = value
 
+    def apply_overrides(self, overrides: Dict[str, Any]) -> None:
+        """Override configuration values (e.g. from command-line flags).
+
+        Values are validated like those of the configuration file; invalid
+        values are logged as warnings and ignored.
+
+        Args:
+            overrides: Configuration values by parameter name.
+        """
+        self._validate_and_merge(overrides)
+
     def _validate_parameter(self, key: str, value: Any) -> bool:
         """Validate a configuration parameter.
 
@@ -137,8 +198,31 @@ class Config:
             return bool(isinstance(value, int) and value > 0)
         elif key == "context_token_limit":
             return bool(isinstance(value, int) and 0 < value < 10000)  # Sanity check from TDD
-        elif key in ("function_usage_warning_threshold", "symbol_cache_max_entries"):
+        elif key in (
+            "function_usage_warning_threshold",
+            "symbol_cache_max_entries",
+            "context_cache_max_entries",
+            "tool_executor_max_workers",
+            "batch_read_max_workers",
+            "directory_scan_workers",
+            "log_queue_max_events",
+            "profile_max_dumps",
+        ):
             return bool(isinstance(value, int) and value > 0)
+        elif key in (
+            "file_event_debounce_ms",
+            "log_flush_every_events",
+            "log_flush_interval_ms",
+            "log_queue_max_block_ms",
+            "recent_injections_buffer_size",
+            "injection_index_entries_per_target",
+            "log_segment_max_kb",
+            "profile_every_n_requests",
+            "profile_slow_request_ms",
+        ):
+            return bool(isinstance(value, int) and value >= 0)
+        elif key == "log_segment_compression":
+            return value in SEGMENT_COMPRESSIONS
         elif key in ["suppress_warnings", "ignore_patterns"]:
             # Must be a list
             return isinstance(value, list)
@@ -180,6 +264,19 @@ class Config:
         assert isinstance(value, int)
         return value
 
+    @property
+    def enforce_context_token_limit(self) -> bool:
+        """Whether context assembly is bounded by context_token_limit.
+
+        When enabled, snippets are added in priority order while tracking
+        their token cost, low-priority entries fall back to location only,
+        and assembly stops at the budget. When disabled, up to 10 snippets are
+        injected and the limit is only used for metrics.
+        """
+        value = self._config["enforce_context_token_limit"]
+        assert isinstance(value, bool)
+        return value
+
     @property
     def enable_context_injection(self) -> bool:
         """Whether context injection is enabled."""
@@ -302,3 +399,275 @@ class Config:
         value = self._config["symbol_cache_max_entries"]
         assert isinstance(value, int)
         return value
+
+    @property
+    def context_cache_max_entries(self) -> int:
+        """Maximum number of target files to memoize injected context for.
+
+        Re-reading a file whose dependencies have not changed returns the
+        memoized context instead of re-assembling it. Least recently used
+        entries are evicted when the limit is reached.
+
+        Default is 256 files.
+        """
+        value = self._config["context_cache_max_entries"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def tokenizer_bpe_path(self) -> Optional[Path]:
+        """Local BPE ranks file for the cl100k_base tokenizer.
+
+        Lets exact token counting work offline with a vendored
+        cl100k_base.tiktoken file. Relative paths are resolved against the
+        directory containing the configuration file.
+
+        Returns:
+            Path to the BPE file, or None to use tiktoken's download cache.
+        """
+        value = self._config["tokenizer_bpe_path"]
+        assert isinstance(value, str)
+        if not value:
+            return None
+        path = Path(value).expanduser()
+        if not path.is_absolute():
+            path = self.config_path.parent / path
+        return path
+
+    @property
+    def tool_executor_max_workers(self) -> int:
+        """Maximum number of worker threads for MCP tool calls.
+
+        Tool handlers run service calls on this pool so that parsing and disk
+        I/O do not block the MCP event loop.
+
+        Default is 4 workers.
+        """
+        value = self._config["tool_executor_max_workers"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def batch_read_max_workers(self) -> int:
+        """Maximum number of threads assembling contexts for a batch read.
+
+        read_many_with_context resolves staleness once for all requested
+        files, then assembles each file's context on up to this many threads.
+
+        Default is 4 workers.
+        """
+        value = self._config["batch_read_max_workers"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def enable_file_watcher(self) -> bool:
+        """Whether the MCP server watches the project for file changes.
+
+        When enabled, the server starts the file watcher and a background worker
+        that applies changes to the relationship graph incrementally, so reads
+        do not need to re-check files for staleness themselves.
+
+        Default is True.
+        """
+        value = self._config["enable_file_watcher"]
+        assert isinstance(value, bool)
+        return value
+
+    @property
+    def file_event_debounce_ms(self) -> int:
+        """Quiet period in milliseconds before file events are applied.
+
+        Raw file system events are coalesced per file while events keep
+        arriving, so an editor save or a branch switch is applied as one batch
+        with one update per file. 0 applies each event immediately.
+
+        Default is 50 ms.
+        """
+        value = self._config["file_event_debounce_ms"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def enable_background_indexing(self) -> bool:
+        """Whether the MCP server analyzes the whole project in the background.
+
+        Analysis is lazy by default (Issue #114): the first read of a file pays
+        for analyzing it and its dependencies. With background indexing, the
+        server warms the graph up at start, and files needed by reads are
+        moved to the front of the indexing queue.
+
+        Default is False.
+        """
+        value = self._config["enable_background_indexing"]
+        assert isinstance(value, bool)
+        return value
+
+    @property
+    def async_log_writes(self) -> bool:
+        """Whether injection and warning logs are written on a background thread.
+
+        When enabled, logging an event only queues it; a background writer
+        serializes and writes queued events in batches and flushes them per
+        log_flush_every_events and log_flush_interval_ms. When disabled, each
+        event is written and flushed on the request path.
+
+        Default is True.
+        """
+        value = self._config["async_log_writes"]
+        assert isinstance(value, bool)
+        return value
+
+    @property
+    def log_flush_every_events(self) -> int:
+        """Flush background log writes after this many events (0 disables).
+
+        Default is 100 events.
+        """
+        value = self._config["log_flush_every_events"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def log_flush_interval_ms(self) -> int:
+        """Flush background log writes at most this long after a write (0 disables).
+
+        With both flush limits 0, queued events are flushed only when a log is
+        queried or the session ends.
+
+        Default is 200 ms.
+        """
+        value = self._config["log_flush_interval_ms"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def log_queue_max_events(self) -> int:
+        """Maximum number of log events queued for the background writer.
+
+        Default is 10000 events.
+        """
+        value = self._config["log_queue_max_events"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def log_queue_max_block_ms(self) -> int:
+        """How long logging waits for queue space before dropping an event.
+
+        Dropped events and waits are reported in the writer statistics.
+
+        Default is 100 ms.
+        """
+        value = self._config["log_queue_max_block_ms"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def recent_injections_buffer_size(self) -> int:
+        """Number of recent injection events kept in memory for queries.
+
+        Queries for recent injections are answered from memory when the buffer
+        holds enough matching events. 0 disables the buffer.
+
+        Default is 1000 events.
+        """
+        value = self._config["recent_injections_buffer_size"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def injection_index_entries_per_target(self) -> int:
+        """Number of injection event offsets per target file in the log index.
+
+        The sidecar index lets recent-injection queries for a target file seek
+        to its events. 0 disables the index.
+
+        Default is 50 offsets.
+        """
+        value = self._config["injection_index_entries_per_target"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def log_segment_max_kb(self) -> int:
+        """Size at which logs are rotated into compressed segments, in kilobytes.
+
+        Applies to the injection, warning and session metrics logs. 0 disables
+        size-based rotation (logs still rotate by date).
+
+        Default is 10240 KB (10 MB).
+        """
+        value = self._config["log_segment_max_kb"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def log_segment_compression(self) -> str:
+        """Compression of log segments: "gzip" or "zstd".
+
+        zstd requires the optional zstandard package; without it, segments
+        are written with gzip.
+
+        Default is "gzip".
+        """
+        value = self._config["log_segment_compression"]
+        assert isinstance(value, str)
+        return value
+
+    @property
+    def directory_scan_workers(self) -> int:
+        """Number of threads listing directories when discovering project files.
+
+        Ignored directories are pruned before descending either way. More than
+        one worker lists directories in parallel, which helps on very wide trees
+        or slow (e.g. network) file systems.
+
+        Default is 1 (serial walk).
+        """
+        value = self._config["directory_scan_workers"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def profile_every_n_requests(self) -> int:
+        """Dump a cProfile profile of every Nth read (0 = no sampling).
+
+        Default is 0 (disabled).
+        """
+        value = self._config["profile_every_n_requests"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def profile_slow_request_ms(self) -> int:
+        """Dump a cProfile profile of reads taking at least this many milliseconds.
+
+        Every read is profiled while this is set, to have the profile of a read
+        that turns out to be slow; this slows reads down. 0 disables it.
+
+        Default is 0 (disabled).
+        """
+        value = self._config["profile_slow_request_ms"]
+        assert isinstance(value, int)
+        return value
+
+    @property
+    def profile_trace_memory(self) -> bool:
+        """Whether profiled reads also dump a tracemalloc snapshot.
+
+        Default is False.
+        """
+        value = self._config["profile_trace_memory"]
+        assert isinstance(value, bool)
+        return value
+
+    @property
+    def profile_max_dumps(self) -> int:
+        """Maximum number of profile dumps per session.
+
+        Default is 100.
+        """
+        value = self._config["profile_max_dumps"]
+        assert isinstance(value, int)
+        return value
@@ -0,0 +1,174 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Memoized context injection results (TDD Section 3.8).
+
+Assembling injected context for a file re-runs prioritization, high-usage
+symbol detection, signature extraction and token counting on every read, even
+when nothing the context depends on has changed. This module caches the
+assembled result per target file so that unchanged re-reads return it directly.
+
+Key features:
+- One entry per target file, validated by an opaque version key
+- Version key covers the graph generation and dependency file versions, so any
+  re-analysis, deletion or dependency edit invalidates the entry
+- LRU eviction when the entry limit is reached
+- Hit/miss statistics exposed to session metrics
+- Thread-safe operations
+
+Usage:
+    cache = ContextResultCache(max_entries=256)
+
+    entry = cache.get(target_file, key)
+    if entry is None:
+        entry = build_context(...)
+        cache.put(target_file, key, entry)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from xfile_context.models import Relationship
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InjectionRecord:
+    """A single snippet injected into context, kept for event logging (FR-26).
+
+    Cached results replay these records through the injection logger so that
+    a cache hit is logged exactly like a freshly assembled context.
+    """
+
+    rel: Relationship
+    snippet: str
+    snippet_location: str
+    token_count: int
+    context_token_total: int
+
+
+@dataclass
+class AssembledContext:
+    """Result of assembling injected context for one target file."""
+
+    context: str
+    warnings: List[str] = field(default_factory=list)
+    token_count: int = 0
+    injections: List[InjectionRecord] = field(default_factory=list)
+
+
+class ContextResultCache:
+    """LRU cache of assembled context results keyed by dependency versions.
+
+    Each target file holds at most one entry together with the key it was
+    built for. A lookup with a different key is treated as a miss (the
+    entry is stale) and the caller replaces it.
+
+    Thread Safety:
+        All public methods are thread-safe using a reentrant lock.
+
+    Eviction Policy:
+        When max_entries is reached, least recently used entries are evicted.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize the context result cache.
+
+        Args:
+            max_entries: Maximum number of target files to cache (default: 256).
+        """
+        self._max_entries = max_entries
+        self._lock = threading.RLock()
+
+        # Use OrderedDict for LRU eviction: target_file -> (key, entry)
+        self._cache: OrderedDict[str, Tuple[Hashable, AssembledContext]] = OrderedDict()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+        self._stale = 0
+        self._evictions = 0
+
+    def get(self, target_file: str, key: Hashable) -> Optional[AssembledContext]:
+        """Get the cached context for a target file if its key still matches.
+
+        Args:
+            target_file: File the context was assembled for.
+            key: Current version key for the target file.
+
+        Returns:
+            Cached AssembledContext, or None on miss or stale entry.
+        """
+        with self._lock:
+            cached = self._cache.get(target_file)
+            if cached is None:
+                self._misses += 1
+                return None
+
+            cached_key, entry = cached
+            if cached_key != key:
+                # Something the context depends on changed
+                self._misses += 1
+                self._stale += 1
+                del self._cache[target_file]
+                return None
+
+            self._cache.move_to_end(target_file)
+            self._hits += 1
+            return entry
+
+    def put(self, target_file: str, key: Hashable, entry: AssembledContext) -> None:
+        """Store an assembled context for a target file.
+
+        Args:
+            target_file: File the context was assembled for.
+            key: Version key the context was built for.
+            entry: Assembled context to cache.
+        """
+        with self._lock:
+            if target_file in self._cache:
+                del self._cache[target_file]
+
+            while len(self._cache) >= self._max_entries:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+
+            self._cache[target_file] = (key, entry)
+
+    def invalidate(self, target_file: str) -> None:
+        """Drop the cached context for a target file.
+
+        Args:
+            target_file: File whose cached context to drop.
+        """
+        with self._lock:
+            self._cache.pop(target_file, None)
+
+    def invalidate_all(self) -> None:
+        """Drop all cached contexts."""
+        with self._lock:
+            self._cache.clear()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with cache statistics.
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+
+            return {
+                "entries": len(self._cache),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": hit_rate,
+                "stale": self._stale,
+                "evictions": self._evictions,
+            }
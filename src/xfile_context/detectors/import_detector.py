@@ -28,6 +28,7 @@ from pathlib import Path
 from typing import FrozenSet, List, Optional, Tuple
 
 from xfile_context.detectors.base import RelationshipDetector
+from xfile_context.io_counters import IO_FIND_SPEC, IO_IMPORT_PROBE, count_io
 from xfile_context.models import (
     ReferenceType,
     Relationship,
@@ -365,6 +366,7 @@ class ImportDetector(RelationshipDetector):
         parent_dir = current_dir.parent
         while parent_dir != parent_dir.parent:  # Stop at filesystem root
             # Check if we're still inside a package (has __init__.py)
+            count_io(IO_IMPORT_PROBE)
             if not (parent_dir / "__init__.py").exists():
                 # We've reached the project root boundary
                 # Try resolving from here
@@ -421,6 +423,7 @@ class ImportDetector(RelationshipDetector):
             if not module_name:
                 # Check if target directory is a package (has __init__.py)
                 init_file = target_dir / "__init__.py"
+                count_io(IO_IMPORT_PROBE)
                 if init_file.exists():
                     return str(init_file)
                 else:
@@ -467,15 +470,17 @@ class ImportDetector(RelationshipDetector):
                     module_file = current_path / f"{part}.py"
                     package_init = current_path / part / "__init__.py"
 
+                    count_io(IO_IMPORT_PROBE)
                     if module_file.exists():
                         return module_file
-                    elif package_init.exists():
+                    count_io(IO_IMPORT_PROBE)
+                    if package_init.exists():
                         return package_init
-                    else:
-                        return None
+                    return None
                 else:
                     # Intermediate part: must be a package
                     current_path = current_path / part
+                    count_io(IO_IMPORT_PROBE)
                     if not (current_path / "__init__.py").exists():
                         return None
 
@@ -512,6 +517,7 @@ class ImportDetector(RelationshipDetector):
         try:
             import importlib.util
 
+            count_io(IO_FIND_SPEC)
             spec = importlib.util.find_spec(module_name)
             if spec is not None and spec.origin is not None:
                 # Module exists and has a file location
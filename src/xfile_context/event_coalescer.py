@@ -0,0 +1,210 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Coalescing of raw file system events (TDD Section 3.6.2).
+
+Editors emit several modify/move events per save, and a branch switch emits
+thousands of events in a burst. This module merges the raw events for each path
+while a burst is in progress and releases them as one batch once the project has
+been quiet for a debounce window.
+
+Key features:
+- One pending event per path, however many raw events arrive
+- Net effect per path: create+modify collapses to a create, delete+create to a
+  modify, and any sequence ending in a delete to a delete
+- Trailing debounce: a batch is released once no event arrived for `window`
+  seconds, or once the oldest pending event is `max_delay` seconds old so that
+  a continuous stream of events cannot postpone updates indefinitely
+- Reports the first modify/delete event per path in a batch, so cache
+  invalidation callbacks run once per path instead of once per raw event
+  (never for files created in the batch, which cannot be cached yet)
+- Thread-safe operations (events arrive on the watchdog thread)
+
+Usage:
+    coalescer = EventCoalescer(window=0.05)
+
+    coalescer.add("/project/a.py", FileEventType.MODIFIED)
+    batch = coalescer.drain_ready()
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Dict, List, Optional
+
+
+class FileEventType(Enum):
+    """Kind of file system change."""
+
+    CREATED = "created"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True)
+class FileEvent:
+    """Net change to one file over a batch of raw events."""
+
+    path: str
+    event_type: FileEventType
+
+
+@dataclass
+class _PendingEvent:
+    """Raw events seen for one path since the last drain."""
+
+    existed_before: bool
+    exists_now: bool
+    invalidated: bool
+
+
+class EventCoalescer:
+    """Merges raw file events per path into debounced batches.
+
+    Thread Safety:
+        All methods are thread-safe.
+    """
+
+    def __init__(self, window: float = 0.0, max_delay: Optional[float] = None):
+        """Initialize the coalescer.
+
+        Args:
+            window: Quiet period in seconds before pending events are released
+                (0 releases them on the next drain_ready() call).
+            max_delay: Maximum seconds an event is held back during a continuous
+                burst. Defaults to 10 windows.
+        """
+        self.window = window
+        self.max_delay = max_delay if max_delay is not None else window * 10
+
+        self._lock = threading.Lock()
+        self._pending: Dict[str, _PendingEvent] = {}
+        self._first_event_time = 0.0
+        self._last_event_time = 0.0
+
+        # Statistics
+        self._raw_events = 0
+        self._released_events = 0
+
+    def add(self, path: str, event_type: FileEventType, now: Optional[float] = None) -> bool:
+        """Record a raw event.
+
+        Args:
+            path: Absolute file path.
+            event_type: Kind of change reported by the file system.
+            now: Event time (defaults to time.monotonic()).
+
+        Returns:
+            True if this is the first modify/delete event for a pre-existing
+            path since the last drain, i.e. cache entries for the path should
+            be invalidated.
+        """
+        if now is None:
+            now = time.monotonic()
+        exists_now = event_type is not FileEventType.DELETED
+        invalidating = event_type is not FileEventType.CREATED
+
+        with self._lock:
+            self._raw_events += 1
+            if not self._pending:
+                self._first_event_time = now
+            self._last_event_time = now
+
+            pending = self._pending.get(path)
+            if pending is None:
+                self._pending[path] = _PendingEvent(
+                    existed_before=event_type is not FileEventType.CREATED,
+                    exists_now=exists_now,
+                    invalidated=invalidating,
+                )
+                return invalidating
+
+            pending.exists_now = exists_now
+            if invalidating and pending.existed_before and not pending.invalidated:
+                pending.invalidated = True
+                return True
+            return False
+
+    def drain_ready(self, now: Optional[float] = None) -> List[FileEvent]:
+        """Release all pending events if the debounce window has elapsed.
+
+        Args:
+            now: Current time (defaults to time.monotonic()).
+
+        Returns:
+            Coalesced events in first-seen order, or an empty list if a burst
+            is still in progress.
+        """
+        if now is None:
+            now = time.monotonic()
+
+        with self._lock:
+            if not self._pending:
+                return []
+            quiet = now - self._last_event_time >= self.window
+            overdue = now - self._first_event_time >= self.max_delay
+            if not (quiet or overdue):
+                return []
+            return self._release()
+
+    def drain(self) -> List[FileEvent]:
+        """Release all pending events regardless of the debounce window.
+
+        Returns:
+            Coalesced events in first-seen order.
+        """
+        with self._lock:
+            return self._release()
+
+    @property
+    def pending(self) -> int:
+        """Number of paths with pending events."""
+        with self._lock:
+            return len(self._pending)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Dictionary with raw_events, released_events and pending counts.
+        """
+        with self._lock:
+            return {
+                "raw_events": self._raw_events,
+                "released_events": self._released_events,
+                "pending": len(self._pending),
+            }
+
+    def _release(self) -> List[FileEvent]:
+        """Convert pending entries to events and reset. Caller must hold the lock."""
+        events = [
+            FileEvent(path, _net_event_type(pending)) for path, pending in self._pending.items()
+        ]
+        self._pending = {}
+        self._released_events += len(events)
+        return events
+
+
+def merge_event_types(first: FileEventType, last: FileEventType) -> FileEventType:
+    """Net change for a path given its first and last (already coalesced) events.
+
+    Used to combine the events of one path across batches, with the same rules
+    as within a batch (e.g. a delete followed by a create is a modify).
+    """
+    return _net_event_type(
+        _PendingEvent(
+            existed_before=first is not FileEventType.CREATED,
+            exists_now=last is not FileEventType.DELETED,
+            invalidated=False,
+        )
+    )
+
+
+def _net_event_type(pending: _PendingEvent) -> FileEventType:
+    """Net change for a path given whether it existed before and after the batch."""
+    if not pending.exists_now:
+        return FileEventType.DELETED
+    if pending.existed_before:
+        return FileEventType.MODIFIED
+    return FileEventType.CREATED
@@ -7,7 +7,8 @@ This module implements file system monitoring (TDD Section 3.6):
 - Watchdog library for cross-platform file watching
 - Timestamp-only tracking (no immediate analysis)
 - Extension-based dispatch to language analyzers
-- .gitignore and hardcoded ignore patterns
+- .gitignore (including nested files) and hardcoded ignore patterns, compiled
+  once with per-directory memoisation (see ignore_matcher)
 - Cache invalidation callbacks on file modify/delete (Section 3.7.3.3)
 
 Design Decisions:
@@ -17,13 +18,19 @@ Design Decisions:
 - FR-15: Cache invalidation on file modification
 
 Performance Characteristics (TDD Section 3.6.2):
-- No debouncing: Timestamp updates are cheap, last write wins
-- No batching: Bulk operations handled by fast timestamp updates
+- Optional debouncing (debounce_window > 0): raw events are coalesced per path
+  and published as one batch once the project has been quiet for the window,
+  so an editor save or a branch switch yields one update per file
+- Without a window, each event updates its timestamp immediately (last write wins)
 - Thread-safe: GIL ensures atomicity for dict operations
+- Change signal: wait_for_changes() wakes a consumer (e.g. the service's graph
+  update worker), which takes the events published since its last call with
+  drain_published() instead of scanning the timestamps dict; each event keeps
+  its coalesced type (created/modified/deleted)
 
 Cache Invalidation (TDD Section 3.7.3.3):
 - Callbacks registered via register_invalidation_callback()
-- Invoked synchronously on file modify/delete events
+- Invoked synchronously on the first modify/delete event per file in a batch
 - Enables immediate cache entry removal for stale files
 
 Known Limitations:
@@ -35,15 +42,24 @@ Known Limitations:
   requirement deferred to future enhancement)
 """
 
-import fnmatch
 import logging
+import os
+import threading
 import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set
 
 from watchdog.events import FileMovedEvent, FileSystemEvent, FileSystemEventHandler
 from watchdog.observers import Observer
 
+from xfile_context.event_coalescer import (
+    EventCoalescer,
+    FileEvent,
+    FileEventType,
+    merge_event_types,
+)
+from xfile_context.ignore_matcher import GITIGNORE_FILENAME, IgnoreMatcher
+
 if TYPE_CHECKING:
     from watchdog.observers.api import BaseObserver
 
@@ -128,6 +144,7 @@ class FileWatcher:
         project_root: str,
         gitignore_path: Optional[str] = None,
         user_ignore_patterns: Optional[Set[str]] = None,
+        debounce_window: float = 0.0,
     ):
         """Initialize FileWatcher.
 
@@ -135,6 +152,8 @@ class FileWatcher:
             project_root: Root directory to watch (where .git/ exists or user-specified)
             gitignore_path: Path to .gitignore file (defaults to {project_root}/.gitignore)
             user_ignore_patterns: Additional user-configured ignore patterns
+            debounce_window: Seconds without events before coalesced events are
+                published (0 publishes each event immediately)
         """
         self.project_root = Path(project_root).resolve()
         self.gitignore_path = (
@@ -144,8 +163,14 @@ class FileWatcher:
 
         self.file_event_timestamps: Dict[str, float] = {}
 
-        # Load ignore patterns
-        self._gitignore_patterns: Set[str] = self._load_gitignore()
+        # Compile ignore patterns (NFR-7, NFR-8)
+        self._ignore_matcher = IgnoreMatcher(
+            project_root=str(self.project_root),
+            name_patterns=self.ALWAYS_IGNORED,
+            sensitive_patterns=self.SENSITIVE_PATTERNS,
+            gitignore_path=str(self.gitignore_path),
+            glob_patterns=self.user_ignore_patterns,
+        )
 
         # Invalidation callbacks (FR-15, Section 3.7.3.3)
         # Called on file modify/delete events to invalidate cache entries
@@ -153,135 +178,72 @@ class FileWatcher:
 
         # Watchdog observer and handler
         self._observer: Optional[BaseObserver] = None
+
+        # Set on every timestamp update, cleared by wait_for_changes()
+        self._changed = threading.Event()
+
+        # Net event per file published since the last drain_published() call
+        self._published_lock = threading.Lock()
+        self._published: Dict[str, FileEventType] = {}
         self._event_handler = _FileEventHandler(self)
 
+        # Event coalescing; a flusher thread publishes batches when debouncing
+        self.debounce_window = debounce_window
+        self._coalescer = EventCoalescer(window=debounce_window)
+        self._flush_thread: Optional[threading.Thread] = None
+        self._flush_stop = threading.Event()
+        self._batches_published = 0
+        self._invalidations = 0
+
         logger.info(f"FileWatcher initialized for {self.project_root}")
         logger.debug(f"Loaded {len(self._gitignore_patterns)} .gitignore patterns")
 
-    def _load_gitignore(self) -> Set[str]:
-        """Load and parse .gitignore patterns with validation.
+    @property
+    def _gitignore_patterns(self) -> List[str]:
+        """Patterns of the root .gitignore file, in file order (NFR-7)."""
+        return self._ignore_matcher.root_rules.patterns
 
-        Pattern validation:
-        - Maximum length: 1000 characters (prevents pathological patterns)
-        - Empty lines and comments are skipped
+    def should_ignore(self, file_path: str) -> bool:
+        """Check if file should be ignored based on patterns.
 
-        Returns:
-            Set of gitignore patterns (NFR-7)
-        """
-        patterns: Set[str] = set()
-
-        if not self.gitignore_path.exists():
-            logger.debug(f"No .gitignore found at {self.gitignore_path}")
-            return patterns
-
-        try:
-            with open(self.gitignore_path, encoding="utf-8") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # Validate pattern length (security: prevent pathological patterns)
-                    if len(line) > 1000:
-                        logger.warning(
-                            f".gitignore line {line_num}: Pattern too long (>1000 chars), skipping"
-                        )
-                        continue
-
-                    patterns.add(line)
-
-            logger.debug(f"Loaded {len(patterns)} patterns from .gitignore")
-        except (FileNotFoundError, PermissionError) as e:
-            logger.warning(f"Failed to load .gitignore: {e}")
-        except UnicodeDecodeError as e:
-            logger.error(f"Failed to decode .gitignore (encoding error): {e}")
-        except OSError as e:
-            logger.error(f"Failed to read .gitignore: {e}")
-
-        return patterns
-
-    def _matches_pattern(
-        self, path: Path, rel_path_str: str, pattern: str, check_parts: bool = True
-    ) -> bool:
-        """Check if path matches a single pattern.
+        Pattern matching strategy (compiled once, see IgnoreMatcher):
+        - ALWAYS_IGNORED & SENSITIVE_PATTERNS: Match any path component
+        - .gitignore files (root and nested): gitignore semantics, including
+          negation, anchoring and directory-only patterns
+        - User patterns: Check relative path and filename (standard glob behavior)
+
+        Results for directories are memoised, so repeated events under the same
+        directory (e.g. node_modules) cost one lookup.
 
         Args:
-            path: Path object to check
-            rel_path_str: String representation of relative path
-            pattern: Pattern to match against
-            check_parts: Whether to check individual path components
+            file_path: Absolute or relative file path
 
         Returns:
-            True if path matches pattern
+            True if file should be ignored
         """
-        # Check if pattern is a wildcard pattern
-        if pattern.startswith("*") or pattern.endswith("*"):
-            # Check full relative path and filename
-            if fnmatch.fnmatch(rel_path_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                return True
-            # Check if any part of the path matches the wildcard pattern
-            if check_parts:
-                for part in path.parts:
-                    if fnmatch.fnmatch(part, pattern):
-                        return True
-        else:
-            # Exact match - check filename or path components
-            if path.name == pattern:
-                return True
-            if check_parts:
-                for part in path.parts:
-                    if part == pattern:
-                        return True
-        return False
+        return self._ignore_matcher.should_ignore(file_path)
 
-    def should_ignore(self, file_path: str) -> bool:
-        """Check if file should be ignored based on patterns.
+    def should_ignore_dir(self, dir_path: str) -> bool:
+        """Check if a directory and everything below it should be ignored.
 
-        Pattern matching strategy:
-        - ALWAYS_IGNORED & SENSITIVE_PATTERNS: Check path parts for directory/file matches
-        - .gitignore patterns: Check relative path and filename (standard gitignore behavior)
-        - User patterns: Check relative path and filename (standard glob behavior)
+        Used to prune directory walks (e.g. .venv, node_modules) before
+        descending. User patterns are not applied to directories.
 
         Args:
-            file_path: Absolute or relative file path
+            dir_path: Absolute or relative directory path
 
         Returns:
-            True if file should be ignored
+            True if the directory should be skipped
         """
-        path = Path(file_path)
-        path_str = str(path)
-
-        # Check if path is relative to project root
-        try:
-            rel_path = path.relative_to(self.project_root)
-            rel_path_str = str(rel_path)
-        except ValueError:
-            # Path is not under project root, use as-is
-            rel_path_str = path_str
-
-        # Always ignored directories and patterns (NFR-8)
-        for pattern in self.ALWAYS_IGNORED:
-            if self._matches_pattern(path, rel_path_str, pattern, check_parts=True):
-                return True
-
-        # Sensitive files (check path parts for sensitive directories/files)
-        for pattern in self.SENSITIVE_PATTERNS:
-            if self._matches_pattern(path, rel_path_str, pattern, check_parts=True):
-                logger.debug(f"Ignoring sensitive file/directory: {path.name}")
-                return True
-
-        # .gitignore patterns (NFR-7) - standard gitignore matching
-        for pattern in self._gitignore_patterns:
-            if fnmatch.fnmatch(rel_path_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                return True
-
-        # User-configured patterns - standard glob matching
-        for pattern in self.user_ignore_patterns:
-            if fnmatch.fnmatch(rel_path_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                return True
-
-        return False
+        return self._ignore_matcher.should_ignore_dir(dir_path)
+
+    def reload_ignore_rules(self, gitignore_file: Optional[str] = None) -> None:
+        """Re-read ignore rules after a .gitignore file changed.
+
+        Args:
+            gitignore_file: Path of the changed .gitignore file (None reloads all)
+        """
+        self._ignore_matcher.reload(gitignore_file)
 
     def is_supported_file(self, file_path: str) -> bool:
         """Check if file extension is supported for analysis.
@@ -368,12 +330,121 @@ class FileWatcher:
     def update_timestamp(self, file_path: str) -> None:
         """Update timestamp for file event.
 
+        The file is handed to consumers as modified.
+
         Args:
             file_path: Absolute file path
         """
         self.file_event_timestamps[file_path] = time.time()
+        self._add_published([FileEvent(file_path, FileEventType.MODIFIED)])
+        self._changed.set()
         logger.debug(f"Updated timestamp for {file_path}")
 
+    def wait_for_changes(self, timeout: Optional[float] = None) -> bool:
+        """Wait until a file event has been recorded since the last call.
+
+        Intended for a single consumer that calls drain_published() after
+        waking up. Events recorded while the consumer is draining set the
+        signal again, so none are missed.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            True if a file event was recorded, False on timeout.
+        """
+        if not self._changed.wait(timeout):
+            return False
+        self._changed.clear()
+        return True
+
+    def record_event(self, file_path: str, event_type: FileEventType) -> None:
+        """Record a file system event for a watched file.
+
+        Cache invalidation callbacks run on the first modify/delete event for the
+        file in the current batch. Timestamps are updated when the batch is
+        published: immediately without a debounce window, otherwise by the
+        flusher thread once events stop arriving.
+
+        Args:
+            file_path: Absolute file path
+            event_type: Kind of change
+        """
+        if self._coalescer.add(file_path, event_type):
+            self._invalidations += 1
+            self._notify_invalidation_callbacks(file_path)
+
+        if self.debounce_window <= 0:
+            self._publish(self._coalescer.drain())
+
+    def flush(self) -> List[FileEvent]:
+        """Publish all pending events now, regardless of the debounce window.
+
+        Returns:
+            The published batch.
+        """
+        batch = self._coalescer.drain()
+        self._publish(batch)
+        return batch
+
+    def _publish(self, batch: List[FileEvent]) -> None:
+        """Update timestamps for a batch of coalesced events and signal consumers.
+
+        All files in a batch share one timestamp, so consumers see the batch at once.
+        """
+        if not batch:
+            return
+
+        timestamp = time.time()
+        for event in batch:
+            self.file_event_timestamps[event.path] = timestamp
+        self._add_published(batch)
+        self._batches_published += 1
+        self._changed.set()
+        logger.debug(f"Published {len(batch)} file events")
+
+    def _add_published(self, batch: List[FileEvent]) -> None:
+        """Merge a batch into the events waiting for drain_published()."""
+        with self._published_lock:
+            for event in batch:
+                previous = self._published.get(event.path)
+                if previous is None:
+                    self._published[event.path] = event.event_type
+                else:
+                    self._published[event.path] = merge_event_types(previous, event.event_type)
+
+    def drain_published(self) -> List[FileEvent]:
+        """Take the events published since the last call.
+
+        Events for a file published in several batches are merged into their
+        net effect. Timestamps stay in file_event_timestamps for staleness
+        checks and recency; only the events waiting for a consumer are cleared.
+
+        Returns:
+            Net event per file published since the last call, sorted by path.
+        """
+        with self._published_lock:
+            published, self._published = self._published, {}
+        return [FileEvent(path, published[path]) for path in sorted(published)]
+
+    def _run_flusher(self) -> None:
+        """Publish coalesced batches once the debounce window elapses."""
+        interval = self.debounce_window / 2
+        while not self._flush_stop.wait(interval):
+            self._publish(self._coalescer.drain_ready())
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get event coalescing statistics.
+
+        Returns:
+            Dictionary with raw_events, released_events, pending, batches and
+            invalidations counts.
+        """
+        stats = self._coalescer.get_statistics()
+        stats["batches"] = self._batches_published
+        stats["invalidations"] = self._invalidations
+        return stats
+
     def get_timestamp(self, file_path: str) -> Optional[float]:
         """Get last event timestamp for file.
 
@@ -400,18 +471,32 @@ class FileWatcher:
         )
         self._observer.start()  # type: ignore  # watchdog types vary by version
 
+        if self.debounce_window > 0:
+            self._flush_stop.clear()
+            self._flush_thread = threading.Thread(
+                target=self._run_flusher, name="FileEventFlusher", daemon=True
+            )
+            self._flush_thread.start()
+
         logger.info(f"FileWatcher started, monitoring {self.project_root}")
 
     def stop(self) -> None:
         """Stop watching file system.
 
-        Blocks until observer thread terminates (with timeout).
+        Blocks until observer thread terminates (with timeout). Pending
+        coalesced events are published so none are lost.
         """
         if self._observer is not None and self._observer.is_alive():
             self._observer.stop()  # type: ignore  # watchdog types vary by version
             self._observer.join(timeout=5.0)
             logger.info("FileWatcher stopped")
 
+        if self._flush_thread is not None:
+            self._flush_stop.set()
+            self._flush_thread.join(timeout=5.0)
+            self._flush_thread = None
+        self.flush()
+
     def is_running(self) -> bool:
         """Check if watcher is currently running.
 
@@ -436,13 +521,13 @@ class _FileEventHandler(FileSystemEventHandler):
         super().__init__()
         self.watcher = watcher
 
-    def _handle_event(self, event: FileSystemEvent, trigger_invalidation: bool = False) -> None:
+    def _handle_event(self, event: FileSystemEvent, event_type: FileEventType) -> None:
         """Common event handling logic.
 
         Args:
             event: File system event from watchdog
-            trigger_invalidation: Whether to trigger cache invalidation callbacks.
-                Should be True for modify/delete events (FR-15, Section 3.7.3.3).
+            event_type: Kind of change. Modify/delete events trigger cache
+                invalidation callbacks (FR-15, Section 3.7.3.3).
         """
         # Skip directory events
         if event.is_directory:
@@ -451,6 +536,10 @@ class _FileEventHandler(FileSystemEventHandler):
         # Convert path from Union[bytes, str] to str
         file_path = str(event.src_path)
 
+        # Edited ignore rules take effect for subsequent events
+        if os.path.basename(file_path) == GITIGNORE_FILENAME:
+            self.watcher.reload_ignore_rules(file_path)
+
         # Check if file should be ignored
         if self.watcher.should_ignore(file_path):
             return
@@ -459,12 +548,9 @@ class _FileEventHandler(FileSystemEventHandler):
         if not self.watcher.is_supported_file(file_path):
             return
 
-        # Update timestamp (TDD Section 3.6.2: timestamp-only approach)
-        self.watcher.update_timestamp(file_path)
-
-        # Trigger cache invalidation for modify/delete events (FR-15)
-        if trigger_invalidation:
-            self.watcher._notify_invalidation_callbacks(file_path)
+        # Record for timestamp update (TDD Section 3.6.2: timestamp-only approach)
+        # and cache invalidation on modify/delete (FR-15)
+        self.watcher.record_event(file_path, event_type)
 
         # Log the event with language info
         language = self.watcher.get_language(file_path)
@@ -476,7 +562,7 @@ class _FileEventHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        self._handle_event(event)
+        self._handle_event(event, FileEventType.CREATED)
 
     def on_modified(self, event: FileSystemEvent) -> None:
         """Handle file modification events.
@@ -486,7 +572,7 @@ class _FileEventHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        self._handle_event(event, trigger_invalidation=True)
+        self._handle_event(event, FileEventType.MODIFIED)
 
     def on_deleted(self, event: FileSystemEvent) -> None:
         """Handle file deletion events.
@@ -497,7 +583,7 @@ class _FileEventHandler(FileSystemEventHandler):
         Args:
             event: File system event
         """
-        self._handle_event(event, trigger_invalidation=True)
+        self._handle_event(event, FileEventType.DELETED)
 
     def on_moved(self, event: FileSystemEvent) -> None:
         """Handle file move/rename events.
@@ -519,15 +605,17 @@ class _FileEventHandler(FileSystemEventHandler):
         src_path = str(event.src_path)
         dest_path = str(event.dest_path)
 
+        if GITIGNORE_FILENAME in (os.path.basename(src_path), os.path.basename(dest_path)):
+            self.watcher.reload_ignore_rules()
+
         # Old path: Mark as deleted and invalidate cache
+        # (file no longer exists at this location)
         if not self.watcher.should_ignore(src_path) and self.watcher.is_supported_file(src_path):
-            self.watcher.update_timestamp(src_path)
-            # Invalidate cache for old path (file no longer exists at this location)
-            self.watcher._notify_invalidation_callbacks(src_path)
+            self.watcher.record_event(src_path, FileEventType.DELETED)
             logger.debug(f"Event: moved_from - {src_path}")
 
         # New path: Mark as created (no invalidation needed - new file)
         if not self.watcher.should_ignore(dest_path) and self.watcher.is_supported_file(dest_path):
-            self.watcher.update_timestamp(dest_path)
+            self.watcher.record_event(dest_path, FileEventType.CREATED)
             language = self.watcher.get_language(dest_path)
             logger.debug(f"Event: moved_to - {dest_path} (language: {language})")
@@ -0,0 +1,385 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Paged, filtered and streaming relationship graph export (FR-23).
+
+The full export (RelationshipGraph.export_to_dict) serializes every file and
+relationship into one response, which is impractical past a few thousand
+files. This module offers two alternatives: export the graph one page at a
+time, walking the graph's relationships-by-source index in sorted source
+order, or stream the whole graph to an NDJSON file for offline analysis.
+
+Key features:
+- Cursor pagination: an opaque cursor records the position (source file and
+  offset) so the next page starts where the previous one ended, even if other
+  files changed in between
+- Filters: source directory prefix, relationship types, and the k-hop
+  neighborhood of a file (relationships between files within k hops)
+- A page costs O(page size) plus any relationships skipped by the type
+  filter: the directory prefix is a range of the sorted sources, and nothing
+  outside the page is serialized
+- Streaming export: records are generated and written one line at a time,
+  so memory use does not grow with the graph; optional gzip compression
+
+NDJSON export format (one JSON object per line, "record" gives its kind):
+    {"record": "metadata", "timestamp": ..., "total_files": ..., ...}
+    {"record": "file", "path": ..., ...}            (one per file)
+    {"record": "relationship", "source_file": ...}  (one per relationship)
+    {"record": "graph_metadata", "most_connected_files": [...], ...}
+
+Usage:
+    page = export_relationship_page(graph, limit=100, path_prefix="/project/src")
+    while page["next_cursor"]:
+        page = export_relationship_page(
+            graph, limit=100, path_prefix="/project/src", cursor=page["next_cursor"]
+        )
+
+    summary = export_graph_ndjson(graph, Path("~/.cross_file_context/exports"), compress=True)
+"""
+
+import base64
+import binascii
+import bisect
+import gzip
+import json
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+
+from xfile_context.models import Relationship, RelationshipGraph, RelationshipType
+
+logger = logging.getLogger(__name__)
+
+# Page size bounds
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+# NDJSON record kinds, in file order
+RECORD_METADATA = "metadata"
+RECORD_FILE = "file"
+RECORD_RELATIONSHIP = "relationship"
+RECORD_GRAPH_METADATA = "graph_metadata"
+
+_RELATIONSHIP_TYPES = {
+    value
+    for name, value in vars(RelationshipType).items()
+    if name.isupper() and isinstance(value, str)
+}
+
+
+def _filter_key(
+    path_prefix: Optional[str],
+    relationship_types: Optional[Set[str]],
+    around_file: Optional[str],
+    hops: int,
+) -> List[Any]:
+    """Filters a cursor is valid for (a cursor cannot be reused with other filters)."""
+    return [
+        path_prefix,
+        sorted(relationship_types) if relationship_types else None,
+        around_file,
+        hops if around_file else None,
+    ]
+
+
+def encode_cursor(source_file: str, offset: int, filters: List[Any]) -> str:
+    """Encode a page position as an opaque cursor string.
+
+    Args:
+        source_file: Source file of the next relationship to export.
+        offset: Index of that relationship among the source's relationships.
+        filters: Filter key of the query (see _filter_key).
+
+    Returns:
+        URL-safe cursor string.
+    """
+    payload = json.dumps({"source": source_file, "offset": offset, "filters": filters})
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str, filters: List[Any]) -> Tuple[str, int]:
+    """Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor string.
+        filters: Filter key of the current query.
+
+    Returns:
+        Tuple of (source_file, offset).
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for other filters.
+    """
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        source_file = data["source"]
+        offset = data["offset"]
+        cursor_filters = data["filters"]
+    except (ValueError, KeyError, TypeError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(source_file, str) or not isinstance(offset, int) or offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    if cursor_filters != filters:
+        raise ValueError("Cursor was issued for a query with different filters")
+    return source_file, offset
+
+
+def _directory_prefix(path_prefix: str) -> str:
+    """Normalize a directory prefix so "src/app" does not match "src/application"."""
+    prefix = os.path.normpath(path_prefix)
+    return prefix if prefix.endswith(os.sep) else prefix + os.sep
+
+
+def _candidate_sources(
+    graph: RelationshipGraph,
+    path_prefix: Optional[str],
+    neighborhood: Optional[Set[str]],
+    start_source: Optional[str],
+) -> Iterator[str]:
+    """Yield source files to export from, in sorted order, starting at start_source."""
+    sources: Sequence[str]
+    if neighborhood is not None:
+        # Neighborhoods are small; sort them instead of scanning all sources
+        sources = sorted(f for f in neighborhood if graph.get_outgoing_relationships(f))
+    else:
+        sources = graph.get_sorted_source_files()
+
+    low = 0
+    if path_prefix is not None:
+        low = bisect.bisect_left(sources, path_prefix)
+    if start_source is not None:
+        low = max(low, bisect.bisect_left(sources, start_source))
+
+    for index in range(low, len(sources)):
+        source = sources[index]
+        if path_prefix is not None and not source.startswith(path_prefix):
+            return  # Past the end of the prefix range
+        yield source
+
+
+def export_relationship_page(
+    graph: RelationshipGraph,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None,
+    path_prefix: Optional[str] = None,
+    relationship_types: Optional[Sequence[str]] = None,
+    around_file: Optional[str] = None,
+    hops: int = 1,
+    project_root: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Export one page of relationships, ordered by source file.
+
+    Args:
+        graph: Graph to export. The caller must keep it unchanged during the
+            call (e.g. hold the service's read lock).
+        limit: Maximum number of relationships in the page
+            (1 to MAX_PAGE_SIZE).
+        cursor: next_cursor of the previous page, or None for the first page.
+        path_prefix: Only relationships whose source file is in this
+            directory (absolute path).
+        relationship_types: Only relationships of these types
+            (RelationshipType values).
+        around_file: Only relationships between files within hops of this
+            file, following relationships in either direction.
+        hops: Neighborhood radius for around_file.
+        project_root: Project root directory for computing relative paths.
+
+    Returns:
+        Dictionary containing:
+        - relationships: relationship dicts in the page
+        - files: file entries for the source files in the page
+        - next_cursor: cursor for the next page, or None if this is the last
+        - metadata: timestamp, version, counts and the graph generation
+
+    Raises:
+        ValueError: If limit or hops is out of range, a relationship type is
+            unknown, or the cursor is invalid for this query.
+    """
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"limit must be between 1 and {MAX_PAGE_SIZE}, got {limit}")
+    if hops < 0:
+        raise ValueError(f"hops must not be negative, got {hops}")
+
+    types = set(relationship_types) if relationship_types else None
+    if types is not None and not types <= _RELATIONSHIP_TYPES:
+        unknown = ", ".join(sorted(types - _RELATIONSHIP_TYPES))
+        raise ValueError(f"Unknown relationship types: {unknown}")
+    prefix = _directory_prefix(path_prefix) if path_prefix else None
+    filters = _filter_key(prefix, types, around_file, hops)
+
+    start_source: Optional[str] = None
+    start_offset = 0
+    if cursor:
+        start_source, start_offset = decode_cursor(cursor, filters)
+
+    neighborhood = graph.get_neighborhood(around_file, hops) if around_file else None
+
+    page: List[Relationship] = []
+    next_cursor: Optional[str] = None
+    for source in _candidate_sources(graph, prefix, neighborhood, start_source):
+        relationships = graph.get_outgoing_relationships(source)
+        offset = start_offset if source == start_source else 0
+        for index in range(offset, len(relationships)):
+            rel = relationships[index]
+            if types is not None and rel.relationship_type not in types:
+                continue
+            if neighborhood is not None and rel.target_file not in neighborhood:
+                continue
+            if len(page) == limit:
+                # One more match exists: the next page starts here
+                next_cursor = encode_cursor(source, index, filters)
+                break
+            page.append(rel)
+        if next_cursor is not None:
+            break
+
+    files = []
+    for source in dict.fromkeys(rel.source_file for rel in page):
+        file_entry = graph.export_file_entry(source, project_root)
+        if file_entry is not None:
+            files.append(file_entry)
+
+    metadata: Dict[str, Any] = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "version": "0.1.0",
+        "language": "python",
+        "total_relationships": graph.get_relationship_count(),
+        "page_size": len(page),
+        "generation": graph.get_generation(),
+    }
+    if project_root:
+        metadata["project_root"] = project_root
+
+    return {
+        "relationships": [rel.to_dict() for rel in page],
+        "files": files,
+        "next_cursor": next_cursor,
+        "metadata": metadata,
+    }
+
+
+def iter_graph_records(
+    graph: RelationshipGraph, project_root: Optional[str] = None
+) -> Iterator[Dict[str, Any]]:
+    """Generate the full graph export as NDJSON records, one at a time.
+
+    Produces the same content as RelationshipGraph.export_to_dict(), with each
+    file and relationship as its own record instead of an element of a list.
+
+    Args:
+        graph: Graph to export. The caller must keep it unchanged until the
+            generator is exhausted (e.g. hold the service's read lock).
+        project_root: Project root directory for computing relative paths.
+
+    Yields:
+        Records with a "record" key: metadata first, then one per file, one per
+        relationship, and graph_metadata last.
+    """
+    metadata: Dict[str, Any] = {
+        "record": RECORD_METADATA,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "version": "0.1.0",
+        "language": "python",
+        "total_files": graph.get_file_count(),
+        "total_relationships": graph.get_relationship_count(),
+    }
+    if project_root:
+        metadata["project_root"] = project_root
+    yield metadata
+
+    for file_entry in graph.iter_file_entries(project_root):
+        yield {"record": RECORD_FILE, **file_entry}
+
+    for rel_entry in graph.iter_relationship_entries():
+        yield {"record": RECORD_RELATIONSHIP, **rel_entry}
+
+    yield {
+        "record": RECORD_GRAPH_METADATA,
+        # Circular imports detection deferred to v0.1.1+ (see TDD Section 3.5.5)
+        "circular_imports": [],
+        "most_connected_files": graph.get_most_connected_files(limit=10),
+    }
+
+
+def write_ndjson(records: Iterable[Dict[str, Any]], path: Path, compress: bool = False) -> int:
+    """Write records to a file as NDJSON, one line at a time.
+
+    The file is written under a temporary name and renamed into place, so a
+    reader never sees a partial export.
+
+    Args:
+        records: Records to write (consumed lazily).
+        path: Output file.
+        compress: Write gzip-compressed output.
+
+    Returns:
+        Number of records written.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    temp_path = path.with_name(path.name + ".tmp")
+    count = 0
+    try:
+        f: IO[str]
+        if compress:
+            f = gzip.open(temp_path, "wt", encoding="utf-8")  # noqa: SIM115
+        else:
+            f = open(temp_path, "w", encoding="utf-8")  # noqa: SIM115
+        with f:
+            for record in records:
+                f.write(json.dumps(record, separators=(",", ":")))
+                f.write("\n")
+                count += 1
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def export_graph_ndjson(
+    graph: RelationshipGraph,
+    output_dir: Path,
+    project_root: Optional[str] = None,
+    compress: bool = False,
+) -> Dict[str, Any]:
+    """Stream the full graph export to a new NDJSON file.
+
+    Args:
+        graph: Graph to export. The caller must keep it unchanged during the
+            call (e.g. hold the service's read lock).
+        output_dir: Directory for the export file (created if missing).
+        project_root: Project root directory for computing relative paths.
+        compress: Write a gzip-compressed .ndjson.gz file.
+
+    Returns:
+        Dictionary with path, files, relationships, records, bytes and
+        compressed.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+    path = output_dir / f"graph-{timestamp}.ndjson{'.gz' if compress else ''}"
+
+    total_files = graph.get_file_count()
+    total_relationships = graph.get_relationship_count()
+    records = write_ndjson(iter_graph_records(graph, project_root), path, compress)
+    size = path.stat().st_size
+    logger.info(
+        f"Graph exported to {path}: {total_files} files, "
+        f"{total_relationships} relationships, {size} bytes"
+    )
+
+    return {
+        "path": str(path),
+        "files": total_files,
+        "relationships": total_relationships,
+        "records": records,
+        "bytes": size,
+        "compressed": compress,
+    }
@@ -4,16 +4,25 @@
 """Incremental graph updater for file system changes.
 
 This module implements incremental update logic (TDD Section 3.6.3):
-- On modify: Remove old relationships, re-analyze, add new relationships
+- On modify: Remove old relationships, re-analyze, add new relationships,
+  rebuild dependents' relationships from their symbol data
 - On delete: Remove all relationships, mark as deleted (EC-14)
 - On create: Analyze and add to graph
 - Atomic updates: No partial state visible
 - Performance: <200ms target per file (NFR-1)
+- Batches: pending changes are applied together with one removal pass over the
+  graph, parallel file reading/parsing, and relationship rebuilds in dependency
+  order, so a batch costs about the sum of its parse times
 
 Design:
 - Coordinates FileWatcher, PythonAnalyzer, and RelationshipGraph
 - Ensures atomic updates through explicit rollback on failure
-- Single-threaded operation (no concurrent modifications)
+- Single-threaded operation (no concurrent modifications); the service runs it
+  under its exclusive state lock from a background worker
+- Each watcher event is processed once: the watcher hands over the coalesced
+  events published since the last call, and their types (not a fresh stat of
+  the file) decide between create, modify and delete; event timestamps are left
+  in place for cache staleness checks and recency prioritization
 
 See TDD Section 3.6.3 for detailed specifications.
 """
@@ -21,11 +30,12 @@ See TDD Section 3.6.3 for detailed specifications.
 import logging
 import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from xfile_context.analyzers.python_analyzer import PythonAnalyzer
+from xfile_context.event_coalescer import FileEventType
 from xfile_context.file_watcher import FileWatcher
-from xfile_context.models import FileMetadata, Relationship, RelationshipGraph
+from xfile_context.models import FileMetadata, FileSymbolData, Relationship, RelationshipGraph
 from xfile_context.relationship_builder import RelationshipBuilder
 
 logger = logging.getLogger(__name__)
@@ -51,6 +61,7 @@ class GraphUpdater:
     - Target: <200ms per file update (NFR-1)
     - Only modified file is re-analyzed, not entire codebase
     - Efficient index updates in RelationshipGraph
+    - process_batch() scans the graph once per batch rather than once per file
 
     Thread Safety:
     - NOT thread-safe: Designed for single-threaded use
@@ -65,6 +76,7 @@ class GraphUpdater:
         analyzer: PythonAnalyzer,
         file_watcher: FileWatcher,
         relationship_builder: Optional[RelationshipBuilder] = None,
+        max_workers: int = 4,
     ):
         """Initialize graph updater.
 
@@ -74,12 +86,14 @@ class GraphUpdater:
             file_watcher: FileWatcher for detecting file changes.
             relationship_builder: RelationshipBuilder for two-phase analysis.
                 Required for Issue #133 fix (symbol-based relationship rebuilding).
+            max_workers: Threads for reading and parsing files in a batch.
         """
         self.graph = graph
         self.analyzer = analyzer
         self.file_watcher = file_watcher
         self.relationship_builder = relationship_builder
         self.project_root = Path(file_watcher.project_root).resolve()
+        self.max_workers = max_workers
 
     def _validate_filepath(self, filepath: str) -> bool:
         """Validate that filepath is within project root (security check).
@@ -142,6 +156,9 @@ class GraphUpdater:
                 filepath
             )
             old_metadata = self.graph.get_file_metadata(filepath)
+            dependent_files = {
+                rel.source_file for rel in old_relationships if rel.target_file == filepath
+            }
 
             # Stage 2: Remove old relationships
             # Note: PythonAnalyzer.analyze_file_two_phase() calls _store_relationships()
@@ -162,6 +179,10 @@ class GraphUpdater:
                 # Note: Old relationships are already removed by analyze_file()
                 # This is acceptable - file is unparseable so relationships are stale
 
+            # Re-analysis removed dependents' relationships to this file (Issue #133);
+            # rebuild them so reads do not see a graph with missing edges
+            self._rebuild_dependents(filepath, dependent_files)
+
             elapsed = time.time() - start_time
             logger.debug(f"Graph update for {filepath} completed in {elapsed * 1000:.1f}ms")
 
@@ -192,6 +213,32 @@ class GraphUpdater:
 
             return False
 
+    def _rebuild_dependents(self, filepath: str, dependent_files: Set[str]) -> None:
+        """Rebuild outgoing relationships of files that depended on a re-analyzed file.
+
+        Relationships are derived from each dependent's FileSymbolData in the
+        RelationshipBuilder (Issue #133 fix), so dependents are not re-parsed.
+
+        Args:
+            filepath: File that was re-analyzed.
+            dependent_files: Files that had relationships to filepath before re-analysis.
+        """
+        if self.relationship_builder is None:
+            return
+
+        for dependent in sorted(dependent_files):
+            if dependent == filepath or _is_special_marker(dependent):
+                continue
+            if self.relationship_builder.get_file_data(dependent) is None:
+                continue
+            try:
+                relationships = self.relationship_builder.build_relationships_for_file(dependent)
+                self.graph.remove_outgoing_relationships(dependent)
+                for rel in relationships:
+                    self.graph.add_relationship(rel)
+            except Exception as e:
+                logger.warning(f"Failed to rebuild relationships for {dependent}: {e}")
+
     def update_on_delete(self, filepath: str) -> bool:
         """Update graph when file is deleted.
 
@@ -231,18 +278,7 @@ class GraphUpdater:
             self.graph.remove_relationships_for_file(filepath)
 
             # Stage 3: Mark as deleted in metadata (EC-14)
-            deletion_timestamp = time.time()
-            metadata = FileMetadata(
-                filepath=filepath,
-                last_analyzed=deletion_timestamp,
-                relationship_count=0,
-                has_dynamic_patterns=False,
-                dynamic_pattern_types=[],
-                is_unparseable=False,
-                deleted=True,
-                deletion_time=deletion_timestamp,
-            )
-            self.graph.set_file_metadata(filepath, metadata)
+            self._mark_deleted(filepath)
 
             elapsed = time.time() - start_time
             logger.debug(
@@ -358,12 +394,16 @@ class GraphUpdater:
     def process_pending_changes(self) -> Dict[str, Any]:
         """Process all pending file changes from FileWatcher.
 
-        This method checks FileWatcher for files with recent timestamps and
-        processes each one according to its event type.
+        This method takes the events FileWatcher published since the last call
+        and processes each according to its event type. Timestamps are not
+        cleared, because the cache and context prioritization still use them.
+        All pending files are applied as one batch (see process_batch()). With
+        debouncing enabled, FileWatcher publishes each burst of coalesced events
+        together, so a burst is applied in a single call.
 
-        Event type detection:
-        - File exists + timestamp: Modified or Created
-        - File doesn't exist + timestamp: Deleted
+        Event types come from the watcher's coalesced events, so the net
+        effect of a burst is kept even if the file changed again since (e.g. a
+        delete followed by a re-create is applied as a modification).
 
         Returns:
             Dictionary with processing statistics:
@@ -373,10 +413,11 @@ class GraphUpdater:
             - deleted: Files removed due to deletion
             - failed: Files that failed to process
             - elapsed_ms: Total processing time in milliseconds
+            - timings_ms: Per-stage batch timings (only when files were pending)
         """
         start_time = time.time()
 
-        stats = {
+        stats: Dict[str, Any] = {
             "total": 0,
             "modified": 0,
             "created": 0,
@@ -385,44 +426,12 @@ class GraphUpdater:
             "elapsed_ms": 0.0,
         }
 
-        # Get all files with timestamps
-        for filepath, _timestamp in self.file_watcher.file_event_timestamps.items():
-            stats["total"] += 1
-
-            # Check if file exists
-            path = Path(filepath)
-            file_exists = path.exists()
-
-            # Determine event type and process
-            if file_exists:
-                # File exists - could be modified or created
-                # Check if we have metadata for this file
-                metadata = self.graph.get_file_metadata(filepath)
-
-                if metadata is None:
-                    # No metadata - this is a new file
-                    success = self.update_on_create(filepath)
-                    if success:
-                        stats["created"] += 1
-                    else:
-                        stats["failed"] += 1
-                else:
-                    # Has metadata - this is a modification
-                    success = self.update_on_modify(filepath)
-                    if success:
-                        stats["modified"] += 1
-                    else:
-                        stats["failed"] += 1
-            else:
-                # File doesn't exist - deletion
-                success = self.update_on_delete(filepath)
-                if success:
-                    stats["deleted"] += 1
-                else:
-                    stats["failed"] += 1
-
-        # Clear processed timestamps
-        self.file_watcher.file_event_timestamps.clear()
+        events = self.file_watcher.drain_published()
+        if events:
+            stats = self.process_batch(
+                [event.path for event in events],
+                event_types={event.path: event.event_type for event in events},
+            )
 
         elapsed = time.time() - start_time
         stats["elapsed_ms"] = elapsed * 1000
@@ -434,3 +443,226 @@ class GraphUpdater:
         )
 
         return stats
+
+    def process_batch(
+        self,
+        filepaths: List[str],
+        event_types: Optional[Dict[str, FileEventType]] = None,
+    ) -> Dict[str, Any]:
+        """Apply a batch of changed files to the graph.
+
+        Pipeline:
+        1. Classify: deleted events (or, without an event type, missing files) are
+           deletions; created events and files without metadata are creations
+        2. Phase 1: extract symbols for existing files (reading/parsing in parallel)
+        3. One removal pass: relationships of all batch files, plus the outgoing
+           relationships of files that depend on changed files
+        4. Phase 2: build and store relationships for changed files in dependency
+           order (dependencies first), then rebuild the dependents' relationships
+           from their symbol data (Issue #133)
+
+        Args:
+            filepaths: Absolute paths of changed files.
+            event_types: Watcher event type per file. Files without one are
+                classified by checking whether they exist.
+
+        Returns:
+            Dictionary with total, modified, created, deleted, failed and
+            elapsed_ms, plus timings_ms with per-stage times (classify, extract,
+            remove, build).
+        """
+        start_time = time.perf_counter()
+        stats: Dict[str, Any] = {
+            "total": len(filepaths),
+            "modified": 0,
+            "created": 0,
+            "deleted": 0,
+            "failed": 0,
+            "elapsed_ms": 0.0,
+            "timings_ms": {},
+        }
+        timings: Dict[str, float] = stats["timings_ms"]
+
+        # Stage 1: Classify
+        batch: List[str] = []
+        for filepath in filepaths:
+            if self._validate_filepath(filepath):
+                batch.append(filepath)
+            else:
+                logger.warning(f"Rejecting update for file outside project root: {filepath}")
+                stats["failed"] += 1
+
+        event_types = event_types or {}
+        existing: List[str] = []
+        deleted: Set[str] = set()
+        for filepath in batch:
+            event_type = event_types.get(filepath)
+            if event_type is None:
+                exists = Path(filepath).exists()
+            else:
+                exists = event_type is not FileEventType.DELETED
+            if exists:
+                existing.append(filepath)
+            else:
+                deleted.add(filepath)
+        created = {
+            filepath
+            for filepath in existing
+            if event_types.get(filepath) is FileEventType.CREATED
+            or self.graph.get_file_metadata(filepath) is None
+        }
+
+        # Files outside the batch whose relationships to changed files must be rebuilt
+        dependents: Set[str] = set()
+        if self.relationship_builder is not None:
+            for filepath in existing:
+                dependents |= self.graph.get_direct_dependents(filepath)
+            dependents = {
+                dep
+                for dep in dependents - set(batch)
+                if not _is_special_marker(dep)
+                and self.relationship_builder.get_file_data(dep) is not None
+            }
+        stage_start = self._record_stage(timings, "classify", start_time)
+
+        # Stage 2: Phase 1 symbol extraction
+        symbols = self.analyzer.extract_symbols_batch(existing, max_workers=self.max_workers)
+        stage_start = self._record_stage(timings, "extract", stage_start)
+
+        # Stage 3: One removal pass for the whole batch
+        removed = self.graph.remove_relationships_for_files(set(batch), outgoing_from=dependents)
+        broken: Dict[str, List[Relationship]] = {}
+        for rel in removed:
+            if rel.target_file in deleted and rel.source_file not in deleted:
+                broken.setdefault(rel.target_file, []).append(rel)
+        for filepath in sorted(deleted):
+            if broken.get(filepath):
+                self._emit_broken_reference_warnings(filepath, broken[filepath])
+            self._mark_deleted(filepath)
+            stats["deleted"] += 1
+        stage_start = self._record_stage(timings, "remove", stage_start)
+
+        # Stage 4: Phase 2 relationship building in dependency order
+        for filepath in self._dependency_order(existing, symbols):
+            try:
+                success = self.analyzer.apply_symbol_data(
+                    filepath,
+                    symbols[filepath],
+                    relationship_builder=self.relationship_builder,
+                    replace_existing=False,
+                )
+            except Exception as e:
+                logger.error(f"Graph update failed for {filepath}: {e}")
+                success = False
+
+            if not success:
+                logger.warning(f"Analysis failed for {filepath}")
+                stats["failed"] += 1
+            elif filepath in created:
+                stats["created"] += 1
+            else:
+                stats["modified"] += 1
+
+        if self.relationship_builder is not None:
+            for dependent in sorted(dependents):
+                try:
+                    for rel in self.relationship_builder.build_relationships_for_file(dependent):
+                        if rel.target_file not in deleted:
+                            self.graph.add_relationship(rel)
+                except Exception as e:
+                    logger.warning(f"Failed to rebuild relationships for {dependent}: {e}")
+        self._record_stage(timings, "build", stage_start)
+
+        elapsed = time.perf_counter() - start_time
+        stats["elapsed_ms"] = elapsed * 1000
+
+        logger.info(
+            f"Applied batch of {stats['total']} files in {stats['elapsed_ms']:.1f}ms "
+            f"(classify {timings['classify']:.1f}ms, extract {timings['extract']:.1f}ms, "
+            f"remove {timings['remove']:.1f}ms, build {timings['build']:.1f}ms; "
+            f"{len(dependents)} dependents rebuilt)"
+        )
+
+        # Check performance target per file (NFR-1)
+        if filepaths and elapsed / len(filepaths) > 0.2:  # 200ms
+            logger.warning(
+                f"⚠️ Performance target exceeded: batch of {len(filepaths)} files took "
+                f"{elapsed * 1000:.1f}ms (target: <200ms per file)"
+            )
+
+        return stats
+
+    def _mark_deleted(self, filepath: str) -> None:
+        """Mark a file as deleted in graph metadata (EC-14)."""
+        deletion_timestamp = time.time()
+        metadata = FileMetadata(
+            filepath=filepath,
+            last_analyzed=deletion_timestamp,
+            relationship_count=0,
+            has_dynamic_patterns=False,
+            dynamic_pattern_types=[],
+            is_unparseable=False,
+            deleted=True,
+            deletion_time=deletion_timestamp,
+        )
+        self.graph.set_file_metadata(filepath, metadata)
+
+    @staticmethod
+    def _dependency_order(
+        filepaths: List[str], symbols: Dict[str, Optional[FileSymbolData]]
+    ) -> List[str]:
+        """Order files so that each comes after the batch files it imports from.
+
+        Dependencies are taken from resolved references. Files in an import
+        cycle keep their relative input order.
+
+        Args:
+            filepaths: Files in the batch.
+            symbols: Phase 1 symbol data per file.
+
+        Returns:
+            filepaths in dependency order.
+        """
+        # Input position per file; dependencies are visited in input order
+        position = {filepath: i for i, filepath in enumerate(filepaths)}
+        deps: Dict[str, List[str]] = {}
+        for filepath in filepaths:
+            data = symbols.get(filepath)
+            targets = {
+                ref.resolved_module
+                for ref in (data.references if data is not None else [])
+                if ref.resolved_module in position and ref.resolved_module != filepath
+            }
+            deps[filepath] = sorted(targets, key=position.__getitem__)
+
+        # Iterative depth-first post-order (import chains can exceed the recursion limit)
+        order: List[str] = []
+        visited: Set[str] = set()
+        for root in filepaths:
+            if root in visited:
+                continue
+            visited.add(root)
+            stack = [(root, iter(deps[root]))]
+            while stack:
+                node, children = stack[-1]
+                for child in children:
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append((child, iter(deps[child])))
+                        break
+                else:
+                    stack.pop()
+                    order.append(node)
+        return order
+
+    @staticmethod
+    def _record_stage(timings: Dict[str, float], stage: str, stage_start: float) -> float:
+        """Record elapsed milliseconds for a stage and return the next stage's start."""
+        now = time.perf_counter()
+        timings[stage] = (now - stage_start) * 1000
+        return now
+
+
+def _is_special_marker(filepath: str) -> bool:
+    """Check for special marker paths such as <stdlib:os> (not real files)."""
+    return filepath.startswith("<") and filepath.endswith(">")
@@ -0,0 +1,436 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Compiled ignore-pattern matching for the file watcher (NFR-7, NFR-8).
+
+All ignore patterns are compiled once into combined regular expressions, and
+results for directories are memoised, so checking a path costs a dictionary
+lookup for its directory plus a few regex matches on the file name instead of
+one fnmatch call per pattern and path component.
+
+Key features:
+- Name patterns (hardcoded dependency directories, sensitive files) matched
+  against every path component, evaluated once per directory
+- Gitignore semantics: last matching pattern wins, "!" negation, anchored
+  patterns ("/build", "src/gen"), directory-only patterns ("build/"), "**",
+  character classes, and files inside an ignored directory cannot be
+  re-included
+- Nested .gitignore files: each applies relative to its own directory and
+  takes precedence over the files above it. They are discovered lazily, one
+  stat per directory
+- Glob patterns with fnmatch semantics (user-configured patterns), matched
+  against the relative path and the file name
+
+Usage:
+    matcher = IgnoreMatcher(
+        project_root="/project",
+        name_patterns={"node_modules", "*.pem"},
+        gitignore_path="/project/.gitignore",
+    )
+
+    matcher.should_ignore("/project/node_modules/lib/index.js")  # True
+"""
+
+import fnmatch
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+logger = logging.getLogger(__name__)
+
+GITIGNORE_FILENAME = ".gitignore"
+
+# Patterns longer than this are skipped (prevents pathological patterns)
+MAX_PATTERN_LENGTH = 1000
+
+
+def load_gitignore(path: Path) -> List[str]:
+    """Load patterns from a .gitignore file.
+
+    Pattern validation:
+    - Maximum length: 1000 characters (prevents pathological patterns)
+    - Empty lines and comments are skipped
+
+    Args:
+        path: Path to the .gitignore file.
+
+    Returns:
+        Patterns in file order (order matters for negation). Empty if the file
+        does not exist or cannot be read.
+    """
+    patterns: List[str] = []
+
+    if not path.exists():
+        logger.debug(f"No .gitignore found at {path}")
+        return patterns
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            for line_num, line in enumerate(f, 1):
+                line = line.strip()
+                # Skip empty lines and comments
+                if not line or line.startswith("#"):
+                    continue
+
+                # Validate pattern length (security: prevent pathological patterns)
+                if len(line) > MAX_PATTERN_LENGTH:
+                    logger.warning(
+                        f".gitignore line {line_num}: Pattern too long (>1000 chars), skipping"
+                    )
+                    continue
+
+                patterns.append(line)
+
+        logger.debug(f"Loaded {len(patterns)} patterns from {path}")
+    except (FileNotFoundError, PermissionError) as e:
+        logger.warning(f"Failed to load .gitignore: {e}")
+    except UnicodeDecodeError as e:
+        logger.error(f"Failed to decode .gitignore (encoding error): {e}")
+    except OSError as e:
+        logger.error(f"Failed to read .gitignore: {e}")
+
+    return patterns
+
+
+def _translate_segment(segment: str) -> str:
+    """Translate one path segment of a gitignore glob to a regex.
+
+    "*" and "?" never match "/". A backslash escapes the next character.
+    """
+    out: List[str] = []
+    i = 0
+    n = len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "\\" and i < n:
+            out.append(re.escape(segment[i]))
+            i += 1
+        elif c == "[":
+            end = i
+            if end < n and segment[end] in "!^":
+                end += 1
+            if end < n and segment[end] == "]":
+                end += 1
+            while end < n and segment[end] != "]":
+                end += 1
+            if end >= n:
+                # No closing bracket: literal "["
+                out.append(re.escape(c))
+                continue
+            body = segment[i:end]
+            i = end + 1
+            negate = body[:1] in ("!", "^")
+            if negate:
+                body = body[1:]
+            body = re.sub(r"([\\\[&~|])", r"\\\1", body)
+            out.append(f"[{'^' if negate else ''}{body}]")
+        else:
+            out.append(re.escape(c))
+    return "".join(out)
+
+
+def translate_gitignore_pattern(pattern: str) -> Optional[Tuple[str, bool, bool]]:
+    """Translate a gitignore pattern to a regex over paths relative to its base.
+
+    Args:
+        pattern: A line from a .gitignore file (comments already removed).
+
+    Returns:
+        Tuple of (regex, negated, directory_only), or None if the pattern
+        matches nothing.
+    """
+    negated = False
+    if pattern.startswith("!"):
+        negated = True
+        pattern = pattern[1:]
+    elif pattern.startswith(("\\!", "\\#")):
+        pattern = pattern[1:]
+
+    directory_only = pattern.endswith("/")
+    pattern = pattern.rstrip("/")
+    if not pattern:
+        return None
+
+    # A slash at the start or in the middle anchors the pattern to the base
+    # directory; otherwise it matches a name at any depth.
+    anchored = "/" in pattern
+    segments = pattern.lstrip("/").split("/")
+
+    parts: List[str] = [] if anchored else ["(?:.*/)?"]
+    for index, segment in enumerate(segments):
+        last = index == len(segments) - 1
+        if segment == "**":
+            parts.append(".+" if last else "(?:.*/)?")
+        else:
+            parts.append(_translate_segment(segment) + ("" if last else "/"))
+    return "".join(parts), negated, directory_only
+
+
+class GitignoreRules:
+    """Compiled patterns of one .gitignore file.
+
+    The patterns are combined into one regex per kind of path (files and
+    directories). Alternatives are ordered from the last pattern to the first
+    and each is a capturing group, so the first alternative that matches is the
+    pattern git would apply (last match wins), and its group index tells
+    whether it was a negation.
+    """
+
+    def __init__(self, base: str, patterns: Iterable[str]):
+        """Compile patterns.
+
+        Args:
+            base: Directory of the .gitignore file relative to the project
+                root ("" for the root), using "/" as separator.
+            patterns: Patterns in file order.
+        """
+        self.base = base
+        self.patterns = list(patterns)
+        self._prefix = f"{base}/" if base else ""
+
+        file_rules: List[Tuple[str, bool]] = []
+        dir_rules: List[Tuple[str, bool]] = []
+        for pattern in self.patterns:
+            translated = translate_gitignore_pattern(pattern)
+            if translated is None:
+                continue
+            regex, negated, directory_only = translated
+            dir_rules.append((regex, negated))
+            if not directory_only:
+                file_rules.append((regex, negated))
+
+        self._file_regex, self._file_negated = self._compile(file_rules)
+        self._dir_regex, self._dir_negated = self._compile(dir_rules)
+
+    @staticmethod
+    def _compile(rules: List[Tuple[str, bool]]) -> Tuple[Optional[Pattern[str]], List[bool]]:
+        """Combine rules into one regex with a group per rule, last rule first."""
+        if not rules:
+            return None, []
+        ordered = rules[::-1]
+        regex = "|".join(f"({rule})" for rule, _ in ordered)
+        # Group 0 does not exist; index 1 is the first alternative
+        return re.compile(f"(?s:{regex})\\Z"), [False] + [negated for _, negated in ordered]
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """Apply the patterns to a path.
+
+        Args:
+            rel_path: Path relative to the project root, "/"-separated.
+            is_dir: Whether the path is a directory.
+
+        Returns:
+            True if the path is ignored, False if it is re-included by a
+            negated pattern, None if no pattern matches.
+        """
+        regex, negated = (
+            (self._dir_regex, self._dir_negated)
+            if is_dir
+            else (self._file_regex, self._file_negated)
+        )
+        if regex is None:
+            return None
+        if self._prefix:
+            if not rel_path.startswith(self._prefix):
+                return None
+            rel_path = rel_path[len(self._prefix) :]
+        m = regex.match(rel_path)
+        if m is None:
+            return None
+        return not negated[m.lastindex or 0]
+
+
+def _compile_globs(patterns: Iterable[str]) -> Optional[Pattern[str]]:
+    """Combine fnmatch-style globs into one regex (None if there are none)."""
+    translated = [fnmatch.translate(pattern) for pattern in sorted(patterns)]
+    if not translated:
+        return None
+    return re.compile("|".join(translated))
+
+
+class IgnoreMatcher:
+    """Decides whether paths under a project root are ignored.
+
+    Thread Safety:
+        Memoisation caches are plain dicts. Concurrent callers may compute the
+        same entry twice, which is harmless since results are deterministic.
+        reload() replaces the caches wholesale.
+    """
+
+    def __init__(
+        self,
+        project_root: str,
+        name_patterns: Iterable[str] = (),
+        sensitive_patterns: Iterable[str] = (),
+        gitignore_path: Optional[str] = None,
+        glob_patterns: Iterable[str] = (),
+        nested_gitignores: bool = True,
+    ):
+        """Compile all patterns.
+
+        Args:
+            project_root: Root directory; paths are matched relative to it.
+            name_patterns: Globs matched against every path component.
+            sensitive_patterns: Like name_patterns; matches are logged.
+            gitignore_path: Root .gitignore file (defaults to
+                {project_root}/.gitignore).
+            glob_patterns: fnmatch globs matched against the relative path and
+                the file name.
+            nested_gitignores: Whether .gitignore files in subdirectories apply.
+        """
+        self.project_root = Path(project_root).resolve()
+        self.gitignore_path = (
+            Path(gitignore_path) if gitignore_path else self.project_root / GITIGNORE_FILENAME
+        )
+        self.nested_gitignores = nested_gitignores
+        self._root_prefix = str(self.project_root).rstrip(os.sep) + os.sep
+
+        self._name_regex = _compile_globs(name_patterns)
+        self._sensitive_regex = _compile_globs(sensitive_patterns)
+        self._glob_regex = _compile_globs(glob_patterns)
+
+        self.root_rules = GitignoreRules("", load_gitignore(self.gitignore_path))
+        self._dir_cache: Dict[str, bool] = {}
+        self._rules_cache: Dict[str, Tuple[GitignoreRules, ...]] = {}
+
+    def reload(self, gitignore_file: Optional[str] = None) -> None:
+        """Drop memoised results after a .gitignore file changed.
+
+        Args:
+            gitignore_file: The changed file. The root .gitignore is re-read
+                immediately; nested files are re-read on next use.
+        """
+        if gitignore_file is None or Path(gitignore_file) == self.gitignore_path:
+            self.root_rules = GitignoreRules("", load_gitignore(self.gitignore_path))
+        self._dir_cache = {}
+        self._rules_cache = {}
+        logger.debug(f"Ignore rules reloaded ({gitignore_file or 'all'})")
+
+    def should_ignore(self, file_path: str) -> bool:
+        """Check whether a file is ignored.
+
+        Args:
+            file_path: Absolute path, or path relative to the project root.
+                Absolute paths outside the project root are checked against
+                name and glob patterns only.
+
+        Returns:
+            True if the file should be ignored.
+        """
+        if file_path.startswith(self._root_prefix):
+            rel_path = file_path[len(self._root_prefix) :]
+            glob_path = rel_path
+        elif os.path.isabs(file_path):
+            rel_path = ""
+            glob_path = file_path
+        else:
+            rel_path = file_path
+            glob_path = file_path
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+
+        if rel_path:
+            dir_path, _, name = rel_path.rpartition("/")
+            if self._is_dir_ignored(dir_path):
+                return True
+            if self._name_ignored(name):
+                return True
+            if self._gitignore_match(rel_path, dir_path, is_dir=False):
+                return True
+        else:
+            # Outside the project: name patterns apply to every component
+            for part in Path(file_path).parts:
+                if self._name_ignored(part):
+                    return True
+            name = os.path.basename(file_path)
+
+        if self._glob_regex is not None:
+            return bool(self._glob_regex.match(glob_path) or self._glob_regex.match(name))
+        return False
+
+    def should_ignore_dir(self, dir_path: str) -> bool:
+        """Check whether a directory is ignored, so a walk can skip it entirely.
+
+        Only name and .gitignore patterns are applied: glob patterns are
+        matched against file paths and may match some files of a directory
+        but not others.
+
+        Args:
+            dir_path: Absolute path, or path relative to the project root.
+
+        Returns:
+            True if the directory and everything below it is ignored.
+        """
+        if dir_path in ("", os.curdir) or dir_path + os.sep == self._root_prefix:
+            return False
+        if dir_path.startswith(self._root_prefix):
+            rel_path = dir_path[len(self._root_prefix) :].rstrip(os.sep)
+        elif os.path.isabs(dir_path):
+            return any(self._name_ignored(part) for part in Path(dir_path).parts)
+        else:
+            rel_path = dir_path.rstrip(os.sep)
+        if os.sep != "/":
+            rel_path = rel_path.replace(os.sep, "/")
+        return self._is_dir_ignored(rel_path)
+
+    def _name_ignored(self, name: str) -> bool:
+        """Check a single path component against name and sensitive patterns."""
+        if self._name_regex is not None and self._name_regex.match(name):
+            return True
+        if self._sensitive_regex is not None and self._sensitive_regex.match(name):
+            logger.debug(f"Ignoring sensitive file/directory: {name}")
+            return True
+        return False
+
+    def _is_dir_ignored(self, dir_path: str) -> bool:
+        """Check (memoised) whether a directory or any of its parents is ignored."""
+        cached = self._dir_cache.get(dir_path)
+        if cached is not None:
+            return cached
+        if not dir_path:
+            result = False
+        else:
+            parent, _, name = dir_path.rpartition("/")
+            result = (
+                self._is_dir_ignored(parent)
+                or self._name_ignored(name)
+                or self._gitignore_match(dir_path, parent, is_dir=True)
+            )
+        self._dir_cache[dir_path] = result
+        return result
+
+    def _gitignore_match(self, rel_path: str, dir_path: str, is_dir: bool) -> bool:
+        """Apply .gitignore files from the deepest directory up to the root."""
+        for rules in self._rules_for_dir(dir_path):
+            result = rules.match(rel_path, is_dir)
+            if result is not None:
+                return result
+        return False
+
+    def _rules_for_dir(self, dir_path: str) -> Tuple[GitignoreRules, ...]:
+        """Get (memoised) the .gitignore rules that apply inside a directory.
+
+        Returns:
+            Rules ordered from the deepest .gitignore to the root one.
+        """
+        cached = self._rules_cache.get(dir_path)
+        if cached is not None:
+            return cached
+        if not dir_path:
+            result: Tuple[GitignoreRules, ...] = (self.root_rules,)
+        else:
+            parent_rules = self._rules_for_dir(dir_path.rpartition("/")[0])
+            nested = self.project_root / dir_path / GITIGNORE_FILENAME
+            if self.nested_gitignores and nested.is_file():
+                result = (GitignoreRules(dir_path, load_gitignore(nested)),) + parent_rules
+            else:
+                result = parent_rules
+        self._rules_cache[dir_path] = result
+        return result
@@ -5,12 +5,22 @@
 
 This module implements structured injection event logging per TDD Section 3.8.5:
 - JSONL format (one JSON object per line)
-- Real-time logging with immediate flush
+- Real-time logging with immediate flush, or queued and written in batches by
+  a background AsyncLogWriter (write_policy)
 - Date-based file rotation for eventual immutability (Issue #150)
+- Size-based rotation into compressed segments (rotation_policy)
 - Injection statistics for session metrics
-- Query API for recent injections (FR-29)
+- Query API for recent injections (FR-29), with costs that depend on the
+  number of events requested rather than the size of the log: an in-memory
+  ring buffer of recent events per target file, a sidecar index of event
+  offsets per target file, and reading the log backwards from its end
 
 Log Location: ~/.cross_file_context/injections/<DATE>-<SESSION-ID>.jsonl
+Sidecar index: <log file>.idx (JSON, rewritten when the log is flushed for a
+query and when the logger is closed)
+Segments: <log file stem>.<NNNN>.jsonl.gz, listed in <log file>.manifest.json
+with the number of events per target file, so queries for a target file skip
+segments without its events
 
 Related Requirements:
 - FR-26 (log all context injections)
@@ -23,18 +33,33 @@ Related Requirements:
 
 import json
 import logging
-from collections import Counter
+import os
+import threading
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO
+from typing import IO, Any, Deque, Dict, Iterator, List, Optional, TextIO, Union
 
+from xfile_context.async_log_writer import AsyncLogWriter, LogWritePolicy
 from xfile_context.log_config import (
     build_log_filename,
     get_current_utc_date,
     get_injections_dir,
     validate_filename_component,
 )
+from xfile_context.log_segments import (
+    COMPRESSION_NONE,
+    LogRotationPolicy,
+    LogSegmenter,
+    get_segment_paths,
+    in_time_range,
+    iter_log_lines,
+    log_exists,
+    open_segment_entry,
+    parse_timestamp,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +74,21 @@ DEFAULT_INJECTION_LOG_FILE = "injections.jsonl"
 # remains for test compatibility
 LOG_SIZE_WARNING_THRESHOLD_BYTES = 50 * 1024 * 1024  # 50MB
 
+# Recent events kept in memory for recent-injection queries
+DEFAULT_RECENT_BUFFER_SIZE = 1000
+
+# Offsets of the most recent events per target file kept in the sidecar index
+DEFAULT_INDEX_ENTRIES_PER_TARGET = 50
+
+# Sidecar index format version
+INDEX_VERSION = 1
+
+# Target files counted per segment in the manifest
+DEFAULT_SEGMENT_TARGETS_TRACKED = 1000
+
+# Block size for reading logs backwards
+REVERSE_READ_BLOCK_SIZE = 64 * 1024
+
 
 @dataclass
 class InjectionEvent:
@@ -218,15 +258,27 @@ class InjectionLogger:
     """Logger for writing injection events to JSONL file.
 
     Provides real-time injection event logging with immediate flush to ensure
-    events are persisted even if the session terminates unexpectedly.
+    events are persisted even if the session terminates unexpectedly. With a
+    write_policy, events are instead queued and written by a background
+    thread, so logging never waits for the disk.
 
     Features:
     - JSONL format (one JSON object per line)
-    - Immediate flush after each write
+    - Immediate flush after each write, or batched background writes
     - Date-based file rotation for eventual immutability (Issue #150)
     - Injection statistics generation for session metrics
     - Query API for recent injections (FR-29)
 
+    Recent-injection queries are answered from an in-memory ring buffer of
+    recent events (indexed by target file) when it holds enough matching
+    events. Otherwise the log is read: the logger records the byte offset of
+    the latest events per target file and writes them to a sidecar index, so
+    the reader seeks to the requested events instead of scanning the log.
+
+    Thread Safety:
+        Writes and statistics updates are serialized by an internal lock, so
+        concurrent reads can log injections from worker threads.
+
     Usage:
         logger = InjectionLogger(session_id="abc-123")
         logger.log_injection(injection_event)
@@ -252,6 +304,10 @@ class InjectionLogger:
         max_unique_files_tracked: int = 10000,
         session_id: Optional[str] = None,
         data_root: Optional[Path] = None,
+        write_policy: Optional[LogWritePolicy] = None,
+        recent_buffer_size: int = DEFAULT_RECENT_BUFFER_SIZE,
+        index_entries_per_target: int = DEFAULT_INDEX_ENTRIES_PER_TARGET,
+        rotation_policy: Optional[LogRotationPolicy] = None,
     ) -> None:
         """Initialize the injection logger.
 
@@ -270,6 +326,17 @@ class InjectionLogger:
                        If None, falls back to legacy static filename.
             data_root: Root directory for logs. If provided, uses
                       {data_root}/injections/ as log directory.
+            write_policy: If provided, events are written by a background
+                         AsyncLogWriter with this durability policy. If None,
+                         each event is written and flushed immediately.
+            recent_buffer_size: Number of recent events kept in memory for
+                               get_recent_injections(). 0 disables the buffer.
+            index_entries_per_target: Number of event offsets per target file
+                                     kept in the sidecar index. 0 disables
+                                     the index.
+            rotation_policy: If provided (with a size limit), the log file is
+                            rotated into a compressed segment whenever it
+                            grows past the limit.
 
         Raises:
             ValueError: If log_file contains path separators.
@@ -319,6 +386,43 @@ class InjectionLogger:
         # File handle (lazy initialization)
         self._file_handle: Optional[TextIO] = None
 
+        # Serializes writes and statistics updates
+        self._lock = threading.Lock()
+
+        # Ring buffer of recent events, and the same events by target file
+        self._recent_buffer_size = recent_buffer_size
+        self._recent: Deque[InjectionEvent] = deque()
+        self._recent_by_target: Dict[str, Deque[InjectionEvent]] = {}
+
+        # Sidecar index: byte offsets of the latest events per target file in
+        # the current log file, tracked from _index_start (the log size when
+        # this logger started writing to it) up to _file_offset
+        self._index_entries_per_target = index_entries_per_target
+        self._offsets_by_target: Dict[str, Deque[int]] = {}
+        self._index_overflow = False  # Some target files were not tracked
+        self._index_start: Optional[int] = None
+        self._file_offset = 0
+        self._index_dirty = False
+
+        # Size-based rotation (None: the log file only rotates by date)
+        self._segmenter: Optional[LogSegmenter] = None
+        if rotation_policy is not None and rotation_policy.max_segment_bytes > 0:
+            self._segmenter = LogSegmenter(
+                rotation_policy,
+                max_keys=min(max_unique_files_tracked, DEFAULT_SEGMENT_TARGETS_TRACKED),
+            )
+
+        # Background writer (None: write on the calling thread)
+        self._writer: Optional[AsyncLogWriter] = None
+        if write_policy is not None:
+            self._writer = AsyncLogWriter(
+                serialize=_serialize_event,
+                write_lines=self._write_lines,
+                flush=self._flush_file,
+                policy=write_policy,
+                name="injection",
+            )
+
     def _ensure_log_dir(self) -> None:
         """Create log directory if it doesn't exist."""
         self._log_dir.mkdir(parents=True, exist_ok=True)
@@ -346,6 +450,13 @@ class InjectionLogger:
                 self._file_handle.close()
                 self._file_handle = None
                 logger.debug(f"Rotated injection log: {self._current_date} -> {current_date}")
+            self._write_index()
+            self._reset_index()
+            if self._segmenter is not None:
+                self._segmenter.reset()
+            # Recent-injection queries cover the current log file only
+            self._recent.clear()
+            self._recent_by_target.clear()
             self._current_date = current_date
             self._log_file = build_log_filename(self._session_id)  # type: ignore[arg-type]
 
@@ -364,24 +475,163 @@ class InjectionLogger:
             # noqa: SIM115 - We manage the file handle lifecycle via close() method
             self._file_handle = open(log_path, "a", encoding="utf-8")  # noqa: SIM115
             logger.debug(f"Opened injection log file: {log_path}")
+            size = os.fstat(self._file_handle.fileno()).st_size
+            if self._index_start is None or size != self._file_offset:
+                # New file, or written by someone else since we last wrote
+                self._reset_index()
+                self._index_start = size
+                self._file_offset = size
+            if self._segmenter is not None:
+                self._segmenter.opened(log_path, size)
         return self._file_handle
 
+    def _append_lines(
+        self, lines: List[str], events: List[InjectionEvent], flush: bool = False
+    ) -> None:
+        """Append serialized events to the log file and index them (lock held).
+
+        Rotates the log file into a segment if it grew past the size limit.
+        """
+        file_handle = self._open_file()
+        track_offsets = self._index_entries_per_target > 0
+        rotate = False
+        if track_offsets or self._segmenter is not None:
+            offset = self._file_offset
+            for line, event in zip(lines, events):
+                size = len(line.encode("utf-8"))
+                if track_offsets:
+                    self._index_offset(event.target_file, offset)
+                if self._segmenter is not None:
+                    rotate = (
+                        self._segmenter.record(size, event.timestamp, key=event.target_file)
+                        or rotate
+                    )
+                offset += size
+            self._file_offset = offset
+            self._index_dirty = self._index_dirty or track_offsets
+        file_handle.writelines(lines)
+        if flush:
+            file_handle.flush()
+        if rotate:
+            self._rotate_segment()
+
+    def _rotate_segment(self) -> None:
+        """Move the log file aside into a segment (lock held).
+
+        Only the rename runs under the lock; the segment is compressed and
+        recorded in the manifest by a background thread.
+        """
+        assert self._segmenter is not None
+        if self._file_handle is not None:
+            self._file_handle.close()
+            self._file_handle = None
+        log_path = self._get_log_path()
+        if self._segmenter.rotate(log_path) is None:
+            return
+        # Indexed offsets refer to the rotated file; the ring buffer stays
+        # valid since queries read segments too
+        self._reset_index()
+        get_index_path(log_path).unlink(missing_ok=True)
+
+    def _write_lines(self, lines: List[str], events: List[InjectionEvent]) -> None:
+        """Append serialized lines to the log file (background writer callback)."""
+        with self._lock:
+            self._append_lines(lines, events)
+
+    def _index_offset(self, target_file: str, offset: int) -> None:
+        """Record the offset of an event for target_file (lock held)."""
+        offsets = self._offsets_by_target.get(target_file)
+        if offsets is None:
+            if len(self._offsets_by_target) >= self._max_unique_files_tracked:
+                self._index_overflow = True
+                return
+            offsets = deque(maxlen=self._index_entries_per_target)
+            self._offsets_by_target[target_file] = offsets
+        offsets.append(offset)
+
+    def _reset_index(self) -> None:
+        """Forget indexed offsets, e.g. when switching log files (lock held)."""
+        self._offsets_by_target = {}
+        self._index_overflow = False
+        self._index_start = None
+        self._file_offset = 0
+        self._index_dirty = False
+
+    def _write_index(self) -> None:
+        """Write the sidecar index for the current log file if it changed (lock held)."""
+        if not self._index_dirty or self._index_start is None:
+            return
+        index = {
+            "version": INDEX_VERSION,
+            "log_size": self._file_offset,
+            "start": self._index_start,
+            "max_offsets": self._index_entries_per_target,
+            "overflow": self._index_overflow,
+            "targets": {
+                target: list(offsets) for target, offsets in self._offsets_by_target.items()
+            },
+        }
+        index_path = get_index_path(self._get_log_path())
+        temp_path = index_path.with_name(index_path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(temp_path, index_path)
+            self._index_dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to write injection log index {index_path}: {e}")
+
+    def _remember_recent(self, event: InjectionEvent) -> None:
+        """Add an event to the ring buffer of recent events (lock held)."""
+        if self._recent_buffer_size <= 0:
+            return
+        if len(self._recent) >= self._recent_buffer_size:
+            evicted = self._recent.popleft()
+            # The evicted event is the oldest buffered event of its target
+            evicted_events = self._recent_by_target[evicted.target_file]
+            evicted_events.popleft()
+            if not evicted_events:
+                del self._recent_by_target[evicted.target_file]
+        self._recent.append(event)
+        target_events = self._recent_by_target.get(event.target_file)
+        if target_events is None:
+            target_events = deque()
+            self._recent_by_target[event.target_file] = target_events
+        target_events.append(event)
+
+    def _flush_file(self) -> None:
+        """Flush the log file (background writer callback)."""
+        with self._lock:
+            if self._file_handle is not None:
+                self._file_handle.flush()
+
     def log_injection(self, event: InjectionEvent) -> None:
         """Log a single injection event to the JSONL file.
 
-        The event is immediately flushed to disk to ensure persistence.
+        The event is immediately flushed to disk to ensure persistence, or
+        queued for the background writer if there is one.
 
         Args:
             event: InjectionEvent to log.
         """
-        file_handle = self._open_file()
+        if self._writer is not None and self._writer.submit(event):
+            with self._lock:
+                self._record_event(event)
+            return
 
         # Write JSON line
-        json_line = json.dumps(event.to_dict(), separators=(",", ":"))
-        file_handle.write(json_line + "\n")
-        file_handle.flush()  # Immediate flush per TDD 3.8.5
+        json_line = _serialize_event(event)
+        with self._lock:
+            self._append_lines([json_line + "\n"], [event], flush=True)  # Per TDD 3.8.5
+            self._record_event(event)
+
+    def _record_event(self, event: InjectionEvent) -> None:
+        """Update in-memory statistics for a logged event (lock held).
 
-        # Update statistics
+        Args:
+            event: InjectionEvent that was logged.
+        """
+        self._remember_recent(event)
         self._injection_count += 1
         self._by_relationship_type[event.relationship_type] += 1
         self._total_tokens += event.token_count
@@ -402,40 +652,34 @@ class InjectionLogger:
         """Log multiple injection events to the JSONL file.
 
         Each event is written on its own line and the file is flushed
-        after all events are written.
+        after all events are written, or the events are queued for the
+        background writer if there is one.
 
         Args:
             events: List of InjectionEvents to log.
         """
+        if self._writer is not None:
+            queued = 0
+            for event in events:
+                if not self._writer.submit(event):
+                    break  # Writer closed: write the rest here
+                queued += 1
+            with self._lock:
+                for event in events[:queued]:
+                    self._record_event(event)
+            events = events[queued:]
+
         if not events:
             return
 
-        file_handle = self._open_file()
-
-        for event in events:
-            # Write JSON line
-            json_line = json.dumps(event.to_dict(), separators=(",", ":"))
-            file_handle.write(json_line + "\n")
-
-            # Update statistics
-            self._injection_count += 1
-            self._by_relationship_type[event.relationship_type] += 1
-            self._total_tokens += event.token_count
-
-            if event.cache_hit:
-                self._cache_hits += 1
-            else:
-                self._cache_misses += 1
-
-            # Only track source file stats up to limit
-            if (
-                len(self._by_source_file) < self._max_unique_files_tracked
-                or event.source_file in self._by_source_file
-            ):
-                self._by_source_file[event.source_file] += 1
+        # Write JSON lines
+        lines = [_serialize_event(event) + "\n" for event in events]
+        with self._lock:
+            # Flush after batch
+            self._append_lines(lines, events, flush=True)
 
-        # Flush after batch
-        file_handle.flush()
+            for event in events:
+                self._record_event(event)
 
     def get_statistics(self, top_files_count: int = 5) -> InjectionStatistics:
         """Get injection statistics for session metrics.
@@ -453,18 +697,77 @@ class InjectionLogger:
         Returns:
             InjectionStatistics with aggregated data.
         """
-        # Get top source files by injection count
-        top_files = self._by_source_file.most_common(top_files_count)
-        by_source_file = dict(top_files)
-
-        return InjectionStatistics(
-            total_injections=self._injection_count,
-            by_relationship_type=dict(self._by_relationship_type),
-            by_source_file=by_source_file,
-            total_tokens_injected=self._total_tokens,
-            cache_hit_count=self._cache_hits,
-            cache_miss_count=self._cache_misses,
-        )
+        with self._lock:
+            # Get top source files by injection count
+            top_files = self._by_source_file.most_common(top_files_count)
+            by_source_file = dict(top_files)
+
+            return InjectionStatistics(
+                total_injections=self._injection_count,
+                by_relationship_type=dict(self._by_relationship_type),
+                by_source_file=by_source_file,
+                total_tokens_injected=self._total_tokens,
+                cache_hit_count=self._cache_hits,
+                cache_miss_count=self._cache_misses,
+            )
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until all events logged so far are written to the log file.
+
+        Also brings the sidecar index up to date. Without a background writer,
+        events are already written when they are logged.
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if all events logged so far are written and flushed.
+        """
+        flushed = self._writer.flush(timeout) if self._writer is not None else True
+        with self._lock:
+            self._write_index()
+        return flushed
+
+    def get_recent_injections(
+        self, target_file: Optional[str] = None, limit: int = 10
+    ) -> List[InjectionEvent]:
+        """Get recent injection events from the current log (FR-29).
+
+        Served from the in-memory ring buffer when it holds at least limit
+        matching events; otherwise reads the log with get_recent_injections()
+        after flushing queued events and the sidecar index.
+
+        Args:
+            target_file: If provided, only return events for this target file.
+            limit: Maximum number of events to return.
+
+        Returns:
+            List of InjectionEvent objects, most recent first.
+        """
+        if limit <= 0:
+            return []
+        with self._lock:
+            if target_file is None:
+                buffered = list(islice(reversed(self._recent), limit))
+            else:
+                target_events = self._recent_by_target.get(target_file, deque())
+                buffered = list(islice(reversed(target_events), limit))
+        if len(buffered) == limit:
+            return buffered
+
+        self.flush()
+        return get_recent_injections(self._get_log_path(), target_file, limit)
+
+    def get_writer_statistics(self) -> Optional[Dict[str, Any]]:
+        """Get background writer statistics (see AsyncLogWriter.get_statistics()).
+
+        Returns:
+            Queueing and backpressure statistics, or None without a background
+            writer.
+        """
+        if self._writer is None:
+            return None
+        return self._writer.get_statistics()
 
     def get_log_path(self) -> Path:
         """Get the path to the log file.
@@ -480,6 +783,7 @@ class InjectionLogger:
         Returns:
             Size in bytes, or 0 if file doesn't exist.
         """
+        self.flush()
         log_path = self._get_log_path()
         if log_path.exists():
             return log_path.stat().st_size
@@ -489,12 +793,19 @@ class InjectionLogger:
         """Close the log file handle.
 
         Should be called when logging is complete to ensure resources
-        are released.
+        are released. Queued events are written first; events logged after
+        closing are written synchronously.
         """
-        if self._file_handle is not None:
-            self._file_handle.close()
-            self._file_handle = None
-            logger.debug(f"Closed injection log file: {self._get_log_path()}")
+        if self._writer is not None:
+            self._writer.close()
+        with self._lock:
+            self._write_index()
+            if self._file_handle is not None:
+                self._file_handle.close()
+                self._file_handle = None
+                logger.debug(f"Closed injection log file: {self._get_log_path()}")
+        if self._segmenter is not None:
+            self._segmenter.wait()
 
     def clear_statistics(self) -> None:
         """Clear the in-memory statistics.
@@ -517,6 +828,206 @@ class InjectionLogger:
         self.close()
 
 
+def _serialize_event(event: InjectionEvent) -> str:
+    """Serialize an injection event as one compact JSON line (without newline)."""
+    return json.dumps(event.to_dict(), separators=(",", ":"))
+
+
+def get_index_path(log_path: Path) -> Path:
+    """Get the path of a log file's sidecar index.
+
+    Args:
+        log_path: Path to the injections log file.
+
+    Returns:
+        Path to <log file>.idx
+    """
+    return log_path.with_name(log_path.name + ".idx")
+
+
+def _load_index(log_path: Path, log_size: int) -> Optional[Dict[str, Any]]:
+    """Load a sidecar index if it exists and matches the log file."""
+    try:
+        with open(get_index_path(log_path), encoding="utf-8") as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if (
+        not isinstance(index, dict)
+        or index.get("version") != INDEX_VERSION
+        or not isinstance(index.get("targets"), dict)
+        or not isinstance(index.get("log_size"), int)
+        or not isinstance(index.get("start"), int)
+        or not index["start"] <= index["log_size"] <= log_size
+    ):
+        return None
+    return index
+
+
+def _iter_lines_reversed(f: IO[bytes], start: int, end: int) -> Iterator[bytes]:
+    """Yield the non-empty lines of f[start:end] from last to first.
+
+    Reads fixed-size blocks backwards from end, so the cost depends on how
+    many lines are consumed, not on the size of the file. start must be the
+    beginning of a line.
+    """
+    position = end
+    remainder = b""
+    while position > start:
+        size = min(REVERSE_READ_BLOCK_SIZE, position - start)
+        position -= size
+        f.seek(position)
+        lines = (f.read(size) + remainder).split(b"\n")
+        # The first piece may continue in the previous block
+        remainder = lines[0]
+        for line in reversed(lines[1:]):
+            if line.strip():
+                yield line
+    if remainder.strip():
+        yield remainder
+
+
+def _target_needle(target_file: Optional[str]) -> Optional[str]:
+    """Get a substring that every log line for target_file contains, if any.
+
+    Lines without the (JSON-encoded) path cannot match and need not be parsed.
+    """
+    if target_file is None or not target_file.isascii():
+        return None  # The writer may not have escaped non-ASCII characters
+    return json.dumps(target_file)
+
+
+def _parse_event(line: Union[bytes, str]) -> Optional[InjectionEvent]:
+    """Parse one log line, or return None (with a warning) if it is malformed."""
+    try:
+        return InjectionEvent.from_dict(json.loads(line))
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Skipping malformed log entry: {e}")
+        return None
+
+
+def _scan_reversed(
+    f: IO[bytes], start: int, end: int, target_file: Optional[str], limit: int
+) -> List[InjectionEvent]:
+    """Collect up to limit matching events from f[start:end], most recent first."""
+    text_needle = _target_needle(target_file)
+    needle = text_needle.encode("ascii") if text_needle is not None else None
+    events: List[InjectionEvent] = []
+    if limit <= 0:
+        return events
+    for line in _iter_lines_reversed(f, start, end):
+        if needle is not None and needle not in line:
+            continue
+        event = _parse_event(line)
+        if event is None:
+            continue
+        if target_file is None or event.target_file == target_file:
+            events.append(event)
+            if len(events) == limit:
+                break
+    return events
+
+
+def _read_indexed_events(
+    f: IO[bytes], index: Dict[str, Any], log_size: int, target_file: str, limit: int
+) -> Optional[List[InjectionEvent]]:
+    """Collect up to limit events for target_file using a sidecar index.
+
+    Returns:
+        Events, most recent first, or None if the index does not match the log.
+    """
+    indexed_size = index["log_size"]
+    # Events written after the index was last updated
+    events = _scan_reversed(f, indexed_size, log_size, target_file, limit)
+
+    offsets = index["targets"].get(target_file, [])
+    for offset in reversed(offsets):
+        if len(events) == limit:
+            return events
+        if not isinstance(offset, int) or not 0 <= offset < indexed_size:
+            return None
+        f.seek(offset)
+        event = _parse_event(f.readline())
+        if event is None or event.target_file != target_file:
+            return None  # Stale index
+        events.append(event)
+
+    if len(events) < limit:
+        # Older events that may not be in the index
+        if offsets and len(offsets) >= index.get("max_offsets", 0):
+            older_end = offsets[0]  # Only the latest offsets were kept
+        elif not offsets and index.get("overflow"):
+            older_end = indexed_size  # The target file was not tracked
+        else:
+            older_end = index["start"]  # Written before the index was started
+        events.extend(_scan_reversed(f, 0, older_end, target_file, limit - len(events)))
+    return events
+
+
+def _count_segment_matches(segment: Dict[str, Any], target_file: Optional[str]) -> Optional[int]:
+    """Get the number of matching events in a segment from its manifest entry.
+
+    Returns:
+        The number of events (for target_file, if provided), or None if the
+        manifest does not record the target files of the segment.
+    """
+    counts = segment.get("key_counts")
+    if not isinstance(counts, dict):
+        return None
+    if target_file is None:
+        return sum(count for count in counts.values() if isinstance(count, int))
+    count = counts.get(target_file, 0)
+    return count if isinstance(count, int) else None
+
+
+def _scan_segment(
+    log_path: Path, segment: Dict[str, Any], target_file: Optional[str], limit: int
+) -> List[InjectionEvent]:
+    """Collect up to limit matching events from one segment, most recent first.
+
+    Pending segments are not compressed yet and are read backwards like the
+    log file. Compressed segments can only be read forwards, so they are
+    streamed while keeping their latest matching lines.
+    """
+    if segment.get("compression") == COMPRESSION_NONE:
+        try:
+            with open(segment["path"], "rb") as f:
+                return _scan_reversed(f, 0, os.fstat(f.fileno()).st_size, target_file, limit)
+        except FileNotFoundError:
+            pass  # Compressed since it was listed
+
+    needle = _target_needle(target_file)
+    latest: Deque[InjectionEvent] = deque(maxlen=limit)
+    with open_segment_entry(log_path, segment) as f:
+        for line in f:
+            if not line.strip() or (needle is not None and needle not in line):
+                continue
+            event = _parse_event(line)
+            if event is not None and target_file in (None, event.target_file):
+                latest.append(event)
+    return list(reversed(latest))
+
+
+def _scan_segments(log_path: Path, target_file: Optional[str], limit: int) -> List[InjectionEvent]:
+    """Collect up to limit matching events from a log's segments, most recent first.
+
+    Segments are read newest first, and reading stops once limit events are
+    found. Segments whose manifest entry shows no matching events are skipped
+    without being opened.
+    """
+    events: List[InjectionEvent] = []
+    for segment in reversed(get_segment_paths(log_path)):
+        if len(events) >= limit:
+            break
+        if _count_segment_matches(segment, target_file) == 0:
+            continue
+        try:
+            events.extend(_scan_segment(log_path, segment, target_file, limit - len(events)))
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"Skipping unreadable log segment {segment['path']}: {e}")
+    return events
+
+
 def get_recent_injections(
     log_path: Path,
     target_file: Optional[str] = None,
@@ -526,8 +1037,14 @@ def get_recent_injections(
 
     Implements FR-29: Query API for recent injection events.
 
-    Reads the log file in reverse order (most recent first) and returns
-    events matching the filter criteria.
+    Reads the log file backwards in blocks from its end and stops once limit
+    matching events are found, so the cost depends on limit (and, with
+    target_file, on how far back its events are) rather than on the size of
+    the log. If the log has a sidecar index (written by InjectionLogger), the
+    events of target_file are read directly at their indexed offsets. If the
+    log file holds fewer than limit matching events, the log's segments are
+    read, newest first, skipping segments that the manifest shows hold no
+    events for target_file.
 
     Args:
         log_path: Path to the injections.jsonl file.
@@ -537,55 +1054,48 @@ def get_recent_injections(
 
     Returns:
         List of InjectionEvent objects, most recent first.
-
-    Raises:
-        FileNotFoundError: If log file doesn't exist.
     """
-    if not log_path.exists():
+    if not log_exists(log_path) or limit <= 0:
         return []
 
-    events: List[InjectionEvent] = []
-
-    # Read file and collect matching events
-    # Note: For very large files, this could be optimized with reverse reading
-    all_events: List[InjectionEvent] = []
-
-    with open(log_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-
-            try:
-                data = json.loads(line)
-                event = InjectionEvent.from_dict(data)
-
-                # Filter by target file if specified
-                if target_file is None or event.target_file == target_file:
-                    all_events.append(event)
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Skipping malformed log entry: {e}")
-                continue
-
-    # Return most recent events (last entries in file are most recent)
-    events = all_events[-limit:] if len(all_events) > limit else all_events
-    events.reverse()  # Most recent first
-
+    events: Optional[List[InjectionEvent]] = None
+    if log_path.exists():
+        with open(log_path, "rb") as f:
+            log_size = os.fstat(f.fileno()).st_size
+            if target_file is not None:
+                index = _load_index(log_path, log_size)
+                if index is not None:
+                    events = _read_indexed_events(f, index, log_size, target_file, limit)
+                    if events is None:
+                        logger.debug(f"Ignoring stale injection log index for {log_path}")
+            if events is None:
+                events = _scan_reversed(f, 0, log_size, target_file, limit)
+    else:
+        events = []
+
+    if len(events) < limit:
+        events.extend(_scan_segments(log_path, target_file, limit - len(events)))
     return events
 
 
 def read_injections_from_log(
     log_path: Path,
     limit: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
 ) -> List[InjectionEvent]:
-    """Read injection events from a JSONL log file.
+    """Read injection events from a JSONL log file and its segments.
 
     Utility function for reading back logged events, useful for
-    testing and analysis.
+    testing and analysis. Segments rotated out of the log are read first,
+    streamed without loading them into memory; segments outside the time
+    range are skipped using the manifest.
 
     Args:
         log_path: Path to the injections.jsonl file.
         limit: Optional maximum number of events to read.
+        since: Optional ISO 8601 timestamp; skip older events.
+        until: Optional ISO 8601 timestamp; skip newer events.
 
     Returns:
         List of InjectionEvent objects in chronological order.
@@ -595,17 +1105,19 @@ def read_injections_from_log(
         json.JSONDecodeError: If log file contains invalid JSON.
     """
     events: List[InjectionEvent] = []
+    since_time = parse_timestamp(since)
+    until_time = parse_timestamp(until)
 
-    with open(log_path, encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            if limit is not None and i >= limit:
-                break
+    for line in iter_log_lines(log_path, since_time, until_time):
+        if limit is not None and len(events) >= limit:
+            break
 
-            line = line.strip()
-            if not line:
-                continue
+        line = line.strip()
+        if not line:
+            continue
 
-            data = json.loads(line)
+        data = json.loads(line)
+        if in_time_range(data.get("timestamp"), since_time, until_time):
             events.append(InjectionEvent.from_dict(data))
 
     return events
@@ -25,6 +25,8 @@ DEFAULT_DATA_ROOT = Path.home() / ".cross_file_context"
 INJECTIONS_SUBDIR = "injections"
 WARNINGS_SUBDIR = "warnings"
 SESSION_METRICS_SUBDIR = "session_metrics"
+EXPORTS_SUBDIR = "exports"
+PROFILES_SUBDIR = "profiles"
 
 
 def get_default_data_root() -> Path:
@@ -123,6 +125,32 @@ def get_session_metrics_dir(data_root: Optional[Path] = None) -> Path:
     return root / SESSION_METRICS_SUBDIR
 
 
+def get_exports_dir(data_root: Optional[Path] = None) -> Path:
+    """Get the graph export directory.
+
+    Args:
+        data_root: Data root directory. If None, uses default.
+
+    Returns:
+        Path to {data_root}/exports/
+    """
+    root = data_root or DEFAULT_DATA_ROOT
+    return root / EXPORTS_SUBDIR
+
+
+def get_profiles_dir(data_root: Optional[Path] = None) -> Path:
+    """Get the request profile directory.
+
+    Args:
+        data_root: Data root directory. If None, uses default.
+
+    Returns:
+        Path to {data_root}/profiles/ (one subdirectory per session)
+    """
+    root = data_root or DEFAULT_DATA_ROOT
+    return root / PROFILES_SUBDIR
+
+
 def ensure_log_directories(data_root: Optional[Path] = None) -> None:
     """Create all log subdirectories if they don't exist.
 
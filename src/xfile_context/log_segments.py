@@ -0,0 +1,623 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Size-based rotation of JSONL logs into compressed segments.
+
+Injection, warning and session metrics logs rotate by UTC date (Issue #150),
+so a busy session writes one large file per day that readers must parse in
+full. With a segment size limit, a logger moves its active log file into a
+compressed segment whenever the file grows past the limit, and records the
+segment in a manifest next to the log.
+
+Rotation runs in two steps so that logging never waits for compression: the
+logger renames the active file aside to a pending segment (a rename, while
+it holds its lock), and a background thread compresses the pending segment
+and records it in the manifest.
+
+Key features:
+- Segments: <log name>.<NNNN>.jsonl.gz (gzip) or .jsonl.zst (zstd, when the
+  optional zstandard package is installed; otherwise gzip is used)
+- Manifest: <log name>.manifest.json lists the segments of a log, oldest
+  first, with the time range of the records in each segment and, if the
+  logger reports record keys, the number of records per key
+- Readers stream a log's segments and then its active file line by line, and
+  skip segments outside a requested time range without opening them
+- Pending segments (<log name>.<NNNN>.jsonl.pending, not compressed yet) are
+  read like segments, so records stay visible while they are compressed
+- The active log keeps its name, so writers and readers address a log by the
+  same path before and after rotation
+
+Usage:
+    policy = LogRotationPolicy(max_segment_bytes=10 * 1024 * 1024)
+    segmenter = LogSegmenter(policy, max_keys=1000)
+    segmenter.opened(log_path, size)  # After opening the active file
+    if segmenter.record(len(line_bytes), event.timestamp, key=event.target_file):
+        file_handle.close()
+        segmenter.rotate(log_path)  # Compresses in the background
+    segmenter.wait()  # Before exiting
+
+    for line in iter_log_lines(log_path, since="2025-12-11T10:00:00Z"):
+        ...
+"""
+
+import gzip
+import io
+import json
+import logging
+import os
+import shutil
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Segment compression formats
+COMPRESSION_GZIP = "gzip"
+COMPRESSION_ZSTD = "zstd"
+SEGMENT_COMPRESSIONS = (COMPRESSION_GZIP, COMPRESSION_ZSTD)
+
+# Compression of pending segments (not compressed yet)
+COMPRESSION_NONE = "none"
+
+# gzip level of segments (JSONL compresses almost as well as at level 9, at
+# about twice the speed)
+GZIP_COMPRESSLEVEL = 6
+
+# File name suffix per compression format
+_SEGMENT_SUFFIXES = {COMPRESSION_GZIP: ".gz", COMPRESSION_ZSTD: ".zst"}
+
+# Manifest format version
+MANIFEST_VERSION = 1
+
+# Suffix appended to the log file name for its manifest
+MANIFEST_SUFFIX = ".manifest.json"
+
+# Suffix of segments waiting to be compressed
+PENDING_SUFFIX = ".pending"
+
+
+@dataclass
+class LogRotationPolicy:
+    """Size limit and compression for log segments.
+
+    Attributes:
+        max_segment_bytes: Rotate the active log file once it is at least this
+            large (0 disables size-based rotation).
+        compression: Segment compression, "gzip" or "zstd".
+    """
+
+    max_segment_bytes: int = 0
+    compression: str = COMPRESSION_GZIP
+
+
+def is_compression_available(compression: str) -> bool:
+    """Check whether segments can be written with a compression format.
+
+    Args:
+        compression: "gzip" or "zstd".
+
+    Returns:
+        True if the format is supported (zstd needs the zstandard package).
+    """
+    if compression == COMPRESSION_ZSTD:
+        return zstandard is not None
+    return compression == COMPRESSION_GZIP
+
+
+def parse_timestamp(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp or date, as written by the loggers.
+
+    Timestamps without a timezone are taken as UTC.
+
+    Args:
+        value: Timestamp such as "2025-12-11T10:00:00.000+00:00",
+               "2025-12-11T10:00:00Z" or "2025-12-11".
+
+    Returns:
+        Timezone-aware datetime, or None if value is not a valid timestamp.
+    """
+    if not isinstance(value, str) or not value:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def in_time_range(
+    timestamp: Any, since: Optional[datetime] = None, until: Optional[datetime] = None
+) -> bool:
+    """Check whether a record timestamp lies within [since, until].
+
+    Records without a valid timestamp are kept.
+    """
+    if since is None and until is None:
+        return True
+    parsed = parse_timestamp(timestamp)
+    if parsed is None:
+        return True
+    return (since is None or parsed >= since) and (until is None or parsed <= until)
+
+
+def get_manifest_path(log_path: Path) -> Path:
+    """Get the path of a log's segment manifest.
+
+    Args:
+        log_path: Path to the active log file.
+
+    Returns:
+        Path to <log file>.manifest.json
+    """
+    return log_path.with_name(log_path.name + MANIFEST_SUFFIX)
+
+
+def read_manifest(log_path: Path) -> List[Dict[str, Any]]:
+    """Read the segments of a log from its manifest.
+
+    Args:
+        log_path: Path to the active log file.
+
+    Returns:
+        Segment entries, oldest first. Each entry has file, sequence,
+        compression, first_timestamp, last_timestamp, bytes (uncompressed)
+        and compressed_bytes, and key_counts if the logger counted records
+        per key (None if the keys of the segment are not known). Empty if the
+        log has no (valid) manifest.
+    """
+    manifest_path = get_manifest_path(log_path)
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable log manifest {manifest_path}: {e}")
+        return []
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        logger.warning(f"Ignoring log manifest with unknown format: {manifest_path}")
+        return []
+    segments = manifest.get("segments")
+    return [s for s in segments if isinstance(s, dict)] if isinstance(segments, list) else []
+
+
+def _write_manifest(log_path: Path, segments: List[Dict[str, Any]]) -> None:
+    """Write a log's manifest atomically."""
+    manifest_path = get_manifest_path(log_path)
+    temp_path = manifest_path.with_name(manifest_path.name + ".tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": MANIFEST_VERSION, "segments": segments}, f, indent=2)
+    os.replace(temp_path, manifest_path)
+
+
+def open_segment(path: Path, compression: str) -> IO[str]:
+    """Open a compressed segment for reading text.
+
+    Args:
+        path: Path to the segment file.
+        compression: "gzip" or "zstd".
+
+    Returns:
+        Text stream of the decompressed lines.
+
+    Raises:
+        ValueError: If the compression format is not supported.
+        OSError: If the segment cannot be opened.
+    """
+    if compression == COMPRESSION_NONE:
+        return open(path, encoding="utf-8")  # noqa: SIM115 - Returned to the caller
+    if compression == COMPRESSION_GZIP:
+        return gzip.open(path, "rt", encoding="utf-8")
+    if compression == COMPRESSION_ZSTD and zstandard is not None:
+        raw = open(path, "rb")  # noqa: SIM115 - Closed with the returned stream
+        reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    raise ValueError(f"Unsupported segment compression: {compression}")
+
+
+def _compress_file(source: Path, target: Path, compression: str) -> None:
+    """Write a compressed copy of source to target."""
+    with open(source, "rb") as src:
+        if compression == COMPRESSION_ZSTD and zstandard is not None:
+            with open(target, "wb") as dst:
+                zstandard.ZstdCompressor().copy_stream(src, dst)
+        else:
+            with gzip.open(target, "wb", compresslevel=GZIP_COMPRESSLEVEL) as dst:
+                shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def _segment_path(log_path: Path, sequence: int, suffix: str) -> Path:
+    """Get the path of a log's segment: <log name>.<NNNN>.jsonl<suffix>."""
+    return log_path.with_name(f"{log_path.stem}.{sequence:04d}{log_path.suffix}{suffix}")
+
+
+def _find_pending_segments(log_path: Path) -> List[Tuple[int, Path]]:
+    """Find a log's pending segments.
+
+    Returns:
+        (sequence, path) per pending segment, oldest first.
+    """
+    prefix = f"{log_path.stem}."
+    suffix = f"{log_path.suffix}{PENDING_SUFFIX}"
+    pending: List[Tuple[int, Path]] = []
+    try:
+        with os.scandir(log_path.parent) as entries:
+            for entry in entries:
+                name = entry.name
+                if not (name.startswith(prefix) and name.endswith(suffix)):
+                    continue
+                sequence = name[len(prefix) : -len(suffix)]
+                if sequence.isdigit():
+                    pending.append((int(sequence), log_path.with_name(name)))
+    except OSError:
+        return []
+    return sorted(pending)
+
+
+def _read_first_timestamp(log_path: Path, timestamp_key: str) -> Optional[str]:
+    """Get the timestamp of the first record in a log file, if any."""
+    try:
+        with open(log_path, encoding="utf-8") as f:
+            value = json.loads(f.readline()).get(timestamp_key)
+    except (OSError, ValueError, AttributeError):
+        return None
+    return value if isinstance(value, str) else None
+
+
+class LogSegmenter:
+    """Tracks the size and time range of a logger's active file and rotates it.
+
+    The owning logger reports every record it appends via record() and, when
+    that returns True, closes its file handle and calls rotate(). Calls must
+    be serialized by the owning logger, except wait(). Compression runs on
+    background threads, one segment at a time.
+    """
+
+    def __init__(
+        self, policy: LogRotationPolicy, timestamp_key: str = "timestamp", max_keys: int = 0
+    ) -> None:
+        """Initialize the segmenter.
+
+        Args:
+            policy: Segment size limit and compression.
+            timestamp_key: Key of the record timestamp, used to recover the
+                time range of records written before the logger started.
+            max_keys: Number of distinct record keys counted per segment, so
+                readers can skip segments without records for a key (0
+                disables counting). Segments with more keys are recorded with
+                unknown keys.
+        """
+        self._policy = policy
+        self._compression = policy.compression
+        if not is_compression_available(self._compression):
+            logger.warning(
+                f"Log segment compression {self._compression!r} is not available "
+                f"(zstd requires the zstandard package), using gzip"
+            )
+            self._compression = COMPRESSION_GZIP
+        self._timestamp_key = timestamp_key
+        self._size = 0
+        self._first: Optional[str] = None
+        self._last: Optional[str] = None
+        self._first_parsed: Optional[datetime] = None
+        self._last_parsed: Optional[datetime] = None
+        # Records per key in the active file (None: not known)
+        self._max_keys = max_keys
+        self._key_counts: Optional[Dict[str, int]] = {}
+        self._failed = False
+        self._segments_written = 0
+        self._last_sequence = 0
+        # Serializes compression and manifest updates
+        self._compress_lock = threading.Lock()
+        self._compressors: List[threading.Thread] = []
+
+    def is_enabled(self) -> bool:
+        """Check whether size-based rotation is enabled."""
+        return self._policy.max_segment_bytes > 0 and not self._failed
+
+    def opened(self, log_path: Path, size: int) -> None:
+        """Report that the active log file was opened for appending.
+
+        Args:
+            log_path: Path to the active log file.
+            size: Current size of the file in bytes.
+        """
+        if size == self._size:
+            return  # Reopened after our own writes
+        self.reset()
+        self._size = size
+        if size > 0:
+            self._observe(_read_first_timestamp(log_path, self._timestamp_key))
+            self._key_counts = None  # Records written before we started
+
+    def record(
+        self, num_bytes: int, timestamp: Optional[str] = None, key: Optional[str] = None
+    ) -> bool:
+        """Report a record appended to the active log file.
+
+        Args:
+            num_bytes: Size of the record in bytes, including the newline.
+            timestamp: Record timestamp (ISO 8601).
+            key: Record key counted in the manifest (e.g. the target file of
+                an injection event), if the segmenter counts keys.
+
+        Returns:
+            True if the active file should now be rotated.
+        """
+        self._size += num_bytes
+        self._observe(timestamp)
+        if self._max_keys > 0 and self._key_counts is not None:
+            if key is None or (
+                key not in self._key_counts and len(self._key_counts) >= self._max_keys
+            ):
+                self._key_counts = None
+            else:
+                self._key_counts[key] = self._key_counts.get(key, 0) + 1
+        return self.is_enabled() and self._size >= self._policy.max_segment_bytes
+
+    def reset(self) -> None:
+        """Forget the active file, e.g. after switching to a new log file."""
+        self._size = 0
+        self._first = self._last = None
+        self._first_parsed = self._last_parsed = None
+        self._key_counts = {}
+
+    def get_segments_written(self) -> int:
+        """Get the number of segments compressed by this segmenter."""
+        return self._segments_written
+
+    def wait(self, timeout: Optional[float] = None) -> None:
+        """Wait until segments rotated so far are compressed.
+
+        Args:
+            timeout: Maximum seconds to wait per pending segment.
+        """
+        for thread in list(self._compressors):
+            thread.join(timeout)
+
+    def _observe(self, timestamp: Optional[str]) -> None:
+        """Extend the time range of the active file by a record timestamp."""
+        parsed = parse_timestamp(timestamp)
+        if parsed is None:
+            return
+        if self._first_parsed is None or parsed < self._first_parsed:
+            self._first, self._first_parsed = timestamp, parsed
+        if self._last_parsed is None or parsed > self._last_parsed:
+            self._last, self._last_parsed = timestamp, parsed
+
+    def rotate(self, log_path: Path) -> Optional[Path]:
+        """Move the active log file aside and compress it in the background.
+
+        The caller must have closed its handle to the file. Only the rename
+        happens on the calling thread. If the rename fails, the active file is
+        kept; if compression fails, the pending segment is kept (readers still
+        see it). Either way, size-based rotation is disabled for this segmenter.
+
+        Args:
+            log_path: Path to the active log file.
+
+        Returns:
+            Path the compressed segment will have, or None if rotation failed.
+        """
+        sequence = 1 + max(
+            [s.get("sequence", 0) for s in read_manifest(log_path)]
+            + [sequence for sequence, _ in _find_pending_segments(log_path)]
+            + [self._last_sequence]
+        )
+        pending_path = _segment_path(log_path, sequence, PENDING_SUFFIX)
+        segment_path = _segment_path(log_path, sequence, _SEGMENT_SUFFIXES[self._compression])
+        try:
+            size = log_path.stat().st_size
+            os.replace(log_path, pending_path)
+        except OSError as e:
+            self._failed = True
+            logger.warning(f"Failed to rotate {log_path} into a segment, keeping it: {e}")
+            return None
+
+        entry = {
+            "file": segment_path.name,
+            "sequence": sequence,
+            "compression": self._compression,
+            "first_timestamp": self._first,
+            "last_timestamp": self._last,
+            "bytes": size,
+        }
+        if self._max_keys > 0:
+            entry["key_counts"] = self._key_counts
+        self._last_sequence = sequence
+        self.reset()
+        self._compressors = [t for t in self._compressors if t.is_alive()]
+        # Not a daemon thread: interpreter exit waits for the segment
+        thread = threading.Thread(
+            target=self._compress,
+            args=(log_path, pending_path, segment_path, entry),
+            name="LogSegmentCompressor",
+        )
+        self._compressors.append(thread)
+        thread.start()
+        return segment_path
+
+    def _compress(
+        self, log_path: Path, pending_path: Path, segment_path: Path, entry: Dict[str, Any]
+    ) -> None:
+        """Compress a pending segment and record it in the manifest."""
+        temp_path = segment_path.with_name(segment_path.name + ".tmp")
+        with self._compress_lock:
+            try:
+                _compress_file(pending_path, temp_path, self._compression)
+                os.replace(temp_path, segment_path)
+                entry["compressed_bytes"] = segment_path.stat().st_size
+                segments = read_manifest(log_path)
+                segments.append(entry)
+                segments.sort(key=lambda s: s.get("sequence", 0))
+                _write_manifest(log_path, segments)
+                pending_path.unlink()
+            except OSError as e:
+                temp_path.unlink(missing_ok=True)
+                self._failed = True
+                logger.warning(f"Failed to compress log segment {pending_path}, keeping it: {e}")
+                return
+            self._segments_written += 1
+        logger.debug(f"Rotated {log_path.name} into segment {segment_path.name}")
+
+
+def _overlaps(
+    segment: Dict[str, Any], since: Optional[datetime], until: Optional[datetime]
+) -> bool:
+    """Check whether a segment may hold records within [since, until]."""
+    first = parse_timestamp(segment.get("first_timestamp"))
+    last = parse_timestamp(segment.get("last_timestamp"))
+    if since is not None and last is not None and last < since:
+        return False
+    return not (until is not None and first is not None and first > until)
+
+
+def get_segment_paths(
+    log_path: Path, since: Optional[datetime] = None, until: Optional[datetime] = None
+) -> List[Dict[str, Any]]:
+    """Get the manifest entries of segments that may hold records in a time range.
+
+    Pending segments that are not in the manifest yet are included (with
+    compression "none" and no time range).
+
+    Args:
+        log_path: Path to the active log file.
+        since: Skip segments whose records are all older.
+        until: Skip segments whose records are all newer.
+
+    Returns:
+        Manifest entries, oldest first, with "path" set to the segment path.
+    """
+    # Pending segments are listed before the manifest is read: a segment
+    # compressed in between is then found in the manifest
+    pending = _find_pending_segments(log_path)
+    manifest = read_manifest(log_path)
+    segments = [
+        dict(segment, path=log_path.with_name(str(segment.get("file", ""))))
+        for segment in manifest
+        if _overlaps(segment, since, until)
+    ]
+    recorded = {segment.get("sequence") for segment in manifest}
+    for sequence, path in pending:
+        if sequence not in recorded:
+            segments.append(
+                {
+                    "file": path.name,
+                    "sequence": sequence,
+                    "compression": COMPRESSION_NONE,
+                    "first_timestamp": None,
+                    "last_timestamp": None,
+                    "path": path,
+                }
+            )
+    segments.sort(key=lambda s: s.get("sequence", 0))
+    return segments
+
+
+def open_segment_entry(log_path: Path, segment: Dict[str, Any]) -> IO[str]:
+    """Open a segment returned by get_segment_paths() for reading text.
+
+    A pending segment that was compressed since it was listed is opened at its
+    compressed location.
+
+    Args:
+        log_path: Path to the active log file.
+        segment: Segment entry with "path" and "compression".
+
+    Returns:
+        Text stream of the segment's lines.
+
+    Raises:
+        ValueError: If the compression format is not supported.
+        OSError: If the segment cannot be opened.
+    """
+    try:
+        return open_segment(segment["path"], str(segment.get("compression")))
+    except FileNotFoundError:
+        if segment.get("compression") != COMPRESSION_NONE:
+            raise
+        for entry in read_manifest(log_path):
+            if entry.get("sequence") == segment.get("sequence"):
+                path = log_path.with_name(str(entry.get("file", "")))
+                return open_segment(path, str(entry.get("compression")))
+        raise
+
+
+def log_exists(log_path: Path) -> bool:
+    """Check whether a log has an active file or segments."""
+    return (
+        log_path.exists()
+        or get_manifest_path(log_path).exists()
+        or bool(_find_pending_segments(log_path))
+    )
+
+
+def iter_log_lines(
+    log_path: Path, since: Optional[datetime] = None, until: Optional[datetime] = None
+) -> Iterator[str]:
+    """Stream the lines of a log: its segments, oldest first, then the active file.
+
+    Segments outside [since, until] per the manifest are skipped without
+    being opened. Lines of the remaining files are not filtered by time.
+
+    Args:
+        log_path: Path to the active log file.
+        since: Skip segments whose records are all older.
+        until: Skip segments whose records are all newer.
+
+    Yields:
+        Lines, including their newline.
+
+    Raises:
+        FileNotFoundError: If the log has neither an active file nor segments.
+    """
+    if not log_exists(log_path):
+        raise FileNotFoundError(f"Log file not found: {log_path}")
+
+    for segment in get_segment_paths(log_path, since, until):
+        try:
+            with open_segment_entry(log_path, segment) as f:
+                yield from f
+        except (OSError, ValueError, EOFError) as e:
+            logger.warning(f"Skipping unreadable log segment {segment['path']}: {e}")
+
+    try:
+        with open(log_path, encoding="utf-8") as f:
+            yield from f
+    except FileNotFoundError:
+        pass  # Rotated, and nothing written since
+
+
+def list_logs(directory: Path) -> List[Path]:
+    """List the logs in a directory, by the path of their active file.
+
+    Includes logs whose active file was rotated into (possibly pending)
+    segments and not recreated since.
+
+    Args:
+        directory: Log directory, e.g. ~/.cross_file_context/session_metrics/.
+
+    Returns:
+        Sorted paths of active log files (which may not exist).
+    """
+    logs = set(directory.glob("*.jsonl"))
+    for manifest_path in directory.glob(f"*.jsonl{MANIFEST_SUFFIX}"):
+        logs.add(manifest_path.with_name(manifest_path.name[: -len(MANIFEST_SUFFIX)]))
+    for pending_path in directory.glob(f"*.jsonl{PENDING_SUFFIX}"):
+        # <log name>.<NNNN>.jsonl.pending
+        stem, sequence, _ = pending_path.name[: -len(PENDING_SUFFIX)].rsplit(".", 2)
+        if sequence.isdigit():
+            logs.add(pending_path.with_name(f"{stem}.jsonl"))
+    return sorted(logs)
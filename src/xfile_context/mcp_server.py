@@ -9,6 +9,12 @@ All business logic is delegated to CrossFileContextService per DD-6 (layered arc
 Per Issue #155: Implements graceful shutdown handling to ensure session metrics are
 written even when the MCP server terminates without explicit shutdown (e.g., when
 Claude Code closes the stdio connection).
+
+Service calls run on a bounded worker pool (ToolExecutor) so they do not block the
+event loop, and concurrent calls for the same file share one computation.
+
+While running, the FileWatcher monitors the project and a background worker applies
+file changes to the relationship graph, so reads find an already-updated graph.
 """
 
 import argparse
@@ -16,16 +22,17 @@ import atexit
 import logging
 import uuid
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from mcp.server.fastmcp import Context, FastMCP
 from mcp.server.session import ServerSession
 
-from xfile_context.cache import WorkingMemoryCache
 from xfile_context.config import Config
+from xfile_context.graph_export import DEFAULT_PAGE_SIZE
 from xfile_context.log_config import ensure_log_directories, get_default_data_root
 from xfile_context.service import CrossFileContextService
 from xfile_context.storage import InMemoryStore
+from xfile_context.tool_executor import ToolExecutor
 
 logger = logging.getLogger(__name__)
 
@@ -74,22 +81,18 @@ class CrossFileContextMCPServer:
         # Initialize service layer
         if service is None:
             store = InMemoryStore()
-            # Note: Cache requires file_event_timestamps dict from FileWatcher
-            # For now, use empty dict as stub (full implementation in Task 4.3)
-            file_event_timestamps: Dict[str, float] = {}
-            cache = WorkingMemoryCache(
-                file_event_timestamps=file_event_timestamps,
-                size_limit_kb=config.cache_size_limit_kb,
-            )
+            # The service builds its cache on the FileWatcher's event timestamps
             service = CrossFileContextService(
                 config=config,
                 store=store,
-                cache=cache,
                 session_id=self.session_id,
                 data_root=self.data_root,
             )
         self.service = service
 
+        # Run service calls off the event loop with per-file single-flight
+        self._executor = ToolExecutor(max_workers=config.tool_executor_max_workers)
+
         # Initialize FastMCP server
         # Server name per TDD Section 3.4.1
         self.mcp = FastMCP(name="cross-file-context-links")
@@ -107,7 +110,9 @@ class CrossFileContextMCPServer:
 
         Registers:
         - read_with_context: Read file with cross-file context injection
+        - read_many_with_context: Read several files with one staleness resolution
         - get_relationship_graph: Export relationship graph
+        - export_relationship_graph: Stream the graph to an NDJSON file
         """
 
         @self.mcp.tool()
@@ -145,7 +150,12 @@ class CrossFileContextMCPServer:
 
             try:
                 # Delegate to service layer (ZERO business logic here)
-                result = self.service.read_file_with_context(file_path)
+                # Concurrent reads of the same file share one computation
+                result = await self._executor.run_single_flight(
+                    ("read_with_context", file_path),
+                    self.service.read_file_with_context,
+                    file_path,
+                )
 
                 # Format response per MCP specification
                 response = {
@@ -169,9 +179,68 @@ class CrossFileContextMCPServer:
                 await ctx.error(f"Unexpected error reading {file_path}: {e}")
                 raise
 
+        @self.mcp.tool()
+        async def read_many_with_context(
+            file_paths: List[str],
+            ctx: Context[ServerSession, None],
+        ) -> Dict[str, Any]:
+            """Read several Python files with automatic cross-file context injection.
+
+            Use this tool instead of several read_with_context calls when reading
+            related files together (e.g. a module and the modules it uses). The
+            files' dependencies are checked and analyzed once for all of them,
+            which is faster than reading the files one at a time.
+
+            Args:
+                file_paths: Absolute or relative paths to the Python files to read
+                ctx: MCP context for logging and progress
+
+            Returns:
+                Dictionary with:
+                - files: One entry per readable file, in request order, each with
+                  file_path, content (with injected context) and warnings
+                - errors: Mapping of each file that could not be read to its
+                  error message (empty if none)
+            """
+            await ctx.info(f"Reading {len(file_paths)} files with context")
+
+            try:
+                # Delegate to service layer (ZERO business logic here)
+                batch = await self._executor.run(self.service.read_files_with_context, file_paths)
+
+                # Format response per MCP specification
+                response: Dict[str, Any] = {
+                    "files": [
+                        {
+                            "file_path": result.file_path,
+                            "content": self._format_content_with_context(
+                                result.content, result.injected_context
+                            ),
+                            "warnings": result.warnings,
+                        }
+                        for result in batch.results
+                    ],
+                    "errors": batch.errors,
+                }
+
+                for file_path, error in batch.errors.items():
+                    await ctx.error(f"Could not read {file_path}: {error}")
+                await ctx.info(f"Successfully read {len(batch.results)} files")
+                return response
+
+            except Exception as e:
+                await ctx.error(f"Unexpected error reading files: {e}")
+                raise
+
         @self.mcp.tool()
         async def get_relationship_graph(
             ctx: Context[ServerSession, None],
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None,
+            path_prefix: Optional[str] = None,
+            relationship_types: Optional[List[str]] = None,
+            around_file: Optional[str] = None,
+            hops: int = 1,
         ) -> Dict[str, Any]:
             """Export the current relationship graph for files analyzed so far.
 
@@ -184,20 +253,57 @@ class CrossFileContextMCPServer:
             Returns relationships including imports, function calls, and class
             inheritance for the files that have been analyzed.
 
+            Without any other argument, returns the whole graph at once. On large
+            projects, pass limit (and the returned next_cursor for following
+            pages) and filters to get one page of relationships at a time.
+
             Args:
                 ctx: MCP context for logging and progress
+                limit: Maximum number of relationships per page (1-1000)
+                cursor: next_cursor from the previous page
+                path_prefix: Only relationships from files in this directory
+                relationship_types: Only these relationship types (import,
+                    function_call, inheritance, wildcard_import, conditional_import)
+                around_file: Only relationships between files within hops of this file
+                hops: Neighborhood radius for around_file (default: 1)
 
             Returns:
                 Dictionary with:
                 - nodes: List of file nodes (for files read so far)
                 - relationships: List of relationships between analyzed files
                 - metadata: Graph metadata (timestamp, counts)
+                When paging, files lists the source files in the page and
+                next_cursor is the cursor for the next page (null on the last).
             """
-            await ctx.info("Exporting relationship graph")
+            paged = any(
+                arg is not None
+                for arg in (limit, cursor, path_prefix, relationship_types, around_file)
+            )
 
             try:
+                if paged:
+                    await ctx.info("Exporting relationship graph page")
+                    # Delegate to service layer (ZERO business logic here)
+                    page: Dict[str, Any] = await self._executor.run(
+                        self.service.get_relationship_graph_page,
+                        limit if limit is not None else DEFAULT_PAGE_SIZE,
+                        cursor,
+                        path_prefix,
+                        relationship_types,
+                        around_file,
+                        hops,
+                    )
+                    await ctx.info(
+                        f"Graph page exported: {len(page['relationships'])} relationships"
+                    )
+                    return page
+
+                await ctx.info("Exporting relationship graph")
+
                 # Delegate to service layer (ZERO business logic here)
-                graph_export = self.service.get_relationship_graph()
+                graph_export = await self._executor.run_single_flight(
+                    ("get_relationship_graph",), self.service.get_relationship_graph
+                )
 
                 # Format response per MCP specification
                 # graph_export may have to_dict method or be a dict directly
@@ -217,7 +323,54 @@ class CrossFileContextMCPServer:
                 await ctx.error(f"Error exporting relationship graph: {e}")
                 raise
 
-        logger.info("MCP tools registered: read_with_context, get_relationship_graph")
+        @self.mcp.tool()
+        async def export_relationship_graph(
+            ctx: Context[ServerSession, None],
+            compress: bool = False,
+        ) -> Dict[str, Any]:
+            """Write the current relationship graph to an NDJSON file for offline analysis.
+
+            Use this instead of get_relationship_graph when the whole graph is
+            needed but too large to return in one response. The graph is
+            streamed to a file under the server's data directory, one JSON
+            record per line: a metadata record, one record per file, one per
+            relationship, and a final graph_metadata record. Only the file
+            path and counts are returned.
+
+            Args:
+                ctx: MCP context for logging and progress
+                compress: Write a gzip-compressed .ndjson.gz file (default: False)
+
+            Returns:
+                Dictionary with:
+                - path: Absolute path of the export file
+                - files: Number of file records
+                - relationships: Number of relationship records
+                - records: Total number of records written
+                - bytes: Size of the export file
+                - compressed: Whether the file is gzip-compressed
+            """
+            await ctx.info("Exporting relationship graph to file")
+
+            try:
+                # Delegate to service layer (ZERO business logic here)
+                summary: Dict[str, Any] = await self._executor.run(
+                    self.service.export_relationship_graph_to_file, compress
+                )
+                await ctx.info(
+                    f"Graph exported to {summary['path']}: {summary['files']} files, "
+                    f"{summary['relationships']} relationships"
+                )
+                return summary
+
+            except Exception as e:
+                await ctx.error(f"Error exporting relationship graph to file: {e}")
+                raise
+
+        logger.info(
+            "MCP tools registered: read_with_context, read_many_with_context, "
+            "get_relationship_graph, export_relationship_graph"
+        )
 
     def _format_content_with_context(self, content: str, injected_context: str) -> str:
         """Format file content with injected context.
@@ -256,6 +409,16 @@ class CrossFileContextMCPServer:
                 - "sse": Server-sent events transport
         """
         logger.info(f"Starting MCP server with {transport} transport")
+
+        # Watch the project and keep the graph updated in the background
+        if self.config.enable_file_watcher:
+            self.service.start_file_watcher()
+            self.service.start_background_updates()
+
+        # Warm the graph up instead of analyzing lazily on first reads
+        if self.config.enable_background_indexing:
+            self.service.start_background_indexing()
+
         self.mcp.run(transport=transport)  # type: ignore[arg-type]
 
     def shutdown(self) -> None:
@@ -271,6 +434,7 @@ class CrossFileContextMCPServer:
 
         logger.info("Shutting down MCP server")
         self._shutdown_called = True
+        self._executor.shutdown()
         self.service.shutdown()
 
 
@@ -300,9 +464,53 @@ def parse_args() -> argparse.Namespace:
         default="stdio",
         help="Transport type for MCP server. Default: stdio",
     )
+    parser.add_argument(
+        "--profile-every",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Profile every Nth read with cProfile and dump it to "
+            "<data-root>/profiles/<session-id>/. Overrides profile_every_n_requests"
+        ),
+    )
+    parser.add_argument(
+        "--profile-slow-ms",
+        type=int,
+        default=None,
+        metavar="MS",
+        help=(
+            "Profile reads and dump those taking at least MS milliseconds (profiles "
+            "every read, which slows reads down). Overrides profile_slow_request_ms"
+        ),
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also dump tracemalloc snapshots of profiled reads",
+    )
     return parser.parse_args()
 
 
+def get_config_overrides(args: argparse.Namespace) -> Dict[str, Any]:
+    """Get the configuration values set by command-line flags.
+
+    Args:
+        args: Parsed arguments.
+
+    Returns:
+        Configuration values by parameter name (empty if no flag was given).
+    """
+    overrides: Dict[str, Any] = {}
+    if args.profile_every is not None:
+        overrides["profile_every_n_requests"] = args.profile_every
+    if args.profile_slow_ms is not None:
+        overrides["profile_slow_request_ms"] = args.profile_slow_ms
+    if args.profile_memory:
+        overrides["profile_trace_memory"] = True
+    return overrides
+
+
 def main() -> None:
     """Main entry point for MCP server.
 
@@ -322,8 +530,12 @@ def main() -> None:
         format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
     )
 
+    # Command-line flags override the configuration file
+    config = Config()
+    config.apply_overrides(get_config_overrides(args))
+
     # Create server with data_root from CLI
-    server = CrossFileContextMCPServer(data_root=args.data_root)
+    server = CrossFileContextMCPServer(config=config, data_root=args.data_root)
 
     # Register atexit handler to ensure graceful shutdown (Issue #155)
     # This ensures session metrics are written even if the process terminates
@@ -5,12 +5,18 @@
 
 This module implements the MetricsCollector class per TDD Section 3.4.9 and 3.10.1:
 - Aggregate session-level metrics from all system components
-- Calculate token count statistics (min, max, median, p95)
+- Calculate token count statistics (min, max, median, p95, p99) from
+  bounded-memory quantile sketches, which are written with the metrics so
+  analysis can merge them across sessions
 - Write metrics to JSONL file at session end
 - Date-based file rotation for eventual immutability (Issue #150)
+- Size-based rotation into compressed segments (rotation_policy)
+- Per-stage latency of read_file_with_context() (ReadStageTimer)
+- File-system calls per read (IOCounters attached to the ReadStageTimer)
 - Capture configuration values for correlation
 
 Log Location: ~/.cross_file_context/session_metrics/<DATE>-<SESSION-ID>.jsonl
+Segments: <log file stem>.<NNNN>.jsonl.gz, listed in <log file>.manifest.json
 
 Related Requirements:
 - FR-43 (emit metrics at session end)
@@ -26,19 +32,33 @@ Related Requirements:
 import hashlib
 import json
 import logging
+import os
 import statistics
+import threading
+import time
 import uuid
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TextIO, Tuple
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
+from xfile_context.io_counters import IO_KINDS, IOCounters
 from xfile_context.log_config import (
     build_log_filename,
     get_current_utc_date,
     get_session_metrics_dir,
     validate_filename_component,
 )
+from xfile_context.log_segments import (
+    LogRotationPolicy,
+    LogSegmenter,
+    in_time_range,
+    iter_log_lines,
+    log_exists,
+    parse_timestamp,
+)
+from xfile_context.quantile_sketch import QuantileSketch
 
 logger = logging.getLogger(__name__)
 
@@ -48,28 +68,52 @@ DEFAULT_LOG_DIR = ".cross_file_context_logs"
 # Legacy default session metrics log filename (for backwards compatibility in tests)
 DEFAULT_METRICS_LOG_FILE = "session_metrics.jsonl"
 
+# Stages of read_file_with_context(), in pipeline order
+READ_STAGES = (
+    "validation",
+    "file_read",
+    "staleness",
+    "dependency_lookup",
+    "prioritization",
+    "snippet_extraction",
+    "token_counting",
+    "logging",
+)
+
+# Stage latencies are recorded in microseconds; 7 significant bits (<1% error)
+# keep the per-stage sketches written with every metrics entry small
+STAGE_SKETCH_SIGNIFICANT_BITS = 7
+
 
 @dataclass
 class TokenCountStatistics:
     """Token count statistics for context injection per TDD Section 3.10.1.
 
-    Tracks min, max, median, and p95 token counts to inform threshold tuning.
+    Tracks min, max, median, p95 and p99 token counts to inform threshold
+    tuning. Statistics computed from a QuantileSketch carry the serialized
+    sketch so that sessions can be merged for analysis.
     """
 
     min: int = 0
     max: int = 0
     median: int = 0
     p95: int = 0
+    p99: int = 0
     total_count: int = 0  # Number of injections tracked
+    sketch: Optional[Dict[str, Any]] = None  # Serialized QuantileSketch
 
-    def to_dict(self) -> Dict[str, int]:
+    def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return {
+        result: Dict[str, Any] = {
             "min": self.min,
             "max": self.max,
             "median": self.median,
             "p95": self.p95,
+            "p99": self.p99,
         }
+        if self.sketch is not None:
+            result["sketch"] = self.sketch
+        return result
 
 
 @dataclass
@@ -102,6 +146,33 @@ class CachePerformanceMetrics:
         }
 
 
+@dataclass
+class ContextCacheMetrics:
+    """Memoized context result metrics.
+
+    Tracks how often re-reads were served from the context result cache
+    instead of re-assembling context.
+    """
+
+    hit_rate: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    stale: int = 0  # Misses caused by a changed graph or dependency
+    evictions: int = 0
+    entries: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hit_rate": round(self.hit_rate, 4),
+            "hits": self.hits,
+            "misses": self.misses,
+            "stale": self.stale,
+            "evictions": self.evictions,
+            "entries": self.entries,
+        }
+
+
 @dataclass
 class ContextInjectionMetrics:
     """Context injection metrics per TDD Section 3.10.1.
@@ -172,12 +243,20 @@ class PerformanceMetrics:
 
     parsing_time_ms: TokenCountStatistics = field(default_factory=TokenCountStatistics)
     injection_latency_ms: TokenCountStatistics = field(default_factory=TokenCountStatistics)
+    # Latency of each read stage in microseconds, keyed by READ_STAGES name
+    read_stages_us: Dict[str, TokenCountStatistics] = field(default_factory=dict)
+    # File-system calls per read, keyed by io_counters.IO_KINDS name
+    read_io: Dict[str, TokenCountStatistics] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
             "parsing_time_ms": self.parsing_time_ms.to_dict(),
             "injection_latency_ms": self.injection_latency_ms.to_dict(),
+            "read_stages_us": {
+                stage: stats.to_dict() for stage, stats in self.read_stages_us.items()
+            },
+            "read_io": {kind: stats.to_dict() for kind, stats in self.read_io.items()},
         }
 
 
@@ -248,6 +327,7 @@ class SessionMetrics:
     start_time: str = ""
     end_time: str = ""
     cache_performance: CachePerformanceMetrics = field(default_factory=CachePerformanceMetrics)
+    context_cache: ContextCacheMetrics = field(default_factory=ContextCacheMetrics)
     context_injection: ContextInjectionMetrics = field(default_factory=ContextInjectionMetrics)
     relationship_graph: RelationshipGraphMetrics = field(default_factory=RelationshipGraphMetrics)
     function_usage_distribution: FunctionUsageDistribution = field(
@@ -260,6 +340,8 @@ class SessionMetrics:
         default_factory=IdentifierResolutionMetrics
     )
     configuration: Dict[str, Any] = field(default_factory=dict)
+    # Background log writer statistics by log ("injections", "warnings")
+    log_writers: Dict[str, Dict[str, Any]] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -268,6 +350,7 @@ class SessionMetrics:
             "start_time": self.start_time,
             "end_time": self.end_time,
             "cache_performance": self.cache_performance.to_dict(),
+            "context_cache": self.context_cache.to_dict(),
             "context_injection": self.context_injection.to_dict(),
             "relationship_graph": self.relationship_graph.to_dict(),
             "function_usage_distribution": self.function_usage_distribution.to_dict(),
@@ -276,11 +359,12 @@ class SessionMetrics:
             "warnings": self.warnings.to_dict(),
             "identifier_resolution": self.identifier_resolution.to_dict(),
             "configuration": self.configuration,
+            "log_writers": self.log_writers,
         }
 
 
 def calculate_percentile_statistics(values: List[int]) -> TokenCountStatistics:
-    """Calculate min, max, median, and p95 from a list of values.
+    """Calculate min, max, median, p95 and p99 from a list of values.
 
     Args:
         values: List of integer values (e.g., token counts or timing in ms).
@@ -299,16 +383,107 @@ def calculate_percentile_statistics(values: List[int]) -> TokenCountStatistics:
     p95_idx = int(n * 0.95)
     if p95_idx >= n:
         p95_idx = n - 1
+    p99_idx = min(int(n * 0.99), n - 1)
 
     return TokenCountStatistics(
         min=sorted_values[0],
         max=sorted_values[-1],
         median=int(statistics.median(sorted_values)),
         p95=sorted_values[p95_idx],
+        p99=sorted_values[p99_idx],
         total_count=n,
     )
 
 
+def calculate_sketch_statistics(sketch: QuantileSketch) -> TokenCountStatistics:
+    """Calculate min, max, median, p95 and p99 from a quantile sketch.
+
+    Uses the same ranks as calculate_percentile_statistics(); results are
+    exact for values below 2**significant_bits and within the sketch's
+    relative accuracy above.
+
+    Args:
+        sketch: Sketch of recorded values (e.g., token counts or timing in ms).
+
+    Returns:
+        TokenCountStatistics with computed statistics and the serialized sketch.
+    """
+    if sketch.get_count() == 0:
+        return TokenCountStatistics()
+
+    return TokenCountStatistics(
+        min=sketch.get_min(),
+        max=sketch.get_max(),
+        median=sketch.median(),
+        p95=sketch.quantile(0.95),
+        p99=sketch.quantile(0.99),
+        total_count=sketch.get_count(),
+        sketch=sketch.to_dict(),
+    )
+
+
+class ReadStageTimer:
+    """Monotonic timer for the stages of one read.
+
+    Durations are accumulated per stage name, so a stage entered several
+    times during one read (or shared by the reads of a batch) is reported
+    once. Stages that did not run (e.g. context assembly on a memoized
+    read) are not reported.
+
+    The timer also carries the read's file-system call counters; the service
+    binds them with track_io() while the read runs.
+
+    Usage:
+        timer = ReadStageTimer()
+        with timer.stage("file_read"):
+            content = path.read_text()
+        collector.record_read(file_path, timer)
+
+    Thread Safety:
+        Not thread-safe; each read uses its own timer.
+    """
+
+    def __init__(self) -> None:
+        """Start timing a read."""
+        self._start_ns = time.perf_counter_ns()
+        self._durations_ns: Dict[str, int] = {}
+        self._io = IOCounters()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time the enclosed block as (part of) a stage.
+
+        Args:
+            name: Stage name, one of READ_STAGES.
+        """
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter_ns() - start)
+
+    def add(self, name: str, duration_ns: int) -> None:
+        """Add a duration measured elsewhere to a stage.
+
+        Args:
+            name: Stage name, one of READ_STAGES.
+            duration_ns: Duration in nanoseconds.
+        """
+        self._durations_ns[name] = self._durations_ns.get(name, 0) + duration_ns
+
+    def get_durations_ns(self) -> Dict[str, int]:
+        """Get the accumulated duration of each stage that ran."""
+        return dict(self._durations_ns)
+
+    def get_elapsed_ns(self) -> int:
+        """Get the time since the timer was created."""
+        return time.perf_counter_ns() - self._start_ns
+
+    def get_io_counters(self) -> IOCounters:
+        """Get the file-system call counters of the read."""
+        return self._io
+
+
 def anonymize_filepath(filepath: str) -> str:
     """Anonymize a file path using SHA-256 hash per FR-47.
 
@@ -367,6 +542,7 @@ class MetricsCollector:
         anonymize_paths: bool = False,
         session_id: Optional[str] = None,
         data_root: Optional[Path] = None,
+        rotation_policy: Optional[LogRotationPolicy] = None,
     ) -> None:
         """Initialize the metrics collector.
 
@@ -380,6 +556,9 @@ class MetricsCollector:
             session_id: Session ID for log filename. If None, generates a UUID.
             data_root: Root directory for logs. If provided, uses
                       {data_root}/session_metrics/ as log directory.
+            rotation_policy: If provided (with a size limit), the log file is
+                            rotated into a compressed segment whenever it
+                            grows past the limit.
 
         Raises:
             ValueError: If log_file contains path separators.
@@ -417,10 +596,12 @@ class MetricsCollector:
         # Initialize session start time
         self._start_time = datetime.now(timezone.utc).isoformat(timespec="milliseconds")
 
-        # Token count tracking (for percentile calculation)
-        self._token_counts: List[int] = []
-        self._parsing_times_ms: List[int] = []
-        self._injection_latencies_ms: List[int] = []
+        # Token count and timing distributions (bounded-memory sketches)
+        self._token_counts = QuantileSketch()
+        self._parsing_times_ms = QuantileSketch()
+        self._injection_latencies_ms = QuantileSketch()
+        self._stage_latencies_us: Dict[str, QuantileSketch] = {}
+        self._read_io: Dict[str, QuantileSketch] = {}
 
         # Re-read pattern tracking
         self._file_read_counts: Dict[str, int] = {}
@@ -434,6 +615,9 @@ class MetricsCollector:
         # Identifier resolution tracking
         self._identifier_resolution = IdentifierResolutionMetrics()
 
+        # Serializes record_*() calls from concurrent reads
+        self._record_lock = threading.Lock()
+
         # File handle (lazy initialization)
         self._file_handle: Optional[TextIO] = None
 
@@ -442,6 +626,11 @@ class MetricsCollector:
         self._metrics_written = False
         self._intermediate_flush_count = 0
 
+        # Size-based rotation (None: the log file only rotates by date)
+        self._segmenter: Optional[LogSegmenter] = None
+        if rotation_policy is not None and rotation_policy.max_segment_bytes > 0:
+            self._segmenter = LogSegmenter(rotation_policy, timestamp_key="end_time")
+
         logger.debug(
             f"MetricsCollector initialized with session_id={self._session_id}, "
             f"anonymize_paths={anonymize_paths}"
@@ -463,6 +652,8 @@ class MetricsCollector:
         if current_date != self._current_date:
             # Date has changed - update filename
             logger.debug(f"Metrics date changed: {self._current_date} -> {current_date}")
+            if self._segmenter is not None:
+                self._segmenter.reset()
             self._current_date = current_date
             self._log_file = build_log_filename(self._session_id)
 
@@ -498,9 +689,10 @@ class MetricsCollector:
             token_count: Number of tokens in the injected context.
             exceeded_threshold: True if this injection exceeded the token limit.
         """
-        self._token_counts.append(token_count)
-        if exceeded_threshold:
-            self._threshold_exceedances += 1
+        with self._record_lock:
+            self._token_counts.record(token_count)
+            if exceeded_threshold:
+                self._threshold_exceedances += 1
 
     def record_parsing_time_ms(self, time_ms: int) -> None:
         """Record a file parsing time.
@@ -508,7 +700,8 @@ class MetricsCollector:
         Args:
             time_ms: Parsing time in milliseconds.
         """
-        self._parsing_times_ms.append(time_ms)
+        with self._record_lock:
+            self._parsing_times_ms.record(time_ms)
 
     def record_injection_latency_ms(self, latency_ms: int) -> None:
         """Record a context injection latency.
@@ -516,7 +709,71 @@ class MetricsCollector:
         Args:
             latency_ms: Injection latency in milliseconds.
         """
-        self._injection_latencies_ms.append(latency_ms)
+        with self._record_lock:
+            self._injection_latencies_ms.record(latency_ms)
+
+    def record_read(self, filepath: str, timer: ReadStageTimer) -> None:
+        """Record a completed read_file_with_context() call.
+
+        Records the file read, the total latency (as injection latency) and
+        the latency of each stage that ran and its file-system call counts.
+
+        Args:
+            filepath: Path of the file that was read.
+            timer: Timer of the read.
+        """
+        self.record_file_read(filepath)
+        elapsed_ns = timer.get_elapsed_ns()
+        durations_ns = timer.get_durations_ns()
+        with self._record_lock:
+            self._injection_latencies_ms.record(round(elapsed_ns / 1_000_000))
+            for stage, duration_ns in durations_ns.items():
+                sketch = self._stage_latencies_us.get(stage)
+                if sketch is None:
+                    sketch = QuantileSketch(STAGE_SKETCH_SIGNIFICANT_BITS)
+                    self._stage_latencies_us[stage] = sketch
+                sketch.record(duration_ns // 1000)
+            for kind, count in timer.get_io_counters().to_dict().items():
+                sketch = self._read_io.get(kind)
+                if sketch is None:
+                    sketch = QuantileSketch(STAGE_SKETCH_SIGNIFICANT_BITS)
+                    self._read_io[kind] = sketch
+                sketch.record(count)
+
+    def get_read_latency_statistics(self) -> TokenCountStatistics:
+        """Get latency percentiles of whole reads (injection latency) in milliseconds."""
+        with self._record_lock:
+            return calculate_sketch_statistics(self._injection_latencies_ms)
+
+    def get_read_stage_statistics(self) -> Dict[str, TokenCountStatistics]:
+        """Get latency percentiles of each read stage recorded so far.
+
+        Returns:
+            Statistics in microseconds keyed by stage name, in READ_STAGES
+            order (other stage names last).
+        """
+        with self._record_lock:
+            order = {stage: index for index, stage in enumerate(READ_STAGES)}
+            return {
+                stage: calculate_sketch_statistics(self._stage_latencies_us[stage])
+                for stage in sorted(
+                    self._stage_latencies_us, key=lambda name: order.get(name, len(order))
+                )
+            }
+
+    def get_read_io_statistics(self) -> Dict[str, TokenCountStatistics]:
+        """Get percentiles of the file-system calls per read recorded so far.
+
+        Returns:
+            Call count statistics keyed by kind, in IO_KINDS order (other
+            kinds last).
+        """
+        with self._record_lock:
+            order = {kind: index for index, kind in enumerate(IO_KINDS)}
+            return {
+                kind: calculate_sketch_statistics(self._read_io[kind])
+                for kind in sorted(self._read_io, key=lambda name: order.get(name, len(order)))
+            }
 
     def record_file_read(self, filepath: str) -> None:
         """Record a file read for re-read pattern tracking.
@@ -525,7 +782,8 @@ class MetricsCollector:
             filepath: Path of the file that was read.
         """
         path = self._maybe_anonymize(filepath)
-        self._file_read_counts[path] = self._file_read_counts.get(path, 0) + 1
+        with self._record_lock:
+            self._file_read_counts[path] = self._file_read_counts.get(path, 0) + 1
 
     def record_identifier_resolution(
         self,
@@ -591,6 +849,26 @@ class MetricsCollector:
             evictions_lru=stats.evictions_lru,
         )
 
+    def collect_context_cache_metrics(self, context_cache: Any) -> ContextCacheMetrics:
+        """Collect memoized context metrics from ContextResultCache.
+
+        Args:
+            context_cache: ContextResultCache instance.
+
+        Returns:
+            ContextCacheMetrics with collected data.
+        """
+        stats = context_cache.get_statistics()
+
+        return ContextCacheMetrics(
+            hit_rate=stats["hit_rate"],
+            hits=stats["hits"],
+            misses=stats["misses"],
+            stale=stats["stale"],
+            evictions=stats["evictions"],
+            entries=stats["entries"],
+        )
+
     def collect_injection_metrics(self, injection_logger: Any) -> ContextInjectionMetrics:
         """Collect context injection metrics from InjectionLogger.
 
@@ -602,8 +880,9 @@ class MetricsCollector:
         """
         stats = injection_logger.get_statistics()
 
-        # Calculate token count statistics from recorded values
-        token_stats = calculate_percentile_statistics(self._token_counts)
+        # Calculate token count statistics from the recorded distribution
+        with self._record_lock:
+            token_stats = calculate_sketch_statistics(self._token_counts)
 
         return ContextInjectionMetrics(
             total_injections=stats.total_injections,
@@ -732,6 +1011,7 @@ class MetricsCollector:
         injection_logger: Optional[Any] = None,
         warning_logger: Optional[Any] = None,
         graph: Optional[Any] = None,
+        context_cache: Optional[Any] = None,
     ) -> SessionMetrics:
         """Build complete session metrics from all sources.
 
@@ -740,6 +1020,7 @@ class MetricsCollector:
             injection_logger: InjectionLogger instance.
             warning_logger: WarningLogger instance.
             graph: RelationshipGraph instance.
+            context_cache: ContextResultCache instance.
 
         Returns:
             SessionMetrics with all collected data.
@@ -758,6 +1039,10 @@ class MetricsCollector:
         if cache is not None:
             metrics.cache_performance = self.collect_cache_metrics(cache)
 
+        # Collect memoized context metrics
+        if context_cache is not None:
+            metrics.context_cache = self.collect_context_cache_metrics(context_cache)
+
         # Collect injection metrics
         if injection_logger is not None:
             metrics.context_injection = self.collect_injection_metrics(injection_logger)
@@ -772,14 +1057,25 @@ class MetricsCollector:
             metrics.relationship_graph = graph_metrics
             metrics.function_usage_distribution = usage_dist
 
+        # Collect background log writer statistics (queueing and backpressure)
+        for name, event_logger in (("injections", injection_logger), ("warnings", warning_logger)):
+            writer_stats = (
+                event_logger.get_writer_statistics() if event_logger is not None else None
+            )
+            if isinstance(writer_stats, dict):
+                metrics.log_writers[name] = writer_stats
+
         # Add re-read patterns
         metrics.re_read_patterns = self.get_re_read_patterns()
 
         # Add performance metrics
-        metrics.performance = PerformanceMetrics(
-            parsing_time_ms=calculate_percentile_statistics(self._parsing_times_ms),
-            injection_latency_ms=calculate_percentile_statistics(self._injection_latencies_ms),
-        )
+        with self._record_lock:
+            metrics.performance = PerformanceMetrics(
+                parsing_time_ms=calculate_sketch_statistics(self._parsing_times_ms),
+                injection_latency_ms=calculate_sketch_statistics(self._injection_latencies_ms),
+            )
+        metrics.performance.read_stages_us = self.get_read_stage_statistics()
+        metrics.performance.read_io = self.get_read_io_statistics()
 
         return metrics
 
@@ -801,18 +1097,28 @@ class MetricsCollector:
         metrics_dict["flush_type"] = flush_type
 
         # Open file for appending
+        json_line = json.dumps(metrics_dict, separators=(",", ":")) + "\n"
         with open(log_path, "a", encoding="utf-8") as f:
-            json_line = json.dumps(metrics_dict, separators=(",", ":"))
-            f.write(json_line + "\n")
+            if self._segmenter is not None:
+                self._segmenter.opened(log_path, os.fstat(f.fileno()).st_size)
+            f.write(json_line)
 
         logger.info(f"Session metrics ({flush_type}) written to {log_path}")
 
+        if self._segmenter is not None:
+            if self._segmenter.record(len(json_line.encode("utf-8")), metrics.end_time):
+                self._segmenter.rotate(log_path)
+            if flush_type == "final":
+                # Segments compress in the background; finish them before the session ends
+                self._segmenter.wait()
+
     def finalize_and_write(
         self,
         cache: Optional[Any] = None,
         injection_logger: Optional[Any] = None,
         warning_logger: Optional[Any] = None,
         graph: Optional[Any] = None,
+        context_cache: Optional[Any] = None,
     ) -> Optional[SessionMetrics]:
         """Finalize session and write metrics to file.
 
@@ -825,6 +1131,7 @@ class MetricsCollector:
             injection_logger: InjectionLogger instance.
             warning_logger: WarningLogger instance.
             graph: RelationshipGraph instance.
+            context_cache: ContextResultCache instance.
 
         Returns:
             The SessionMetrics that were written, or None if already written.
@@ -839,6 +1146,7 @@ class MetricsCollector:
             injection_logger=injection_logger,
             warning_logger=warning_logger,
             graph=graph,
+            context_cache=context_cache,
         )
         self.write_metrics(metrics, flush_type="final")
         self._metrics_written = True
@@ -850,6 +1158,7 @@ class MetricsCollector:
         injection_logger: Optional[Any] = None,
         warning_logger: Optional[Any] = None,
         graph: Optional[Any] = None,
+        context_cache: Optional[Any] = None,
     ) -> SessionMetrics:
         """Write intermediate metrics during session without finalizing.
 
@@ -862,6 +1171,7 @@ class MetricsCollector:
             injection_logger: InjectionLogger instance.
             warning_logger: WarningLogger instance.
             graph: RelationshipGraph instance.
+            context_cache: ContextResultCache instance.
 
         Returns:
             The SessionMetrics that were written.
@@ -873,6 +1183,7 @@ class MetricsCollector:
             injection_logger=injection_logger,
             warning_logger=warning_logger,
             graph=graph,
+            context_cache=context_cache,
         )
         self.write_metrics(metrics, flush_type="intermediate")
 
@@ -924,15 +1235,41 @@ class MetricsCollector:
         pass  # Metrics must be explicitly written with finalize_and_write()
 
 
-def read_session_metrics(log_path: Path, limit: Optional[int] = None) -> List[SessionMetrics]:
-    """Read session metrics from a JSONL log file.
+def _read_statistics(data: Dict[str, Any]) -> TokenCountStatistics:
+    """Rebuild TokenCountStatistics from its serialized form.
+
+    Entries written before p99 and sketches were recorded read as 0 and None.
+    """
+    sketch = data.get("sketch")
+    return TokenCountStatistics(
+        min=data.get("min", 0),
+        max=data.get("max", 0),
+        median=data.get("median", 0),
+        p95=data.get("p95", 0),
+        p99=data.get("p99", 0),
+        total_count=sketch.get("count", 0) if isinstance(sketch, dict) else 0,
+        sketch=sketch if isinstance(sketch, dict) else None,
+    )
+
+
+def read_session_metrics(
+    log_path: Path,
+    limit: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
+) -> List[SessionMetrics]:
+    """Read session metrics from a JSONL log file and its segments.
 
     Utility function for reading back logged metrics, useful for
-    testing and analysis.
+    testing and analysis. Segments rotated out of the log are read first,
+    streamed without loading them into memory; segments outside the time
+    range are skipped using the manifest.
 
     Args:
         log_path: Path to the session_metrics.jsonl file.
         limit: Optional maximum number of sessions to read.
+        since: Optional ISO 8601 timestamp; skip entries that ended earlier.
+        until: Optional ISO 8601 timestamp; skip entries that ended later.
 
     Returns:
         List of SessionMetrics objects.
@@ -940,88 +1277,115 @@ def read_session_metrics(log_path: Path, limit: Optional[int] = None) -> List[Se
     Raises:
         FileNotFoundError: If log file doesn't exist.
     """
-    if not log_path.exists():
+    if not log_exists(log_path):
         return []
 
     metrics_list: List[SessionMetrics] = []
+    since_time = parse_timestamp(since)
+    until_time = parse_timestamp(until)
+
+    for line in iter_log_lines(log_path, since_time, until_time):
+        if limit is not None and len(metrics_list) >= limit:
+            break
 
-    with open(log_path, encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            if limit is not None and i >= limit:
-                break
+        line = line.strip()
+        if not line:
+            continue
 
-            line = line.strip()
-            if not line:
+        try:
+            data = json.loads(line)
+            if not in_time_range(data.get("end_time"), since_time, until_time):
                 continue
+            # Create SessionMetrics from dict
+            metrics = SessionMetrics(
+                session_id=data.get("session_id", ""),
+                start_time=data.get("start_time", ""),
+                end_time=data.get("end_time", ""),
+                configuration=data.get("configuration", {}),
+            )
 
-            try:
-                data = json.loads(line)
-                # Create SessionMetrics from dict
-                metrics = SessionMetrics(
-                    session_id=data.get("session_id", ""),
-                    start_time=data.get("start_time", ""),
-                    end_time=data.get("end_time", ""),
-                    configuration=data.get("configuration", {}),
+            # Populate nested metrics if present
+            if "cache_performance" in data:
+                cp = data["cache_performance"]
+                metrics.cache_performance = CachePerformanceMetrics(
+                    hit_rate=cp.get("hit_rate", 0.0),
+                    miss_rate=cp.get("miss_rate", 0.0),
+                    total_reads=cp.get("total_reads", 0),
+                    cache_hits=cp.get("cache_hits", 0),
+                    cache_misses=cp.get("cache_misses", 0),
+                    staleness_refreshes=cp.get("staleness_refreshes", 0),
+                    peak_size_kb=cp.get("peak_size_kb", 0.0),
+                    evictions_lru=cp.get("evictions_lru", 0),
                 )
 
-                # Populate nested metrics if present
-                if "cache_performance" in data:
-                    cp = data["cache_performance"]
-                    metrics.cache_performance = CachePerformanceMetrics(
-                        hit_rate=cp.get("hit_rate", 0.0),
-                        miss_rate=cp.get("miss_rate", 0.0),
-                        total_reads=cp.get("total_reads", 0),
-                        cache_hits=cp.get("cache_hits", 0),
-                        cache_misses=cp.get("cache_misses", 0),
-                        staleness_refreshes=cp.get("staleness_refreshes", 0),
-                        peak_size_kb=cp.get("peak_size_kb", 0.0),
-                        evictions_lru=cp.get("evictions_lru", 0),
-                    )
-
-                if "context_injection" in data:
-                    ci = data["context_injection"]
-                    tc = ci.get("token_counts", {})
-                    metrics.context_injection = ContextInjectionMetrics(
-                        total_injections=ci.get("total_injections", 0),
-                        token_counts=TokenCountStatistics(
-                            min=tc.get("min", 0),
-                            max=tc.get("max", 0),
-                            median=tc.get("median", 0),
-                            p95=tc.get("p95", 0),
-                        ),
-                        threshold_exceedances=ci.get("threshold_exceedances", 0),
-                    )
-
-                if "relationship_graph" in data:
-                    rg = data["relationship_graph"]
-                    metrics.relationship_graph = RelationshipGraphMetrics(
-                        total_files=rg.get("total_files", 0),
-                        total_relationships=rg.get("total_relationships", 0),
-                        most_connected_files=rg.get("most_connected_files", []),
-                    )
-
-                if "function_usage_distribution" in data:
-                    fud = data["function_usage_distribution"]
-                    metrics.function_usage_distribution = FunctionUsageDistribution(
-                        files_1_to_3=fud.get("1-3_files", 0),
-                        files_4_to_10=fud.get("4-10_files", 0),
-                        files_11_plus=fud.get("11+_files", 0),
-                    )
-
-                if "re_read_patterns" in data:
-                    metrics.re_read_patterns = data["re_read_patterns"]
-
-                if "warnings" in data:
-                    w = data["warnings"]
-                    metrics.warnings = WarningStatisticsMetrics(
-                        total_warnings=w.get("total_warnings", 0),
-                        by_type=w.get("by_type", {}),
-                        files_with_most_warnings=w.get("files_with_most_warnings", []),
-                    )
-
-                metrics_list.append(metrics)
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"Skipping malformed metrics entry: {e}")
-                continue
+            if "context_cache" in data:
+                cc = data["context_cache"]
+                metrics.context_cache = ContextCacheMetrics(
+                    hit_rate=cc.get("hit_rate", 0.0),
+                    hits=cc.get("hits", 0),
+                    misses=cc.get("misses", 0),
+                    stale=cc.get("stale", 0),
+                    evictions=cc.get("evictions", 0),
+                    entries=cc.get("entries", 0),
+                )
+
+            if "context_injection" in data:
+                ci = data["context_injection"]
+                tc = ci.get("token_counts", {})
+                metrics.context_injection = ContextInjectionMetrics(
+                    total_injections=ci.get("total_injections", 0),
+                    token_counts=_read_statistics(tc),
+                    threshold_exceedances=ci.get("threshold_exceedances", 0),
+                )
+
+            if "relationship_graph" in data:
+                rg = data["relationship_graph"]
+                metrics.relationship_graph = RelationshipGraphMetrics(
+                    total_files=rg.get("total_files", 0),
+                    total_relationships=rg.get("total_relationships", 0),
+                    most_connected_files=rg.get("most_connected_files", []),
+                )
+
+            if "function_usage_distribution" in data:
+                fud = data["function_usage_distribution"]
+                metrics.function_usage_distribution = FunctionUsageDistribution(
+                    files_1_to_3=fud.get("1-3_files", 0),
+                    files_4_to_10=fud.get("4-10_files", 0),
+                    files_11_plus=fud.get("11+_files", 0),
+                )
+
+            if "re_read_patterns" in data:
+                metrics.re_read_patterns = data["re_read_patterns"]
+
+            if "performance" in data:
+                perf = data["performance"]
+                metrics.performance = PerformanceMetrics(
+                    parsing_time_ms=_read_statistics(perf.get("parsing_time_ms", {})),
+                    injection_latency_ms=_read_statistics(perf.get("injection_latency_ms", {})),
+                    read_stages_us={
+                        stage: _read_statistics(stats)
+                        for stage, stats in perf.get("read_stages_us", {}).items()
+                    },
+                    read_io={
+                        kind: _read_statistics(stats)
+                        for kind, stats in perf.get("read_io", {}).items()
+                    },
+                )
+
+            if "log_writers" in data:
+                metrics.log_writers = data["log_writers"]
+
+            if "warnings" in data:
+                w = data["warnings"]
+                metrics.warnings = WarningStatisticsMetrics(
+                    total_warnings=w.get("total_warnings", 0),
+                    by_type=w.get("by_type", {}),
+                    files_with_most_warnings=w.get("files_with_most_warnings", []),
+                )
+
+            metrics_list.append(metrics)
+        except (json.JSONDecodeError, KeyError) as e:
+            logger.warning(f"Skipping malformed metrics entry: {e}")
+            continue
 
     return metrics_list
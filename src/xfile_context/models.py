@@ -21,11 +21,12 @@ Intermediate AST data models (Issue #122):
 All models use JSON-compatible primitives (DD-4) for serialization.
 """
 
+import heapq
 import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -485,9 +486,20 @@ class RelationshipGraph:
         self._dependencies: Dict[str, Set[str]] = {}  # file → files it depends on
         self._dependents: Dict[str, Set[str]] = {}  # file → files that depend on it
 
+        # Relationships by source file, in insertion order, and the source files
+        # in sorted order (rebuilt lazily when a source is added or removed).
+        # Used for per-file queries and paged export without scanning all
+        # relationships.
+        self._outgoing: Dict[str, List[Relationship]] = {}
+        self._sorted_sources: Optional[List[str]] = None
+
         # Metadata
         self._file_metadata: Dict[str, FileMetadata] = {}
 
+        # Monotonic mutation counter. Any change to relationships or metadata
+        # bumps it, so callers can detect "graph unchanged" in O(1).
+        self._generation = 0
+
         # Note: _circular_groups removed (cycle detection deferred to v0.1.1+, see Section 3.5.5)
 
     def add_relationship(self, rel: Relationship) -> None:
@@ -516,6 +528,13 @@ class RelationshipGraph:
 
             # Add to relationships list
             self._relationships.append(rel)
+            outgoing = self._outgoing.get(rel.source_file)
+            if outgoing is None:
+                self._outgoing[rel.source_file] = [rel]
+                self._sorted_sources = None
+            else:
+                outgoing.append(rel)
+            self._generation += 1
         except Exception as e:
             # If dict update fails (extremely unlikely at target scale):
             # Log error with full context and re-raise
@@ -569,8 +588,7 @@ class RelationshipGraph:
         Returns:
             List of unique relationships where filepath is the source.
         """
-        file_rels = [rel for rel in self._relationships if rel.source_file == filepath]
-        return self._deduplicate_relationships(file_rels)
+        return self._deduplicate_relationships(self._outgoing.get(filepath, []))
 
     def get_dependents(self, filepath: str) -> List[Relationship]:
         """Get relationships where others depend on filepath.
@@ -603,6 +621,7 @@ class RelationshipGraph:
                 for rel in self._relationships
                 if rel.source_file != filepath and rel.target_file != filepath
             ]
+            self._rebuild_outgoing_index()
 
             # Remove from indices
             if filepath in self._dependencies:
@@ -619,6 +638,8 @@ class RelationshipGraph:
             # Remove metadata
             if filepath in self._file_metadata:
                 del self._file_metadata[filepath]
+
+            self._generation += 1
         except Exception as e:
             # If removal fails (extremely unlikely at target scale):
             # Log error with full context and re-raise
@@ -626,6 +647,48 @@ class RelationshipGraph:
             logger.error(f"Graph removal failed for {filepath}: {e}")
             raise
 
+    def remove_relationships_for_files(
+        self, filepaths: Set[str], outgoing_from: Optional[Set[str]] = None
+    ) -> List[Relationship]:
+        """Remove relationships for many files in a single pass.
+
+        Equivalent to remove_relationships_for_file() for each file in filepaths
+        plus remove_outgoing_relationships() for each file in outgoing_from, but
+        scans the relationship list once instead of once per file.
+
+        Args:
+            filepaths: Files whose relationships (incoming and outgoing) and
+                metadata are removed.
+            outgoing_from: Files whose outgoing relationships are removed.
+
+        Returns:
+            List of removed relationships.
+        """
+        sources = filepaths | outgoing_from if outgoing_from else filepaths
+
+        removed: List[Relationship] = []
+        remaining: List[Relationship] = []
+        for rel in self._relationships:
+            if rel.source_file in sources or rel.target_file in filepaths:
+                removed.append(rel)
+            else:
+                remaining.append(rel)
+        self._relationships = remaining
+
+        # Rebuild indices from the remaining relationships
+        self._dependencies = {}
+        self._dependents = {}
+        for rel in remaining:
+            self._dependencies.setdefault(rel.source_file, set()).add(rel.target_file)
+            self._dependents.setdefault(rel.target_file, set()).add(rel.source_file)
+        self._rebuild_outgoing_index()
+
+        for filepath in filepaths:
+            self._file_metadata.pop(filepath, None)
+
+        self._generation += 1
+        return removed
+
     def export_to_dict(self, project_root: Optional[str] = None) -> Dict[str, Any]:
         """Export graph to JSON-compatible dict (FR-23, FR-25).
 
@@ -654,35 +717,16 @@ class RelationshipGraph:
             metadata["project_root"] = project_root
 
         # Build files section with both absolute and relative paths
-        files = []
-        for filepath, file_meta in self._file_metadata.items():
-            file_entry: Dict[str, Any] = {
-                "path": filepath,
-                "last_modified": datetime.fromtimestamp(
-                    file_meta.last_analyzed, tz=timezone.utc
-                ).isoformat(),
-                "relationship_count": file_meta.relationship_count,
-                "in_import_cycle": False,  # Cycle detection deferred to v0.1.1+
-            }
-            # Add relative path if project_root provided
-            if project_root:
-                file_entry["relative_path"] = self._compute_relative_path(filepath, project_root)
-            files.append(file_entry)
+        files = list(self.iter_file_entries(project_root))
 
         # Build relationships section
-        relationships = []
-        for rel in self._relationships:
-            rel_entry = rel.to_dict()
-            # Ensure metadata structure matches TDD 3.10.3
-            if rel.metadata:
-                rel_entry["metadata"] = rel.metadata
-            relationships.append(rel_entry)
+        relationships = list(self.iter_relationship_entries())
 
         # Build graph_metadata section
         graph_metadata = {
             # Circular imports detection deferred to v0.1.1+ (see TDD Section 3.5.5)
             "circular_imports": [],
-            "most_connected_files": self._get_most_connected_files(limit=10),
+            "most_connected_files": self.get_most_connected_files(limit=10),
         }
 
         return {
@@ -692,6 +736,73 @@ class RelationshipGraph:
             "graph_metadata": graph_metadata,
         }
 
+    def iter_file_entries(self, project_root: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """Yield the "files" section of a graph export one entry at a time.
+
+        The graph must not change while the iterator is in use.
+
+        Args:
+            project_root: Project root directory for computing relative paths.
+
+        Yields:
+            File entries per TDD Section 3.10.3.
+        """
+        for filepath, file_meta in self._file_metadata.items():
+            yield self._export_file_entry(filepath, file_meta, project_root)
+
+    def iter_relationship_entries(self) -> Iterator[Dict[str, Any]]:
+        """Yield the "relationships" section of a graph export one entry at a time.
+
+        The graph must not change while the iterator is in use.
+
+        Yields:
+            Relationship entries per TDD Section 3.10.3.
+        """
+        for rel in self._relationships:
+            rel_entry = rel.to_dict()
+            # Ensure metadata structure matches TDD 3.10.3
+            if rel.metadata:
+                rel_entry["metadata"] = rel.metadata
+            yield rel_entry
+
+    def get_file_count(self) -> int:
+        """Get the number of files with metadata (the "files" of an export)."""
+        return len(self._file_metadata)
+
+    def export_file_entry(
+        self, filepath: str, project_root: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Export one file's entry in the "files" section of a graph export.
+
+        Args:
+            filepath: File to export.
+            project_root: Project root directory for computing relative paths.
+
+        Returns:
+            File entry per TDD Section 3.10.3, or None if the file has no metadata.
+        """
+        file_meta = self._file_metadata.get(filepath)
+        if file_meta is None:
+            return None
+        return self._export_file_entry(filepath, file_meta, project_root)
+
+    def _export_file_entry(
+        self, filepath: str, file_meta: FileMetadata, project_root: Optional[str]
+    ) -> Dict[str, Any]:
+        """Build a file entry with absolute and (optionally) relative paths."""
+        file_entry: Dict[str, Any] = {
+            "path": filepath,
+            "last_modified": datetime.fromtimestamp(
+                file_meta.last_analyzed, tz=timezone.utc
+            ).isoformat(),
+            "relationship_count": file_meta.relationship_count,
+            "in_import_cycle": False,  # Cycle detection deferred to v0.1.1+
+        }
+        # Add relative path if project_root provided
+        if project_root:
+            file_entry["relative_path"] = self._compute_relative_path(filepath, project_root)
+        return file_entry
+
     def _compute_relative_path(self, filepath: str, project_root: str) -> str:
         """Compute relative path from project root.
 
@@ -708,7 +819,7 @@ class RelationshipGraph:
             # On Windows, relpath fails for paths on different drives
             return filepath
 
-    def _get_most_connected_files(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_most_connected_files(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get files with highest dependency counts.
 
         Counts files that have the most dependents (most imported by other files).
@@ -719,15 +830,84 @@ class RelationshipGraph:
         Returns:
             List of dicts with 'file' and 'dependency_count' keys, sorted by count.
         """
-        # Count dependents for each file (how many files depend on it)
-        dependency_counts: Dict[str, int] = {}
-        for filepath in self._dependents:
-            dependency_counts[filepath] = len(self._dependents[filepath])
+        # Top N by dependent count (how many files depend on it), without
+        # materializing a count for every file
+        top_files = heapq.nlargest(limit, self._dependents.items(), key=lambda x: len(x[1]))
 
-        # Sort by count descending and take top N
-        sorted_files = sorted(dependency_counts.items(), key=lambda x: x[1], reverse=True)[:limit]
+        return [
+            {"file": filepath, "dependency_count": len(dependents)}
+            for filepath, dependents in top_files
+        ]
 
-        return [{"file": filepath, "dependency_count": count} for filepath, count in sorted_files]
+    def _rebuild_outgoing_index(self) -> None:
+        """Rebuild the relationships-by-source index from the relationship list."""
+        self._outgoing = {}
+        for rel in self._relationships:
+            self._outgoing.setdefault(rel.source_file, []).append(rel)
+        self._sorted_sources = None
+
+    def get_outgoing_relationships(self, filepath: str) -> Sequence[Relationship]:
+        """Get a file's outgoing relationships in insertion order.
+
+        Unlike get_dependencies(), returns the index entry itself: no copy and
+        no deduplication. Callers must not modify it.
+
+        Args:
+            filepath: Source file to query.
+
+        Returns:
+            Relationships where filepath is the source.
+        """
+        return self._outgoing.get(filepath, ())
+
+    def get_sorted_source_files(self) -> Sequence[str]:
+        """Get all files with outgoing relationships, in sorted order.
+
+        The sorted list is cached until a source file is added or removed, so
+        repeated calls (e.g. one per export page) cost O(1). Callers must not
+        modify it.
+
+        Returns:
+            Sorted source file paths.
+        """
+        if self._sorted_sources is None:
+            self._sorted_sources = sorted(self._outgoing)
+        return self._sorted_sources
+
+    def get_neighborhood(self, filepath: str, hops: int) -> Set[str]:
+        """Get files within a number of hops of a file, in either direction.
+
+        Follows both dependencies and dependents, so the result includes what
+        the file uses and what uses it.
+
+        Args:
+            filepath: File at the center of the neighborhood.
+            hops: Maximum number of relationships to follow (0 = the file only).
+
+        Returns:
+            Set of file paths, including filepath.
+        """
+        visited: Set[str] = {filepath}
+        frontier: List[str] = [filepath]
+        for _ in range(hops):
+            next_frontier: List[str] = []
+            for current in frontier:
+                for neighbor in self._dependencies.get(current, ()):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+                for neighbor in self._dependents.get(current, ()):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier.append(neighbor)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return visited
+
+    def get_relationship_count(self) -> int:
+        """Get the number of relationships in the graph (without copying them)."""
+        return len(self._relationships)
 
     def get_all_relationships(self) -> List[Relationship]:
         """Get all relationships in the graph.
@@ -745,6 +925,7 @@ class RelationshipGraph:
             metadata: FileMetadata to store.
         """
         self._file_metadata[filepath] = metadata
+        self._generation += 1
 
     def get_file_metadata(self, filepath: str) -> Optional[FileMetadata]:
         """Get metadata for a file.
@@ -757,6 +938,17 @@ class RelationshipGraph:
         """
         return self._file_metadata.get(filepath)
 
+    def get_generation(self) -> int:
+        """Get the graph's mutation counter.
+
+        The counter increases on every change to relationships or file
+        metadata. Two equal values mean the graph has not changed in between.
+
+        Returns:
+            Current generation number.
+        """
+        return self._generation
+
     def validate_graph(self) -> Tuple[bool, List[str]]:
         """Validate graph structure for consistency (EC-19).
 
@@ -857,7 +1049,10 @@ class RelationshipGraph:
         self._relationships.clear()
         self._dependencies.clear()
         self._dependents.clear()
+        self._outgoing.clear()
+        self._sorted_sources = None
         self._file_metadata.clear()
+        self._generation += 1
 
     # =========================================================================
     # Issue #117 Option B: Staleness Resolution Support Methods
@@ -937,7 +1132,7 @@ class RelationshipGraph:
         Returns:
             List of relationships where filepath is the source.
         """
-        return [rel for rel in self._relationships if rel.source_file == filepath]
+        return list(self._outgoing.get(filepath, []))
 
     def restore_pending_relationships(self, relationships: List[Relationship]) -> None:
         """Restore previously stored relationships (Issue #117 Option B).
@@ -975,6 +1170,9 @@ class RelationshipGraph:
                 remaining.append(rel)
 
         self._relationships = remaining
+        if self._outgoing.pop(filepath, None) is not None:
+            self._sorted_sources = None
+        self._generation += 1
 
         # Update dependencies index (outgoing edges from this file)
         if filepath in self._dependencies:
@@ -1001,6 +1199,7 @@ class RelationshipGraph:
         metadata = self.get_file_metadata(filepath)
         if metadata is not None:
             metadata.pending_relationships = True
+            self._generation += 1
 
     def clear_pending_relationships(self, filepath: str) -> None:
         """Clear the pending_relationships flag for a file (Issue #117 Option B).
@@ -1013,6 +1212,7 @@ class RelationshipGraph:
         metadata = self.get_file_metadata(filepath)
         if metadata is not None:
             metadata.pending_relationships = False
+            self._generation += 1
 
     def get_files_with_pending_relationships(self) -> List[str]:
         """Get all files marked as having pending relationships.
@@ -0,0 +1,249 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Mergeable streaming quantile sketch for session metrics.
+
+MetricsCollector used to keep every token count and latency sample in a list
+and sort it for each (intermediate) flush, so memory and flush cost grew with
+session length. A QuantileSketch records samples into a log-linear histogram
+(in the style of an HDR histogram) instead.
+
+Key features:
+- O(1) recording: a sample increments the counter of its bucket
+- Bounded memory: the number of buckets depends on the precision and the
+  magnitude of the samples, not on how many samples were recorded
+- Accuracy: values below 2**significant_bits are counted exactly; larger
+  values fall into buckets whose width is at most 1/2**(significant_bits - 1)
+  of their lower bound. min, max, count and sum are exact
+- Mergeable: adding bucket counters combines sketches from multiple sessions
+  (scripts/analyze_metrics.py) with the same accuracy as a single sketch
+- Serializable to a compact dict stored with the session metrics
+
+Usage:
+    sketch = QuantileSketch()
+    sketch.record(120)
+    sketch.quantile(0.95)
+    merged = QuantileSketch.from_dict(data)
+    merged.merge(other)
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Values below 2**10 are exact, larger values are within ~0.1%
+DEFAULT_SIGNIFICANT_BITS = 10
+
+MIN_SIGNIFICANT_BITS = 1
+MAX_SIGNIFICANT_BITS = 16
+
+
+class QuantileSketch:
+    """Log-linear histogram of non-negative integer samples.
+
+    A value v below 2**significant_bits has its own bucket (index v). A larger
+    value is reduced to its top significant_bits bits: with
+    shift = v.bit_length() - significant_bits, it is counted in bucket
+    (shift << significant_bits) + (v >> shift), which covers the values
+    [(v >> shift) << shift, ((v >> shift) + 1) << shift). Bucket indices grow
+    with the values they cover.
+
+    Quantiles use the same ranks as calculate_percentile_statistics(): the
+    q-quantile is the value at rank int(q * count) (clamped to the last rank)
+    and the median averages the two middle values of an even count.
+
+    Thread Safety:
+        Not thread-safe. MetricsCollector records under its own lock.
+    """
+
+    def __init__(self, significant_bits: int = DEFAULT_SIGNIFICANT_BITS) -> None:
+        """Initialize an empty sketch.
+
+        Args:
+            significant_bits: Precision of the buckets (1-16).
+
+        Raises:
+            ValueError: If significant_bits is out of range.
+        """
+        if not MIN_SIGNIFICANT_BITS <= significant_bits <= MAX_SIGNIFICANT_BITS:
+            raise ValueError(
+                f"significant_bits must be between {MIN_SIGNIFICANT_BITS} and "
+                f"{MAX_SIGNIFICANT_BITS}, got {significant_bits}"
+            )
+        self._significant_bits = significant_bits
+        self._buckets: Dict[int, int] = {}
+        self._count = 0
+        self._sum = 0
+        self._min = 0
+        self._max = 0
+
+    def record(self, value: int, count: int = 1) -> None:
+        """Record a sample.
+
+        Args:
+            value: Sample value; negative values are recorded as 0.
+            count: Number of times to record the value.
+        """
+        if count <= 0:
+            return
+        value = max(int(value), 0)
+        index = self._bucket_index(value)
+        self._buckets[index] = self._buckets.get(index, 0) + count
+        if self._count == 0:
+            self._min = self._max = value
+        elif value < self._min:
+            self._min = value
+        elif value > self._max:
+            self._max = value
+        self._count += count
+        self._sum += value * count
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the samples of another sketch to this one.
+
+        Args:
+            other: Sketch with the same precision.
+
+        Raises:
+            ValueError: If the sketches have different precision.
+        """
+        if other._significant_bits != self._significant_bits:
+            raise ValueError(
+                f"Cannot merge sketches with {other._significant_bits} and "
+                f"{self._significant_bits} significant bits"
+            )
+        if other._count == 0:
+            return
+        for index, count in other._buckets.items():
+            self._buckets[index] = self._buckets.get(index, 0) + count
+        if self._count == 0:
+            self._min, self._max = other._min, other._max
+        else:
+            self._min = min(self._min, other._min)
+            self._max = max(self._max, other._max)
+        self._count += other._count
+        self._sum += other._sum
+
+    def get_count(self) -> int:
+        """Get the number of recorded samples."""
+        return self._count
+
+    def get_min(self) -> int:
+        """Get the smallest recorded sample (0 if empty)."""
+        return self._min
+
+    def get_max(self) -> int:
+        """Get the largest recorded sample (0 if empty)."""
+        return self._max
+
+    def get_sum(self) -> int:
+        """Get the sum of all recorded samples."""
+        return self._sum
+
+    def get_bucket_count(self) -> int:
+        """Get the number of non-empty buckets (the memory used by the sketch)."""
+        return len(self._buckets)
+
+    def quantile(self, q: float) -> int:
+        """Estimate the q-quantile of the recorded samples.
+
+        Args:
+            q: Quantile between 0.0 and 1.0 (e.g. 0.95 for p95).
+
+        Returns:
+            Estimated value, or 0 if the sketch is empty.
+
+        Raises:
+            ValueError: If q is outside [0, 1].
+        """
+        if not 0.0 <= q <= 1.0:
+            raise ValueError(f"Quantile must be between 0 and 1, got {q}")
+        if self._count == 0:
+            return 0
+        return self._value_at_rank(min(int(self._count * q), self._count - 1))
+
+    def median(self) -> int:
+        """Estimate the median (the mean of the two middle values for even counts)."""
+        if self._count == 0:
+            return 0
+        lower = self._value_at_rank((self._count - 1) // 2)
+        upper = self._value_at_rank(self._count // 2)
+        return (lower + upper) // 2
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization.
+
+        Buckets are stored as [index, count] pairs ordered by index.
+        """
+        return {
+            "significant_bits": self._significant_bits,
+            "count": self._count,
+            "sum": self._sum,
+            "min": self._min,
+            "max": self._max,
+            "buckets": [[index, self._buckets[index]] for index in sorted(self._buckets)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Create a sketch from a dictionary written by to_dict().
+
+        Args:
+            data: Serialized sketch.
+
+        Returns:
+            QuantileSketch with the serialized samples.
+
+        Raises:
+            ValueError: If the data is not a valid sketch.
+        """
+        try:
+            sketch = cls(int(data.get("significant_bits", DEFAULT_SIGNIFICANT_BITS)))
+            for index, count in data["buckets"]:
+                if int(index) < 0 or int(count) <= 0:
+                    raise ValueError(f"Invalid bucket {index}: {count}")
+                sketch._buckets[int(index)] = int(count)
+            sketch._count = int(data["count"])
+            sketch._sum = int(data.get("sum", 0))
+            sketch._min = int(data.get("min", 0))
+            sketch._max = int(data.get("max", 0))
+        except (AttributeError, KeyError, TypeError) as e:
+            raise ValueError(f"Invalid quantile sketch: {e}") from e
+        if sketch._count != sum(sketch._buckets.values()):
+            raise ValueError("Invalid quantile sketch: count does not match buckets")
+        return sketch
+
+    def _bucket_index(self, value: int) -> int:
+        """Get the index of the bucket counting a non-negative value."""
+        shift = value.bit_length() - self._significant_bits
+        if shift <= 0:
+            return value
+        return (shift << self._significant_bits) + (value >> shift)
+
+    def _bucket_range(self, index: int) -> Tuple[int, int]:
+        """Get the smallest and largest value counted in a bucket."""
+        shift = index >> self._significant_bits
+        if shift == 0:
+            return index, index
+        mantissa = index - (shift << self._significant_bits)
+        lower = mantissa << shift
+        return lower, lower + (1 << shift) - 1
+
+    def _value_at_rank(self, rank: int) -> int:
+        """Estimate the value at a 0-based rank in sorted order.
+
+        Returns the middle of the bucket holding the rank, clamped to the
+        exact min and max.
+        """
+        seen = 0
+        found: Optional[int] = None
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen > rank:
+                found = index
+                break
+        if found is None:
+            return self._max
+        lower, upper = self._bucket_range(found)
+        return min(max((lower + upper) // 2, self._min), self._max)
@@ -11,10 +11,13 @@ This module implements the Query API per TDD Section 3.10.4:
 API Methods (FR-29, FR-18, FR-23):
 - get_recent_injections(target_file, limit): Recent context injection events
 - get_relationship_graph(): Full graph export structure
+- get_relationship_graph_page(...): One filtered page of the graph export
 - get_dependents(file_path): Files that depend on specified file
 - get_dependencies(file_path): Files that specified file depends on
 - get_session_metrics(): Current session metrics (in-progress)
+- get_read_latency(): Per-stage latency percentiles of file reads
 - get_cache_statistics(): Current cache statistics
+- get_indexing_progress(): Background indexing progress
 
 Implementation:
 - v0.1.0: Internal Python API (used by MCP server and tests)
@@ -23,10 +26,14 @@ Implementation:
 
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from xfile_context.graph_export import DEFAULT_PAGE_SIZE, export_relationship_page
+
 if TYPE_CHECKING:
+    from xfile_context.background_indexer import BackgroundIndexer
     from xfile_context.cache import WorkingMemoryCache
+    from xfile_context.context_cache import ContextResultCache
     from xfile_context.injection_logger import InjectionLogger
-    from xfile_context.metrics_collector import MetricsCollector
+    from xfile_context.metrics_collector import MetricsCollector, TokenCountStatistics
     from xfile_context.models import RelationshipGraph
     from xfile_context.service import CrossFileContextService
     from xfile_context.warning_logger import WarningLogger
@@ -70,6 +77,8 @@ class QueryAPI:
         metrics_collector: "MetricsCollector",
         warning_logger: "WarningLogger",
         project_root: Optional[str] = None,
+        context_cache: Optional["ContextResultCache"] = None,
+        indexer: Optional["BackgroundIndexer"] = None,
     ) -> None:
         """Initialize the Query API with system components.
 
@@ -80,6 +89,8 @@ class QueryAPI:
             metrics_collector: MetricsCollector instance for session metrics.
             warning_logger: WarningLogger instance for warning metrics.
             project_root: Project root directory for relative paths in exports.
+            context_cache: Optional ContextResultCache for memoized context metrics.
+            indexer: Optional BackgroundIndexer for indexing progress.
         """
         self._graph = graph
         self._cache = cache
@@ -87,6 +98,8 @@ class QueryAPI:
         self._metrics_collector = metrics_collector
         self._warning_logger = warning_logger
         self._project_root = project_root
+        self._context_cache = context_cache
+        self._indexer = indexer
 
     @classmethod
     def from_service(cls, service: "CrossFileContextService") -> "QueryAPI":
@@ -107,6 +120,8 @@ class QueryAPI:
             metrics_collector=service._metrics_collector,
             warning_logger=service._warning_logger,
             project_root=str(service._project_root),
+            context_cache=service._context_cache,
+            indexer=service._indexer,
         )
 
     def get_recent_injections(
@@ -139,10 +154,7 @@ class QueryAPI:
             - token_count: Token count of this snippet
             - context_token_total: Cumulative token count
         """
-        from xfile_context.injection_logger import get_recent_injections
-
-        log_path = self._injection_logger.get_log_path()
-        events = get_recent_injections(log_path, target_file, limit)
+        events = self._injection_logger.get_recent_injections(target_file, limit)
         return [event.to_dict() for event in events]
 
     def get_relationship_graph(self) -> Dict[str, Any]:
@@ -160,6 +172,45 @@ class QueryAPI:
         """
         return self._graph.export_to_dict(project_root=self._project_root)
 
+    def get_relationship_graph_page(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        relationship_types: Optional[List[str]] = None,
+        around_file: Optional[str] = None,
+        hops: int = 1,
+    ) -> Dict[str, Any]:
+        """Get one page of the relationship graph (FR-23).
+
+        Use case: Graph-wide queries on large projects, one page at a time.
+
+        Args:
+            limit: Maximum number of relationships in the page.
+            cursor: next_cursor of the previous page, or None for the first page.
+            path_prefix: Only relationships whose source file is in this directory.
+            relationship_types: Only relationships of these types.
+            around_file: Only relationships between files within hops of this file.
+            hops: Neighborhood radius for around_file.
+
+        Returns:
+            Dictionary containing:
+            - relationships: list of relationship dicts in the page
+            - files: file info for the source files in the page
+            - next_cursor: cursor for the next page (None on the last page)
+            - metadata: timestamp, counts, graph generation
+        """
+        return export_relationship_page(
+            self._graph,
+            limit=limit,
+            cursor=cursor,
+            path_prefix=path_prefix,
+            relationship_types=relationship_types,
+            around_file=around_file,
+            hops=hops,
+            project_root=self._project_root,
+        )
+
     def get_dependents(self, file_path: str) -> List[Dict[str, Any]]:
         """Get files that depend on the specified file (FR-18).
 
@@ -221,11 +272,12 @@ class QueryAPI:
             - start_time: Session start timestamp
             - end_time: Current timestamp (session not ended)
             - cache_performance: Hit rate, miss rate, peak size, evictions
+            - context_cache: Memoized context hit rate, stale entries, evictions
             - context_injection: Total injections, token counts, thresholds
             - relationship_graph: File and relationship counts
             - function_usage_distribution: Usage histogram
             - re_read_patterns: Files with multiple re-reads
-            - performance: Parsing and injection timing
+            - performance: Parsing, injection and per-stage read timing
             - warnings: Warning counts by type
             - identifier_resolution: Resolution statistics
             - configuration: Configuration values captured
@@ -235,9 +287,31 @@ class QueryAPI:
             injection_logger=self._injection_logger,
             warning_logger=self._warning_logger,
             graph=self._graph,
+            context_cache=self._context_cache,
         )
         return metrics.to_dict()
 
+    def get_read_latency(self) -> Dict[str, Any]:
+        """Get latency percentiles of file reads, overall and per stage.
+
+        Use case: Finding where read latency goes (validation, file read,
+        staleness resolution, dependency lookup, prioritization, snippet
+        extraction, token counting, logging).
+
+        Returns:
+            Dictionary containing:
+            - total_ms: Latency of whole reads in milliseconds
+            - stages_us: Latency of each stage in microseconds, keyed by stage
+              name in pipeline order. Stages that did not run for a read (e.g.
+              context assembly on a memoized read) are not counted.
+            Each entry has count, min, max, median, p95 and p99.
+        """
+        stages = self._metrics_collector.get_read_stage_statistics()
+        return {
+            "total_ms": _latency_to_dict(self._metrics_collector.get_read_latency_statistics()),
+            "stages_us": {stage: _latency_to_dict(stats) for stage, stats in stages.items()},
+        }
+
     def get_cache_statistics(self) -> Dict[str, Any]:
         """Get current cache statistics.
 
@@ -264,6 +338,30 @@ class QueryAPI:
 
         return result
 
+    def get_indexing_progress(self) -> Dict[str, Any]:
+        """Get background indexing progress.
+
+        Use case: Show warm-up progress, decide whether first reads will pay
+        for analysis.
+
+        Returns:
+            Dictionary containing:
+            - state: "stopped", "discovering", "indexing" or "complete"
+            - files_discovered: Project files found by the walk
+            - files_current: Discovered files analyzed and up to date
+            - files_indexed: Analysis runs (including files requested by reads)
+            - files_skipped: Files already analyzed by reads or updates
+            - files_failed: Files whose analysis failed
+            - files_queued: Files waiting in the queue
+            - promotions: Files moved to the front by reads
+            - percent_complete: files_current / files_discovered (0.0-100.0)
+            - elapsed_ms: Time since indexing started
+            Only state is present ("disabled") without an indexer.
+        """
+        if self._indexer is None:
+            return {"state": "disabled"}
+        return self._indexer.get_progress()
+
     def get_injection_statistics(self) -> Dict[str, Any]:
         """Get aggregated injection statistics.
 
@@ -316,3 +414,15 @@ class QueryAPI:
             "total_relationships": metadata.get("total_relationships", 0),
             "most_connected_files": graph_metadata.get("most_connected_files", []),
         }
+
+
+def _latency_to_dict(stats: "TokenCountStatistics") -> Dict[str, int]:
+    """Convert latency statistics to a dictionary without the sketch."""
+    return {
+        "count": stats.total_count,
+        "min": stats.min,
+        "max": stats.max,
+        "median": stats.median,
+        "p95": stats.p95,
+        "p99": stats.p99,
+    }
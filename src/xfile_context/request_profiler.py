@@ -0,0 +1,277 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Opt-in sampling profiler for service requests.
+
+Outlier reads that take seconds are rare and hard to reproduce. When enabled,
+RequestProfiler runs requests under cProfile and writes the profile of every
+Nth request, and of any request slower than a threshold, to a session-scoped
+directory for later analysis (scripts/profile_report.py).
+
+Key features:
+- Off by default: a disabled profiler only counts requests
+- Sampling: every Nth request is profiled and dumped
+- Outliers: with a latency threshold, requests are profiled and only dumped
+  when they turn out to be slow (profiling every request has overhead; use the
+  threshold while chasing outliers, not permanently)
+- Optional tracemalloc snapshots of the memory a dumped request allocated and
+  still held when it finished, with its peak traced memory
+- Bounded output: at most max_dumps profiles per session
+- One profiled request at a time: concurrent requests run unprofiled
+  (Python 3.12+ allows one active profiler per process). On Python 3.12+
+  cProfile is built on sys.monitoring and records every thread, so requests
+  running alongside a profiled one appear in its dump; the manifest records
+  how many did. Before 3.12 only the profiled request's thread is recorded.
+
+Dump layout under {data_root}/profiles/<session-id>/:
+- NNNN-<request>.prof: cProfile stats (pstats format)
+- NNNN-<request>.tracemalloc: tracemalloc snapshot (if enabled)
+- profiles.jsonl: one record per dump with request, target, elapsed time,
+  the reason it was dumped ("sampled" or "slow"), whether the profile covers
+  all threads and the number of requests that ran concurrently with it
+
+Usage:
+    profiler = RequestProfiler(ProfilingPolicy(every_n_requests=100), output_dir)
+    with profiler.profile("read_file_with_context", file_path):
+        ...
+"""
+
+import cProfile
+import json
+import logging
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+# Manifest of the dumps in a profile directory
+PROFILE_MANIFEST = "profiles.jsonl"
+
+# Frames kept per traced allocation in tracemalloc snapshots
+_TRACEMALLOC_FRAMES = 10
+
+# cProfile records all threads since it moved to sys.monitoring (Python 3.12)
+PROFILES_ALL_THREADS = sys.version_info >= (3, 12)
+
+
+@dataclass
+class ProfilingPolicy:
+    """When requests are profiled and dumped.
+
+    Attributes:
+        every_n_requests: Dump the profile of every Nth request (0 = no sampling).
+        slow_request_ms: Dump the profile of requests taking at least this long
+            (0 = no threshold). Requires profiling every request.
+        trace_memory: Also dump a tracemalloc snapshot of profiled requests.
+        max_dumps: Maximum number of dumps per session.
+    """
+
+    every_n_requests: int = 0
+    slow_request_ms: int = 0
+    trace_memory: bool = False
+    max_dumps: int = 100
+
+    def is_enabled(self) -> bool:
+        """Whether any request can be profiled."""
+        return self.max_dumps > 0 and (self.every_n_requests > 0 or self.slow_request_ms > 0)
+
+
+class RequestProfiler:
+    """Profiles service requests according to a ProfilingPolicy.
+
+    Thread Safety:
+        Thread-safe. Requests may call profile() from any thread; one request
+        is profiled at a time and dumps are written by the profiled request.
+        On Python 3.12+ the dump also contains the other threads' work.
+    """
+
+    def __init__(self, policy: ProfilingPolicy, output_dir: Path):
+        """Initialize the profiler.
+
+        Args:
+            policy: When to profile and dump requests.
+            output_dir: Session-scoped directory for dumps, created on the
+                first dump.
+        """
+        self._policy = policy
+        self._output_dir = output_dir
+        self._lock = threading.Lock()
+        # Held while a request is profiled
+        self._active = threading.Lock()
+        self._requests = 0
+        self._in_flight = 0
+        # Requests that ran while the active request was profiled
+        self._concurrent = 0
+        self._profiled = 0
+        self._dumps = 0
+        self._skipped = 0
+
+    def is_enabled(self) -> bool:
+        """Whether the policy profiles any request."""
+        return self._policy.is_enabled()
+
+    def get_output_dir(self) -> Path:
+        """Get the directory dumps are written to."""
+        return self._output_dir
+
+    @contextmanager
+    def profile(self, request: str, target: str = "") -> Iterator[None]:
+        """Run the enclosed request, profiling it if the policy selects it.
+
+        Args:
+            request: Request name (e.g. the service method), used in dump names.
+            target: What the request was for (e.g. the file path), recorded in
+                the manifest.
+        """
+        sampled = self._should_profile()
+        if sampled is None or not self._active.acquire(blocking=False):
+            if sampled is not None:
+                with self._lock:
+                    self._skipped += 1
+            try:
+                yield
+            finally:
+                self._finish_request()
+            return
+
+        with self._lock:
+            self._profiled += 1
+            self._concurrent = self._in_flight - 1
+        try:
+            started_tracing = False
+            if self._policy.trace_memory and not tracemalloc.is_tracing():
+                tracemalloc.start(_TRACEMALLOC_FRAMES)
+                started_tracing = True
+            profiler = cProfile.Profile()
+            start = time.perf_counter()
+            profiler.enable()
+            try:
+                yield
+            finally:
+                profiler.disable()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    concurrent = self._concurrent
+                snapshot = None
+                peak_bytes = None
+                if started_tracing:
+                    snapshot = tracemalloc.take_snapshot()
+                    peak_bytes = tracemalloc.get_traced_memory()[1]
+                    tracemalloc.stop()
+
+                reason = None
+                if sampled:
+                    reason = "sampled"
+                elif self._policy.slow_request_ms and elapsed_ms >= self._policy.slow_request_ms:
+                    reason = "slow"
+                if reason is not None:
+                    self._dump(
+                        profiler,
+                        snapshot,
+                        request,
+                        target,
+                        elapsed_ms,
+                        reason,
+                        peak_bytes,
+                        concurrent,
+                    )
+        finally:
+            self._active.release()
+            self._finish_request()
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Get request, profiled, dump and skipped (busy profiler) counts."""
+        with self._lock:
+            return {
+                "requests": self._requests,
+                "profiled": self._profiled,
+                "dumps": self._dumps,
+                "skipped": self._skipped,
+            }
+
+    def _should_profile(self) -> Optional[bool]:
+        """Count a request and decide whether to profile it.
+
+        The request counts as in flight until _finish_request().
+
+        Returns:
+            None if the request is not profiled, True if it is sampled (always
+            dumped), False if it is profiled to be dumped only if slow.
+        """
+        policy = self._policy
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            if self._active.locked():
+                self._concurrent += 1
+            if not policy.is_enabled() or self._dumps >= policy.max_dumps:
+                return None
+            sampled = policy.every_n_requests > 0 and self._requests % policy.every_n_requests == 0
+            if not sampled and policy.slow_request_ms <= 0:
+                return None
+            return sampled
+
+    def _finish_request(self) -> None:
+        """Mark a request counted by _should_profile() as finished."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def _dump(
+        self,
+        profiler: cProfile.Profile,
+        snapshot: Optional[tracemalloc.Snapshot],
+        request: str,
+        target: str,
+        elapsed_ms: float,
+        reason: str,
+        peak_bytes: Optional[int],
+        concurrent: int,
+    ) -> None:
+        """Write a profiled request to the output directory.
+
+        Failures are logged and never fail the request.
+        """
+        with self._lock:
+            if self._dumps >= self._policy.max_dumps:
+                return
+            self._dumps += 1
+            sequence = self._dumps
+
+        stem = f"{sequence:04d}-{request}"
+        record: Dict[str, Any] = {
+            "sequence": sequence,
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "request": request,
+            "target": target,
+            "elapsed_ms": round(elapsed_ms, 3),
+            "reason": reason,
+            "profile": f"{stem}.prof",
+            "memory_snapshot": None,
+            "peak_memory_bytes": peak_bytes,
+            # Work of concurrent requests is in the profile when it covers all threads
+            "all_threads": PROFILES_ALL_THREADS,
+            "concurrent_requests": concurrent,
+        }
+        try:
+            self._output_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(str(self._output_dir / record["profile"]))
+            if snapshot is not None:
+                record["memory_snapshot"] = f"{stem}.tracemalloc"
+                snapshot.dump(str(self._output_dir / record["memory_snapshot"]))
+            with open(self._output_dir / PROFILE_MANIFEST, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to write profile of {request} to {self._output_dir}: {e}")
+            return
+
+        logger.info(
+            f"Profiled {request} ({reason}, {elapsed_ms:.1f}ms): "
+            f"{self._output_dir / record['profile']}"
+        )
@@ -0,0 +1,133 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Reader-writer lock for the service's shared state.
+
+The relationship graph, relationship builder and analyzer are not thread-safe.
+Context assembly only reads them, while analysis and watcher updates modify them.
+This lock lets any number of readers proceed together and gives writers exclusive
+access.
+
+Key features:
+- Shared read access: readers never wait on other readers
+- Exclusive write access
+- Writer preference: waiting writers block new readers so that a steady
+  stream of reads cannot starve watcher updates
+- Re-entrant writes, and reads nested inside a write by the same thread
+- Context manager API
+
+Limitations:
+- A read lock cannot be upgraded to a write lock (release it first)
+
+Usage:
+    lock = ReadWriteLock()
+
+    with lock.read_lock():
+        deps = graph.get_dependencies(path)
+
+    with lock.write_lock():
+        analyzer.analyze_file(path)
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+
+class ReadWriteLock:
+    """Writer-preferring reader-writer lock.
+
+    Thread Safety:
+        All methods are thread-safe.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the lock."""
+        self._condition = threading.Condition(threading.Lock())
+
+        # Active readers per thread (thread ident -> depth)
+        self._readers: Dict[int, int] = {}
+
+        # Writer state
+        self._writer: Optional[int] = None
+        self._writer_depth = 0
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read_lock(self) -> Iterator[None]:
+        """Hold the lock for shared (read) access."""
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write_lock(self) -> Iterator[None]:
+        """Hold the lock for exclusive (write) access."""
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+    def acquire_read(self) -> None:
+        """Acquire shared access, waiting while a writer holds or awaits the lock."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                # Reads nested in a write are covered by the write
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                # Nested read: do not wait behind queued writers (would deadlock)
+                self._readers[me] += 1
+                return
+            while self._writer is not None or self._writers_waiting:
+                self._condition.wait()
+            self._readers[me] = 1
+
+    def release_read(self) -> None:
+        """Release shared access."""
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth -= 1
+                return
+            depth = self._readers[me] - 1
+            if depth:
+                self._readers[me] = depth
+                return
+            del self._readers[me]
+            if not self._readers:
+                self._condition.notify_all()
+
+    def acquire_write(self) -> None:
+        """Acquire exclusive access, waiting for active readers and writers.
+
+        Raises:
+            RuntimeError: If the calling thread holds a read lock.
+        """
+        me = threading.get_ident()
+        with self._condition:
+            if self._writer == me:
+                self._writer_depth += 1
+                return
+            if me in self._readers:
+                raise RuntimeError("Cannot upgrade a read lock to a write lock")
+            self._writers_waiting += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._condition.wait()
+            finally:
+                self._writers_waiting -= 1
+            self._writer = me
+            self._writer_depth = 1
+
+    def release_write(self) -> None:
+        """Release exclusive access."""
+        with self._condition:
+            self._writer_depth -= 1
+            if self._writer_depth == 0:
+                self._writer = None
+                self._condition.notify_all()
@@ -11,18 +11,27 @@ Key Responsibilities:
 - Handle file read requests with context injection (Section 3.8)
 - Provide relationship graph queries and export
 - Manage component lifecycle and configuration
+- Apply file watcher events to the graph on a background worker
 """
 
 import logging
+import os
+import stat
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 import tiktoken
 
 from xfile_context.analyzers.python_analyzer import PythonAnalyzer
+from xfile_context.async_log_writer import LogWritePolicy
+from xfile_context.background_indexer import BackgroundIndexer
 from xfile_context.cache import WorkingMemoryCache
 from xfile_context.config import Config
+from xfile_context.context_cache import AssembledContext, ContextResultCache, InjectionRecord
 from xfile_context.detectors import (
     ClassInheritanceDetector,
     ConditionalImportDetector,
@@ -37,20 +46,27 @@ from xfile_context.detectors import (
     MonkeyPatchingDetector,
     WildcardImportDetector,
 )
+from xfile_context.file_scanner import ScanResult, scan_files
 from xfile_context.file_watcher import FileWatcher
-from xfile_context.graph_updater import GraphUpdater
-from xfile_context.injection_logger import (
-    InjectionEvent,
-    InjectionLogger,
-    InjectionStatistics,
-    get_recent_injections,
+from xfile_context.graph_export import (
+    DEFAULT_PAGE_SIZE,
+    export_graph_ndjson,
+    export_relationship_page,
 )
-from xfile_context.metrics_collector import MetricsCollector, SessionMetrics
+from xfile_context.graph_updater import GraphUpdater
+from xfile_context.injection_logger import InjectionEvent, InjectionLogger, InjectionStatistics
+from xfile_context.io_counters import IO_READ, IO_STAT, count_io, track_io
+from xfile_context.log_config import get_exports_dir, get_profiles_dir
+from xfile_context.log_segments import LogRotationPolicy
+from xfile_context.metrics_collector import MetricsCollector, ReadStageTimer, SessionMetrics
 from xfile_context.models import Relationship, RelationshipGraph, RelationshipType
 from xfile_context.relationship_builder import RelationshipBuilder
+from xfile_context.request_profiler import ProfilingPolicy, RequestProfiler
+from xfile_context.rwlock import ReadWriteLock
 from xfile_context.staleness_resolver import StalenessResolver
 from xfile_context.storage import GraphExport, InMemoryStore, RelationshipStore
 from xfile_context.symbol_cache import SymbolDataCache
+from xfile_context.token_counter import TokenBudget, TokenCounter
 from xfile_context.warning_formatter import StructuredWarning, WarningEmitter
 
 logger = logging.getLogger(__name__)
@@ -59,6 +75,35 @@ logger = logging.getLogger(__name__)
 _MAX_FILEPATH_LENGTH = 4096  # Maximum filepath length to prevent DoS
 _MAX_FILE_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB max file size
 
+# Context assembly constants (TDD Section 3.8.3)
+_MAX_SNIPPETS_PER_FILE = 10  # Snippet cap when the token limit is not enforced
+_LARGE_FUNCTION_THRESHOLD = 200  # Lines (EC-12)
+_SUMMARY_HEADER = "This file imports from (line numbers are in dependency files):"
+
+# Background graph updates
+_UPDATE_WORKER_POLL_INTERVAL = 0.25  # Seconds between stop checks in the update worker
+
+# Background indexing
+_INDEXER_WAIT_TIMEOUT = 10.0  # Seconds a read waits for the indexer before analyzing itself
+
+
+def _counted_exists(path: Path) -> bool:
+    """Check whether a path exists, counting the stat for the current request."""
+    count_io(IO_STAT)
+    return path.exists()
+
+
+@dataclass
+class _ContextSnippet:
+    """One "Recent definitions" entry in its full and location-only forms."""
+
+    parts: List[str]  # Context lines for the full entry (ends with a blank line)
+    snippet: str  # Injected content for logging (FR-27)
+    location: str  # File path and line range for logging
+    location_parts: List[str]  # Cheaper location-only form for budget packing
+    warning: Optional[str] = None  # Warning to surface if the entry is included
+    is_special: bool = False  # Deleted file or wildcard entry (no symbol warnings)
+
 
 class ReadResult:
     """Result of reading a file with context injection."""
@@ -93,6 +138,22 @@ class ReadResult:
         }
 
 
+class BatchReadResult:
+    """Result of reading several files with context injection."""
+
+    def __init__(self) -> None:
+        """Initialize an empty batch result."""
+        self.results: List[ReadResult] = []  # Readable files, in request order
+        self.errors: Dict[str, str] = {}  # Unreadable file -> error message
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for MCP response."""
+        return {
+            "results": [result.to_dict() for result in self.results],
+            "errors": dict(self.errors),
+        }
+
+
 class CrossFileContextService:
     """Business logic coordinator for cross-file context analysis.
 
@@ -160,6 +221,12 @@ class CrossFileContextService:
         self._session_id = session_id
         self._data_root = data_root
         self.config = config
+
+        # Guards the graph, relationship builder and analyzer so the service can
+        # be called from MCP worker threads. Context assembly only reads them and
+        # holds the lock shared, so readers never wait on each other; analysis
+        # and watcher updates hold it exclusively. File reads happen outside it.
+        self._state_lock = ReadWriteLock()
         self._project_root = Path(project_root) if project_root else Path.cwd()
 
         # Initialize store (storage-agnostic per DD-4)
@@ -177,6 +244,7 @@ class CrossFileContextService:
                 user_ignore_patterns=(
                     set(config.ignore_patterns) if config.ignore_patterns else None
                 ),
+                debounce_window=config.file_event_debounce_ms / 1000,
             )
         )
 
@@ -221,14 +289,39 @@ class CrossFileContextService:
         # Track if watcher is running
         self._watcher_running = False
 
-        # Initialize tiktoken encoder for token counting (TDD Section 3.8.4)
-        # Use cl100k_base encoding (compatible with Claude/GPT-4)
-        # Lazy initialization to avoid network calls in __init__
-        self._token_encoder: Optional[tiktoken.Encoding] = None
+        # Background worker that applies watcher events to the graph
+        self._update_worker: Optional[threading.Thread] = None
+        self._update_worker_stop = threading.Event()
+
+        # Initialize token counter for token counting (TDD Section 3.8.4)
+        # Uses cl100k_base encoding (compatible with Claude/GPT-4), warmed up on a
+        # background thread so no request blocks on loading it. The fallback
+        # estimate is used until warm-up completes. Counts are memoized by content.
+        bpe_path = config.tokenizer_bpe_path
+        self._token_counter = TokenCounter(bpe_path=str(bpe_path) if bpe_path else None)
+        self._token_counter.start_warmup()
 
         # Initialize warning emitter for dynamic pattern warnings (TDD Section 3.9.3)
         self._warning_emitter = WarningEmitter()
 
+        # Injection and warning logs are written by background writers unless
+        # async_log_writes is disabled, so logging an event only queues it
+        log_write_policy = (
+            LogWritePolicy(
+                flush_every_events=config.log_flush_every_events,
+                flush_interval_ms=config.log_flush_interval_ms,
+                max_queue_events=config.log_queue_max_events,
+                max_block_ms=config.log_queue_max_block_ms,
+            )
+            if config.async_log_writes
+            else None
+        )
+        # Logs are moved into compressed segments once they reach the size limit
+        log_rotation_policy = LogRotationPolicy(
+            max_segment_bytes=config.log_segment_max_kb * 1024,
+            compression=config.log_segment_compression,
+        )
+
         # Initialize injection logger for context injection event logging (TDD Section 3.8.5)
         # Per FR-26: Log all context injections for analysis
         # Issue #150: Use session_id and data_root for new log architecture
@@ -238,6 +331,10 @@ class CrossFileContextService:
             else InjectionLogger(
                 session_id=self._session_id,
                 data_root=self._data_root,
+                write_policy=log_write_policy,
+                recent_buffer_size=config.recent_injections_buffer_size,
+                index_entries_per_target=config.injection_index_entries_per_target,
+                rotation_policy=log_rotation_policy,
             )
         )
 
@@ -250,6 +347,7 @@ class CrossFileContextService:
             else MetricsCollector(
                 session_id=self._session_id,
                 data_root=self._data_root,
+                rotation_policy=log_rotation_policy,
             )
         )
 
@@ -259,12 +357,25 @@ class CrossFileContextService:
                 "cache_expiry_minutes": config.cache_expiry_minutes,
                 "cache_size_limit_kb": config.cache_size_limit_kb,
                 "context_token_limit": config.context_token_limit,
+                "enforce_context_token_limit": config.enforce_context_token_limit,
                 "function_usage_warning_threshold": config.function_usage_warning_threshold,
                 "warn_on_wildcards": config.warn_on_wildcards,
                 "enable_context_injection": config.enable_context_injection,
+                "context_cache_max_entries": config.context_cache_max_entries,
             }
         )
 
+        # Opt-in profiling of outlier and sampled reads, dumped per session
+        self._profiler = RequestProfiler(
+            ProfilingPolicy(
+                every_n_requests=config.profile_every_n_requests,
+                slow_request_ms=config.profile_slow_request_ms,
+                trace_memory=config.profile_trace_memory,
+                max_dumps=config.profile_max_dumps,
+            ),
+            get_profiles_dir(self._data_root) / self._metrics_collector.get_session_id(),
+        )
+
         # Initialize warning logger for warning event logging (TDD Section 3.9.5)
         # Issue #150: Use session_id and data_root for new log architecture
         from xfile_context.warning_logger import WarningLogger
@@ -272,6 +383,8 @@ class CrossFileContextService:
         self._warning_logger = WarningLogger(
             session_id=self._session_id,
             data_root=self._data_root,
+            write_policy=log_write_policy,
+            rotation_policy=log_rotation_policy,
         )
 
         # Initialize RelationshipBuilder for two-phase analysis (Issue #125)
@@ -286,6 +399,12 @@ class CrossFileContextService:
         )
         logger.info(f"Symbol cache enabled (max {self.config.symbol_cache_max_entries} entries)")
 
+        # Memoized context injection results, validated against graph generation
+        # and dependency file versions so unchanged re-reads skip assembly
+        self._context_cache = ContextResultCache(
+            max_entries=self.config.context_cache_max_entries,
+        )
+
         # Initialize graph updater (after RelationshipBuilder for two-phase support)
         self._graph_updater = (
             graph_updater
@@ -298,6 +417,18 @@ class CrossFileContextService:
             )
         )
 
+        # Threads assembling contexts for batch reads (created on first use)
+        self._batch_pool: Optional[ThreadPoolExecutor] = None
+        self._batch_pool_lock = threading.Lock()
+
+        # Optional eager warm-up: analyzes the project in the background, with
+        # files needed by reads promoted to the front (started on demand)
+        self._indexer = BackgroundIndexer(
+            discover=lambda: self._discover_files(self._project_root).files,
+            index_file=self._index_file_in_background,
+            needs_indexing=self._needs_indexing,
+        )
+
         logger.info(f"CrossFileContextService initialized with project_root={self._project_root}")
 
     def _needs_analysis(self, file_path: str) -> bool:
@@ -321,10 +452,12 @@ class CrossFileContextService:
         Returns:
             True if file needs analysis, False otherwise.
         """
-        # Check if file exists first
-        path = Path(file_path)
-        if not path.exists():
-            return False  # Non-existent file doesn't need analysis
+        # One stat answers both whether the file exists and when it changed
+        count_io(IO_STAT)
+        try:
+            file_mtime = os.stat(file_path).st_mtime
+        except OSError:
+            return False  # Non-existent or inaccessible file doesn't need analysis
 
         metadata = self._graph.get_file_metadata(file_path)
 
@@ -332,17 +465,10 @@ class CrossFileContextService:
             return True  # File exists but never analyzed
 
         # Check if file was modified since last analysis
-        try:
-            file_mtime = path.stat().st_mtime
-            if file_mtime > metadata.last_analyzed:
-                return True  # Modified since last analysis
-        except OSError:
-            return False  # Can't stat file, skip
+        return file_mtime > metadata.last_analyzed
 
-        return False  # Already analyzed and not modified
-
-    def _resolve_staleness(self, file_path: str) -> None:
-        """Resolve staleness for target file and its transitive dependencies.
+    def _resolve_staleness(self, file_paths: List[str]) -> None:
+        """Resolve staleness for target files and their transitive dependencies.
 
         Implements Issue #117 Option B: Full transitive dependency check using
         topological sort-based staleness resolution.
@@ -359,21 +485,31 @@ class CrossFileContextService:
         cleaner than the previous store/restore approach and handles all
         edge cases correctly.
 
+        Several targets read together are resolved in one pass over the union
+        of their dependency closures.
+
         Args:
-            file_path: Target file being read via read_file_with_context().
+            file_paths: Target files being read via read_file_with_context()
+                or read_files_with_context().
         """
-        # Create staleness resolver with callbacks to service methods
-        # Pass the RelationshipBuilder for Issue #133 fix
-        resolver = StalenessResolver(
+        # Resolve staleness for targets and all transitive dependencies
+        self._create_staleness_resolver().resolve_staleness_batch(file_paths)
+
+    def _create_staleness_resolver(self) -> StalenessResolver:
+        """Create a staleness resolver with callbacks to service methods.
+
+        Passes the RelationshipBuilder for Issue #133 fix.
+
+        Returns:
+            StalenessResolver bound to the current graph and builder.
+        """
+        return StalenessResolver(
             graph=self._graph,
             needs_analysis=self._needs_analysis,
             analyze_file=self._analyze_file_for_staleness,
             relationship_builder=self._relationship_builder,
         )
 
-        # Resolve staleness for target and all transitive dependencies
-        resolver.resolve_staleness(file_path)
-
     def _analyze_file_for_staleness(self, file_path: str) -> bool:
         """Analyze a file during staleness resolution (Issue #117 Option B).
 
@@ -388,9 +524,12 @@ class CrossFileContextService:
         """
         logger.debug(f"Staleness resolution: analyzing {file_path}")
 
-        return self._analyzer.analyze_file_two_phase(
+        start = time.perf_counter()
+        result = self._analyzer.analyze_file_two_phase(
             file_path, relationship_builder=self._relationship_builder
         )
+        self._metrics_collector.record_parsing_time_ms(round((time.perf_counter() - start) * 1000))
+        return result
 
     def _validate_filepath(self, filepath: str) -> None:
         """Validate filepath for security concerns.
@@ -440,7 +579,137 @@ class CrossFileContextService:
         Returns:
             Statistics about processed changes.
         """
-        return self._graph_updater.process_pending_changes()
+        with self._state_lock.write_lock():
+            return self._graph_updater.process_pending_changes()
+
+    def start_background_updates(self) -> None:
+        """Start a worker thread that applies file watcher events to the graph.
+
+        The worker wakes on each watcher event and runs process_pending_changes(),
+        so reads find an already-updated graph instead of resolving staleness
+        themselves. Requires the file watcher to be running to receive events.
+        """
+        if self._update_worker is not None and self._update_worker.is_alive():
+            return
+
+        self._update_worker_stop.clear()
+        self._update_worker = threading.Thread(
+            target=self._run_update_worker, name="GraphUpdateWorker", daemon=True
+        )
+        self._update_worker.start()
+        logger.info("Background graph updates started")
+
+    def stop_background_updates(self, timeout: float = 5.0) -> None:
+        """Stop the background update worker.
+
+        Args:
+            timeout: Maximum seconds to wait for an in-progress update to finish.
+        """
+        if self._update_worker is None:
+            return
+
+        self._update_worker_stop.set()
+        self._update_worker.join(timeout=timeout)
+        self._update_worker = None
+        logger.info("Background graph updates stopped")
+
+    def _run_update_worker(self) -> None:
+        """Drain watcher events into incremental graph updates until stopped."""
+        while not self._update_worker_stop.is_set():
+            if not self._file_watcher.wait_for_changes(timeout=_UPDATE_WORKER_POLL_INTERVAL):
+                continue
+            if self._update_worker_stop.is_set():
+                break
+            try:
+                stats = self.process_pending_changes()
+                if stats["total"]:
+                    logger.debug(
+                        f"Applied {stats['total']} file changes in {stats['elapsed_ms']:.1f}ms"
+                    )
+            except Exception as e:
+                # Keep the worker alive; reads fall back to staleness resolution
+                logger.error(f"Background graph update failed: {e}")
+
+    def start_background_indexing(self) -> None:
+        """Start analyzing the whole project on a background thread.
+
+        Files are analyzed one at a time, most recently modified first. While
+        indexing runs, reads hand the files they need to the indexer, which
+        analyzes them next, so no file is analyzed twice.
+        """
+        self._indexer.start()
+
+    def stop_background_indexing(self, timeout: float = 5.0) -> None:
+        """Stop background indexing.
+
+        Args:
+            timeout: Maximum seconds to wait for the file in progress.
+        """
+        self._indexer.stop(timeout=timeout)
+
+    def get_indexing_progress(self) -> Dict[str, Any]:
+        """Get background indexing progress.
+
+        Returns:
+            Progress dictionary (see BackgroundIndexer.get_progress()).
+        """
+        return self._indexer.get_progress()
+
+    def _index_file_in_background(self, file_path: str) -> bool:
+        """Analyze a file and its stale dependencies for the background indexer.
+
+        Staleness resolution only covers the file's dependency closure. Its
+        dependents lose their relationships to re-analyzed files and are left
+        pending; they are queued for another pass of the indexer.
+
+        Args:
+            file_path: File to analyze.
+
+        Returns:
+            True if analysis succeeded, False otherwise.
+        """
+        with self._state_lock.write_lock():
+            result = self._create_staleness_resolver().resolve_staleness(file_path)
+            self._collect_detector_warnings()
+            pending = self._graph.get_files_with_pending_relationships()
+        if pending:
+            self._indexer.enqueue(pending)
+        return result
+
+    def _needs_indexing(self, file_path: str) -> bool:
+        """Check if the background indexer has work to do for a file.
+
+        Args:
+            file_path: Path to file to check.
+
+        Returns:
+            True if the file needs analysis or its relationships are pending.
+        """
+        with self._state_lock.read_lock():
+            metadata = self._graph.get_file_metadata(file_path)
+            if metadata is not None and metadata.pending_relationships:
+                return True
+        return self._needs_analysis(file_path)
+
+    def _discover_files(self, dir_path: Path) -> ScanResult:
+        """Find the files to analyze below a directory.
+
+        Ignored directories (.venv, node_modules, .gitignore'd paths) are pruned
+        during the walk without listing their contents.
+
+        Args:
+            dir_path: Directory to walk.
+
+        Returns:
+            ScanResult with the files to analyze.
+        """
+        return scan_files(
+            str(dir_path),
+            should_ignore_dir=self._file_watcher.should_ignore_dir,
+            should_ignore_file=self._file_watcher.should_ignore,
+            extensions=tuple(self._file_watcher.SUPPORTED_EXTENSIONS),
+            max_workers=self.config.directory_scan_workers,
+        )
 
     def analyze_file(self, file_path: str) -> bool:
         """Analyze a single file and add its relationships to the graph.
@@ -457,13 +726,18 @@ class CrossFileContextService:
         """
         self._validate_filepath(file_path)
 
-        # Two-phase analysis: AST -> FileSymbolData -> Relationships
-        result = self._analyzer.analyze_file_two_phase(
-            file_path, relationship_builder=self._relationship_builder
-        )
+        with self._state_lock.write_lock():
+            # Two-phase analysis: AST -> FileSymbolData -> Relationships
+            start = time.perf_counter()
+            result = self._analyzer.analyze_file_two_phase(
+                file_path, relationship_builder=self._relationship_builder
+            )
+            self._metrics_collector.record_parsing_time_ms(
+                round((time.perf_counter() - start) * 1000)
+            )
 
-        # Collect warnings from dynamic pattern detectors
-        self._collect_detector_warnings()
+            # Collect warnings from dynamic pattern detectors
+            self._collect_detector_warnings()
 
         return result
 
@@ -475,12 +749,15 @@ class CrossFileContextService:
         2. Building relationships with full project context
 
         This provides better cross-file resolution than analyzing files independently.
+        Ignored directories (.venv, node_modules, .gitignore'd paths) are pruned
+        during discovery without listing their contents.
 
         Args:
             directory_path: Path to directory (default: project_root).
 
         Returns:
-            Statistics about analyzed files.
+            Statistics about analyzed files, including skipped (ignored files),
+            pruned_dirs and discovery_ms.
         """
         dir_path = Path(directory_path) if directory_path else self._project_root
 
@@ -494,27 +771,27 @@ class CrossFileContextService:
 
         start_time = time.time()
 
-        # Collect files to analyze
-        files_to_analyze: List[str] = []
-        for py_file in dir_path.rglob("*.py"):
-            file_path = str(py_file)
-
-            # Check if file should be ignored
-            if self._file_watcher.should_ignore(file_path):
-                stats["skipped"] += 1
-                continue
-
-            files_to_analyze.append(file_path)
-            stats["total"] += 1
+        # Collect files to analyze, pruning ignored directories before descending
+        scan = self._discover_files(dir_path)
+        files_to_analyze = scan.files
+        stats["total"] = len(files_to_analyze)
+        stats["skipped"] = scan.files_skipped
+        stats["pruned_dirs"] = scan.directories_pruned
+        stats["discovery_ms"] = (time.time() - start_time) * 1000
 
         # Two-phase analysis: Extract all symbols first, then build relationships
         # This provides better cross-file resolution
         # Pass symbol cache for incremental analysis (Issue #125 Phase 3)
-        success, failed, self._relationship_builder = self._analyzer.analyze_project_two_phase(
-            files_to_analyze,
-            relationship_builder=self._relationship_builder,
-            symbol_cache=self._symbol_cache,
-        )
+        with self._state_lock.write_lock():
+            success, failed, self._relationship_builder = self._analyzer.analyze_project_two_phase(
+                files_to_analyze,
+                relationship_builder=self._relationship_builder,
+                symbol_cache=self._symbol_cache,
+            )
+
+            # Collect warnings from dynamic pattern detectors
+            self._collect_detector_warnings()
+
         stats["success"] = success
         stats["failed"] = failed
         # Add cache statistics
@@ -524,9 +801,6 @@ class CrossFileContextService:
 
         stats["elapsed_ms"] = (time.time() - start_time) * 1000
 
-        # Collect warnings from dynamic pattern detectors
-        self._collect_detector_warnings()
-
         logger.info(
             f"Analyzed {stats['total']} files (two-phase) in {stats['elapsed_ms']:.1f}ms: "
             f"{stats['success']} success, {stats['failed']} failed, {stats['skipped']} skipped"
@@ -543,6 +817,13 @@ class CrossFileContextService:
         3. Assemble context snippets in priority order
         4. Format injected context per Section 3.8.3
 
+        The latency of each stage (READ_STAGES in metrics_collector) and the
+        file-system calls made for the read (IO_KINDS in io_counters) are
+        recorded in the session metrics.
+
+        With request profiling enabled (profile_* configuration), sampled and
+        slow reads are profiled and dumped under <data root>/profiles/.
+
         Args:
             file_path: Path to file to read
 
@@ -554,62 +835,224 @@ class CrossFileContextService:
             PermissionError: If file can't be read
             ValueError: If path validation fails (traversal, control chars, etc.)
         """
-        # Security: Validate filepath before any operations
-        self._validate_filepath(file_path)
+        with self._profiler.profile("read_file_with_context", file_path):
+            return self._read_file_with_context(file_path)
+
+    def _read_file_with_context(self, file_path: str) -> ReadResult:
+        """Run read_file_with_context() (see there)."""
+        timer = ReadStageTimer()
+        with track_io(timer.get_io_counters()):
+            content = self._read_file_content(file_path, timer)
+
+            # Check if context injection is enabled
+            if not self.config.enable_context_injection:
+                logger.debug("Context injection disabled, returning file content only")
+                result = ReadResult(
+                    file_path=file_path,
+                    content=content,
+                    injected_context="",
+                    warnings=[],
+                )
+            else:
+                with timer.stage("staleness"):
+                    self._ensure_analyzed([file_path])
+                result = self._build_read_result(file_path, content, timer)
+        self._metrics_collector.record_read(file_path, timer)
+        return result
 
-        path = Path(file_path)
+    def read_files_with_context(self, file_paths: List[str]) -> "BatchReadResult":
+        """Read several files and inject cross-file context for each.
 
-        if not path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        Related files read in a row share most of their dependency closures.
+        Instead of resolving staleness once per file, this resolves it once over
+        the union of all closures, then assembles the contexts concurrently
+        (read-only, under the shared lock).
 
-        if not path.is_file():
-            raise ValueError(f"Path is not a file: {file_path}")
+        A file that cannot be read does not fail the batch: its error is
+        reported in BatchReadResult.errors. Stage latencies are recorded per
+        file; every file is charged the shared staleness resolution it waited
+        for. The file-system calls of the shared resolution are charged to the
+        first readable file only, so the per-file counts add up to the batch.
 
-        # Security: Check file size before reading to prevent DoS
-        try:
-            file_size = path.stat().st_size
-            if file_size > _MAX_FILE_SIZE_BYTES:
-                raise ValueError(f"File too large: {file_size} bytes > {_MAX_FILE_SIZE_BYTES}")
-        except OSError as e:
-            raise PermissionError(f"Cannot access file: {file_path}") from e
+        Args:
+            file_paths: Paths of the files to read. Duplicates are read once.
+
+        Returns:
+            BatchReadResult with one ReadResult per readable file, in request
+            order, and an error message per unreadable file.
+        """
+        with self._profiler.profile("read_files_with_context", f"{len(file_paths)} files"):
+            return self._read_files_with_context(file_paths)
+
+    def _read_files_with_context(self, file_paths: List[str]) -> "BatchReadResult":
+        """Run read_files_with_context() (see there)."""
+        batch = BatchReadResult()
+        contents: Dict[str, str] = {}
+        timers: Dict[str, ReadStageTimer] = {}
+        for file_path in dict.fromkeys(file_paths):
+            timer = ReadStageTimer()
+            try:
+                with track_io(timer.get_io_counters()):
+                    contents[file_path] = self._read_file_content(file_path, timer)
+                timers[file_path] = timer
+            except (OSError, ValueError) as e:
+                batch.errors[file_path] = str(e)
+
+        if not self.config.enable_context_injection:
+            batch.results = [
+                ReadResult(file_path=path, content=content, injected_context="", warnings=[])
+                for path, content in contents.items()
+            ]
+            for path, timer in timers.items():
+                self._metrics_collector.record_read(path, timer)
+            return batch
+
+        if contents:
+            first_timer = timers[next(iter(contents))]
+            start_ns = time.perf_counter_ns()
+            with track_io(first_timer.get_io_counters()):
+                self._ensure_analyzed(list(contents))
+            staleness_ns = time.perf_counter_ns() - start_ns
+            for timer in timers.values():
+                timer.add("staleness", staleness_ns)
+
+        def build(path: str, content: str) -> ReadResult:
+            with track_io(timers[path].get_io_counters()):
+                result = self._build_read_result(path, content, timers[path])
+            self._metrics_collector.record_read(path, timers[path])
+            return result
+
+        if len(contents) <= 1 or self.config.batch_read_max_workers <= 1:
+            batch.results = [build(path, content) for path, content in contents.items()]
+        else:
+            batch.results = list(
+                self._get_batch_pool().map(lambda item: build(*item), contents.items())
+            )
+
+        logger.debug(f"Read {len(batch.results)} files with context ({len(batch.errors)} errors)")
+        return batch
+
+    def _get_batch_pool(self) -> ThreadPoolExecutor:
+        """Get the thread pool for batch context assembly, creating it on first use."""
+        with self._batch_pool_lock:
+            if self._batch_pool is None:
+                self._batch_pool = ThreadPoolExecutor(
+                    max_workers=self.config.batch_read_max_workers,
+                    thread_name_prefix="xfile-batch",
+                )
+            return self._batch_pool
+
+    def _read_file_content(self, file_path: str, timer: ReadStageTimer) -> str:
+        """Validate a file path and read the file.
+
+        Args:
+            file_path: Path to file to read
+            timer: Timer charged with the validation and file_read stages
+
+        Returns:
+            File content
+
+        Raises:
+            FileNotFoundError: If file doesn't exist
+            PermissionError: If file can't be read
+            ValueError: If path validation fails or the file is too large
+        """
+        with timer.stage("validation"):
+            # Security: Validate filepath before any operations
+            self._validate_filepath(file_path)
+
+            path = Path(file_path)
+
+            # One stat checks existence, type and size
+            count_io(IO_STAT)
+            try:
+                file_stat = path.stat()
+            except (FileNotFoundError, NotADirectoryError) as e:
+                raise FileNotFoundError(f"File not found: {file_path}") from e
+            except OSError as e:
+                raise PermissionError(f"Cannot access file: {file_path}") from e
+
+            if not stat.S_ISREG(file_stat.st_mode):
+                raise ValueError(f"Path is not a file: {file_path}")
+
+            # Security: Check file size before reading to prevent DoS
+            if file_stat.st_size > _MAX_FILE_SIZE_BYTES:
+                raise ValueError(
+                    f"File too large: {file_stat.st_size} bytes > {_MAX_FILE_SIZE_BYTES}"
+                )
 
         # Read file content
-        try:
-            content = path.read_text(encoding="utf-8")
-        except PermissionError as e:
-            raise PermissionError(f"Permission denied reading file: {file_path}") from e
+        with timer.stage("file_read"):
+            count_io(IO_READ)
+            try:
+                return path.read_text(encoding="utf-8")
+            except PermissionError as e:
+                raise PermissionError(f"Permission denied reading file: {file_path}") from e
+
+    def _ensure_analyzed(self, file_paths: List[str]) -> None:
+        """Analyze stale files in the dependency closures of files about to be read.
+
+        Lazy initialization: analyze target files and stale dependencies (Issue
+        #114, #117). This ensures context is available on first read without
+        requiring eager full-project analysis at startup.
+
+        Issue #117 Option B: Use topological sort-based staleness resolution
+        to handle transitive dependencies correctly. This ensures:
+        - Modified dependency files are re-analyzed before their dependents
+        - Files with pending relationships are restored in correct order
+        - Diamond patterns and complex dependency chains are handled properly
+
+        The staleness check only reads the graph, so exclusive access is taken
+        only when something actually needs re-analysis. While background
+        indexing runs, a single read lets the indexer do the work next so reads
+        and indexing never analyze the same files twice. Batches resolve the
+        union of their closures in one pass instead; the indexer then finds
+        those files current and skips them.
 
+        Args:
+            file_paths: Files about to be read.
+        """
+        with self._state_lock.read_lock():
+            needs_resolution = self._create_staleness_resolver().has_stale_files_batch(file_paths)
+        if not needs_resolution:
+            return
+        if len(file_paths) == 1 and self._indexer.ensure_indexed(
+            file_paths[0], timeout=_INDEXER_WAIT_TIMEOUT
+        ):
+            return
+        with self._state_lock.write_lock():
+            self._resolve_staleness(file_paths)
+
+    def _build_read_result(self, file_path: str, content: str, timer: ReadStageTimer) -> ReadResult:
+        """Assemble the injected context for a file that has been analyzed.
+
+        Args:
+            file_path: Path of the file that was read
+            content: File content
+            timer: Timer charged with the stages of context assembly
+
+        Returns:
+            ReadResult with file content and injected context
+        """
         warnings: List[str] = []
         injected_context = ""
 
-        # Check if context injection is enabled
-        if not self.config.enable_context_injection:
-            logger.debug("Context injection disabled, returning file content only")
-            return ReadResult(
-                file_path=file_path,
-                content=content,
-                injected_context="",
-                warnings=warnings,
-            )
+        assembled: Optional[AssembledContext] = None
+        with self._state_lock.read_lock():
+            # Get dependencies for this file from the graph
+            with timer.stage("dependency_lookup"):
+                dependencies = self._get_file_dependencies(file_path)
 
-        # Lazy initialization: analyze target file and stale dependencies (Issue #114, #117)
-        # This ensures context is available on first read without requiring
-        # eager full-project analysis at startup.
-        #
-        # Issue #117 Option B: Use topological sort-based staleness resolution
-        # to handle transitive dependencies correctly. This ensures:
-        # - Modified dependency files are re-analyzed before their dependents
-        # - Files with pending relationships are restored in correct order
-        # - Diamond patterns and complex dependency chains are handled properly
-        self._resolve_staleness(file_path)
-
-        # Get dependencies for this file from the graph
-        dependencies = self._get_file_dependencies(file_path)
-
-        if dependencies:
-            # Assemble and format context
-            injected_context, context_warnings = self._assemble_context(file_path, dependencies)
-            warnings.extend(context_warnings)
+            if dependencies:
+                # Assemble and format context, reusing the memoized result when
+                # nothing the context depends on has changed
+                assembled = self._get_or_build_context(file_path, dependencies, timer)
+
+        if assembled is not None:
+            with timer.stage("logging"):
+                self._emit_context_events(file_path, assembled)
+            injected_context = assembled.context
+            warnings.extend(assembled.warnings)
 
         logger.debug(
             f"Read file {file_path} ({len(content)} bytes) with {len(dependencies)} dependencies"
@@ -635,27 +1078,22 @@ class CrossFileContextService:
         return self._graph.get_dependencies(file_path)
 
     def _get_token_encoder(self) -> Optional[tiktoken.Encoding]:
-        """Get or initialize the tiktoken encoder.
+        """Get the tiktoken encoder.
 
-        Uses lazy initialization to avoid network calls in __init__.
-        Falls back gracefully if tiktoken is unavailable.
+        The encoder is warmed up on a background thread at construction.
+        Returns None while warm-up is in progress or if tiktoken is unavailable.
 
         Returns:
             tiktoken.Encoding or None if unavailable.
         """
-        if self._token_encoder is None:
-            try:
-                self._token_encoder = tiktoken.get_encoding("cl100k_base")
-            except Exception as e:
-                logger.warning(f"Failed to initialize tiktoken encoder: {e}")
-                return None
-        return self._token_encoder
+        return self._token_counter.get_encoder()
 
     def _count_tokens(self, text: str) -> int:
         """Count tokens in text using tiktoken.
 
         Per TDD Section 3.8.4, uses cl100k_base encoding for accurate
-        token counting matching Claude's tokenization.
+        token counting matching Claude's tokenization. Counts are memoized
+        by content, so repeated snippets are not re-encoded.
 
         Falls back to word-based approximation if tiktoken is unavailable.
 
@@ -665,17 +1103,7 @@ class CrossFileContextService:
         Returns:
             Number of tokens in text (approximate if tiktoken unavailable).
         """
-        encoder = self._get_token_encoder()
-        if encoder is not None:
-            return len(encoder.encode(text))
-
-        # Fallback: approximate token count based on whitespace splitting
-        # This is less accurate but allows operation without network
-        if not text:
-            return 0
-        # Rough approximation: ~1.3 tokens per word for code
-        words = len(text.split())
-        return int(words * 1.3)
+        return self._token_counter.count(text)
 
     def _get_symbol_usage_count(self, target_file: str, target_symbol: Optional[str]) -> int:
         """Get the number of files that use a specific symbol.
@@ -1019,7 +1447,7 @@ class CrossFileContextService:
                             f"⚠️ Note: This file imports from {target_path.name} which was deleted"
                         )
             # Also check if file physically exists
-            elif not target_path.exists() and rel.target_file not in deleted_files:
+            elif rel.target_file not in deleted_files and not _counted_exists(target_path):
                 deleted_files.add(rel.target_file)
                 warnings.append(
                     f"⚠️ Note: This file imports from {target_path.name} which no longer exists"
@@ -1098,13 +1526,344 @@ class CrossFileContextService:
         Returns:
             Tuple of (formatted_context, warnings).
         """
-        warnings: List[str] = []
-
         if not dependencies:
-            return "", warnings
+            return "", []
+
+        assembled = self._build_context(target_file, dependencies)
+        self._emit_context_events(target_file, assembled)
+        return assembled.context, assembled.warnings
+
+    def _get_or_build_context(
+        self, target_file: str, dependencies: List[Relationship], timer: ReadStageTimer
+    ) -> AssembledContext:
+        """Get assembled context from the memoized results, building it on a miss.
+
+        Args:
+            target_file: File being read.
+            dependencies: Dependencies of target_file from the graph.
+            timer: Timer charged with the stages of building the context.
+
+        Returns:
+            AssembledContext for target_file.
+        """
+        key = self._context_cache_key(dependencies)
+        assembled = self._context_cache.get(target_file, key)
+        if assembled is not None:
+            logger.debug(f"Context cache hit for {target_file}")
+            return assembled
+
+        assembled = self._build_context(target_file, dependencies, timer)
+        self._context_cache.put(target_file, key, assembled)
+        return assembled
+
+    def _context_cache_key(self, dependencies: List[Relationship]) -> Tuple[Any, ...]:
+        """Build the version key that a memoized context is valid for.
+
+        The key changes whenever the assembled context could change:
+        - Graph generation: any re-analysis, relationship change or deletion mark
+        - Dependency file versions: edits to files whose signatures are shown
+        - Recency inputs: "recently edited" priority and the cache age label
+        - Token counting mode: contexts built with the fallback estimate during
+          tokenizer warm-up are rebuilt once exact counts are available
+
+        Args:
+            dependencies: Dependencies of the target file.
+
+        Returns:
+            Hashable key tuple.
+        """
+        now = time.time()
+        versions = []
+        for dep_file in sorted({rel.target_file for rel in dependencies}):
+            timestamp = self._file_watcher.get_timestamp(dep_file)
+            recently_edited = timestamp is not None and (now - timestamp) / 60 < 10
+            versions.append((dep_file, self._get_dependency_version(dep_file), recently_edited))
+
+        return (
+            self._graph.get_generation(),
+            tuple(versions),
+            self._get_context_age_label(dependencies),
+            self._token_counter.is_exact,
+        )
+
+    def _get_dependency_version(self, file_path: str) -> Optional[int]:
+        """Get a version token for a dependency file.
+
+        Uses the modification time in nanoseconds. Special marker paths
+        (<stdlib:...>, <third-party:...>, etc.) never change.
+
+        Args:
+            file_path: Dependency file path.
+
+        Returns:
+            Version token, or None if the file cannot be stat'ed (e.g. deleted).
+        """
+        if file_path.startswith("<") and file_path.endswith(">"):
+            return 0
+        count_io(IO_STAT)
+        try:
+            return os.stat(file_path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _get_context_age_label(self, dependencies: List[Relationship]) -> Optional[str]:
+        """Format the "last read" age indicator for the context header (TDD 3.8.3).
+
+        Uses the oldest cached dependency.
+
+        Args:
+            dependencies: Dependencies of the target file.
+
+        Returns:
+            Human-readable age (e.g. "3 minutes ago"), or None if no dependency
+            has a known timestamp.
+        """
+        cache_ages = []
+        for rel in dependencies:
+            age = self._get_cache_age_minutes(rel.target_file)
+            if age is not None:
+                cache_ages.append(age)
+
+        if not cache_ages:
+            return None
+
+        max_age = max(cache_ages)
+        if max_age < 1:
+            return "just now"
+        if max_age < 60:
+            return f"{int(max_age)} minute{'s' if int(max_age) != 1 else ''} ago"
+        hours = int(max_age / 60)
+        return f"{hours} hour{'s' if hours != 1 else ''} ago"
+
+    def _emit_context_events(self, target_file: str, assembled: AssembledContext) -> None:
+        """Log injection events and record token metrics for an assembled context.
+
+        Runs on every read, including memoized ones, so that logs and session
+        metrics reflect every injection (FR-26, FR-44).
+
+        Args:
+            target_file: File being read (where context is injected).
+            assembled: Assembled context to report.
+        """
+        for record in assembled.injections:
+            self._log_injection_event(
+                rel=record.rel,
+                target_file=target_file,
+                snippet=record.snippet,
+                snippet_location=record.snippet_location,
+                token_count=record.token_count,
+                context_token_total=record.context_token_total,
+            )
+
+        # Record token count for session metrics per FR-44
+        exceeded_threshold = assembled.token_count > self.config.context_token_limit
+        self._metrics_collector.record_injection_token_count(
+            assembled.token_count, exceeded_threshold
+        )
+
+    def _build_context_snippet(
+        self, rel: Relationship, deleted_files: Set[str]
+    ) -> Optional[_ContextSnippet]:
+        """Build the "Recent definitions" entry for one dependency.
+
+        Handles deleted files (EC-14), wildcard imports (EC-4), large functions
+        (EC-12) and regular signatures with short docstrings (TDD 3.8.3).
+
+        Args:
+            rel: Dependency relationship.
+            deleted_files: Dependency files known to be deleted.
+
+        Returns:
+            _ContextSnippet, or None if no signature could be found.
+        """
+        # Skip deleted files in snippet generation (EC-14)
+        if rel.target_file in deleted_files:
+            # Add a note about the deleted file
+            # Issue #136: Use full file path
+            location = f"{rel.target_file}:{rel.line_number}"
+            return _ContextSnippet(
+                parts=[
+                    f"From {location}",
+                    "    # ⚠️ File was deleted",
+                    f"    # Last known location: {rel.target_file}",
+                    "",
+                ],
+                snippet=f"# ⚠️ File was deleted\n# Last known location: {rel.target_file}",
+                location=location,
+                location_parts=[f"From {location}", ""],
+                is_special=True,
+            )
+
+        # Check for wildcard imports (EC-4)
+        # Issue #136: Use full file path instead of just filename
+        if rel.relationship_type == RelationshipType.WILDCARD_IMPORT:
+            location = f"{rel.target_file}:{rel.line_number}"
+            warning = None
+            if self.config.warn_on_wildcards:
+                warning = f"⚠️ Wildcard import from {rel.target_file} at line {rel.line_number}"
+            return _ContextSnippet(
+                parts=[
+                    f"From {location}",
+                    f"from {Path(rel.target_file).stem} import *",
+                    "    # Note: Wildcard import - specific function tracking unavailable",
+                    f"    # See {rel.target_file} for available functions",
+                    "",
+                ],
+                snippet=(
+                    f"from {Path(rel.target_file).stem} import *\n"
+                    f"# Note: Wildcard import - specific function tracking unavailable\n"
+                    f"# See {rel.target_file} for available functions"
+                ),
+                location=location,
+                location_parts=[f"From {location}", ""],
+                warning=warning,
+                is_special=True,
+            )
+
+        # Get signature with docstring and line range
+        signature, docstring, impl_range = self._get_function_signature_with_docstring(
+            rel.target_file, rel.target_symbol, rel.target_line
+        )
+        if not signature:
+            return None
+
+        # Issue #136: Use full file path instead of just filename
+        header = f"From {rel.target_file}:{rel.target_line or '?'}"
+        parts = [header, signature]
+
+        # Build snippet text for logging
+        snippet_lines = [signature]
+
+        # Add docstring if present and short (TDD 3.8.3: <50 chars)
+        if docstring:
+            parts.append(f'    """{docstring}"""')
+            snippet_lines.append(f'"""{docstring}"""')
+
+        # Calculate snippet location for logging
+        if impl_range:
+            start_line, end_line = impl_range
+            location = f"{rel.target_file}:{start_line}-{end_line}"
+            line_count = end_line - start_line + 1
+
+            # Check for large function (EC-12)
+            if line_count >= _LARGE_FUNCTION_THRESHOLD:
+                # Large function - add truncation note
+                parts.append(f"    # Function is {line_count}+ lines, showing signature only")
+                parts.append(f"    # Full definition: {location}")
+            else:
+                # Normal function - show implementation range
+                parts.append(f"    # Implementation in {location}")
+        else:
+            # Fallback if no range available
+            location = f"{rel.target_file}:{rel.target_line or '?'}"
+            parts.append(f"    # Implementation in {location}")
+
+        parts.append("")
+
+        symbol_label = f" ({rel.target_symbol})" if rel.target_symbol else ""
+        return _ContextSnippet(
+            parts=parts,
+            snippet="\n".join(snippet_lines),
+            location=location,
+            location_parts=[f"{header}{symbol_label}", ""],
+        )
+
+    def _pack_summary_lines(self, summary_lines: List[str], budget: TokenBudget) -> List[str]:
+        """Keep the dependency summary lines that fit in the token budget.
+
+        Lines are kept in order; once one does not fit, the rest are replaced
+        by an omission note (if that fits).
+
+        Args:
+            summary_lines: Summary lines in output order.
+            budget: Token budget to charge.
+
+        Returns:
+            Summary lines to emit.
+        """
+        packed: List[str] = []
+        for index, line in enumerate(summary_lines):
+            if budget.try_add([line]):
+                packed.append(line)
+                continue
+            omitted = len(summary_lines) - index
+            note = f"- ... and {omitted} more file{'s' if omitted != 1 else ''}"
+            if budget.try_add([note]):
+                packed.append(note)
+            break
+        return packed
+
+    def _pack_context_snippets(
+        self,
+        rels: List[Relationship],
+        deleted_files: Set[str],
+        budget: TokenBudget,
+    ) -> List[Tuple[Relationship, _ContextSnippet, bool]]:
+        """Greedily pack "Recent definitions" entries into a token budget.
+
+        Two passes over the entries in priority order:
+        1. Reserve the location-only form for as many entries as fit.
+        2. Upgrade entries to their full form (signature, docstring, range)
+           while the extra cost still fits.
+
+        High-priority entries therefore get signatures first, low-priority
+        entries fall back to their location, and the total never exceeds the
+        budget.
+
+        Args:
+            rels: Deduplicated dependencies in priority order.
+            deleted_files: Dependency files known to be deleted.
+            budget: Token budget to charge.
+
+        Returns:
+            List of (relationship, snippet, is_full) in priority order.
+        """
+        packed: List[Tuple[Relationship, _ContextSnippet, bool]] = []
+        for rel in rels:
+            snippet = self._build_context_snippet(rel, deleted_files)
+            if snippet is None:
+                continue
+            if not budget.try_add(snippet.location_parts):
+                break
+            packed.append((rel, snippet, False))
+
+        for index, (rel, snippet, _) in enumerate(packed):
+            if budget.try_replace(snippet.location_parts, snippet.parts):
+                packed[index] = (rel, snippet, True)
+
+        return packed
+
+    def _build_context(
+        self,
+        target_file: str,
+        dependencies: List[Relationship],
+        timer: Optional[ReadStageTimer] = None,
+    ) -> AssembledContext:
+        """Build the injected context for a file without logging it.
+
+        See _assemble_context() for the format. Injection events are returned
+        as records so they can be logged (and replayed for memoized results)
+        by _emit_context_events().
+
+        Args:
+            target_file: File being read.
+            dependencies: List of dependencies to include.
+            timer: Timer charged with the prioritization, snippet_extraction
+                and token_counting stages. Token budget checks while packing
+                snippets count as snippet extraction.
+
+        Returns:
+            AssembledContext with formatted context, warnings, and injection records.
+        """
+        if timer is None:
+            timer = ReadStageTimer()
+        warnings: List[str] = []
+        injections: List[InjectionRecord] = []
 
         # Prioritize dependencies
-        prioritized = self._prioritize_dependencies(dependencies)
+        with timer.stage("prioritization"):
+            prioritized = self._prioritize_dependencies(dependencies)
+        extraction_start_ns = time.perf_counter_ns()
 
         # Identify high-usage symbols for warnings (FR-19, FR-20)
         high_usage_symbols = self._get_high_usage_symbols(dependencies)
@@ -1120,17 +1879,12 @@ class CrossFileContextService:
                 files_imported[rel.target_file] = []
             files_imported[rel.target_file].append(rel)
 
-        # Build context sections
-        context_parts: List[str] = []
-        context_parts.append("[Cross-File Context]")
-        context_parts.append("")
-
         # Dependency summary
         # Per TDD Section 3.8.3 and FR-13: Line numbers should indicate where
         # symbols are DEFINED in the dependency file, not where they're USED
         # in the target file. This enables efficient snippet-based caching.
         # Issue #136: Clarify that line numbers refer to dependency files
-        context_parts.append("This file imports from (line numbers are in dependency files):")
+        summary_lines: List[str] = []
         # Sort references by file path for deterministic output (Issue #131)
         for target_file_path in sorted(files_imported.keys()):
             rels = files_imported[target_file_path]
@@ -1150,31 +1904,14 @@ class CrossFileContextService:
             # Print all symbols without truncation (Issue #131)
             symbols_str = ", ".join(unique_symbols)
             # Issue #136: Use full file path instead of just filename
-            context_parts.append(f"- {target_file_path}: {symbols_str}")
-
-        context_parts.append("")
-
-        # Calculate overall cache age (use oldest cached dependency)
-        cache_ages = []
-        for rel in prioritized:
-            age = self._get_cache_age_minutes(rel.target_file)
-            if age is not None:
-                cache_ages.append(age)
+            summary_lines.append(f"- {target_file_path}: {symbols_str}")
 
         # Recent definitions section with cache age indicator (TDD 3.8.3)
-        if cache_ages:
-            max_age = max(cache_ages)
-            if max_age < 1:
-                age_str = "just now"
-            elif max_age < 60:
-                age_str = f"{int(max_age)} minute{'s' if int(max_age) != 1 else ''} ago"
-            else:
-                hours = int(max_age / 60)
-                age_str = f"{hours} hour{'s' if hours != 1 else ''} ago"
-            context_parts.append(f"Recent definitions (last read: {age_str}):")
+        age_str = self._get_context_age_label(prioritized)
+        if age_str is not None:
+            definitions_header = f"Recent definitions (last read: {age_str}):"
         else:
-            context_parts.append("Recent definitions:")
-        context_parts.append("")
+            definitions_header = "Recent definitions:"
 
         # Deduplicate relationships for recent definitions section (Issue #144)
         # This is assembly-level deduplication (complements graph-level deduplication in PR #145).
@@ -1194,178 +1931,123 @@ class CrossFileContextService:
                 seen_dedup_keys.add(dedup_key)
                 deduplicated_rels.append(rel)
 
-        snippets_added = 0
-        max_snippets = 10  # Reasonable limit per file
-        warned_symbols: Set[Tuple[str, str]] = set()  # Track symbols we've warned about
-
-        # Large function threshold (EC-12)
-        large_function_threshold = 200
-
-        # Track cumulative token count for injection logging (TDD Section 3.8.5)
-        context_token_total = 0
-
-        for rel in deduplicated_rels:
-            if snippets_added >= max_snippets:
-                break
-
-            # Skip deleted files in snippet generation (EC-14)
-            if rel.target_file in deleted_files:
-                # Add a note about the deleted file
-                # Issue #136: Use full file path
-                snippet_text = f"# ⚠️ File was deleted\n# Last known location: {rel.target_file}"
-                context_parts.append(f"From {rel.target_file}:{rel.line_number}")
-                context_parts.append("    # ⚠️ File was deleted")
-                context_parts.append(f"    # Last known location: {rel.target_file}")
-                context_parts.append("")
-
-                # Log the injection event (FR-26)
-                snippet_token_count = self._count_tokens(snippet_text)
-                context_token_total += snippet_token_count
-                self._log_injection_event(
-                    rel=rel,
-                    target_file=target_file,
-                    snippet=snippet_text,
-                    snippet_location=f"{rel.target_file}:{rel.line_number}",
-                    token_count=snippet_token_count,
-                    context_token_total=context_token_total,
+        # Budget-aware mode: every part is costed against context_token_limit so
+        # the joined context never exceeds it. The frame (headers and closing
+        # separator) is reserved first; if even that does not fit, no context
+        # is injected.
+        budget: Optional[TokenBudget] = None
+        frame_parts = [
+            "[Cross-File Context]",
+            "",
+            _SUMMARY_HEADER,
+            "",
+            definitions_header,
+            "",
+            "---",
+        ]
+        if self.config.enforce_context_token_limit:
+            budget = TokenBudget(self._token_counter, self.config.context_token_limit)
+            if not budget.try_add(frame_parts):
+                logger.debug(
+                    f"Context frame for {target_file} exceeds token limit "
+                    f"{self.config.context_token_limit}, skipping injection"
                 )
+                timer.add("snippet_extraction", time.perf_counter_ns() - extraction_start_ns)
+                return AssembledContext(context="", warnings=warnings)
+            summary_lines = self._pack_summary_lines(summary_lines, budget)
+
+        # Select entries and their representation (full or location only)
+        selected: List[Tuple[Relationship, _ContextSnippet, bool]] = []
+        if budget is None:
+            for rel in deduplicated_rels:
+                if len(selected) >= _MAX_SNIPPETS_PER_FILE:
+                    break
+                snippet = self._build_context_snippet(rel, deleted_files)
+                if snippet is not None:
+                    selected.append((rel, snippet, True))
+        else:
+            selected = self._pack_context_snippets(deduplicated_rels, deleted_files, budget)
 
-                snippets_added += 1
-                continue
+        snippet_parts: List[str] = []
+        warned_symbols: Set[Tuple[str, str]] = set()  # Track symbols we've warned about
 
-            # Check for wildcard imports (EC-4)
-            # Issue #136: Use full file path instead of just filename
-            if rel.relationship_type == RelationshipType.WILDCARD_IMPORT:
-                snippet_text = (
-                    f"from {Path(rel.target_file).stem} import *\n"
-                    f"# Note: Wildcard import - specific function tracking unavailable\n"
-                    f"# See {rel.target_file} for available functions"
-                )
-                context_parts.append(f"From {rel.target_file}:{rel.line_number}")
-                context_parts.append(f"from {Path(rel.target_file).stem} import *")
-                context_parts.append(
-                    "    # Note: Wildcard import - specific function tracking unavailable"
-                )
-                context_parts.append(f"    # See {rel.target_file} for available functions")
-                context_parts.append("")
+        for rel, snippet, full in selected:
+            parts = snippet.parts if full else snippet.location_parts
+            snippet_parts.extend(parts)
 
-                # Log the injection event (FR-26)
-                snippet_token_count = self._count_tokens(snippet_text)
-                context_token_total += snippet_token_count
-                self._log_injection_event(
+            # Record the injection event for logging (FR-26)
+            injections.append(
+                InjectionRecord(
                     rel=rel,
-                    target_file=target_file,
-                    snippet=snippet_text,
-                    snippet_location=f"{rel.target_file}:{rel.line_number}",
-                    token_count=snippet_token_count,
-                    context_token_total=context_token_total,
+                    snippet=snippet.snippet if full else parts[0],
+                    snippet_location=snippet.location,
+                    token_count=0,  # Filled in by the batched count below
+                    context_token_total=0,
                 )
-
-                snippets_added += 1
-
-                if self.config.warn_on_wildcards:
-                    warnings.append(
-                        f"⚠️ Wildcard import from {rel.target_file} at line {rel.line_number}"
-                    )
-                continue
-
-            # Get signature with docstring and line range
-            signature, docstring, impl_range = self._get_function_signature_with_docstring(
-                rel.target_file, rel.target_symbol, rel.target_line
             )
 
-            if signature:
-                # Issue #136: Use full file path instead of just filename
-                context_parts.append(f"From {rel.target_file}:{rel.target_line or '?'}")
-                context_parts.append(signature)
-
-                # Build snippet text for logging
-                snippet_parts = [signature]
-                if docstring:
-                    snippet_parts.append(f'"""{docstring}"""')
-
-                # Add docstring if present and short (TDD 3.8.3: <50 chars)
-                if docstring:
-                    context_parts.append(f'    """{docstring}"""')
+            if snippet.warning:
+                warnings.append(snippet.warning)
 
-                # Calculate snippet location for logging
-                if impl_range:
-                    start_line, end_line = impl_range
-                    snippet_location = f"{rel.target_file}:{start_line}-{end_line}"
-                else:
-                    start_line = rel.target_line or 0
-                    end_line = start_line
-                    snippet_location = f"{rel.target_file}:{rel.target_line or '?'}"
-
-                # Check for large function (EC-12)
-                if impl_range:
-                    line_count = end_line - start_line + 1
-
-                    if line_count >= large_function_threshold:
-                        # Large function - add truncation note
-                        context_parts.append(
-                            f"    # Function is {line_count}+ lines, showing signature only"
-                        )
-                        context_parts.append(
-                            f"    # Full definition: {rel.target_file}:{start_line}-{end_line}"
-                        )
-                    else:
-                        # Normal function - show implementation range
-                        context_parts.append(
-                            f"    # Implementation in {rel.target_file}:{start_line}-{end_line}"
-                        )
-                else:
-                    # Fallback if no range available
-                    context_parts.append(
-                        f"    # Implementation in {rel.target_file}:{rel.target_line or '?'}"
+            # Check for high-usage function warning (FR-19, FR-20)
+            if rel.target_symbol and not snippet.is_special:
+                symbol_key = (rel.target_file, rel.target_symbol)
+                if symbol_key in high_usage_symbols and symbol_key not in warned_symbols:
+                    usage_count = high_usage_symbols[symbol_key]
+                    warnings.append(
+                        f"⚠️ Note: `{rel.target_symbol}()` is used in {usage_count} files"
                     )
+                    warned_symbols.add(symbol_key)
+        snippets_added = len(selected)
 
-                context_parts.append("")
-
-                # Log the injection event (FR-26)
-                snippet_text = "\n".join(snippet_parts)
-                snippet_token_count = self._count_tokens(snippet_text)
-                context_token_total += snippet_token_count
-                self._log_injection_event(
-                    rel=rel,
-                    target_file=target_file,
-                    snippet=snippet_text,
-                    snippet_location=snippet_location,
-                    token_count=snippet_token_count,
-                    context_token_total=context_token_total,
-                )
-
-                snippets_added += 1
-
-                # Check for high-usage function warning (FR-19, FR-20)
-                if rel.target_symbol:
-                    symbol_key = (rel.target_file, rel.target_symbol)
-                    if symbol_key in high_usage_symbols and symbol_key not in warned_symbols:
-                        usage_count = high_usage_symbols[symbol_key]
-                        warnings.append(
-                            f"⚠️ Note: `{rel.target_symbol}()` is used in {usage_count} files"
-                        )
-                        warned_symbols.add(symbol_key)
+        # Build context sections
+        context_parts: List[str] = [
+            "[Cross-File Context]",
+            "",
+            _SUMMARY_HEADER,
+            *summary_lines,
+            "",
+            definitions_header,
+            "",
+            *snippet_parts,
+        ]
 
         context_parts.append("---")
 
         # Assemble final context
         context_text = "\n".join(context_parts)
-
-        # Log token count for metrics (TDD Section 3.8.4)
-        # v0.1.0: No limit, gather data on actual token counts
-        token_count = self._count_tokens(context_text)
+        timer.add("snippet_extraction", time.perf_counter_ns() - extraction_start_ns)
+
+        with timer.stage("token_counting"):
+            # Count snippet tokens in one batch: first-time snippets are encoded
+            # together, repeated ones come from the memoized counts.
+            # Track cumulative token count for injection logging (TDD Section 3.8.5)
+            snippet_counts = self._token_counter.count_many(
+                [record.snippet for record in injections]
+            )
+            context_token_total = 0
+            for record, snippet_token_count in zip(injections, snippet_counts):
+                context_token_total += snippet_token_count
+                record.token_count = snippet_token_count
+                record.context_token_total = context_token_total
+
+            # Log token count for metrics (TDD Section 3.8.4)
+            # v0.1.0: No limit, gather data on actual token counts
+            # Total is computed from per-line counts plus newline overhead rather
+            # than re-encoding the assembled context
+            token_count = self._token_counter.count_joined(context_parts)
         logger.debug(
             f"Context injection for {target_file}: "
             f"{len(prioritized)} dependencies ({len(deduplicated_rels)} unique), "
             f"{snippets_added} snippets, {token_count} tokens"
         )
 
-        # Record token count for session metrics per FR-44
-        exceeded_threshold = token_count > self.config.context_token_limit
-        self._metrics_collector.record_injection_token_count(token_count, exceeded_threshold)
-
-        return context_text, warnings
+        return AssembledContext(
+            context=context_text,
+            warnings=warnings,
+            token_count=token_count,
+            injections=injections,
+        )
 
     def get_relationship_graph(self) -> GraphExport:
         """Get the full relationship graph for export.
@@ -1379,7 +2061,85 @@ class CrossFileContextService:
         Returns:
             GraphExport object with current graph state (FR-23, FR-25).
         """
-        return self._graph.export_to_dict(project_root=str(self._project_root))
+        with self._state_lock.read_lock():
+            return self._graph.export_to_dict(project_root=str(self._project_root))
+
+    def get_relationship_graph_page(
+        self,
+        limit: int = DEFAULT_PAGE_SIZE,
+        cursor: Optional[str] = None,
+        path_prefix: Optional[str] = None,
+        relationship_types: Optional[List[str]] = None,
+        around_file: Optional[str] = None,
+        hops: int = 1,
+    ) -> Dict[str, Any]:
+        """Get one page of the relationship graph, optionally filtered.
+
+        See graph_export.export_relationship_page() for the page format. A
+        page costs O(page size) regardless of the size of the graph.
+
+        Args:
+            limit: Maximum number of relationships in the page.
+            cursor: next_cursor of the previous page, or None for the first page.
+            path_prefix: Only relationships whose source file is in this
+                directory (absolute or relative to the project root).
+            relationship_types: Only relationships of these types.
+            around_file: Only relationships between files within hops of this
+                file (absolute or relative to the project root).
+            hops: Neighborhood radius for around_file.
+
+        Returns:
+            Dictionary with relationships, files, next_cursor and metadata.
+
+        Raises:
+            ValueError: If a path fails validation, or a parameter or the
+                cursor is invalid.
+        """
+        if path_prefix:
+            self._validate_filepath(path_prefix)
+            path_prefix = str(self._project_root / path_prefix)
+        if around_file:
+            self._validate_filepath(around_file)
+            around_file = str(self._project_root / around_file)
+
+        with self._state_lock.read_lock():
+            return export_relationship_page(
+                self._graph,
+                limit=limit,
+                cursor=cursor,
+                path_prefix=path_prefix,
+                relationship_types=relationship_types,
+                around_file=around_file,
+                hops=hops,
+                project_root=str(self._project_root),
+            )
+
+    def export_relationship_graph_to_file(self, compress: bool = False) -> Dict[str, Any]:
+        """Stream the full relationship graph to an NDJSON file under the data root.
+
+        Unlike get_relationship_graph(), the export is never held in memory:
+        records are generated and written one at a time (see
+        graph_export.iter_graph_records() for the format). Reads proceed
+        during the export; graph updates wait for it to finish.
+
+        Args:
+            compress: Write a gzip-compressed .ndjson.gz file.
+
+        Returns:
+            Dictionary with path, files, relationships, records, bytes and
+            compressed.
+
+        Raises:
+            OSError: If the export file cannot be written.
+        """
+        output_dir = get_exports_dir(self._data_root)
+        with self._state_lock.read_lock():
+            return export_graph_ndjson(
+                self._graph,
+                output_dir,
+                project_root=str(self._project_root),
+                compress=compress,
+            )
 
     def get_dependents(self, file_path: str) -> List[Dict[str, Any]]:
         """Get files that depend on the given file.
@@ -1391,7 +2151,8 @@ class CrossFileContextService:
             List of relationship dictionaries for files that import from file_path.
         """
         self._validate_filepath(file_path)
-        relationships = self._graph.get_dependents(file_path)
+        with self._state_lock.read_lock():
+            relationships = self._graph.get_dependents(file_path)
         return [rel.to_dict() for rel in relationships]
 
     def get_dependencies(self, file_path: str) -> List[Dict[str, Any]]:
@@ -1404,7 +2165,8 @@ class CrossFileContextService:
             List of relationship dictionaries for files that file_path imports from.
         """
         self._validate_filepath(file_path)
-        relationships = self._graph.get_dependencies(file_path)
+        with self._state_lock.read_lock():
+            relationships = self._graph.get_dependencies(file_path)
         return [rel.to_dict() for rel in relationships]
 
     def get_graph_statistics(self) -> Dict[str, Any]:
@@ -1413,7 +2175,8 @@ class CrossFileContextService:
         Returns:
             Dictionary with graph statistics.
         """
-        graph_export = self._graph.export_to_dict()
+        with self._state_lock.read_lock():
+            graph_export = self._graph.export_to_dict()
         statistics: Dict[str, Any] = graph_export.get("statistics", {})
         return statistics
 
@@ -1428,6 +2191,7 @@ class CrossFileContextService:
             self.cache.invalidate(file_path)
         else:
             self.cache.clear()
+            self._context_cache.invalidate_all()
 
     def _collect_detector_warnings(self) -> None:
         """Collect warnings from all dynamic pattern detectors.
@@ -1550,8 +2314,7 @@ class CrossFileContextService:
         """
         if target_file:
             self._validate_filepath(target_file)
-        log_path = self._injection_logger.get_log_path()
-        return get_recent_injections(log_path, target_file, limit)
+        return self._injection_logger.get_recent_injections(target_file, limit)
 
     def get_injection_log_path(self) -> Path:
         """Get the path to the injection log file.
@@ -1577,6 +2340,23 @@ class CrossFileContextService:
         """
         return self._symbol_cache.get_statistics()
 
+    def get_context_cache_statistics(self) -> Dict[str, Any]:
+        """Get memoized context result statistics for monitoring.
+
+        Returns statistics about the context result cache including:
+        - entries: Current number of memoized target files
+        - max_entries: Maximum cache size
+        - hits: Reads served from a memoized context
+        - misses: Reads that assembled context (including stale entries)
+        - hit_rate: Cache hit rate (0.0 to 1.0)
+        - stale: Misses caused by a changed graph or dependency
+        - evictions: Number of LRU evictions
+
+        Returns:
+            Dictionary with cache statistics.
+        """
+        return self._context_cache.get_statistics()
+
     def get_session_metrics(self) -> SessionMetrics:
         """Get current session metrics without writing to file.
 
@@ -1591,6 +2371,7 @@ class CrossFileContextService:
             injection_logger=self._injection_logger,
             warning_logger=self._warning_logger,
             graph=self._graph,
+            context_cache=self._context_cache,
         )
 
     def get_metrics_log_path(self) -> Path:
@@ -1617,9 +2398,22 @@ class CrossFileContextService:
         """
         logger.info("CrossFileContextService shutting down...")
 
+        # Stop background work before the watcher that feeds it
+        self.stop_background_indexing()
+        self.stop_background_updates()
+
         # Stop file watcher
         self.stop_file_watcher()
 
+        with self._batch_pool_lock:
+            if self._batch_pool is not None:
+                self._batch_pool.shutdown()
+                self._batch_pool = None
+
+        # Write queued log events so the final metrics account for them
+        self._injection_logger.flush()
+        self._warning_logger.flush()
+
         # Emit session metrics at session end per FR-43
         try:
             self._metrics_collector.finalize_and_write(
@@ -1627,6 +2421,7 @@ class CrossFileContextService:
                 injection_logger=self._injection_logger,
                 warning_logger=self._warning_logger,
                 graph=self._graph,
+                context_cache=self._context_cache,
             )
         except Exception as e:
             logger.error(f"Failed to write session metrics: {e}")
@@ -1644,6 +2439,9 @@ class CrossFileContextService:
         # Clear SymbolDataCache (Issue #125 Phase 3)
         self._symbol_cache.invalidate_all()
 
+        # Clear memoized context results
+        self._context_cache.invalidate_all()
+
         # Close injection logger (ensures final flush)
         self._injection_logger.close()
 
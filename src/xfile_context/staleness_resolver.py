@@ -121,15 +121,31 @@ class StalenessResolver:
             value indicates if ALL files were processed successfully.
         """
         logger.debug(f"Starting staleness resolution for {target_file}")
+        return self.resolve_staleness_batch([target_file])
 
+    def resolve_staleness_batch(self, target_files: List[str]) -> bool:
+        """Resolve staleness for several target files in one pass.
+
+        Runs the algorithm of resolve_staleness() once over the union of the
+        targets' dependency closures. Files shared by several closures are
+        checked and analyzed once, and the dependency graph is copied once,
+        instead of once per target.
+
+        Args:
+            target_files: Files being read together (e.g. read_many_with_context()).
+
+        Returns:
+            True if resolution succeeded, False if any file analysis failed.
+        """
         # Step 1: Copy dependency graph before any modifications
         dependency_graph_copy = self.graph.copy_dependency_graph()
 
-        # Step 2: Find all stale files in the transitive dependency chain
-        stale_files = self._find_stale_files(target_file, dependency_graph_copy)
+        # Step 2: Find all stale files in the transitive dependency chains
+        closure = self._get_closure(target_files, dependency_graph_copy)
+        stale_files = self._find_stale_files(target_files, dependency_graph_copy, closure)
 
-        if not stale_files:
-            logger.debug(f"No stale files found in dependency chain of {target_file}")
+        if not stale_files and not self._has_pending_files(closure):
+            logger.debug(f"No stale files found in dependency chains of {target_files}")
             return True
 
         logger.debug(f"Found {len(stale_files)} stale files: {stale_files}")
@@ -143,48 +159,105 @@ class StalenessResolver:
         self._remove_relationships_and_mark_pending(sorted_stale_files)
 
         # Step 5: Generate updated topological order including pending files
-        files_to_process = self._get_files_to_process(
-            target_file, stale_files, dependency_graph_copy
-        )
+        files_to_process = self._get_files_to_process(stale_files, closure, dependency_graph_copy)
 
         logger.debug(f"Files to process in order: {files_to_process}")
 
         # Step 6: Analyze/restore files in topological order
         return self._process_files(files_to_process, stale_files)
 
+    def has_stale_files(self, target_file: str) -> bool:
+        """Check whether resolve_staleness() would have any work to do.
+
+        Read-only: does not modify the graph, so callers can run it under a
+        shared lock and only take exclusive access when resolution is needed.
+
+        Args:
+            target_file: File being read via read_with_context().
+
+        Returns:
+            True if the target or any transitive dependency is stale.
+        """
+        return self.has_stale_files_batch([target_file])
+
+    def has_stale_files_batch(self, target_files: List[str]) -> bool:
+        """Check whether resolve_staleness_batch() would have any work to do.
+
+        Read-only, like has_stale_files().
+
+        Args:
+            target_files: Files being read together.
+
+        Returns:
+            True if any target or any of their transitive dependencies is stale
+            or has pending relationships.
+        """
+        dependency_graph_copy = self.graph.copy_dependency_graph()
+        closure = self._get_closure(target_files, dependency_graph_copy)
+        return self._has_pending_files(closure) or bool(
+            self._find_stale_files(target_files, dependency_graph_copy, closure)
+        )
+
+    def _get_closure(
+        self, target_files: List[str], dependency_graph: Dict[str, Set[str]]
+    ) -> Set[str]:
+        """Get the targets and all their transitive dependencies.
+
+        Args:
+            target_files: Starting files.
+            dependency_graph: Copied dependency graph for traversal.
+
+        Returns:
+            Set of filepaths in the targets' dependency closure.
+        """
+        closure: Set[str] = set(target_files)
+        for target_file in target_files:
+            closure |= self.graph.get_transitive_dependencies(target_file, dependency_graph)
+        return closure
+
+    def _has_pending_files(self, files: Set[str]) -> bool:
+        """Check whether any of the files has pending relationships."""
+        for filepath in files:
+            metadata = self.graph.get_file_metadata(filepath)
+            if metadata is not None and metadata.pending_relationships:
+                return True
+        return False
+
     def _find_stale_files(
-        self, target_file: str, dependency_graph: Dict[str, Set[str]]
+        self,
+        target_files: List[str],
+        dependency_graph: Dict[str, Set[str]],
+        closure: Optional[Set[str]] = None,
     ) -> Set[str]:
-        """Find all stale files in the transitive dependency chain.
+        """Find all stale files in the transitive dependency chains of the targets.
 
-        Checks the target file and all its transitive dependencies for staleness.
-        A file is stale if needs_analysis() returns True.
+        Checks the target files and all their transitive dependencies for
+        staleness. A file is stale if needs_analysis() returns True. Each file
+        is checked once, even if it is in the closure of several targets.
 
         Args:
-            target_file: Starting file to check.
+            target_files: Starting files to check.
             dependency_graph: Copied dependency graph for traversal.
+            closure: The targets' dependency closure, if already computed.
 
         Returns:
             Set of filepaths that are stale (need re-analysis).
         """
-        stale_files: Set[str] = set()
-
-        # Check target file
-        if self.needs_analysis(target_file):
-            stale_files.add(target_file)
-
-        # Get all transitive dependencies
-        transitive_deps = self.graph.get_transitive_dependencies(target_file, dependency_graph)
+        # Targets and all their transitive dependencies
+        candidates = closure
+        if candidates is None:
+            candidates = self._get_closure(target_files, dependency_graph)
 
-        # Check each dependency for staleness
+        # Check each file for staleness
         # Skip special marker paths like <stdlib:os>, <third-party:requests>
         # These represent external dependencies that cannot be analyzed
-        for dep in transitive_deps:
-            if dep.startswith("<") and dep.endswith(">"):
+        stale_files: Set[str] = set()
+        for filepath in candidates:
+            if filepath.startswith("<") and filepath.endswith(">"):
                 continue
 
-            if self.needs_analysis(dep):
-                stale_files.add(dep)
+            if self.needs_analysis(filepath):
+                stale_files.add(filepath)
 
         return stale_files
 
@@ -298,10 +371,7 @@ class StalenessResolver:
             )
 
     def _get_files_to_process(
-        self,
-        target_file: str,
-        stale_files: Set[str],
-        dependency_graph: Dict[str, Set[str]],
+        self, stale_files: Set[str], closure: Set[str], dependency_graph: Dict[str, Set[str]]
     ) -> List[str]:
         """Get files to process in order (stale + pending files).
 
@@ -309,11 +379,16 @@ class StalenessResolver:
         - Stale files (need re-analysis)
         - Files marked as pending_relationships (need relationship restoration)
 
+        Only files in the targets' dependency closure are processed, so a read
+        never pays for unrelated parts of the project. Pending dependents
+        outside the closure keep their flag; they are rebuilt when they are
+        read themselves, or by the background indexer.
+
         Files are ordered such that dependencies come before dependents.
 
         Args:
-            target_file: The original target file.
             stale_files: Set of stale file paths.
+            closure: The targets and their transitive dependencies.
             dependency_graph: Original (copied) dependency graph.
 
         Returns:
@@ -325,11 +400,8 @@ class StalenessResolver:
         # Also mark stale files as pending (they need processing too)
         all_files_to_process = stale_files | pending_files
 
-        # Filter to files reachable from target_file in original graph
-        reachable = self.graph.get_transitive_dependencies(target_file, dependency_graph)
-        reachable.add(target_file)
-
-        files_to_process = all_files_to_process & reachable
+        # Filter to files reachable from the targets in the original graph
+        files_to_process = all_files_to_process & closure
 
         # Topologically sort all files to process
         return self._topological_sort_files(files_to_process, dependency_graph)
@@ -34,6 +34,7 @@ from collections import OrderedDict
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from xfile_context.io_counters import IO_READ, IO_STAT, count_io
 from xfile_context.models import FileSymbolData, SymbolDefinition, SymbolReference
 
 logger = logging.getLogger(__name__)
@@ -263,10 +264,12 @@ class SymbolDataCache:
         """
         try:
             # Check file exists
+            count_io(IO_STAT)
             if not os.path.exists(filepath):
                 return False
 
             # Check modification time
+            count_io(IO_STAT)
             current_mtime = os.path.getmtime(filepath)
             if current_mtime != entry.file_mtime:
                 return False
@@ -309,6 +312,7 @@ class SymbolDataCache:
             SHA256 hash of file contents.
         """
         hasher = hashlib.sha256()
+        count_io(IO_READ)
         with open(filepath, "rb") as f:
             for chunk in iter(lambda: f.read(8192), b""):
                 hasher.update(chunk)
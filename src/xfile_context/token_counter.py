@@ -0,0 +1,426 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Memoized token counting for context injection (TDD Section 3.8.4).
+
+Context assembly counts tokens for every snippet and for the full context on
+every read. Most snippets (signatures, headers, separators) repeat across reads,
+so re-encoding them is wasted work. This module memoizes counts by content and
+batches first-time encodes.
+
+Key features:
+- Content-keyed LRU of token counts (signatures rarely change between reads)
+- Batch encoding of uncached texts via tiktoken's encode_batch()
+- Joined-text totals computed from per-part counts plus separator overhead,
+  instead of re-encoding the assembled context
+- Word-based fallback estimate when tiktoken is unavailable
+- Background warm-up: the encoder loads on a daemon thread and counts use the
+  fallback estimate until it is ready, so no request blocks on tokenizer
+  initialization (or on a slow failing network fetch when offline)
+- Offline loading from a vendored BPE file (no network access required)
+- Thread-safe operations
+
+Note on joined totals:
+BPE merges across a separator (e.g. "\n\n" or "\n" followed by indentation)
+only ever reduce the count, so the sum of per-part counts is an upper bound on
+the joined text's count. That makes it safe for enforcing token budgets.
+"""
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import tiktoken
+from tiktoken.load import load_tiktoken_bpe
+
+logger = logging.getLogger(__name__)
+
+# Use cl100k_base encoding (compatible with Claude/GPT-4)
+DEFAULT_ENCODING_NAME = "cl100k_base"
+
+# cl100k_base split pattern and special tokens, used when building the encoding
+# from a local BPE file (mirrors tiktoken_ext.openai_public.cl100k_base)
+_CL100K_PAT_STR = (
+    r"""'(?i:[sdmt]|ll|ve|re)|[^\r\n\p{L}\p{N}]?+\p{L}++|\p{N}{1,3}+"""
+    r"""| ?[^\s\p{L}\p{N}]++[\r\n]*+|\s++$|\s*[\r\n]|\s+(?!\S)|\s"""
+)
+_CL100K_SPECIAL_TOKENS = {
+    "<|endoftext|>": 100257,
+    "<|fim_prefix|>": 100258,
+    "<|fim_middle|>": 100259,
+    "<|fim_suffix|>": 100260,
+    "<|endofprompt|>": 100276,
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count based on whitespace splitting.
+
+    Less accurate than tiktoken but allows operation without network.
+    Rounds up so that the sum of estimates for parts is never below the
+    estimate for the joined text.
+
+    Args:
+        text: Text to estimate tokens for.
+
+    Returns:
+        Approximate number of tokens (~1.3 tokens per word for code).
+    """
+    if not text:
+        return 0
+    words = len(text.split())
+    return math.ceil(words * 1.3)
+
+
+def load_encoding_from_file(
+    bpe_path: str, encoding_name: str = DEFAULT_ENCODING_NAME
+) -> tiktoken.Encoding:
+    """Build a tiktoken encoding from a local BPE ranks file.
+
+    Allows exact token counting without network access, e.g. with a
+    cl100k_base.tiktoken file vendored alongside the project.
+
+    Args:
+        bpe_path: Path to a .tiktoken BPE ranks file.
+        encoding_name: Encoding the file contains (only cl100k_base is supported).
+
+    Returns:
+        tiktoken.Encoding built from the file.
+
+    Raises:
+        ValueError: If encoding_name is not supported.
+        OSError: If the file cannot be read.
+    """
+    if encoding_name != DEFAULT_ENCODING_NAME:
+        raise ValueError(f"Loading '{encoding_name}' from a BPE file is not supported")
+    return tiktoken.Encoding(
+        name=encoding_name,
+        pat_str=_CL100K_PAT_STR,
+        mergeable_ranks=load_tiktoken_bpe(bpe_path),
+        special_tokens=_CL100K_SPECIAL_TOKENS,
+    )
+
+
+class TokenCounter:
+    """Token counter with a content-keyed LRU of counts.
+
+    Thread Safety:
+        All public methods are thread-safe using a reentrant lock. Encoding
+        happens outside the lock.
+
+    Warm-up:
+        After start_warmup(), the encoder loads on a background thread and
+        counts use the fallback estimate until it is ready. Estimates made
+        while warming are not memoized, so exact counts replace them once
+        the encoder is available.
+
+    Eviction Policy:
+        When max_entries is reached, least recently used counts are evicted.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 4096,
+        encoding_name: str = DEFAULT_ENCODING_NAME,
+        encoder: Optional[tiktoken.Encoding] = None,
+        bpe_path: Optional[str] = None,
+    ):
+        """Initialize the token counter.
+
+        Args:
+            max_entries: Maximum number of memoized counts (default: 4096).
+            encoding_name: tiktoken encoding to load lazily.
+            encoder: Pre-built encoder (default: loaded lazily on first use).
+            bpe_path: Local BPE ranks file to load the encoding from instead
+                of tiktoken's download cache (default: None).
+        """
+        self._max_entries = max_entries
+        self._encoding_name = encoding_name
+        self._bpe_path = bpe_path
+        self._encoder = encoder
+        self._encoder_failed = False
+        self._warmup_thread: Optional[threading.Thread] = None
+        self._lock = threading.RLock()
+
+        # Use OrderedDict for LRU eviction: text -> token count
+        self._counts: OrderedDict[str, int] = OrderedDict()
+
+        # Statistics
+        self._hits = 0
+        self._misses = 0
+
+    def get_encoder(self) -> Optional[tiktoken.Encoding]:
+        """Get or initialize the tiktoken encoder.
+
+        Uses lazy initialization to avoid network calls at construction.
+        A failed load is not retried, so offline sessions fall back to the
+        estimate without paying for a network timeout on every count.
+
+        While a background warm-up is in progress this never blocks and
+        returns None until the warm-up completes.
+
+        Returns:
+            tiktoken.Encoding or None if unavailable.
+        """
+        if self._encoder is None and not self._encoder_failed and not self.is_warming:
+            with self._lock:
+                if self._encoder is None and not self._encoder_failed:
+                    self._load_encoder()
+        return self._encoder
+
+    def start_warmup(self) -> None:
+        """Load the encoder on a background daemon thread.
+
+        Does nothing if the encoder is already loaded, has failed to load,
+        or a warm-up is already running.
+        """
+        with self._lock:
+            if self._encoder is not None or self._encoder_failed:
+                return
+            if self._warmup_thread is not None:
+                return
+            self._warmup_thread = threading.Thread(
+                target=self._load_encoder, name="TokenizerWarmup", daemon=True
+            )
+            self._warmup_thread.start()
+
+    def wait_until_warm(self, timeout: Optional[float] = None) -> bool:
+        """Wait for a background warm-up to finish.
+
+        Args:
+            timeout: Maximum seconds to wait (default: wait indefinitely).
+
+        Returns:
+            True if the exact encoder is available.
+        """
+        thread = self._warmup_thread
+        if thread is not None:
+            thread.join(timeout)
+        return self._encoder is not None
+
+    @property
+    def is_exact(self) -> bool:
+        """Whether counts come from the tiktoken encoder rather than the estimate."""
+        return self._encoder is not None
+
+    @property
+    def is_warming(self) -> bool:
+        """Whether a background warm-up is still loading the encoder."""
+        thread = self._warmup_thread
+        return thread is not None and thread.is_alive()
+
+    def count(self, text: str) -> int:
+        """Count tokens in text, using the memoized count when available.
+
+        Args:
+            text: Text to count tokens for.
+
+        Returns:
+            Number of tokens in text (approximate if tiktoken unavailable).
+        """
+        return self.count_many([text])[0]
+
+    def count_many(self, texts: Sequence[str]) -> List[int]:
+        """Count tokens for several texts, batch-encoding the uncached ones.
+
+        Args:
+            texts: Texts to count tokens for.
+
+        Returns:
+            Token counts in the same order as texts.
+        """
+        counts: Dict[str, int] = {}
+        missing: Dict[str, None] = {}  # Ordered set of uncached texts
+
+        with self._lock:
+            for text in texts:
+                if text in counts:
+                    continue
+                cached = self._counts.get(text)
+                if cached is None:
+                    missing[text] = None
+                    self._misses += 1
+                else:
+                    self._counts.move_to_end(text)
+                    counts[text] = cached
+                    self._hits += 1
+
+        if missing:
+            missing_texts = list(missing)
+            new_counts, memoize = self._encode_lengths(missing_texts)
+            with self._lock:
+                for text, token_count in zip(missing_texts, new_counts):
+                    counts[text] = token_count
+                    if memoize:
+                        self._store(text, token_count)
+
+        return [counts[text] for text in texts]
+
+    def count_joined(self, parts: Sequence[str], separator: str = "\n") -> int:
+        """Count tokens for parts joined by separator without re-encoding the join.
+
+        Args:
+            parts: Text parts that will be joined.
+            separator: Separator placed between parts.
+
+        Returns:
+            Sum of per-part counts plus separator overhead.
+        """
+        if not parts:
+            return 0
+        separator_tokens = self.count(separator) if separator else 0
+        return sum(self.count_many(parts)) + separator_tokens * (len(parts) - 1)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get token count cache statistics.
+
+        Returns:
+            Dictionary with cache statistics.
+        """
+        with self._lock:
+            total_requests = self._hits + self._misses
+            hit_rate = self._hits / total_requests if total_requests > 0 else 0.0
+
+            return {
+                "entries": len(self._counts),
+                "max_entries": self._max_entries,
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": hit_rate,
+                "exact": self.is_exact,
+                "warming": self.is_warming,
+            }
+
+    def clear(self) -> None:
+        """Drop all memoized counts."""
+        with self._lock:
+            self._counts.clear()
+
+    def _load_encoder(self) -> None:
+        """Load the encoder, recording a failure so it is not retried."""
+        try:
+            if self._bpe_path:
+                encoder = load_encoding_from_file(self._bpe_path, self._encoding_name)
+            else:
+                encoder = tiktoken.get_encoding(self._encoding_name)
+        except Exception as e:
+            logger.warning(f"Failed to initialize tiktoken encoder: {e}")
+            with self._lock:
+                self._encoder_failed = True
+            return
+
+        with self._lock:
+            self._encoder = encoder
+        logger.debug(f"Loaded tiktoken encoder '{self._encoding_name}'")
+
+    def _encode_lengths(self, texts: List[str]) -> Tuple[List[int], bool]:
+        """Count tokens for uncached texts.
+
+        Args:
+            texts: Texts to encode.
+
+        Returns:
+            Tuple of (token counts in the same order as texts, whether the
+            counts may be memoized). Estimates made while the encoder is still
+            warming up are not memoized.
+        """
+        encoder = self.get_encoder()
+        if encoder is None:
+            return [estimate_tokens(text) for text in texts], self._encoder_failed
+        # Snippets are source code, so special-token text is counted as plain text
+        if len(texts) == 1:
+            return [len(encoder.encode(texts[0], disallowed_special=()))], True
+        return [len(tokens) for tokens in encoder.encode_batch(texts, disallowed_special=())], True
+
+    def _store(self, text: str, token_count: int) -> None:
+        """Store a count, evicting the least recently used entries (lock held)."""
+        if text in self._counts:
+            self._counts.move_to_end(text)
+            return
+        while len(self._counts) >= self._max_entries:
+            self._counts.popitem(last=False)
+        self._counts[text] = token_count
+
+
+class TokenBudget:
+    """Running token cost of newline-joined parts against a fixed limit.
+
+    Used for budget-aware context assembly: callers offer groups of parts in
+    priority order and only groups that fit within the remaining budget are
+    accepted, so the joined text never exceeds the limit.
+    """
+
+    def __init__(self, counter: TokenCounter, limit: int, separator: str = "\n"):
+        """Initialize the budget.
+
+        Args:
+            counter: TokenCounter used to cost parts.
+            limit: Maximum total tokens for the joined parts.
+            separator: Separator placed between parts when joined.
+        """
+        self._counter = counter
+        self._limit = limit
+        self._separator_tokens = counter.count(separator) if separator else 0
+        self._used = 0
+        self._part_count = 0
+
+    @property
+    def used(self) -> int:
+        """Tokens consumed by accepted parts, including separators."""
+        return self._used
+
+    @property
+    def remaining(self) -> int:
+        """Tokens still available."""
+        return self._limit - self._used
+
+    def cost(self, parts: Sequence[str]) -> int:
+        """Get the cost of appending parts to the accepted parts.
+
+        Args:
+            parts: Parts to cost.
+
+        Returns:
+            Token cost including the separators the parts would add.
+        """
+        if not parts:
+            return 0
+        separators = len(parts) if self._part_count else len(parts) - 1
+        return sum(self._counter.count_many(parts)) + self._separator_tokens * separators
+
+    def try_add(self, parts: Sequence[str]) -> bool:
+        """Accept parts if they fit in the remaining budget.
+
+        Args:
+            parts: Parts to add as a group.
+
+        Returns:
+            True if the parts were accepted, False if they would exceed the limit.
+        """
+        cost = self.cost(parts)
+        if cost > self.remaining:
+            return False
+        self._used += cost
+        self._part_count += len(parts)
+        return True
+
+    def try_replace(self, old_parts: Sequence[str], new_parts: Sequence[str]) -> bool:
+        """Swap previously accepted parts for new ones if the difference fits.
+
+        Args:
+            old_parts: Parts previously accepted via try_add().
+            new_parts: Replacement parts.
+
+        Returns:
+            True if the replacement was accepted, False if it would exceed the limit.
+        """
+        old_cost = sum(self._counter.count_many(old_parts))
+        new_cost = sum(self._counter.count_many(new_parts))
+        delta = new_cost - old_cost + self._separator_tokens * (len(new_parts) - len(old_parts))
+        if delta > self.remaining:
+            return False
+        self._used += delta
+        self._part_count += len(new_parts) - len(old_parts)
+        return True
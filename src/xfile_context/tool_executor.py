@@ -0,0 +1,131 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Bounded executor with single-flight de-duplication for MCP tool calls.
+
+The MCP tools are async, but the service layer is synchronous: AST parsing,
+staleness resolution and disk I/O would block the event loop and serialize
+concurrent tool calls. This module runs service calls on a bounded thread pool
+so the event loop stays responsive, and de-duplicates concurrent calls for the
+same key (e.g. the same file) so they share one computation.
+
+Key features:
+- Bounded worker pool (max_workers threads)
+- Single-flight: concurrent calls with the same key await one shared result,
+  including a shared exception
+- Cancelling one waiter does not cancel the shared computation
+- Statistics on started and de-duplicated calls
+
+Usage:
+    executor = ToolExecutor(max_workers=4)
+
+    result = await executor.run_single_flight(
+        ("read_with_context", file_path), service.read_file_with_context, file_path
+    )
+"""
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class ToolExecutor:
+    """Runs synchronous service calls off the event loop.
+
+    Thread Safety:
+        Must be used from a single event loop. Submitted functions run on
+        worker threads and must be thread-safe.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        """Initialize the executor.
+
+        Args:
+            max_workers: Maximum number of worker threads (default: 4).
+        """
+        self._max_workers = max_workers
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="xfile-tool"
+        )
+
+        # key -> shared future for the in-flight computation
+        self._in_flight: Dict[Hashable, asyncio.Future[Any]] = {}
+
+        # Statistics
+        self._started = 0
+        self._shared = 0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) on a worker thread.
+
+        Args:
+            fn: Synchronous function to run.
+            *args: Positional arguments for fn.
+
+        Returns:
+            Result of fn.
+        """
+        loop = asyncio.get_running_loop()
+        self._started += 1
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args))
+
+    async def run_single_flight(self, key: Hashable, fn: Callable[..., T], *args: Any) -> T:
+        """Run fn(*args) on a worker thread, sharing in-flight calls with the same key.
+
+        If a call with the same key is already running, waits for its result
+        instead of starting another computation.
+
+        Args:
+            key: De-duplication key (e.g. tool name and file path).
+            fn: Synchronous function to run.
+            *args: Positional arguments for fn.
+
+        Returns:
+            Result of fn (shared with concurrent callers using the same key).
+        """
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, functools.partial(fn, *args))
+            self._in_flight[key] = future
+            future.add_done_callback(functools.partial(self._forget, key))
+            self._started += 1
+        else:
+            self._shared += 1
+            logger.debug(f"Joining in-flight call for {key!r}")
+
+        # Shield so that a cancelled waiter does not cancel the shared computation
+        result: T = await asyncio.shield(future)
+        return result
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get executor statistics.
+
+        Returns:
+            Dictionary with max_workers, started, shared and in_flight counts.
+        """
+        return {
+            "max_workers": self._max_workers,
+            "started": self._started,
+            "shared": self._shared,
+            "in_flight": len(self._in_flight),
+        }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker pool.
+
+        Args:
+            wait: Whether to wait for running calls to finish.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _forget(self, key: Hashable, future: "asyncio.Future[Any]") -> None:
+        """Remove a finished computation from the in-flight table."""
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
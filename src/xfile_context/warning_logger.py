@@ -5,11 +5,14 @@
 
 This module implements structured warning logging per TDD Section 3.9.5:
 - JSONL format (one JSON object per line)
-- Real-time logging with immediate flush
+- Real-time logging with immediate flush, or queued and written in batches by
+  a background AsyncLogWriter (write_policy)
 - Date-based file rotation for eventual immutability (Issue #150)
+- Size-based rotation into compressed segments (rotation_policy)
 - Warning statistics for session metrics
 
 Log Location: ~/.cross_file_context/warnings/<DATE>-<SESSION-ID>.jsonl
+Segments: <log file stem>.<NNNN>.jsonl.gz, listed in <log file>.manifest.json
 
 Related Requirements:
 - FR-41 (structured warning log)
@@ -20,17 +23,27 @@ Related Requirements:
 
 import json
 import logging
+import os
+import threading
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, TextIO
 
+from xfile_context.async_log_writer import AsyncLogWriter, LogWritePolicy
 from xfile_context.log_config import (
     build_log_filename,
     get_current_utc_date,
     get_warnings_dir,
     validate_filename_component,
 )
+from xfile_context.log_segments import (
+    LogRotationPolicy,
+    LogSegmenter,
+    in_time_range,
+    iter_log_lines,
+    parse_timestamp,
+)
 from xfile_context.warning_formatter import StructuredWarning
 
 logger = logging.getLogger(__name__)
@@ -80,14 +93,19 @@ class WarningLogger:
     """Logger for writing warnings to JSONL file.
 
     Provides real-time warning logging with immediate flush to ensure
-    warnings are persisted even if the session terminates unexpectedly.
+    warnings are persisted even if the session terminates unexpectedly. With
+    a write_policy, warnings are instead queued and written by a background
+    thread, so logging never waits for the disk.
 
     Features:
     - JSONL format (one JSON object per line)
-    - Immediate flush after each write
+    - Immediate flush after each write, or batched background writes
     - Date-based file rotation for eventual immutability (Issue #150)
     - Warning statistics generation for session metrics
 
+    Thread Safety:
+        Writes and statistics updates are serialized by an internal lock.
+
     Usage:
         logger = WarningLogger(session_id="abc-123")
         logger.log_warning(structured_warning)
@@ -111,6 +129,8 @@ class WarningLogger:
         max_unique_files_tracked: int = 10000,
         session_id: Optional[str] = None,
         data_root: Optional[Path] = None,
+        write_policy: Optional[LogWritePolicy] = None,
+        rotation_policy: Optional[LogRotationPolicy] = None,
     ) -> None:
         """Initialize the warning logger.
 
@@ -129,6 +149,12 @@ class WarningLogger:
                        If None, falls back to legacy static filename.
             data_root: Root directory for logs. If provided, uses
                       {data_root}/warnings/ as log directory.
+            write_policy: If provided, warnings are written by a background
+                         AsyncLogWriter with this durability policy. If None,
+                         each warning is written and flushed immediately.
+            rotation_policy: If provided (with a size limit), the log file is
+                            rotated into a compressed segment whenever it
+                            grows past the limit.
 
         Raises:
             ValueError: If log_file contains path separators.
@@ -175,6 +201,25 @@ class WarningLogger:
         # File handle (lazy initialization)
         self._file_handle: Optional[TextIO] = None
 
+        # Serializes writes and statistics updates
+        self._lock = threading.Lock()
+
+        # Size-based rotation (None: the log file only rotates by date)
+        self._segmenter: Optional[LogSegmenter] = None
+        if rotation_policy is not None and rotation_policy.max_segment_bytes > 0:
+            self._segmenter = LogSegmenter(rotation_policy)
+
+        # Background writer (None: write on the calling thread)
+        self._writer: Optional[AsyncLogWriter] = None
+        if write_policy is not None:
+            self._writer = AsyncLogWriter(
+                serialize=_serialize_warning,
+                write_lines=self._write_lines,
+                flush=self._flush_file,
+                policy=write_policy,
+                name="warning",
+            )
+
     def _ensure_log_dir(self) -> None:
         """Create log directory if it doesn't exist."""
         self._log_dir.mkdir(parents=True, exist_ok=True)
@@ -202,6 +247,8 @@ class WarningLogger:
                 self._file_handle.close()
                 self._file_handle = None
                 logger.debug(f"Rotated warning log: {self._current_date} -> {current_date}")
+            if self._segmenter is not None:
+                self._segmenter.reset()
             self._current_date = current_date
             self._log_file = build_log_filename(self._session_id)  # type: ignore[arg-type]
 
@@ -220,58 +267,97 @@ class WarningLogger:
             # noqa: SIM115 - We manage the file handle lifecycle via close() method
             self._file_handle = open(log_path, "a", encoding="utf-8")  # noqa: SIM115
             logger.debug(f"Opened warning log file: {log_path}")
+            if self._segmenter is not None:
+                size = os.fstat(self._file_handle.fileno()).st_size
+                self._segmenter.opened(log_path, size)
         return self._file_handle
 
-    def log_warning(self, warning: StructuredWarning) -> None:
-        """Log a single warning to the JSONL file.
-
-        The warning is immediately flushed to disk to ensure persistence.
+    def _append_lines(
+        self, lines: List[str], warnings: List[StructuredWarning], flush: bool = False
+    ) -> None:
+        """Append serialized warnings to the log file (lock held).
 
-        Args:
-            warning: StructuredWarning to log.
+        Rotates the log file into a segment if it grew past the size limit.
         """
         file_handle = self._open_file()
+        file_handle.writelines(lines)
+        if flush:
+            file_handle.flush()
+        if self._segmenter is None:
+            return
+        rotate = False
+        for line, warning in zip(lines, warnings):
+            rotate = self._segmenter.record(len(line.encode("utf-8")), warning.timestamp) or rotate
+        if rotate:
+            file_handle.close()
+            self._file_handle = None
+            self._segmenter.rotate(self._get_log_path())
+
+    def _write_lines(self, lines: List[str], warnings: List[StructuredWarning]) -> None:
+        """Append serialized lines to the log file (background writer callback)."""
+        with self._lock:
+            self._append_lines(lines, warnings)
 
-        # Write JSON line
-        json_line = json.dumps(warning.to_dict(), separators=(",", ":"))
-        file_handle.write(json_line + "\n")
-        file_handle.flush()  # Immediate flush per TDD 3.9.5
+    def _flush_file(self) -> None:
+        """Flush the log file (background writer callback)."""
+        with self._lock:
+            if self._file_handle is not None:
+                self._file_handle.flush()
+
+    def _record_warning(self, warning: StructuredWarning) -> None:
+        """Update in-memory statistics for a logged warning (lock held).
 
-        # Update statistics
+        Args:
+            warning: StructuredWarning that was logged.
+        """
         self._warning_count += 1
         self._by_type[warning.type] += 1
         # Only track file stats up to limit to prevent memory exhaustion
         if len(self._by_file) < self._max_unique_files_tracked or warning.file in self._by_file:
             self._by_file[warning.file] += 1
 
+    def log_warning(self, warning: StructuredWarning) -> None:
+        """Log a single warning to the JSONL file.
+
+        The warning is immediately flushed to disk to ensure persistence, or
+        queued for the background writer if there is one.
+
+        Args:
+            warning: StructuredWarning to log.
+        """
+        self.log_warnings([warning])
+
     def log_warnings(self, warnings: List[StructuredWarning]) -> None:
         """Log multiple warnings to the JSONL file.
 
         Each warning is written on its own line and the file is flushed
-        after all warnings are written.
+        after all warnings are written, or the warnings are queued for the
+        background writer if there is one.
 
         Args:
             warnings: List of StructuredWarnings to log.
         """
+        if self._writer is not None:
+            queued = 0
+            for warning in warnings:
+                if not self._writer.submit(warning):
+                    break  # Writer closed: write the rest here
+                queued += 1
+            with self._lock:
+                for warning in warnings[:queued]:
+                    self._record_warning(warning)
+            warnings = warnings[queued:]
+
         if not warnings:
             return
 
-        file_handle = self._open_file()
-
-        for warning in warnings:
-            # Write JSON line
-            json_line = json.dumps(warning.to_dict(), separators=(",", ":"))
-            file_handle.write(json_line + "\n")
+        # Write JSON lines
+        lines = [_serialize_warning(warning) + "\n" for warning in warnings]
+        with self._lock:
+            self._append_lines(lines, warnings, flush=True)  # Immediate flush per TDD 3.9.5
 
-            # Update statistics
-            self._warning_count += 1
-            self._by_type[warning.type] += 1
-            # Only track file stats up to limit to prevent memory exhaustion
-            if len(self._by_file) < self._max_unique_files_tracked or warning.file in self._by_file:
-                self._by_file[warning.file] += 1
-
-        # Flush after batch
-        file_handle.flush()
+            for warning in warnings:
+                self._record_warning(warning)
 
     def get_statistics(self, top_files_count: int = 5) -> WarningStatistics:
         """Get warning statistics for session metrics.
@@ -288,32 +374,62 @@ class WarningLogger:
         Returns:
             WarningStatistics with aggregated data.
         """
-        # Get top files by warning count
-        top_files = self._by_file.most_common(top_files_count)
-        files_with_most_warnings = [
-            {"file": filepath, "warning_count": count} for filepath, count in top_files
-        ]
-
-        return WarningStatistics(
-            total_warnings=self._warning_count,
-            by_type=dict(self._by_type),
-            files_with_most_warnings=files_with_most_warnings,
-        )
+        with self._lock:
+            # Get top files by warning count
+            top_files = self._by_file.most_common(top_files_count)
+            files_with_most_warnings = [
+                {"file": filepath, "warning_count": count} for filepath, count in top_files
+            ]
+
+            return WarningStatistics(
+                total_warnings=self._warning_count,
+                by_type=dict(self._by_type),
+                files_with_most_warnings=files_with_most_warnings,
+            )
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until all warnings logged so far are written to the log file.
+
+        A no-op without a background writer (warnings are written immediately).
+
+        Args:
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            True if all warnings logged so far are written and flushed.
+        """
+        if self._writer is None:
+            return True
+        return self._writer.flush(timeout)
+
+    def get_writer_statistics(self) -> Optional[Dict[str, Any]]:
+        """Get background writer statistics (see AsyncLogWriter.get_statistics()).
+
+        Returns:
+            Queueing and backpressure statistics, or None without a background
+            writer.
+        """
+        if self._writer is None:
+            return None
+        return self._writer.get_statistics()
 
     def get_log_path(self) -> Path:
         """Get the path to the log file.
 
+        Segments rotated out of the log are found via its manifest.
+
         Returns:
             Path to the warnings log file.
         """
         return self._get_log_path()
 
     def get_log_size(self) -> int:
-        """Get the current size of the log file in bytes.
+        """Get the current size of the active log file in bytes.
 
         Returns:
             Size in bytes, or 0 if file doesn't exist.
         """
+        self.flush()
         log_path = self._get_log_path()
         if log_path.exists():
             return log_path.stat().st_size
@@ -323,12 +439,18 @@ class WarningLogger:
         """Close the log file handle.
 
         Should be called when logging is complete to ensure resources
-        are released.
+        are released. Queued warnings are written first; warnings logged
+        after closing are written synchronously.
         """
-        if self._file_handle is not None:
-            self._file_handle.close()
-            self._file_handle = None
-            logger.debug(f"Closed warning log file: {self._get_log_path()}")
+        if self._writer is not None:
+            self._writer.close()
+        with self._lock:
+            if self._file_handle is not None:
+                self._file_handle.close()
+                self._file_handle = None
+                logger.debug(f"Closed warning log file: {self._get_log_path()}")
+        if self._segmenter is not None:
+            self._segmenter.wait()
 
     def clear_statistics(self) -> None:
         """Clear the in-memory statistics.
@@ -348,18 +470,29 @@ class WarningLogger:
         self.close()
 
 
+def _serialize_warning(warning: StructuredWarning) -> str:
+    """Serialize a warning as one compact JSON line (without newline)."""
+    return json.dumps(warning.to_dict(), separators=(",", ":"))
+
+
 def read_warnings_from_log(
     log_path: Path,
     limit: Optional[int] = None,
+    since: Optional[str] = None,
+    until: Optional[str] = None,
 ) -> List[StructuredWarning]:
-    """Read warnings from a JSONL log file.
+    """Read warnings from a JSONL log file and its segments.
 
     Utility function for reading back logged warnings, useful for
-    testing and analysis.
+    testing and analysis. Segments rotated out of the log are read first,
+    streamed without loading them into memory; segments outside the time
+    range are skipped using the manifest.
 
     Args:
         log_path: Path to the warnings.jsonl file.
         limit: Optional maximum number of warnings to read.
+        since: Optional ISO 8601 timestamp; skip older warnings.
+        until: Optional ISO 8601 timestamp; skip newer warnings.
 
     Returns:
         List of StructuredWarning objects.
@@ -369,17 +502,19 @@ def read_warnings_from_log(
         json.JSONDecodeError: If log file contains invalid JSON.
     """
     warnings: List[StructuredWarning] = []
+    since_time = parse_timestamp(since)
+    until_time = parse_timestamp(until)
 
-    with open(log_path, encoding="utf-8") as f:
-        for i, line in enumerate(f):
-            if limit is not None and i >= limit:
-                break
+    for line in iter_log_lines(log_path, since_time, until_time):
+        if limit is not None and len(warnings) >= limit:
+            break
 
-            line = line.strip()
-            if not line:
-                continue
+        line = line.strip()
+        if not line:
+            continue
 
-            data = json.loads(line)
+        data = json.loads(line)
+        if in_time_range(data.get("timestamp"), since_time, until_time):
             warnings.append(StructuredWarning.from_dict(data))
 
     return warnings
@@ -41,6 +41,9 @@ from analyze_metrics import (  # type: ignore[import-not-found]
     parse_session_metrics,
 )
 
+from xfile_context.metrics_collector import calculate_sketch_statistics
+from xfile_context.quantile_sketch import QuantileSketch
+
 
 def create_session_data(
     session_id: str = "test-session",
@@ -315,6 +318,38 @@ class TestComputeAggregateStatistics:
         assert stats.avg_hit_rate == 0.0
         assert stats.total_injections == 0
 
+    def test_merges_quantile_sketches_across_sessions(self) -> None:
+        """Percentiles come from the merged sketches, not the median of sessions."""
+        sessions = []
+        for values in ([10] * 90, list(range(500, 510))):
+            sketch = QuantileSketch()
+            for value in values:
+                sketch.record(value)
+            stats = calculate_sketch_statistics(sketch).to_dict()
+            session = create_session_data(total_injections=len(values))
+            session["context_injection"]["token_counts"] = stats
+            session["performance"]["injection_latency_ms"] = stats
+            sessions.append(session)
+
+        stats = compute_aggregate_statistics(sessions)
+
+        # 100 samples: 90 x 10 and 500..509 (the median of session p95s is 259)
+        assert (stats.token_median, stats.token_p95, stats.token_p99) == (10, 505, 509)
+        assert (stats.token_min, stats.token_max) == (10, 509)
+        assert stats.injection_p95_ms == 505
+
+    def test_falls_back_without_sketches(self) -> None:
+        """Sessions written without sketches use the median of per-session values."""
+        sessions = [
+            create_session_data(session_id="s1", token_p95=300),
+            create_session_data(session_id="s2", token_p95=500),
+        ]
+        sessions[0]["context_injection"]["token_counts"]["sketch"] = QuantileSketch().to_dict()
+
+        stats = compute_aggregate_statistics(sessions)
+
+        assert stats.token_p95 == 400
+
 
 class TestIdentifyOutliers:
     """Tests for identify_outliers function."""
@@ -738,6 +773,30 @@ class TestAnalyzeMetrics:
         assert "2025-01-10" in report.date_range[0]
         assert "2025-01-20" in report.date_range[1]
 
+    def test_analyze_rotated_segments_in_directory(self, temp_dir: Path) -> None:
+        """Segments of a rotated log are streamed and filtered by time range."""
+        from xfile_context.log_segments import LogRotationPolicy, LogSegmenter
+
+        log_path = temp_dir / "2025-01-10-session.jsonl"
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=1), "end_time")
+        for day in range(10, 15):
+            session = {
+                **create_session_data(session_id=f"s{day}"),
+                "start_time": f"2025-01-{day}T10:00:00.000+00:00",
+                "end_time": f"2025-01-{day}T12:00:00.000+00:00",
+            }
+            line = json.dumps(session) + "\n"
+            with open(log_path, "a") as f:
+                f.write(line)
+            segmenter.record(len(line), session["end_time"])
+            segmenter.rotate(log_path)
+
+        assert not log_path.exists()
+        assert analyze_metrics([temp_dir]).sessions_analyzed == 5
+        report = analyze_metrics([temp_dir], since="2025-01-12", until="2025-01-13T23:59:59Z")
+        assert report.sessions_analyzed == 2
+        assert "2025-01-12" in report.date_range[0]
+
 
 class TestCommandLineInterface:
     """Tests for command-line interface functionality."""
@@ -0,0 +1,179 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for AsyncLogWriter.
+
+Tests background log writing including:
+- Ordered, batched writes and explicit flushes
+- Durability policy (every N events, every T ms, on close only)
+- Backpressure accounting when the queue is full
+- Error handling and writes after close
+"""
+
+import threading
+import time
+from typing import List
+
+from xfile_context.async_log_writer import AsyncLogWriter, LogWritePolicy
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+class _Sink:
+    """Collects written lines and counts flushes."""
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.flushed: List[str] = []
+        self.flushes = 0
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def write_lines(self, lines: List[str], events: List[object]) -> None:
+        assert len(lines) == len(events)
+        self.gate.wait(5.0)
+        self.lines.extend(lines)
+
+    def flush(self) -> None:
+        self.flushes += 1
+        self.flushed = list(self.lines)
+
+
+def _writer(sink: _Sink, **policy) -> AsyncLogWriter:
+    return AsyncLogWriter(
+        serialize=str,
+        write_lines=sink.write_lines,
+        flush=sink.flush,
+        policy=LogWritePolicy(**policy),
+        name="test",
+    )
+
+
+class TestAsyncLogWriter:
+    """Tests for AsyncLogWriter."""
+
+    def test_flush_writes_events_in_order(self) -> None:
+        """Test that flush() waits until all queued events are flushed."""
+        sink = _Sink()
+        writer = _writer(sink, flush_every_events=0, flush_interval_ms=0)
+        try:
+            for i in range(50):
+                assert writer.submit(i)
+            assert writer.flush()
+
+            assert sink.flushed == [f"{i}\n" for i in range(50)]
+            stats = writer.get_statistics()
+            assert stats["events_queued"] == 50
+            assert stats["events_written"] == 50
+            assert stats["events_dropped"] == 0
+            assert stats["queue_depth"] == 0
+            assert 1 <= stats["batches"] <= 50
+        finally:
+            writer.close()
+
+    def test_flush_every_n_events(self) -> None:
+        """Test that the writer flushes by itself once N events are written."""
+        sink = _Sink()
+        writer = _writer(sink, flush_every_events=10, flush_interval_ms=0)
+        try:
+            for i in range(10):
+                writer.submit(i)
+
+            assert _wait_for(lambda: len(sink.flushed) == 10)
+        finally:
+            writer.close()
+
+    def test_flush_interval(self) -> None:
+        """Test that written events are flushed once the interval has passed."""
+        sink = _Sink()
+        writer = _writer(sink, flush_every_events=0, flush_interval_ms=20)
+        try:
+            writer.submit("event")
+
+            assert _wait_for(lambda: sink.flushed == ["event\n"])
+        finally:
+            writer.close()
+
+    def test_close_only_policy(self) -> None:
+        """Test that with both limits disabled, events are flushed on close."""
+        sink = _Sink()
+        writer = _writer(sink, flush_every_events=0, flush_interval_ms=0)
+        for i in range(5):
+            writer.submit(i)
+        assert _wait_for(lambda: len(sink.lines) == 5)
+        time.sleep(0.05)
+        assert sink.flushes == 0
+
+        writer.close()
+
+        assert sink.flushes == 1
+        assert len(sink.flushed) == 5
+        assert writer.is_closed()
+
+    def test_full_queue_blocks_then_drops(self) -> None:
+        """Test backpressure: submits wait for space, then drop and count."""
+        sink = _Sink()
+        sink.gate.clear()  # Writes block until released
+        writer = _writer(sink, max_queue_events=2, max_block_ms=10)
+        try:
+            writer.submit("taken by the writer")
+            assert _wait_for(lambda: writer.get_statistics()["queue_depth"] == 0)
+            writer.submit("a")
+            writer.submit("b")
+
+            start = time.monotonic()
+            assert writer.submit("dropped")
+            assert time.monotonic() - start >= 0.009
+
+            stats = writer.get_statistics()
+            assert stats["events_dropped"] == 1
+            assert stats["blocked_submits"] == 1
+            assert stats["blocked_ms"] >= 9
+            assert stats["max_queue_depth"] == 2
+        finally:
+            sink.gate.set()
+            writer.close()
+
+        assert sink.lines == ["taken by the writer\n", "a\n", "b\n"]
+
+    def test_errors_counted_and_writer_continues(self) -> None:
+        """Test that an event that fails to serialize does not stop the writer."""
+        lines: List[str] = []
+
+        def serialize(event: object) -> str:
+            if event == "bad":
+                raise ValueError("not serializable")
+            return str(event)
+
+        writer = AsyncLogWriter(
+            serialize=serialize,
+            write_lines=lambda batch, events: lines.extend(batch),
+            flush=lambda: None,
+            name="test",
+        )
+        try:
+            for event in ("a", "bad", "b"):
+                writer.submit(event)
+            assert writer.flush()
+
+            assert lines == ["a\n", "b\n"]
+            assert writer.get_statistics()["write_errors"] == 1
+        finally:
+            writer.close()
+
+    def test_submit_after_close(self) -> None:
+        """Test that a closed writer rejects events so the caller writes them."""
+        sink = _Sink()
+        writer = _writer(sink)
+        writer.close()
+
+        assert writer.submit("late") is False
+        assert writer.flush()
+        assert sink.lines == []
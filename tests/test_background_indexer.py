@@ -0,0 +1,271 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for BackgroundIndexer.
+
+Tests background indexing including:
+- Idle ordering (most recently modified first)
+- Skipping files that are already current
+- Promotion of files needed by reads, including the file being indexed
+- Re-queueing files made out of date by other files
+- Progress reporting and stopping
+"""
+
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+from xfile_context.background_indexer import BackgroundIndexer
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+def _make_files(root: Path, count: int) -> List[str]:
+    files = []
+    for i in range(count):
+        path = root / f"module_{i}.py"
+        path.write_text("")
+        # module_0 is the oldest, module_{count-1} the newest
+        os.utime(path, (1000 + i, 1000 + i))
+        files.append(str(path))
+    return files
+
+
+class TestBackgroundIndexer:
+    """Tests for BackgroundIndexer."""
+
+    def test_indexes_most_recently_modified_first(self, tmp_path: Path) -> None:
+        """Test that all discovered files are indexed, newest first."""
+        files = _make_files(tmp_path, 5)
+        indexed: List[str] = []
+
+        def index_file(path: str) -> bool:
+            indexed.append(path)
+            return True
+
+        indexer = BackgroundIndexer(
+            discover=lambda: files,
+            index_file=index_file,
+            needs_indexing=lambda path: True,
+        )
+
+        indexer.start()
+        try:
+            assert _wait_for(lambda: indexer.get_progress()["state"] == "complete")
+        finally:
+            indexer.stop()
+
+        assert indexed == files[::-1]
+        progress = indexer.get_progress()
+        assert progress["state"] == "stopped"
+        assert progress["files_discovered"] == 5
+        assert progress["files_current"] == 5
+        assert progress["files_indexed"] == 5
+        assert progress["files_queued"] == 0
+        assert progress["percent_complete"] == 100.0
+
+    def test_skips_files_already_current(self, tmp_path: Path) -> None:
+        """Test that files analyzed elsewhere are not analyzed again."""
+        files = _make_files(tmp_path, 4)
+        current = {files[0], files[2]}
+        indexed: List[str] = []
+
+        def index_file(path: str) -> bool:
+            indexed.append(path)
+            return True
+
+        indexer = BackgroundIndexer(
+            discover=lambda: files,
+            index_file=index_file,
+            needs_indexing=lambda path: path not in current,
+        )
+
+        indexer.start()
+        try:
+            assert _wait_for(lambda: indexer.get_progress()["state"] == "complete")
+        finally:
+            indexer.stop()
+
+        assert sorted(indexed) == [files[1], files[3]]
+        progress = indexer.get_progress()
+        assert progress["files_skipped"] == 2
+        assert progress["files_current"] == 4
+
+    def test_failures_counted(self, tmp_path: Path) -> None:
+        """Test that failed files are reported and not marked current."""
+        files = _make_files(tmp_path, 3)
+
+        def index_file(path: str) -> bool:
+            if path == files[1]:
+                raise RuntimeError("parse error")
+            return path != files[2]
+
+        indexer = BackgroundIndexer(
+            discover=lambda: files, index_file=index_file, needs_indexing=lambda path: True
+        )
+
+        indexer.start()
+        try:
+            assert _wait_for(lambda: indexer.get_progress()["state"] == "complete")
+        finally:
+            indexer.stop()
+
+        progress = indexer.get_progress()
+        assert progress["files_failed"] == 2
+        assert progress["files_current"] == 1
+
+    def test_enqueue_indexes_files_again(self, tmp_path: Path) -> None:
+        """Test that enqueued files are indexed again if they still need it."""
+        files = _make_files(tmp_path, 3)
+        indexed: List[str] = []
+        pending = set()
+
+        def index_file(path: str) -> bool:
+            indexed.append(path)
+            pending.discard(path)
+            return True
+
+        indexer = BackgroundIndexer(
+            discover=lambda: files,
+            index_file=index_file,
+            needs_indexing=lambda path: path not in indexed or path in pending,
+        )
+
+        indexer.start()
+        try:
+            assert _wait_for(lambda: indexer.get_progress()["state"] == "complete")
+            pending.add(files[0])
+            indexer.enqueue([files[0], files[1]])
+            assert _wait_for(lambda: indexer.get_progress()["files_skipped"] == 1)
+        finally:
+            indexer.stop()
+
+        assert indexed == files[::-1] + [files[0]]
+        assert indexer.get_progress()["files_current"] == 3
+
+    def test_read_request_promoted_ahead_of_idle_files(self, tmp_path: Path) -> None:
+        """Test that ensure_indexed() jumps the queue and waits for the result."""
+        files = _make_files(tmp_path, 10)
+        requested = str(tmp_path / "requested.py")
+        gate = threading.Event()
+        indexed: List[str] = []
+
+        def index_file(path: str) -> bool:
+            gate.wait(5.0)
+            indexed.append(path)
+            return True
+
+        indexer = BackgroundIndexer(
+            discover=lambda: files, index_file=index_file, needs_indexing=lambda path: True
+        )
+        indexer.start()
+        try:
+            # The indexer is blocked on the newest file; the rest are queued
+            assert _wait_for(lambda: indexer.get_progress()["files_queued"] == 9)
+
+            result: List[bool] = []
+            reader = threading.Thread(
+                target=lambda: result.append(indexer.ensure_indexed(requested, timeout=5.0))
+            )
+            reader.start()
+            assert _wait_for(lambda: indexer.get_progress()["promotions"] == 1)
+            gate.set()
+            reader.join(5.0)
+
+            assert result == [True]
+            assert indexed[:2] == [files[-1], requested]
+        finally:
+            gate.set()
+            indexer.stop()
+
+    def test_read_of_file_in_progress_waits_for_new_run(self, tmp_path: Path) -> None:
+        """Test that a read promoting the file being indexed waits for a fresh run."""
+        files = _make_files(tmp_path, 1)
+        gates = [threading.Event(), threading.Event()]
+        runs: List[str] = []
+
+        def index_file(path: str) -> bool:
+            run = len(runs)
+            runs.append(path)
+            gates[run].wait(5.0)
+            return True
+
+        indexer = BackgroundIndexer(
+            discover=lambda: files, index_file=index_file, needs_indexing=lambda path: True
+        )
+        indexer.start()
+        try:
+            assert _wait_for(lambda: len(runs) == 1)
+
+            result: List[bool] = []
+            reader = threading.Thread(
+                target=lambda: result.append(indexer.ensure_indexed(files[0], timeout=5.0))
+            )
+            reader.start()
+            assert _wait_for(lambda: indexer.get_progress()["promotions"] == 1)
+
+            # The run in progress started before the read and does not complete it
+            gates[0].set()
+            assert _wait_for(lambda: len(runs) == 2)
+            reader.join(0.1)
+            assert reader.is_alive()
+
+            gates[1].set()
+            reader.join(5.0)
+            assert result == [True]
+            assert indexer.get_progress()["files_indexed"] == 2
+        finally:
+            for gate in gates:
+                gate.set()
+            indexer.stop()
+
+    def test_ensure_indexed_without_running_indexer(self, tmp_path: Path) -> None:
+        """Test that reads analyze files themselves when the indexer is stopped."""
+        indexer = BackgroundIndexer(
+            discover=lambda: [], index_file=lambda path: True, needs_indexing=lambda path: True
+        )
+
+        assert indexer.ensure_indexed(str(tmp_path / "a.py"), timeout=0.1) is False
+        assert indexer.get_progress()["state"] == "stopped"
+
+    def test_stop_releases_waiting_reads(self, tmp_path: Path) -> None:
+        """Test that stopping wakes reads waiting on queued files."""
+        files = _make_files(tmp_path, 2)
+        gate = threading.Event()
+
+        def index_file(path: str) -> bool:
+            gate.wait(5.0)
+            return True
+
+        indexer = BackgroundIndexer(
+            discover=lambda: files, index_file=index_file, needs_indexing=lambda path: True
+        )
+        indexer.start()
+        assert _wait_for(lambda: indexer.get_progress()["files_queued"] == 1)
+
+        result: List[bool] = []
+        reader = threading.Thread(
+            target=lambda: result.append(indexer.ensure_indexed(files[0], timeout=5.0))
+        )
+        reader.start()
+        assert _wait_for(lambda: indexer.get_progress()["promotions"] == 1)
+
+        stopper = threading.Thread(target=indexer.stop)
+        stopper.start()
+        # Let the file in progress finish only once stopping has begun
+        assert _wait_for(lambda: not indexer.is_running())
+        gate.set()
+        stopper.join(5.0)
+        reader.join(5.0)
+
+        assert result == [False]
+        assert not indexer.is_running()
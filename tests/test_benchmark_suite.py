@@ -0,0 +1,146 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Unit tests for the synthetic project generator and benchmark suite scripts.
+
+Tests cover:
+- Deterministic project generation from a seed
+- Import fan-out and cycles of generated projects
+- Branch-switch churn
+- Running the suite on a small project
+- Comparison against a stored baseline
+"""
+
+import hashlib
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from benchmark_suite import compare_results, run_suite  # type: ignore[import-not-found]
+from synthetic_project import (  # type: ignore[import-not-found]
+    ProjectSpec,
+    generate_project,
+    switch_branch,
+)
+
+from xfile_context.config import Config  # noqa: E402
+from xfile_context.service import CrossFileContextService  # noqa: E402
+
+
+def _digest(modules) -> str:
+    return hashlib.sha256(b"".join(Path(m).read_bytes() for m in modules)).hexdigest()
+
+
+class TestSyntheticProject:
+    """Tests for generating synthetic projects."""
+
+    def test_generation_is_deterministic(self, tmp_path: Path) -> None:
+        """Test that a spec always produces the same files, and a seed changes them."""
+        spec = ProjectSpec(files=120, seed=3)
+        first = generate_project(tmp_path / "a", spec)
+        second = generate_project(tmp_path / "b", spec)
+        other = generate_project(tmp_path / "c", ProjectSpec(files=120, seed=4))
+
+        assert [Path(m).relative_to(tmp_path / "a") for m in first.modules] == [
+            Path(m).relative_to(tmp_path / "b") for m in second.modules
+        ]
+        assert _digest(first.modules) == _digest(second.modules)
+        assert _digest(first.modules) != _digest(other.modules)
+
+    def test_structure_is_analyzed(self, tmp_path: Path) -> None:
+        """Test that packages, fan-out and cycles show up in the relationship graph."""
+        spec = ProjectSpec(files=60, fan_out=3, depth=2, cycle_ratio=0.5, seed=1)
+        project = generate_project(tmp_path / "project", spec)
+        service = CrossFileContextService(
+            Config(config_path=tmp_path / "missing.yml"),
+            project_root=str(project.root),
+            data_root=tmp_path / "data",
+        )
+        try:
+            stats = service.analyze_directory()
+            imports = {
+                (dep["target_file"])
+                for dep in service.get_dependencies(project.modules[59])
+                if dep["relationship_type"] == "import"
+            }
+        finally:
+            service.shutdown()
+
+        assert stats["success"] == 60 + len(list(project.root.rglob("__init__.py")))
+        assert all(Path(m).parent.parent.parent == project.root for m in project.modules)
+        assert {project.modules[i] for i in project.dependencies[59]} <= imports
+        assert any(dep > i for i, deps in enumerate(project.dependencies) for dep in deps)
+
+    def test_switch_branch(self, tmp_path: Path) -> None:
+        """Test that a branch switch rewrites, creates and deletes modules."""
+        project = generate_project(tmp_path / "project", ProjectSpec(files=100))
+
+        switch = switch_branch(project, 0.2, 1, random.Random(0))
+
+        assert (len(switch.changed), len(switch.deleted), len(switch.created)) == (12, 4, 4)
+        assert not any(Path(path).exists() for path in switch.deleted)
+        assert all("revision 1" in Path(path).read_text() for path in switch.created)
+        assert len(project.modules) == 104
+
+    def test_invalid_spec(self, tmp_path: Path) -> None:
+        """Test that out-of-range specs are rejected."""
+        with pytest.raises(ValueError, match="files"):
+            generate_project(tmp_path, ProjectSpec(files=20_001))
+
+
+class TestBenchmarkSuite:
+    """Tests for running and comparing benchmarks."""
+
+    def test_run_suite(self, tmp_path: Path) -> None:
+        """Test that every scenario reports its metrics."""
+        result = run_suite(
+            ProjectSpec(files=40, functions_per_file=3),
+            sample=5,
+            edits=2,
+            churn=0.2,
+            workdir=tmp_path,
+        )
+
+        metrics = result["metrics"]
+        for name in (
+            "cold_analyze_ms",
+            "cold_read_p50_ms",
+            "first_read_p95_ms",
+            "warm_read_max_ms",
+            "incremental_update_p50_ms",
+            "read_after_edit_p50_ms",
+            "branch_switch_ms",
+            "read_after_switch_p50_ms",
+        ):
+            assert metrics[name] > 0, name
+        assert metrics["branch_switch_files"] == 8
+        assert result["spec"]["files"] == 40
+        assert result["settings"]["sample"] == 5
+        assert list(tmp_path.iterdir()) == []
+
+    def test_compare_results(self) -> None:
+        """Test regressions beyond the tolerance, ignoring sub-millisecond noise."""
+        baseline = {
+            "spec": {"files": 10},
+            "settings": {},
+            "metrics": {"cold_analyze_ms": 100.0, "warm_read_p50_ms": 0.2, "peak_rss_mb": 50.0},
+        }
+        result = {
+            "spec": {"files": 10},
+            "settings": {},
+            "metrics": {"cold_analyze_ms": 130.0, "warm_read_p50_ms": 0.5, "peak_rss_mb": 52.0},
+        }
+
+        comparison = {entry["metric"]: entry for entry in compare_results(result, baseline, 0.2)}
+
+        assert comparison["cold_analyze_ms"]["regression"]
+        assert comparison["cold_analyze_ms"]["ratio"] == 1.3
+        assert not comparison["warm_read_p50_ms"]["regression"]
+        assert not comparison["peak_rss_mb"]["regression"]
+
+        with pytest.raises(ValueError, match="spec"):
+            compare_results({**result, "spec": {"files": 20}}, baseline, 0.2)
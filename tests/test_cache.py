@@ -508,6 +508,28 @@ class TestThreadSafety:
         # Verify no errors
         assert len(errors) == 0
 
+    def test_disk_read_happens_outside_lock(self, tmp_path: Path) -> None:
+        """Test that a slow disk read does not block lookups of other files."""
+        slow_file = tmp_path / "slow.py"
+        slow_file.write_text("slow content")
+        fast_file = tmp_path / "fast.py"
+        fast_file.write_text("fast content")
+        cache = WorkingMemoryCache({})
+        cache.get(str(fast_file))
+
+        original_read = cache._read_from_disk_with_retry
+        lock_held_during_read = []
+
+        def read_and_record(filepath: str) -> str:
+            lock_held_during_read.append(cache._cache_lock.locked())
+            return original_read(filepath)
+
+        cache._read_from_disk_with_retry = read_and_record  # type: ignore[method-assign]
+
+        assert cache.get(str(slow_file)) == "slow content"
+        assert lock_held_during_read == [False]
+        assert cache.get(str(fast_file)) == "fast content"
+
 
 class TestEdgeCases:
     """Test edge cases (EC-15, EC-16)."""
@@ -202,3 +202,167 @@ def test_metrics_and_logging_flags():
         assert config.metrics_anonymize_paths is True
         assert config.enable_injection_logging is False
         assert config.enable_warning_logging is False
+
+
+def test_tokenizer_bpe_path():
+    """Test that the tokenizer BPE path is unset by default and resolved relative to config."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        assert Config(config_path=config_path).tokenizer_bpe_path is None
+
+        with open(config_path, "w") as f:
+            yaml.dump({"tokenizer_bpe_path": "vendor/cl100k_base.tiktoken"}, f)
+
+        config = Config(config_path=config_path)
+
+        assert config.tokenizer_bpe_path == Path(tmpdir) / "vendor" / "cl100k_base.tiktoken"
+
+
+def test_file_event_debounce_ms():
+    """Test that the debounce window accepts 0 and rejects negative values."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        assert Config(config_path=config_path).file_event_debounce_ms == 50
+
+        with open(config_path, "w") as f:
+            yaml.dump({"file_event_debounce_ms": 0}, f)
+        assert Config(config_path=config_path).file_event_debounce_ms == 0
+
+        with open(config_path, "w") as f:
+            yaml.dump({"file_event_debounce_ms": -10}, f)
+        assert Config(config_path=config_path).file_event_debounce_ms == 50
+
+
+def test_directory_scan_workers():
+    """Test that the directory scan worker count must be positive."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        assert Config(config_path=config_path).directory_scan_workers == 1
+
+        with open(config_path, "w") as f:
+            yaml.dump({"directory_scan_workers": 8}, f)
+        assert Config(config_path=config_path).directory_scan_workers == 8
+
+        with open(config_path, "w") as f:
+            yaml.dump({"directory_scan_workers": 0}, f)
+        assert Config(config_path=config_path).directory_scan_workers == 1
+
+
+def test_enable_background_indexing():
+    """Test that background indexing is off by default and can be enabled."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        assert Config(config_path=config_path).enable_background_indexing is False
+
+        with open(config_path, "w") as f:
+            yaml.dump({"enable_background_indexing": True}, f)
+        assert Config(config_path=config_path).enable_background_indexing is True
+
+
+def test_batch_read_max_workers():
+    """Test that the batch read worker count must be positive."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        assert Config(config_path=config_path).batch_read_max_workers == 4
+
+        with open(config_path, "w") as f:
+            yaml.dump({"batch_read_max_workers": 1}, f)
+        assert Config(config_path=config_path).batch_read_max_workers == 1
+
+        with open(config_path, "w") as f:
+            yaml.dump({"batch_read_max_workers": 0}, f)
+        assert Config(config_path=config_path).batch_read_max_workers == 4
+
+
+def test_log_write_settings():
+    """Test background log write settings and their ranges."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        config = Config(config_path=config_path)
+        assert config.async_log_writes is True
+        assert config.log_flush_every_events == 100
+        assert config.log_flush_interval_ms == 200
+        assert config.log_queue_max_events == 10000
+        assert config.log_queue_max_block_ms == 100
+
+        with open(config_path, "w") as f:
+            yaml.dump(
+                {
+                    "async_log_writes": False,
+                    "log_flush_every_events": 0,
+                    "log_flush_interval_ms": 0,
+                    "log_queue_max_events": 0,
+                    "log_queue_max_block_ms": -1,
+                },
+                f,
+            )
+        config = Config(config_path=config_path)
+        assert config.async_log_writes is False
+        assert config.log_flush_every_events == 0
+        assert config.log_flush_interval_ms == 0
+        # Invalid values fall back to the defaults
+        assert config.log_queue_max_events == 10000
+        assert config.log_queue_max_block_ms == 100
+
+
+def test_recent_injection_query_settings():
+    """Test recent-injection buffer and index settings."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        config = Config(config_path=config_path)
+        assert config.recent_injections_buffer_size == 1000
+        assert config.injection_index_entries_per_target == 50
+
+        with open(config_path, "w") as f:
+            yaml.dump(
+                {"recent_injections_buffer_size": 0, "injection_index_entries_per_target": -1}, f
+            )
+        config = Config(config_path=config_path)
+        assert config.recent_injections_buffer_size == 0
+        assert config.injection_index_entries_per_target == 50
+
+
+def test_log_segment_settings():
+    """Test log segment size and compression settings."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        config = Config(config_path=config_path)
+        assert config.log_segment_max_kb == 10240
+        assert config.log_segment_compression == "gzip"
+
+        with open(config_path, "w") as f:
+            yaml.dump({"log_segment_max_kb": 0, "log_segment_compression": "zstd"}, f)
+        config = Config(config_path=config_path)
+        assert config.log_segment_max_kb == 0
+        assert config.log_segment_compression == "zstd"
+
+        with open(config_path, "w") as f:
+            yaml.dump({"log_segment_max_kb": -1, "log_segment_compression": "lz4"}, f)
+        config = Config(config_path=config_path)
+        assert config.log_segment_max_kb == 10240
+        assert config.log_segment_compression == "gzip"
+
+
+def test_profiling_settings_and_overrides():
+    """Test request profiling settings, overridden like command-line flags do."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = Path(tmpdir) / "config.yml"
+        with open(config_path, "w") as f:
+            yaml.dump({"profile_every_n_requests": 50, "profile_max_dumps": 0}, f)
+        config = Config(config_path=config_path)
+        assert config.profile_every_n_requests == 50
+        assert config.profile_slow_request_ms == 0
+        assert config.profile_trace_memory is False
+        assert config.profile_max_dumps == 100
+
+        config.apply_overrides(
+            {
+                "profile_slow_request_ms": 500,
+                "profile_trace_memory": True,
+                "profile_every_n_requests": -1,
+            }
+        )
+        assert config.profile_slow_request_ms == 500
+        assert config.profile_trace_memory is True
+        # Invalid overrides are ignored
+        assert config.profile_every_n_requests == 50
@@ -0,0 +1,91 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for ContextResultCache.
+
+Tests memoized context result functionality including:
+- Hits when the version key is unchanged
+- Stale entries when the version key changes
+- LRU eviction when max entries reached
+- Statistics tracking
+"""
+
+from xfile_context.context_cache import AssembledContext, ContextResultCache
+
+
+def _assembled(text: str = "[Cross-File Context]") -> AssembledContext:
+    """Create a minimal AssembledContext for testing."""
+    return AssembledContext(context=text, warnings=[], token_count=3)
+
+
+class TestContextResultCache:
+    """Tests for ContextResultCache operations."""
+
+    def test_get_miss_on_empty_cache(self) -> None:
+        """Test that an empty cache returns None and counts a miss."""
+        cache = ContextResultCache()
+
+        assert cache.get("/a.py", (1,)) is None
+        stats = cache.get_statistics()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 0
+
+    def test_get_hit_with_same_key(self) -> None:
+        """Test that a matching key returns the stored entry."""
+        cache = ContextResultCache()
+        entry = _assembled()
+        cache.put("/a.py", (1, ("dep", 5)), entry)
+
+        assert cache.get("/a.py", (1, ("dep", 5))) is entry
+        stats = cache.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 1.0
+
+    def test_changed_key_is_stale(self) -> None:
+        """Test that a different key is a miss and drops the entry."""
+        cache = ContextResultCache()
+        cache.put("/a.py", (1,), _assembled())
+
+        assert cache.get("/a.py", (2,)) is None
+        stats = cache.get_statistics()
+        assert stats["stale"] == 1
+        assert stats["misses"] == 1
+        assert stats["entries"] == 0
+
+    def test_put_replaces_existing_entry(self) -> None:
+        """Test that storing again for a target replaces the previous entry."""
+        cache = ContextResultCache()
+        cache.put("/a.py", (1,), _assembled("old"))
+        new_entry = _assembled("new")
+        cache.put("/a.py", (2,), new_entry)
+
+        assert cache.get("/a.py", (2,)) is new_entry
+        assert cache.get_statistics()["entries"] == 1
+
+    def test_lru_eviction(self) -> None:
+        """Test that least recently used entries are evicted at the limit."""
+        cache = ContextResultCache(max_entries=2)
+        cache.put("/a.py", (1,), _assembled())
+        cache.put("/b.py", (1,), _assembled())
+
+        # Touch /a.py so /b.py becomes least recently used
+        assert cache.get("/a.py", (1,)) is not None
+        cache.put("/c.py", (1,), _assembled())
+
+        assert cache.get("/b.py", (1,)) is None
+        assert cache.get("/a.py", (1,)) is not None
+        assert cache.get("/c.py", (1,)) is not None
+        assert cache.get_statistics()["evictions"] == 1
+
+    def test_invalidate(self) -> None:
+        """Test dropping a single entry and all entries."""
+        cache = ContextResultCache()
+        cache.put("/a.py", (1,), _assembled())
+        cache.put("/b.py", (1,), _assembled())
+
+        cache.invalidate("/a.py")
+        assert cache.get("/a.py", (1,)) is None
+        assert cache.get_statistics()["entries"] == 1
+
+        cache.invalidate_all()
+        assert cache.get_statistics()["entries"] == 0
@@ -0,0 +1,109 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for EventCoalescer.
+
+Tests coalescing of raw file events including:
+- Net effect per path (create+modify, delete+create, modify+delete)
+- Trailing debounce window and maximum delay
+- First invalidating event per path
+"""
+
+from xfile_context.event_coalescer import (
+    EventCoalescer,
+    FileEvent,
+    FileEventType,
+    merge_event_types,
+)
+
+CREATED = FileEventType.CREATED
+MODIFIED = FileEventType.MODIFIED
+DELETED = FileEventType.DELETED
+
+
+class TestNetEffect:
+    """Tests for merging raw events per path."""
+
+    def _coalesce(self, *event_types: FileEventType) -> FileEventType:
+        coalescer = EventCoalescer()
+        for event_type in event_types:
+            coalescer.add("/p/a.py", event_type, now=0.0)
+        (event,) = coalescer.drain()
+        return event.event_type
+
+    def test_repeated_modifies_collapse(self) -> None:
+        """Test that repeated modify events become one modify."""
+        assert self._coalesce(MODIFIED, MODIFIED, MODIFIED) is MODIFIED
+
+    def test_create_then_modify_is_create(self) -> None:
+        """Test that a new file written in several steps is one create."""
+        assert self._coalesce(CREATED, MODIFIED, MODIFIED) is CREATED
+
+    def test_delete_then_create_is_modify(self) -> None:
+        """Test that a file replaced in place (e.g. by git) is one modify."""
+        assert self._coalesce(DELETED, CREATED, MODIFIED) is MODIFIED
+
+    def test_sequence_ending_in_delete_is_delete(self) -> None:
+        """Test that a file removed at the end of a burst is one delete."""
+        assert self._coalesce(MODIFIED, DELETED) is DELETED
+        assert self._coalesce(CREATED, MODIFIED, DELETED) is DELETED
+
+    def test_merge_across_batches(self) -> None:
+        """Test that events of separate batches merge like raw events."""
+        assert merge_event_types(DELETED, CREATED) is MODIFIED
+        assert merge_event_types(CREATED, MODIFIED) is CREATED
+        assert merge_event_types(MODIFIED, DELETED) is DELETED
+
+    def test_events_released_in_first_seen_order(self) -> None:
+        """Test that a batch keeps the order in which paths first changed."""
+        coalescer = EventCoalescer()
+        coalescer.add("/p/b.py", MODIFIED, now=0.0)
+        coalescer.add("/p/a.py", CREATED, now=0.0)
+        coalescer.add("/p/b.py", MODIFIED, now=0.0)
+
+        assert coalescer.drain() == [
+            FileEvent("/p/b.py", MODIFIED),
+            FileEvent("/p/a.py", CREATED),
+        ]
+        stats = coalescer.get_statistics()
+        assert stats["raw_events"] == 3
+        assert stats["released_events"] == 2
+        assert stats["pending"] == 0
+
+
+class TestDebounce:
+    """Tests for the debounce window."""
+
+    def test_held_until_quiet(self) -> None:
+        """Test that events are released only after the window without events."""
+        coalescer = EventCoalescer(window=0.1)
+        coalescer.add("/p/a.py", MODIFIED, now=0.0)
+        coalescer.add("/p/b.py", MODIFIED, now=0.08)
+
+        assert coalescer.drain_ready(now=0.15) == []
+        assert len(coalescer.drain_ready(now=0.2)) == 2
+        assert coalescer.pending == 0
+
+    def test_max_delay_releases_continuous_burst(self) -> None:
+        """Test that a burst that never goes quiet is released after max_delay."""
+        coalescer = EventCoalescer(window=0.1, max_delay=0.5)
+        for i in range(10):
+            coalescer.add(f"/p/{i}.py", CREATED, now=i * 0.05)
+
+        assert coalescer.drain_ready(now=0.49) == []
+        assert len(coalescer.drain_ready(now=0.5)) == 10
+
+    def test_first_invalidating_event_reported_once(self) -> None:
+        """Test that only the first modify/delete per existing path invalidates."""
+        coalescer = EventCoalescer(window=0.1)
+
+        assert coalescer.add("/p/a.py", MODIFIED, now=0.0) is True
+        assert coalescer.add("/p/a.py", MODIFIED, now=0.0) is False
+        assert coalescer.add("/p/a.py", DELETED, now=0.0) is False
+
+        # Files created in the batch have nothing cached to invalidate
+        assert coalescer.add("/p/new.py", CREATED, now=0.0) is False
+        assert coalescer.add("/p/new.py", MODIFIED, now=0.0) is False
+
+        coalescer.drain()
+        assert coalescer.add("/p/a.py", MODIFIED, now=1.0) is True
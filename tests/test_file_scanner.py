@@ -0,0 +1,116 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for the pruning directory walk.
+
+Tests file discovery including:
+- Pruning of ignored directories before descending
+- Skipped files and walk statistics
+- Serial and parallel scanning yielding the same files
+- Symlinked directories and unreadable entries
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from xfile_context.file_scanner import scan_files
+from xfile_context.file_watcher import FileWatcher
+
+
+def _touch(root: Path, *paths: str) -> None:
+    for rel in paths:
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n")
+
+
+def _scan(watcher: FileWatcher, root: Path, max_workers: int = 1):
+    return scan_files(
+        str(root),
+        should_ignore_dir=watcher.should_ignore_dir,
+        should_ignore_file=watcher.should_ignore,
+        extensions=(".py",),
+        max_workers=max_workers,
+    )
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    (tmp_path / ".gitignore").write_text("generated/\n*_pb2.py\n")
+    _touch(
+        tmp_path,
+        "main.py",
+        "README.md",
+        "pkg/__init__.py",
+        "pkg/core.py",
+        "pkg/api_pb2.py",
+        "pkg/sub/deep.py",
+        ".venv/lib/site-packages/requests/api.py",
+        "node_modules/lib/index.py",
+        "generated/models.py",
+    )
+    return tmp_path
+
+
+class TestScanFiles:
+    """Tests for scan_files()."""
+
+    def test_prunes_ignored_directories(self, project: Path) -> None:
+        """Test that only non-ignored files are found and ignored trees are skipped."""
+        watcher = FileWatcher(project_root=str(project))
+        visited = []
+
+        def should_ignore_dir(path: str) -> bool:
+            visited.append(os.path.relpath(path, project))
+            return watcher.should_ignore_dir(path)
+
+        result = scan_files(
+            str(project),
+            should_ignore_dir=should_ignore_dir,
+            should_ignore_file=watcher.should_ignore,
+            extensions=(".py",),
+        )
+
+        assert [os.path.relpath(f, project) for f in result.files] == [
+            "main.py",
+            os.path.join("pkg", "__init__.py"),
+            os.path.join("pkg", "core.py"),
+            os.path.join("pkg", "sub", "deep.py"),
+        ]
+        assert result.directories_pruned == 3  # .venv, node_modules, generated
+        assert result.files_skipped == 1  # api_pb2.py
+        assert result.directories_scanned == 3  # root, pkg, pkg/sub
+        # Nothing below a pruned directory is looked at
+        assert not any(path.startswith(".venv" + os.sep) for path in visited)
+
+    def test_parallel_scan_matches_serial(self, project: Path) -> None:
+        """Test that the thread pool walk finds the same files."""
+        watcher = FileWatcher(project_root=str(project))
+
+        serial = _scan(watcher, project)
+        parallel = _scan(watcher, project, max_workers=4)
+
+        assert parallel.files == serial.files
+        assert parallel.directories_scanned == serial.directories_scanned
+        assert parallel.directories_pruned == serial.directories_pruned
+
+    def test_symlinked_directories_not_followed(self, tmp_path: Path) -> None:
+        """Test that directory symlinks are not descended into (no cycles)."""
+        _touch(tmp_path, "pkg/a.py")
+        (tmp_path / "pkg" / "loop").symlink_to(tmp_path, target_is_directory=True)
+        watcher = FileWatcher(project_root=str(tmp_path))
+
+        result = _scan(watcher, tmp_path)
+
+        assert result.files == [str(tmp_path / "pkg" / "a.py")]
+
+    def test_missing_root(self, tmp_path: Path) -> None:
+        """Test that an unreadable directory yields no files instead of an error."""
+        watcher = FileWatcher(project_root=str(tmp_path))
+
+        result = _scan(watcher, tmp_path / "missing")
+
+        assert result.files == []
+        assert result.directories_scanned == 1
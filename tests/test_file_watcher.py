@@ -6,7 +6,9 @@
 import time
 
 import pytest
+from watchdog.events import FileModifiedEvent
 
+from xfile_context.event_coalescer import FileEvent, FileEventType
 from xfile_context.file_watcher import FileWatcher
 
 
@@ -160,6 +162,19 @@ temp_*
         # Test non-ignored files
         assert not watcher.should_ignore(str(tmp_path / "src" / "main.py"))
 
+    def test_gitignore_change_reloads_rules(self, tmp_path):
+        """Test that an edited .gitignore applies to subsequent events."""
+        watcher = FileWatcher(project_root=str(tmp_path))
+        target = str(tmp_path / "generated.py")
+        assert not watcher.should_ignore(target)
+
+        gitignore = tmp_path / ".gitignore"
+        gitignore.write_text("generated.py\n")
+        watcher._event_handler.on_modified(FileModifiedEvent(str(gitignore)))
+
+        assert watcher.should_ignore(target)
+        assert watcher._gitignore_patterns == ["generated.py"]
+
     def test_is_supported_file(self, tmp_path):
         """Test extension-based file filtering."""
         watcher = FileWatcher(project_root=str(tmp_path))
@@ -217,6 +232,87 @@ temp_*
         assert timestamp2 > timestamp  # Last write wins
         assert before2 <= timestamp2 <= after2
 
+    def test_wait_for_changes(self, tmp_path):
+        """Test that timestamp updates wake a waiting consumer once."""
+        watcher = FileWatcher(project_root=str(tmp_path))
+
+        assert watcher.wait_for_changes(timeout=0.01) is False
+
+        watcher.update_timestamp(str(tmp_path / "a.py"))
+        watcher.update_timestamp(str(tmp_path / "b.py"))
+
+        assert watcher.wait_for_changes(timeout=0.01) is True
+        assert watcher.wait_for_changes(timeout=0.01) is False
+
+    def test_debounced_events_published_as_one_batch(self, tmp_path):
+        """Test that debounced events update timestamps only when flushed."""
+        watcher = FileWatcher(project_root=str(tmp_path), debounce_window=10.0)
+        a_file = str(tmp_path / "a.py")
+        b_file = str(tmp_path / "b.py")
+
+        watcher.record_event(a_file, FileEventType.MODIFIED)
+        watcher.record_event(a_file, FileEventType.MODIFIED)
+        watcher.record_event(b_file, FileEventType.CREATED)
+
+        assert watcher.get_timestamp(a_file) is None
+        assert watcher.wait_for_changes(timeout=0.01) is False
+
+        batch = watcher.flush()
+
+        assert [event.path for event in batch] == [a_file, b_file]
+        assert watcher.get_timestamp(a_file) == watcher.get_timestamp(b_file)
+        assert watcher.wait_for_changes(timeout=0.01) is True
+        stats = watcher.get_statistics()
+        assert stats["raw_events"] == 3
+        assert stats["batches"] == 1
+        assert stats["invalidations"] == 1
+
+    def test_drain_published(self, tmp_path):
+        """Test that published events are handed over once and timestamps are kept."""
+        watcher = FileWatcher(project_root=str(tmp_path), debounce_window=10.0)
+        a_file = str(tmp_path / "a.py")
+        b_file = str(tmp_path / "b.py")
+
+        watcher.record_event(b_file, FileEventType.MODIFIED)
+        watcher.flush()
+        watcher.record_event(a_file, FileEventType.CREATED)
+        watcher.record_event(b_file, FileEventType.MODIFIED)
+
+        # Events still held back by the debounce window are not handed over
+        assert watcher.drain_published() == [FileEvent(b_file, FileEventType.MODIFIED)]
+        assert watcher.drain_published() == []
+
+        watcher.flush()
+
+        assert watcher.drain_published() == [
+            FileEvent(a_file, FileEventType.CREATED),
+            FileEvent(b_file, FileEventType.MODIFIED),
+        ]
+        assert watcher.drain_published() == []
+        assert watcher.get_timestamp(a_file) is not None
+        assert watcher.get_timestamp(b_file) is not None
+
+    def test_drain_published_merges_batches(self, tmp_path):
+        """Test that a delete and re-create published separately are one modify."""
+        watcher = FileWatcher(project_root=str(tmp_path))
+        a_file = str(tmp_path / "a.py")
+
+        watcher.record_event(a_file, FileEventType.DELETED)
+        watcher.record_event(a_file, FileEventType.CREATED)
+
+        assert watcher.get_statistics()["batches"] == 2
+        assert watcher.drain_published() == [FileEvent(a_file, FileEventType.MODIFIED)]
+
+    def test_stop_publishes_pending_events(self, tmp_path):
+        """Test that events still inside the window are not lost on stop."""
+        watcher = FileWatcher(project_root=str(tmp_path), debounce_window=10.0)
+        watcher.start()
+        watcher.record_event(str(tmp_path / "a.py"), FileEventType.MODIFIED)
+
+        watcher.stop()
+
+        assert watcher.get_timestamp(str(tmp_path / "a.py")) is not None
+
     def test_start_and_stop(self, tmp_path):
         """Test starting and stopping the file watcher."""
         watcher = FileWatcher(project_root=str(tmp_path))
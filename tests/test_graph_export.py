@@ -0,0 +1,236 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for paged and streaming relationship graph export.
+
+Tests export_relationship_page() and export_graph_ndjson() including:
+- Cursor pagination covering every relationship exactly once
+- Directory prefix, relationship type and neighborhood filters
+- Cursor validation
+- NDJSON records matching the full export, with and without gzip
+"""
+
+import gzip
+import json
+from pathlib import Path
+
+import pytest
+
+from xfile_context.graph_export import (
+    export_graph_ndjson,
+    export_relationship_page,
+    iter_graph_records,
+    write_ndjson,
+)
+from xfile_context.models import FileMetadata, Relationship, RelationshipGraph, RelationshipType
+
+
+def _add(graph: RelationshipGraph, source: str, target: str, rel_type: str, line: int = 1) -> None:
+    graph.add_relationship(
+        Relationship(
+            source_file=source,
+            target_file=target,
+            relationship_type=rel_type,
+            line_number=line,
+        )
+    )
+
+
+@pytest.fixture
+def graph() -> RelationshipGraph:
+    """Graph with files under /p/src, /p/src/app, /p/src/application and /p/tests."""
+    graph = RelationshipGraph()
+    _add(graph, "/p/src/app/views.py", "/p/src/app/models.py", RelationshipType.IMPORT)
+    _add(graph, "/p/src/app/views.py", "/p/src/app/models.py", RelationshipType.FUNCTION_CALL, 5)
+    _add(graph, "/p/src/app/models.py", "/p/src/db.py", RelationshipType.IMPORT)
+    _add(graph, "/p/src/application/main.py", "/p/src/app/views.py", RelationshipType.IMPORT)
+    _add(graph, "/p/src/db.py", "/p/src/config.py", RelationshipType.IMPORT)
+    _add(graph, "/p/tests/test_views.py", "/p/src/app/views.py", RelationshipType.IMPORT)
+    _add(graph, "/p/tests/test_views.py", "/p/tests/base.py", RelationshipType.CLASS_INHERITANCE, 3)
+    graph.set_file_metadata(
+        "/p/src/app/views.py",
+        FileMetadata(
+            filepath="/p/src/app/views.py",
+            last_analyzed=0.0,
+            relationship_count=2,
+            has_dynamic_patterns=False,
+            dynamic_pattern_types=[],
+            is_unparseable=False,
+        ),
+    )
+    return graph
+
+
+def _pairs(page):
+    return [(r["source_file"], r["target_file"], r["line_number"]) for r in page["relationships"]]
+
+
+def _all_pages(graph, **kwargs):
+    pages = [export_relationship_page(graph, **kwargs)]
+    while pages[-1]["next_cursor"]:
+        pages.append(export_relationship_page(graph, cursor=pages[-1]["next_cursor"], **kwargs))
+    return pages
+
+
+class TestPagination:
+    """Tests for cursor pagination."""
+
+    @pytest.mark.parametrize("limit", [1, 2, 3, 7, 100])
+    def test_pages_cover_graph_once(self, graph, limit) -> None:
+        """Test that paging returns every relationship once, ordered by source."""
+        pages = _all_pages(graph, limit=limit)
+
+        exported = [pair for page in pages for pair in _pairs(page)]
+        assert len(exported) == 7
+        assert sorted(exported) == sorted(
+            (r.source_file, r.target_file, r.line_number) for r in graph.get_all_relationships()
+        )
+        assert [source for source, _, _ in exported] == sorted(s for s, _, _ in exported)
+        assert all(len(page["relationships"]) <= limit for page in pages)
+        # The last page is only followed by a cursor if more relationships exist
+        assert len(pages) == -(-7 // limit)
+
+    def test_page_contents(self, graph) -> None:
+        """Test file entries and metadata of a page."""
+        page = export_relationship_page(graph, limit=2, project_root="/p")
+
+        assert _pairs(page) == [
+            ("/p/src/app/models.py", "/p/src/db.py", 1),
+            ("/p/src/app/views.py", "/p/src/app/models.py", 1),
+        ]
+        # Only sources with metadata get a file entry
+        assert [f["relative_path"] for f in page["files"]] == ["src/app/views.py"]
+        assert page["metadata"]["page_size"] == 2
+        assert page["metadata"]["total_relationships"] == 7
+        assert page["metadata"]["generation"] == graph.get_generation()
+
+    def test_cursor_survives_changes_to_other_files(self, graph) -> None:
+        """Test that a cursor resumes by position after unrelated changes."""
+        first = export_relationship_page(graph, limit=3)
+        graph.remove_relationships_for_file("/p/src/app/models.py")
+        _add(graph, "/p/a.py", "/p/b.py", RelationshipType.IMPORT)
+
+        rest = export_relationship_page(graph, limit=100, cursor=first["next_cursor"])
+
+        assert _pairs(rest) == [
+            ("/p/src/application/main.py", "/p/src/app/views.py", 1),
+            ("/p/src/db.py", "/p/src/config.py", 1),
+            ("/p/tests/test_views.py", "/p/src/app/views.py", 1),
+            ("/p/tests/test_views.py", "/p/tests/base.py", 3),
+        ]
+
+
+class TestFilters:
+    """Tests for page filters."""
+
+    def test_path_prefix_is_a_directory(self, graph) -> None:
+        """Test that the prefix matches whole directory names."""
+        page = export_relationship_page(graph, path_prefix="/p/src/app")
+
+        assert {source for source, _, _ in _pairs(page)} == {
+            "/p/src/app/models.py",
+            "/p/src/app/views.py",
+        }
+
+    def test_relationship_types(self, graph) -> None:
+        """Test filtering by relationship type across pages."""
+        pages = _all_pages(
+            graph,
+            limit=1,
+            relationship_types=[RelationshipType.FUNCTION_CALL, RelationshipType.CLASS_INHERITANCE],
+        )
+
+        assert [pair for page in pages for pair in _pairs(page)] == [
+            ("/p/src/app/views.py", "/p/src/app/models.py", 5),
+            ("/p/tests/test_views.py", "/p/tests/base.py", 3),
+        ]
+
+    def test_neighborhood(self, graph) -> None:
+        """Test that only relationships between files within k hops are exported."""
+        one_hop = export_relationship_page(graph, around_file="/p/src/app/models.py", hops=1)
+        two_hops = export_relationship_page(graph, around_file="/p/src/app/models.py", hops=2)
+
+        assert sorted(_pairs(one_hop)) == [
+            ("/p/src/app/models.py", "/p/src/db.py", 1),
+            ("/p/src/app/views.py", "/p/src/app/models.py", 1),
+            ("/p/src/app/views.py", "/p/src/app/models.py", 5),
+        ]
+        assert len(two_hops["relationships"]) == 6  # all but tests/base.py
+        assert export_relationship_page(graph, around_file="/p/unknown.py")["relationships"] == []
+
+
+class TestValidation:
+    """Tests for parameter and cursor validation."""
+
+    def test_invalid_parameters(self, graph) -> None:
+        """Test that out-of-range parameters are rejected."""
+        with pytest.raises(ValueError, match="limit"):
+            export_relationship_page(graph, limit=0)
+        with pytest.raises(ValueError, match="hops"):
+            export_relationship_page(graph, around_file="/p/src/db.py", hops=-1)
+        with pytest.raises(ValueError, match="Unknown relationship types: calls"):
+            export_relationship_page(graph, relationship_types=["calls"])
+
+    def test_invalid_cursor(self, graph) -> None:
+        """Test that malformed cursors and cursors for other filters are rejected."""
+        cursor = export_relationship_page(graph, limit=1)["next_cursor"]
+
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            export_relationship_page(graph, cursor="not a cursor")
+        with pytest.raises(ValueError, match="different filters"):
+            export_relationship_page(graph, cursor=cursor, path_prefix="/p/src")
+
+
+class TestStreamingExport:
+    """Tests for the streaming NDJSON export."""
+
+    def test_records_match_full_export(self, graph) -> None:
+        """Test that the records carry the same content as export_to_dict()."""
+        records = list(iter_graph_records(graph, project_root="/p"))
+        full = graph.export_to_dict(project_root="/p")
+
+        assert [r["record"] for r in records] == (
+            ["metadata", "file"] + ["relationship"] * 7 + ["graph_metadata"]
+        )
+
+        def strip(record):
+            return {k: v for k, v in record.items() if k not in ("record", "timestamp")}
+
+        expected_metadata = {k: v for k, v in full["metadata"].items() if k != "timestamp"}
+        assert strip(records[0]) == expected_metadata
+        assert strip(records[1]) == full["files"][0]
+        assert [strip(r) for r in records[2:-1]] == full["relationships"]
+        assert strip(records[-1]) == full["graph_metadata"]
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_export_file(self, graph, tmp_path: Path, compress: bool) -> None:
+        """Test writing an export file and reading it back line by line."""
+        summary = export_graph_ndjson(graph, tmp_path / "exports", "/p", compress=compress)
+
+        path = Path(summary["path"])
+        assert path.parent == tmp_path / "exports"
+        assert path.name.endswith(".ndjson.gz" if compress else ".ndjson")
+        assert summary["files"] == 1
+        assert summary["relationships"] == 7
+        assert summary["records"] == 10
+        assert summary["bytes"] == path.stat().st_size
+        assert summary["compressed"] is compress
+
+        opener = gzip.open if compress else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            lines = [json.loads(line) for line in f]
+        assert lines[0]["total_relationships"] == 7
+        assert sum(1 for line in lines if line["record"] == "relationship") == 7
+
+    def test_failed_export_leaves_no_file(self, tmp_path: Path) -> None:
+        """Test that an error while writing removes the partial file."""
+
+        def records():
+            yield {"record": "metadata"}
+            raise RuntimeError("graph changed")
+
+        path = tmp_path / "graph.ndjson"
+        with pytest.raises(RuntimeError):
+            write_ndjson(records(), path)
+
+        assert list(tmp_path.iterdir()) == []
@@ -19,10 +19,20 @@ from unittest.mock import MagicMock, Mock
 import pytest
 
 from xfile_context.analyzers.python_analyzer import PythonAnalyzer
+from xfile_context.detectors import ImportDetector
 from xfile_context.detectors.registry import DetectorRegistry
+from xfile_context.event_coalescer import FileEventType
 from xfile_context.file_watcher import FileWatcher
 from xfile_context.graph_updater import GraphUpdater
-from xfile_context.models import FileMetadata, Relationship, RelationshipGraph, RelationshipType
+from xfile_context.models import (
+    FileMetadata,
+    FileSymbolData,
+    ReferenceType,
+    Relationship,
+    RelationshipGraph,
+    RelationshipType,
+    SymbolReference,
+)
 
 
 @pytest.fixture
@@ -162,6 +172,34 @@ class TestUpdateOnModify:
         assert success is True
         assert elapsed < 0.2, f"Update took {elapsed*1000:.1f}ms (target: <200ms)"
 
+    def test_modification_rebuilds_dependent_relationships(
+        self, graph, file_watcher, temp_project_dir
+    ):
+        """Test that dependents keep their relationships to a modified file."""
+        registry = DetectorRegistry()
+        registry.register(ImportDetector())
+        analyzer = PythonAnalyzer(graph=graph, detector_registry=registry)
+
+        utils = temp_project_dir / "utils.py"
+        utils.write_text("def helper():\n    return 1\n")
+        main = temp_project_dir / "main.py"
+        main.write_text("from utils import helper\n\nhelper()\n")
+
+        _, _, builder = analyzer.analyze_project_two_phase([str(utils), str(main)])
+        updater = GraphUpdater(
+            graph=graph,
+            analyzer=analyzer,
+            file_watcher=file_watcher,
+            relationship_builder=builder,
+        )
+        assert graph.get_dependents(str(utils))
+
+        utils.write_text("def helper():\n    return 2\n\n\ndef other():\n    pass\n")
+        assert updater.update_on_modify(str(utils)) is True
+
+        dependents = {rel.source_file for rel in graph.get_dependents(str(utils))}
+        assert dependents == {str(main)}
+
 
 class TestUpdateOnDelete:
     """Test file deletion updates."""
@@ -502,10 +540,10 @@ class TestProcessPendingChanges:
         )
         graph.set_file_metadata(file3_path, metadata3)
 
-        # Add timestamps for all files
-        file_watcher.file_event_timestamps[str(file1)] = time.time()
-        file_watcher.file_event_timestamps[str(file2)] = time.time()
-        file_watcher.file_event_timestamps[file3_path] = time.time()
+        # Record events for all files
+        file_watcher.record_event(str(file1), FileEventType.MODIFIED)
+        file_watcher.record_event(str(file2), FileEventType.CREATED)
+        file_watcher.record_event(file3_path, FileEventType.DELETED)
 
         # Process changes
         stats = updater.process_pending_changes()
@@ -518,8 +556,29 @@ class TestProcessPendingChanges:
         assert stats["failed"] == 0
         assert stats["elapsed_ms"] > 0
 
-        # Verify timestamps cleared
-        assert len(file_watcher.file_event_timestamps) == 0
+        # Verify events are processed once; timestamps are kept for the cache
+        assert len(file_watcher.file_event_timestamps) == 3
+        assert updater.process_pending_changes()["total"] == 0
+
+    def test_event_types_decide_classification(
+        self, updater, graph, file_watcher, temp_project_dir
+    ):
+        """Test that published event types are used instead of the file's current state."""
+        module = temp_project_dir / "module.py"
+        module.write_text("x = 1\n")
+        assert updater.update_on_create(str(module)) is True
+
+        # Replaced in place: deleted and re-created in separate batches
+        file_watcher.record_event(str(module), FileEventType.DELETED)
+        file_watcher.record_event(str(module), FileEventType.CREATED)
+        stats = updater.process_pending_changes()
+        assert (stats["modified"], stats["created"], stats["deleted"]) == (1, 0, 0)
+
+        # Deleted and re-created after the delete was published
+        file_watcher.record_event(str(module), FileEventType.DELETED)
+        stats = updater.process_pending_changes()
+        assert (stats["modified"], stats["created"], stats["deleted"]) == (0, 0, 1)
+        assert graph.get_file_metadata(str(module)).deleted is True
 
     def test_process_empty_changes(self, updater, file_watcher):
         """Test processing when no changes pending."""
@@ -534,6 +593,78 @@ class TestProcessPendingChanges:
         assert stats["failed"] == 0
 
 
+class TestProcessBatch:
+    """Test the batched update pipeline."""
+
+    def test_batch_keeps_dependent_relationships(self, graph, file_watcher, temp_project_dir):
+        """Test that a batch rebuilds changed files and files depending on them."""
+        registry = DetectorRegistry()
+        registry.register(ImportDetector())
+        analyzer = PythonAnalyzer(graph=graph, detector_registry=registry)
+
+        base = temp_project_dir / "base.py"
+        base.write_text("def helper():\n    return 1\n")
+        mid = temp_project_dir / "mid.py"
+        mid.write_text("from base import helper\n")
+        app = temp_project_dir / "app.py"
+        app.write_text("from mid import helper\n")
+        old = temp_project_dir / "old.py"
+        old.write_text("from base import helper\n")
+
+        files = [str(base), str(mid), str(app), str(old)]
+        _, _, builder = analyzer.analyze_project_two_phase(files)
+        updater = GraphUpdater(
+            graph=graph,
+            analyzer=analyzer,
+            file_watcher=file_watcher,
+            relationship_builder=builder,
+        )
+
+        base.write_text("def helper():\n    return 2\n")
+        mid.write_text("from base import helper\n\nX = 1\n")
+        old.unlink()
+        stats = updater.process_batch([str(base), str(mid), str(old)])
+
+        assert stats["modified"] == 2
+        assert stats["deleted"] == 1
+        assert stats["failed"] == 0
+        assert set(stats["timings_ms"]) == {"classify", "extract", "remove", "build"}
+
+        # app.py is outside the batch but keeps its edge to mid.py
+        assert {rel.source_file for rel in graph.get_dependents(str(mid))} == {str(app)}
+        assert {rel.source_file for rel in graph.get_dependents(str(base))} == {str(mid)}
+        assert graph.get_dependencies(str(old)) == []
+        assert graph.get_file_metadata(str(old)).deleted is True
+
+    def test_dependency_order(self):
+        """Test that dependencies inside a batch are ordered before dependents."""
+
+        def symbols(filepath: str, *targets: str) -> FileSymbolData:
+            references = [
+                SymbolReference(
+                    name="x",
+                    reference_type=ReferenceType.IMPORT,
+                    line_number=1,
+                    resolved_module=target,
+                )
+                for target in targets
+            ]
+            return FileSymbolData(
+                filepath=filepath, definitions=[], references=references, parse_time=0.0
+            )
+
+        order = GraphUpdater._dependency_order(
+            ["/p/app.py", "/p/mid.py", "/p/base.py"],
+            {
+                "/p/app.py": symbols("/p/app.py", "/p/mid.py"),
+                "/p/mid.py": symbols("/p/mid.py", "/p/base.py", "/p/outside.py"),
+                "/p/base.py": None,
+            },
+        )
+
+        assert order == ["/p/base.py", "/p/mid.py", "/p/app.py"]
+
+
 class TestAtomicUpdates:
     """Test atomic update guarantees."""
 
@@ -0,0 +1,201 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for IgnoreMatcher.
+
+Tests compiled ignore-pattern matching including:
+- Gitignore semantics (negation, anchoring, directory-only, **, classes)
+- Nested .gitignore files
+- Name and glob patterns
+- Reloading after .gitignore changes
+"""
+
+import pytest
+
+from xfile_context.ignore_matcher import IgnoreMatcher, translate_gitignore_pattern
+
+
+def _matcher(tmp_path, gitignore: str, **kwargs) -> IgnoreMatcher:
+    (tmp_path / ".gitignore").write_text(gitignore)
+    return IgnoreMatcher(project_root=str(tmp_path), **kwargs)
+
+
+class TestGitignoreSemantics:
+    """Tests for gitignore pattern semantics."""
+
+    @pytest.mark.parametrize(
+        "pattern,path,ignored",
+        [
+            # Unanchored patterns match a name at any depth
+            ("*.log", "debug.log", True),
+            ("*.log", "a/b/debug.log", True),
+            ("temp_*", "src/temp_file.py", True),
+            # "*" and "?" do not cross directories
+            ("src/*.py", "src/a.py", True),
+            ("src/*.py", "src/sub/a.py", False),
+            ("mod?.py", "mod1.py", True),
+            ("mod?.py", "mod10.py", False),
+            # A slash at the start or in the middle anchors the pattern
+            ("/config.py", "config.py", True),
+            ("/config.py", "pkg/config.py", False),
+            ("pkg/gen", "pkg/gen/a.py", True),
+            ("pkg/gen", "other/pkg/gen/a.py", False),
+            # "**" matches any number of directories
+            ("**/fixtures", "a/b/fixtures/x.py", True),
+            ("docs/**/*.py", "docs/conf.py", True),
+            ("docs/**/*.py", "docs/a/b/conf.py", True),
+            ("out/**", "out/a/b.py", True),
+            # Character classes
+            ("file[0-9].py", "file3.py", True),
+            ("file[!0-9].py", "file3.py", False),
+            ("file[!0-9].py", "filex.py", True),
+            # Escapes
+            ("\\#notes.py", "#notes.py", True),
+        ],
+    )
+    def test_pattern(self, tmp_path, pattern, path, ignored) -> None:
+        """Test single patterns against relative paths."""
+        matcher = _matcher(tmp_path, pattern + "\n")
+
+        assert matcher.should_ignore(str(tmp_path / path)) is ignored
+
+    def test_directory_only_pattern(self, tmp_path) -> None:
+        """Test that "name/" matches directories but not files."""
+        matcher = _matcher(tmp_path, "build/\n")
+
+        assert matcher.should_ignore(str(tmp_path / "build" / "output.py"))
+        assert matcher.should_ignore(str(tmp_path / "src" / "build" / "output.py"))
+        assert not matcher.should_ignore(str(tmp_path / "build"))
+
+    def test_negation_last_match_wins(self, tmp_path) -> None:
+        """Test that a later negated pattern re-includes a file."""
+        matcher = _matcher(tmp_path, "*.py\n!keep.py\nkeep.py\n!keep_me.py\n")
+
+        assert matcher.should_ignore(str(tmp_path / "a.py"))
+        assert matcher.should_ignore(str(tmp_path / "keep.py"))
+        assert not matcher.should_ignore(str(tmp_path / "keep_me.py"))
+
+    def test_negation_cannot_reinclude_inside_ignored_directory(self, tmp_path) -> None:
+        """Test that files below an ignored directory stay ignored."""
+        matcher = _matcher(tmp_path, "vendor/\n!vendor/keep.py\n/lib/*\n!/lib/keep.py\n")
+
+        assert matcher.should_ignore(str(tmp_path / "vendor" / "keep.py"))
+        # The directory itself is not ignored, only its contents
+        assert matcher.should_ignore(str(tmp_path / "lib" / "other.py"))
+        assert not matcher.should_ignore(str(tmp_path / "lib" / "keep.py"))
+
+    def test_empty_pattern_ignored(self) -> None:
+        """Test that patterns matching nothing are dropped."""
+        assert translate_gitignore_pattern("/") is None
+        assert translate_gitignore_pattern("!") is None
+
+
+class TestNestedGitignore:
+    """Tests for .gitignore files in subdirectories."""
+
+    def test_nested_rules_relative_to_their_directory(self, tmp_path) -> None:
+        """Test that nested patterns are anchored at their own directory."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / ".gitignore").write_text("/generated.py\n*.tmp.py\n")
+        matcher = _matcher(tmp_path, "")
+
+        assert matcher.should_ignore(str(tmp_path / "pkg" / "generated.py"))
+        assert matcher.should_ignore(str(tmp_path / "pkg" / "sub" / "x.tmp.py"))
+        assert not matcher.should_ignore(str(tmp_path / "generated.py"))
+        assert not matcher.should_ignore(str(tmp_path / "pkg" / "sub" / "generated.py"))
+
+    def test_nested_rules_take_precedence(self, tmp_path) -> None:
+        """Test that a deeper .gitignore overrides the root one."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / ".gitignore").write_text("!important.log\n")
+        matcher = _matcher(tmp_path, "*.log\n")
+
+        assert matcher.should_ignore(str(tmp_path / "important.log"))
+        assert not matcher.should_ignore(str(tmp_path / "pkg" / "important.log"))
+        assert matcher.should_ignore(str(tmp_path / "pkg" / "other.log"))
+
+    def test_nested_disabled(self, tmp_path) -> None:
+        """Test that nested files can be disabled."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / ".gitignore").write_text("*.py\n")
+        matcher = _matcher(tmp_path, "", nested_gitignores=False)
+
+        assert not matcher.should_ignore(str(tmp_path / "pkg" / "a.py"))
+
+    def test_reload(self, tmp_path) -> None:
+        """Test that memoised results are dropped on reload."""
+        (tmp_path / "pkg").mkdir()
+        matcher = _matcher(tmp_path, "")
+        target = str(tmp_path / "pkg" / "a.py")
+        assert not matcher.should_ignore(target)
+
+        (tmp_path / "pkg" / ".gitignore").write_text("a.py\n")
+        assert not matcher.should_ignore(target)  # memoised
+
+        matcher.reload(str(tmp_path / "pkg" / ".gitignore"))
+        assert matcher.should_ignore(target)
+
+        (tmp_path / ".gitignore").write_text("pkg/\n")
+        matcher.reload(str(tmp_path / ".gitignore"))
+        assert matcher.root_rules.patterns == ["pkg/"]
+        assert matcher.should_ignore(str(tmp_path / "pkg" / "b.py"))
+
+
+class TestDirectoryChecks:
+    """Tests for should_ignore_dir()."""
+
+    def test_should_ignore_dir(self, tmp_path) -> None:
+        """Test directory checks with name, gitignore and glob patterns."""
+        matcher = _matcher(
+            tmp_path,
+            "build/\n/logs\n",
+            name_patterns={".venv"},
+            glob_patterns={"vendor/*"},
+        )
+
+        assert matcher.should_ignore_dir(str(tmp_path / ".venv"))
+        assert matcher.should_ignore_dir(str(tmp_path / "src" / "build"))
+        assert matcher.should_ignore_dir(str(tmp_path / "src" / "build" / "sub"))
+        assert matcher.should_ignore_dir(str(tmp_path / "logs"))
+        assert not matcher.should_ignore_dir(str(tmp_path / "src" / "logs"))
+        # Glob patterns apply to files only
+        assert not matcher.should_ignore_dir(str(tmp_path / "vendor" / "lib"))
+        # The project root itself is never ignored
+        assert not matcher.should_ignore_dir(str(tmp_path))
+
+
+class TestNameAndGlobPatterns:
+    """Tests for component and glob patterns."""
+
+    def test_name_patterns_match_any_component(self, tmp_path) -> None:
+        """Test that name patterns match directories and file names."""
+        matcher = IgnoreMatcher(
+            project_root=str(tmp_path),
+            name_patterns={"node_modules", "*.egg-info"},
+            sensitive_patterns={"*.pem"},
+        )
+
+        assert matcher.should_ignore(str(tmp_path / "node_modules" / "a" / "index.js"))
+        assert matcher.should_ignore(str(tmp_path / "web" / "node_modules" / "x.py"))
+        assert matcher.should_ignore(str(tmp_path / "foo.egg-info" / "PKG-INFO"))
+        assert matcher.should_ignore(str(tmp_path / "certs" / "server.pem"))
+        assert not matcher.should_ignore(str(tmp_path / "src" / "node_modules.py"))
+
+    def test_only_path_below_project_root_is_matched(self, tmp_path) -> None:
+        """Test that components of the project root itself are not matched."""
+        root = tmp_path / "build" / "project"
+        root.mkdir(parents=True)
+        matcher = IgnoreMatcher(project_root=str(root), name_patterns={"build"})
+
+        assert not matcher.should_ignore(str(root / "main.py"))
+        assert matcher.should_ignore("/elsewhere/build/main.py")
+
+    def test_glob_patterns(self, tmp_path) -> None:
+        """Test fnmatch globs against the relative path and the file name."""
+        matcher = IgnoreMatcher(
+            project_root=str(tmp_path), glob_patterns={"generated/**/*.py", "*.tmp"}
+        )
+
+        assert matcher.should_ignore(str(tmp_path / "generated" / "api" / "models.py"))
+        assert matcher.should_ignore(str(tmp_path / "a" / "b.tmp"))
+        assert not matcher.should_ignore(str(tmp_path / "src" / "main.py"))
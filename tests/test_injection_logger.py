@@ -14,15 +14,21 @@ Tests cover TDD Section 3.8.5 requirements:
 """
 
 import json
+import threading
+import time
 from pathlib import Path
+from typing import List
 
 import pytest
 
+import xfile_context.injection_logger as injection_logger_module
+from xfile_context.async_log_writer import LogWritePolicy
 from xfile_context.injection_logger import (
     DEFAULT_INJECTION_LOG_FILE,
     InjectionEvent,
     InjectionLogger,
     InjectionStatistics,
+    get_index_path,
     get_recent_injections,
     read_injections_from_log,
 )
@@ -373,6 +379,47 @@ class TestInjectionLogger:
 
         logger.close()
 
+    def test_background_writes(self, tmp_path: Path) -> None:
+        """Test that with a write policy, events are queued and written in the background."""
+        logger = InjectionLogger(
+            log_dir=tmp_path,
+            write_policy=LogWritePolicy(flush_every_events=0, flush_interval_ms=0),
+        )
+        events = [
+            InjectionEvent.create(
+                source_file=f"/src/a{i}.py",
+                target_file="/src/b.py",
+                relationship_type="IMPORT",
+                snippet="def foo():",
+                snippet_location=f"a{i}.py:1",
+                cache_age_seconds=None,
+                cache_hit=False,
+                token_count=5,
+                context_token_total=5 * (i + 1),
+            )
+            for i in range(3)
+        ]
+
+        logger.log_injection(events[0])
+        logger.log_injections(events[1:])
+
+        # Statistics are updated when events are queued
+        assert logger.get_statistics().total_injections == 3
+        assert logger.flush()
+        log_path = tmp_path / DEFAULT_INJECTION_LOG_FILE
+        assert read_injections_from_log(log_path) == events
+        writer_stats = logger.get_writer_statistics()
+        assert writer_stats is not None
+        assert writer_stats["events_written"] == 3
+
+        # Events logged after closing are written directly
+        logger.close()
+        logger.log_injection(events[0])
+        assert len(read_injections_from_log(log_path)) == 4
+        logger.close()
+
+        assert InjectionLogger(log_dir=tmp_path).get_writer_statistics() is None
+
     def test_statistics_tracking(self, tmp_path: Path) -> None:
         """Test injection statistics tracking (T-5.4)."""
         logger = InjectionLogger(log_dir=tmp_path)
@@ -643,6 +690,276 @@ class TestGetRecentInjections:
             assert event.target_file == "/src/main.py"
 
 
+def _target_event(i: int, target: str) -> InjectionEvent:
+    return InjectionEvent.create(
+        source_file=f"/src/file{i}.py",
+        target_file=target,
+        relationship_type="IMPORT",
+        snippet=f"def func{i}():",
+        snippet_location=f"file{i}.py:{i}",
+        cache_age_seconds=None,
+        cache_hit=False,
+        token_count=5,
+        context_token_total=5,
+    )
+
+
+def _sources(events: List[InjectionEvent]) -> List[str]:
+    return [event.source_file for event in events]
+
+
+def _expected(targets: List[str], target: str, limit: int) -> List[str]:
+    """Sources of the latest events for target, most recent first."""
+    matching = [f"/src/file{i}.py" for i, t in enumerate(targets) if t == target]
+    return matching[::-1][:limit]
+
+
+class TestRecentInjectionsFromLogTail:
+    """Tests for reading recent injections from the log tail and index."""
+
+    TARGETS = [f"/src/mod{i % 7}.py" for i in range(200)]
+
+    def _log(self, tmp_path: Path, **kwargs) -> Path:
+        logger = InjectionLogger(log_dir=tmp_path, **kwargs)
+        logger.log_injections([_target_event(i, t) for i, t in enumerate(self.TARGETS)])
+        logger.close()
+        return logger.get_log_path()
+
+    def test_reverse_read_across_blocks(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that reading backwards in small blocks splits lines correctly."""
+        log_path = self._log(tmp_path, index_entries_per_target=0)
+        monkeypatch.setattr(injection_logger_module, "REVERSE_READ_BLOCK_SIZE", 97)
+
+        events = get_recent_injections(log_path, limit=500)
+        assert _sources(events) == [f"/src/file{i}.py" for i in range(199, -1, -1)]
+        events = get_recent_injections(log_path, target_file="/src/mod3.py", limit=5)
+        assert _sources(events) == _expected(self.TARGETS, "/src/mod3.py", 5)
+
+    def test_index_written_on_close(self, tmp_path: Path) -> None:
+        """Test that the sidecar index holds the latest offsets per target file."""
+        log_path = self._log(tmp_path, index_entries_per_target=4)
+
+        with open(get_index_path(log_path)) as f:
+            index = json.load(f)
+        assert index["log_size"] == log_path.stat().st_size
+        assert index["start"] == 0
+        assert len(index["targets"]) == 7
+        assert all(len(offsets) == 4 for offsets in index["targets"].values())
+
+        with open(log_path, "rb") as f:
+            f.seek(index["targets"]["/src/mod5.py"][-1])
+            assert json.loads(f.readline())["target_file"] == "/src/mod5.py"
+
+    @pytest.mark.parametrize("limit", [1, 4, 10, 100])
+    def test_indexed_query(self, tmp_path: Path, limit: int) -> None:
+        """Test indexed queries, including limits beyond the indexed offsets."""
+        log_path = self._log(tmp_path, index_entries_per_target=4)
+
+        for target in ("/src/mod0.py", "/src/mod6.py", "/src/unknown.py"):
+            events = get_recent_injections(log_path, target_file=target, limit=limit)
+            assert _sources(events) == _expected(self.TARGETS, target, limit)
+
+    def test_events_before_and_after_index(self, tmp_path: Path) -> None:
+        """Test events older than the logger and newer than the index."""
+        with open(tmp_path / DEFAULT_INJECTION_LOG_FILE, "w") as f:
+            for i in range(3):
+                event = _target_event(i, "/src/mod0.py")
+                event.source_file = f"/src/old{i}.py"
+                f.write(json.dumps(event.to_dict()) + "\n")
+
+        log_path = self._log(tmp_path)
+        with open(get_index_path(log_path)) as f:
+            assert json.load(f)["start"] > 0
+
+        # Appended after the index was written
+        late = _target_event(0, "/src/mod0.py")
+        late.source_file = "/src/late.py"
+        with open(log_path, "a") as f:
+            f.write(json.dumps(late.to_dict()) + "\n")
+
+        events = get_recent_injections(log_path, target_file="/src/mod0.py", limit=100)
+        assert _sources(events) == (
+            ["/src/late.py"]
+            + _expected(self.TARGETS, "/src/mod0.py", 100)
+            + ["/src/old2.py", "/src/old1.py", "/src/old0.py"]
+        )
+
+    def test_stale_index_falls_back_to_scan(self, tmp_path: Path) -> None:
+        """Test that an index that does not match the log is not trusted."""
+        log_path = self._log(tmp_path)
+        index_path = get_index_path(log_path)
+        stale_index = index_path.read_text()
+
+        # Same size, different events: the indexed offsets point elsewhere
+        log_path.unlink()
+        reversed_targets = self.TARGETS[::-1]
+        logger = InjectionLogger(log_dir=tmp_path, index_entries_per_target=0)
+        logger.log_injections([_target_event(i, t) for i, t in enumerate(reversed_targets)])
+        logger.close()
+        index_path.write_text(stale_index)
+
+        events = get_recent_injections(log_path, target_file="/src/mod2.py", limit=3)
+        assert _sources(events) == _expected(reversed_targets, "/src/mod2.py", 3)
+
+    def test_untracked_targets(self, tmp_path: Path) -> None:
+        """Test targets beyond max_unique_files_tracked are found by scanning."""
+        log_path = self._log(tmp_path, max_unique_files_tracked=3)
+
+        with open(get_index_path(log_path)) as f:
+            index = json.load(f)
+        assert index["overflow"] is True
+        assert len(index["targets"]) == 3
+        events = get_recent_injections(log_path, target_file="/src/mod6.py", limit=3)
+        assert _sources(events) == _expected(self.TARGETS, "/src/mod6.py", 3)
+
+    def test_logger_query_uses_ring_buffer(self, tmp_path: Path) -> None:
+        """Test that the logger answers from memory when it holds enough events."""
+        logger = InjectionLogger(log_dir=tmp_path, recent_buffer_size=20)
+        logger.log_injections([_target_event(i, t) for i, t in enumerate(self.TARGETS)])
+        # Only the last 20 events are buffered
+        assert sorted(len(events) for events in logger._recent_by_target.values()) == [2] + [3] * 6
+
+        logger.get_log_path().unlink()
+        events = logger.get_recent_injections(limit=5)
+        assert _sources(events) == [f"/src/file{i}.py" for i in range(199, 194, -1)]
+        events = logger.get_recent_injections(target_file="/src/mod1.py", limit=2)
+        assert _sources(events) == _expected(self.TARGETS, "/src/mod1.py", 2)
+        logger.close()
+
+    def test_logger_query_falls_back_to_log(self, tmp_path: Path) -> None:
+        """Test that the logger reads the log when the buffer has too few events."""
+        policy = LogWritePolicy(flush_every_events=0, flush_interval_ms=0)
+        logger = InjectionLogger(log_dir=tmp_path, write_policy=policy, recent_buffer_size=10)
+        logger.log_injections([_target_event(i, t) for i, t in enumerate(self.TARGETS)])
+
+        events = logger.get_recent_injections(target_file="/src/mod4.py", limit=10)
+
+        assert _sources(events) == _expected(self.TARGETS, "/src/mod4.py", 10)
+        assert get_index_path(logger.get_log_path()).exists()
+        logger.close()
+
+
+class TestInjectionLogRotation:
+    """Tests for size-based rotation of the injection log."""
+
+    TARGETS = [f"/src/mod{i % 3}.py" for i in range(60)]
+
+    def test_rotation_keeps_events_readable(self, tmp_path: Path) -> None:
+        """Test that reads and recent-injection queries span segments."""
+        from xfile_context.log_segments import LogRotationPolicy, read_manifest
+
+        logger = InjectionLogger(
+            log_dir=tmp_path,
+            recent_buffer_size=0,
+            rotation_policy=LogRotationPolicy(max_segment_bytes=4096),
+        )
+        for i, target in enumerate(self.TARGETS):
+            logger.log_injection(_target_event(i, target))
+        logger.close()
+        log_path = logger.get_log_path()
+
+        assert len(read_manifest(log_path)) >= 2
+        events = read_injections_from_log(log_path)
+        assert _sources(events) == [f"/src/file{i}.py" for i in range(60)]
+
+        recent = get_recent_injections(log_path, target_file="/src/mod1.py", limit=100)
+        assert _sources(recent) == _expected(self.TARGETS, "/src/mod1.py", 100)
+        assert _sources(get_recent_injections(log_path, limit=3)) == [
+            "/src/file59.py",
+            "/src/file58.py",
+            "/src/file57.py",
+        ]
+
+    def test_queries_skip_segments_without_target(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that segments without events for a target file are not opened."""
+        import xfile_context.injection_logger as injection_logger
+        from xfile_context.log_segments import LogRotationPolicy, read_manifest
+
+        targets = ["/src/rare.py"] + self.TARGETS[1:]
+        logger = InjectionLogger(
+            log_dir=tmp_path,
+            recent_buffer_size=0,
+            rotation_policy=LogRotationPolicy(max_segment_bytes=4096),
+        )
+        for i, target in enumerate(targets):
+            logger.log_injection(_target_event(i, target))
+        logger.close()
+        log_path = logger.get_log_path()
+
+        manifest = read_manifest(log_path)
+        assert len(manifest) >= 2
+        assert manifest[0]["key_counts"]["/src/rare.py"] == 1
+        assert all("/src/rare.py" not in s["key_counts"] for s in manifest[1:])
+
+        opened = []
+        open_segment_entry = injection_logger.open_segment_entry
+
+        def counting_open(log_path, segment):
+            opened.append(segment["sequence"])
+            return open_segment_entry(log_path, segment)
+
+        monkeypatch.setattr(injection_logger, "open_segment_entry", counting_open)
+
+        assert get_recent_injections(log_path, target_file="/src/missing.py") == []
+        assert opened == []
+        recent = get_recent_injections(log_path, target_file="/src/rare.py")
+        assert _sources(recent) == ["/src/file0.py"]
+        assert opened == [manifest[0]["sequence"]]
+
+    def test_rotation_does_not_wait_for_compression(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that logging continues while a rotated segment is compressed."""
+        import xfile_context.log_segments as log_segments
+        from xfile_context.log_segments import LogRotationPolicy, read_manifest
+
+        release = threading.Event()
+        compress_file = log_segments._compress_file
+
+        def slow_compress(*args):
+            release.wait(5.0)
+            compress_file(*args)
+
+        monkeypatch.setattr(log_segments, "_compress_file", slow_compress)
+        logger = InjectionLogger(
+            log_dir=tmp_path,
+            recent_buffer_size=0,
+            rotation_policy=LogRotationPolicy(max_segment_bytes=4096),
+        )
+        start = time.perf_counter()
+        for i, target in enumerate(self.TARGETS):
+            logger.log_injection(_target_event(i, target))
+        elapsed = time.perf_counter() - start
+        log_path = logger.get_log_path()
+
+        # Rotated segments are pending, and still found by queries
+        assert elapsed < 2.0
+        assert read_manifest(log_path) == []
+        recent = get_recent_injections(log_path, target_file="/src/mod1.py", limit=100)
+        assert _sources(recent) == _expected(self.TARGETS, "/src/mod1.py", 100)
+
+        release.set()
+        logger.close()
+        assert len(read_manifest(log_path)) >= 2
+        assert len(read_injections_from_log(log_path)) == 60
+
+    def test_rotation_resets_index(self, tmp_path: Path) -> None:
+        """Test that the sidecar index only covers the active log file."""
+        from xfile_context.log_segments import LogRotationPolicy
+
+        logger = InjectionLogger(
+            log_dir=tmp_path, rotation_policy=LogRotationPolicy(max_segment_bytes=4096)
+        )
+        logger.log_injections([_target_event(i, t) for i, t in enumerate(self.TARGETS)])
+        logger.log_injection(_target_event(60, "/src/mod0.py"))
+        logger.close()
+        log_path = logger.get_log_path()
+
+        with open(get_index_path(log_path)) as f:
+            index = json.load(f)
+        assert index["start"] == 0
+        assert index["targets"] == {"/src/mod0.py": [0]}
+        assert index["log_size"] == log_path.stat().st_size
+
+
 class TestReadInjectionsFromLog:
     """Tests for read_injections_from_log utility function."""
 
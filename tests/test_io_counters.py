@@ -0,0 +1,87 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for per-request file-system call accounting.
+
+Tests IOCounters and the thread-local tracking including:
+- Counting only while a request is tracked
+- Restoring outer counters after nested tracking
+- Isolation between threads
+- Counts of the instrumented analyzer and import resolution
+"""
+
+import threading
+from pathlib import Path
+
+from xfile_context.analyzers.python_analyzer import PythonAnalyzer
+from xfile_context.detectors import ImportDetector
+from xfile_context.detectors.registry import DetectorRegistry
+from xfile_context.io_counters import (
+    IO_FIND_SPEC,
+    IO_IMPORT_PROBE,
+    IO_READ,
+    IO_STAT,
+    IOCounters,
+    count_io,
+    track_io,
+)
+from xfile_context.models import RelationshipGraph
+
+
+class TestIOCounters:
+    """Tests for counting and attributing file-system calls."""
+
+    def test_counts_only_while_tracked(self) -> None:
+        """Test that calls outside a tracked request are not counted anywhere."""
+        count_io(IO_STAT)
+
+        with track_io() as counters:
+            count_io(IO_STAT)
+            count_io(IO_READ, 3)
+        count_io(IO_READ)
+
+        assert counters.to_dict() == {"stat": 1, "read": 3, "import_probe": 0, "find_spec": 0}
+
+    def test_nested_tracking_restores_outer_counters(self) -> None:
+        """Test that nested tracking charges the inner counters until it ends."""
+        outer = IOCounters()
+        with track_io(outer):
+            count_io(IO_STAT)
+            with track_io() as inner:
+                count_io(IO_STAT)
+            count_io(IO_STAT)
+
+        assert outer.get(IO_STAT) == 2
+        assert inner.get(IO_STAT) == 1
+
+        outer.merge(inner)
+        assert outer.get(IO_STAT) == 3
+
+    def test_threads_are_isolated(self) -> None:
+        """Test that calls on another thread are not charged to this request."""
+        with track_io() as counters:
+            thread = threading.Thread(target=count_io, args=(IO_STAT,))
+            thread.start()
+            thread.join()
+
+        assert counters.get(IO_STAT) == 0
+
+    def test_analysis_counts(self, tmp_path: Path) -> None:
+        """Test the calls of analyzing a file with local and third-party imports."""
+        (tmp_path / "pkg").mkdir()
+        (tmp_path / "pkg" / "__init__.py").write_text("")
+        (tmp_path / "pkg" / "util.py").write_text("def util():\n    return 1\n")
+        main = tmp_path / "main.py"
+        main.write_text("import xfile_context_missing_module\nfrom pkg.util import util\n")
+        registry = DetectorRegistry()
+        registry.register(ImportDetector())
+        analyzer = PythonAnalyzer(graph=RelationshipGraph(), detector_registry=registry)
+
+        with track_io() as counters:
+            analyzer.analyze_file(str(main))
+
+        # Existence and size check, line count and content
+        assert counters.get(IO_STAT) >= 2
+        assert counters.get(IO_READ) == 2
+        assert counters.get(IO_IMPORT_PROBE) > 0
+        assert counters.get(IO_FIND_SPEC) >= 1
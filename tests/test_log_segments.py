@@ -0,0 +1,238 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for size-based log rotation into compressed segments.
+
+Tests LogSegmenter and the segment readers including:
+- Rotation into numbered gzip segments recorded in the manifest
+- Time ranges of segments, including records written before the logger
+- Record counts per key, unknown when keys overflow or predate the logger
+- Streaming a log across its segments and active file
+- Skipping segments outside a time range without opening them
+- Fallback to gzip when zstd is not available
+- Compression in the background, with pending segments visible to readers
+"""
+
+import gzip
+import json
+import threading
+from pathlib import Path
+from typing import List
+
+import pytest
+
+import xfile_context.log_segments as log_segments
+from xfile_context.log_segments import (
+    LogRotationPolicy,
+    LogSegmenter,
+    get_manifest_path,
+    iter_log_lines,
+    list_logs,
+    parse_timestamp,
+    read_manifest,
+)
+
+
+def _timestamp(i: int) -> str:
+    return f"2025-12-11T10:{i // 60:02d}:{i % 60:02d}.000+00:00"
+
+
+def _write_records(
+    log_path: Path, segmenter: LogSegmenter, start: int, count: int, wait: bool = True
+) -> None:
+    """Append records like a logger does, rotating when the segmenter says so."""
+    for i in range(start, start + count):
+        line = json.dumps({"timestamp": _timestamp(i), "n": i}) + "\n"
+        with open(log_path, "a", encoding="utf-8") as f:
+            segmenter.opened(log_path, f.tell())
+            f.write(line)
+        if segmenter.record(len(line.encode("utf-8")), _timestamp(i)):
+            segmenter.rotate(log_path)
+    if wait:
+        segmenter.wait()
+
+
+def _numbers(lines: List[str]) -> List[int]:
+    return [json.loads(line)["n"] for line in lines]
+
+
+class TestLogSegmenter:
+    """Tests for rotating a log into segments."""
+
+    def test_rotation_writes_segments_and_manifest(self, tmp_path: Path) -> None:
+        """Test that the log is moved into numbered segments once it is large enough."""
+        log_path = tmp_path / "2025-12-11-session.jsonl"
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=500))
+
+        _write_records(log_path, segmenter, 0, 30)
+
+        segments = read_manifest(log_path)
+        assert len(segments) == segmenter.get_segments_written() >= 2
+        assert segments[0]["file"] == "2025-12-11-session.0001.jsonl.gz"
+        assert [s["sequence"] for s in segments] == list(range(1, len(segments) + 1))
+        assert segments[0]["first_timestamp"] == _timestamp(0)
+        assert all(s["bytes"] >= 500 for s in segments)
+        with gzip.open(tmp_path / segments[0]["file"], "rt") as f:
+            assert _numbers(f.readlines())[0] == 0
+        # Consecutive segments cover consecutive time ranges
+        for older, newer in zip(segments, segments[1:]):
+            assert parse_timestamp(older["last_timestamp"]) < parse_timestamp(
+                newer["first_timestamp"]
+            )
+
+    def test_time_range_includes_existing_records(self, tmp_path: Path) -> None:
+        """Test that records written before the segmenter started count for the range."""
+        log_path = tmp_path / "log.jsonl"
+        _write_records(log_path, LogSegmenter(LogRotationPolicy()), 0, 3)
+
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=1))
+        _write_records(log_path, segmenter, 3, 1)
+
+        assert read_manifest(log_path)[0]["first_timestamp"] == _timestamp(0)
+        assert read_manifest(log_path)[0]["last_timestamp"] == _timestamp(3)
+
+    def test_key_counts(self, tmp_path: Path) -> None:
+        """Test that segments record their number of records per key, if known."""
+        log_path = tmp_path / "log.jsonl"
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=1), max_keys=2)
+
+        def write(keys: List[str]) -> None:
+            with open(log_path, "a", encoding="utf-8") as f:
+                segmenter.opened(log_path, f.tell())
+                for key in keys:
+                    f.write("{}\n")
+                    segmenter.record(3, key=key)
+            segmenter.rotate(log_path)
+            segmenter.wait()
+
+        write(["a", "b", "a"])
+        write(["a", "b", "c"])  # Too many keys
+        log_path.write_text("{}\n")  # Written by someone else
+        write(["a"])
+
+        assert [s["key_counts"] for s in read_manifest(log_path)] == [
+            {"a": 2, "b": 1},
+            None,
+            None,
+        ]
+
+    def test_disabled_without_size_limit(self, tmp_path: Path) -> None:
+        """Test that a policy without a size limit never rotates."""
+        log_path = tmp_path / "log.jsonl"
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=0))
+
+        _write_records(log_path, segmenter, 0, 50)
+
+        assert not segmenter.is_enabled()
+        assert not get_manifest_path(log_path).exists()
+
+    def test_zstd_falls_back_to_gzip(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that zstd segments are written as gzip without the zstandard package."""
+        monkeypatch.setattr(log_segments, "zstandard", None)
+        log_path = tmp_path / "log.jsonl"
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=1, compression="zstd"))
+
+        _write_records(log_path, segmenter, 0, 1)
+
+        assert read_manifest(log_path)[0]["compression"] == "gzip"
+        assert read_manifest(log_path)[0]["file"].endswith(".jsonl.gz")
+
+    def test_failed_compression_keeps_pending_segment(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that a failed compression keeps the records readable and stops rotating."""
+
+        def fail(*args):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(log_segments, "_compress_file", fail)
+        log_path = tmp_path / "log.jsonl"
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=1))
+
+        _write_records(log_path, segmenter, 0, 3)
+
+        assert not segmenter.is_enabled()
+        assert _numbers(list(iter_log_lines(log_path))) == [0, 1, 2]
+        assert read_manifest(log_path) == []
+        assert all(p.name.endswith((".jsonl", ".pending")) for p in tmp_path.iterdir())
+
+    def test_compression_runs_in_background(self, tmp_path: Path, monkeypatch) -> None:
+        """Test that rotate() returns before compression and pending records stay readable."""
+        release = threading.Event()
+        compress_file = log_segments._compress_file
+
+        def slow_compress(*args):
+            release.wait(5.0)
+            compress_file(*args)
+
+        monkeypatch.setattr(log_segments, "_compress_file", slow_compress)
+        log_path = tmp_path / "log.jsonl"
+        segmenter = LogSegmenter(LogRotationPolicy(max_segment_bytes=200))
+
+        _write_records(log_path, segmenter, 0, 10, wait=False)
+
+        # Rotated but not compressed yet
+        assert segmenter.get_segments_written() == 0
+        assert read_manifest(log_path) == []
+        assert _numbers(list(iter_log_lines(log_path))) == list(range(10))
+        assert list_logs(tmp_path) == [log_path]
+
+        release.set()
+        segmenter.wait()
+
+        assert len(read_manifest(log_path)) == segmenter.get_segments_written() >= 2
+        assert not any(p.name.endswith(".pending") for p in tmp_path.iterdir())
+        assert _numbers(list(iter_log_lines(log_path))) == list(range(10))
+
+
+class TestSegmentReaders:
+    """Tests for reading logs across segments."""
+
+    @pytest.fixture
+    def log_path(self, tmp_path: Path) -> Path:
+        """Log of 60 records, one per second, in segments plus an active file."""
+        log_path = tmp_path / "log.jsonl"
+        _write_records(log_path, LogSegmenter(LogRotationPolicy(max_segment_bytes=600)), 0, 60)
+        assert len(read_manifest(log_path)) >= 3
+        assert log_path.exists()
+        return log_path
+
+    def test_streams_segments_then_active_file(self, log_path: Path) -> None:
+        """Test that all records are read in order."""
+        assert _numbers(list(iter_log_lines(log_path))) == list(range(60))
+
+    def test_skips_segments_outside_time_range(self, log_path: Path, monkeypatch) -> None:
+        """Test that segments outside the range are not opened."""
+        opened: List[str] = []
+        open_segment = log_segments.open_segment
+
+        def tracking_open(path, compression):
+            opened.append(path.name)
+            return open_segment(path, compression)
+
+        monkeypatch.setattr(log_segments, "open_segment", tracking_open)
+        segments = read_manifest(log_path)
+        since = parse_timestamp(segments[-1]["first_timestamp"])
+
+        numbers = _numbers(list(iter_log_lines(log_path, since=since)))
+
+        assert opened == [segments[-1]["file"]]
+        assert numbers == list(range(numbers[0], 60))
+        assert numbers[0] > 0
+
+    def test_rotated_log_without_active_file(self, log_path: Path) -> None:
+        """Test reading and listing a log whose active file was rotated away."""
+        log_path.unlink()
+
+        assert _numbers(list(iter_log_lines(log_path)))[0] == 0
+        assert list_logs(log_path.parent) == [log_path]
+
+    def test_missing_log(self, tmp_path: Path) -> None:
+        """Test that a log without an active file or segments is reported."""
+        with pytest.raises(FileNotFoundError):
+            list(iter_log_lines(tmp_path / "missing.jsonl"))
+
+    def test_parse_timestamp(self) -> None:
+        """Test the timestamp formats accepted for time ranges."""
+        assert parse_timestamp("2025-12-11") == parse_timestamp("2025-12-11T00:00:00Z")
+        assert parse_timestamp("2025-12-11T10:00:00.000+00:00") is not None
+        assert parse_timestamp("yesterday") is None
+        assert parse_timestamp(None) is None
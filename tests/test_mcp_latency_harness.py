@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Unit tests for the MCP stdio latency harness script.
+
+Tests cover:
+- Loading recorded workloads (path lists and JSONL records)
+- Latency percentiles and throughput
+- Driving the MCP server over stdio on a synthetic project
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from mcp_latency_harness import (  # type: ignore[import-not-found]
+    SERVER_LOG,
+    load_workload,
+    run_harness,
+    summarize,
+    synthetic_workload,
+)
+from synthetic_project import ProjectSpec, generate_project  # type: ignore[import-not-found]
+
+
+class TestWorkload:
+    """Tests for building workloads."""
+
+    def test_load_path_list(self, tmp_path: Path) -> None:
+        """Test that a path list keeps its order and skips comments and blank lines."""
+        workload = tmp_path / "reads.txt"
+        workload.write_text("# reads\na.py\n\nb.py\na.py\n")
+
+        assert load_workload(workload) == ["a.py", "b.py", "a.py"]
+
+    def test_load_jsonl_records(self, tmp_path: Path) -> None:
+        """Test that consecutive records of one file (injection logs) are one read."""
+        workload = tmp_path / "injections.jsonl"
+        records = [
+            {"target_file": "/p/a.py", "source_file": "/p/x.py"},
+            {"target_file": "/p/a.py", "source_file": "/p/y.py"},
+            {"file_path": "/p/b.py"},
+            {"target_file": "/p/a.py", "source_file": "/p/x.py"},
+        ]
+        workload.write_text("".join(json.dumps(r) + "\n" for r in records))
+
+        assert load_workload(workload) == ["/p/a.py", "/p/b.py", "/p/a.py"]
+
+        workload.write_text('{"source_file": "/p/x.py"}\n')
+        with pytest.raises(ValueError, match="no file path"):
+            load_workload(workload)
+
+    def test_synthetic_workload_is_seeded(self) -> None:
+        """Test that the synthetic sample depends only on the seed."""
+        modules = [f"module_{i}.py" for i in range(50)]
+
+        first = synthetic_workload(modules, 20, seed=1)
+
+        assert first == synthetic_workload(modules, 20, seed=1)
+        assert first != synthetic_workload(modules, 20, seed=2)
+        assert set(first) <= set(modules)
+
+
+class TestSummarize:
+    """Tests for summarizing a run."""
+
+    def test_percentiles_and_throughput(self) -> None:
+        """Test nearest-rank percentiles and throughput including errors."""
+        summary = summarize([float(i) for i in range(1, 101)], errors=4, elapsed_s=2.0)
+
+        assert (summary["p50_ms"], summary["p95_ms"], summary["p99_ms"]) == (50.0, 95.0, 99.0)
+        assert summary["max_ms"] == 100.0
+        assert summary["mean_ms"] == 50.5
+        assert summary["requests"] == 104
+        assert summary["throughput_rps"] == 52.0
+
+    def test_no_successful_calls(self) -> None:
+        """Test that a run without successful calls reports no percentiles."""
+        summary = summarize([], errors=3, elapsed_s=1.0)
+
+        assert summary["errors"] == 3
+        assert "p50_ms" not in summary
+
+
+@pytest.mark.slow
+def test_run_harness_over_stdio(tmp_path: Path) -> None:
+    """Test reads through a server subprocess, including a failing read."""
+    project = generate_project(tmp_path / "project", ProjectSpec(files=20, functions_per_file=2))
+    paths = synthetic_workload(project.modules, 12, seed=0) + ["missing.py"]
+
+    result = asyncio.run(
+        run_harness(project.root, paths, concurrency=3, warmup=4, data_root=tmp_path / "data")
+    )
+
+    summary = result["summary"]
+    assert summary["requests"] == 13
+    assert summary["errors"] == 1
+    assert 0 < summary["p50_ms"] <= summary["p99_ms"] <= summary["max_ms"]
+    assert summary["throughput_rps"] > 0
+    assert summary["mean_response_kb"] > 0
+    assert result["settings"]["concurrency"] == 3
+    assert "Starting MCP server" in (tmp_path / "data" / SERVER_LOG).read_text()
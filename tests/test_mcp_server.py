@@ -348,6 +348,32 @@ class TestMCPToolHandlers:
                     await read_tool.fn("/some/file.py", mock_ctx)
                 mock_ctx.error.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_read_many_with_context_handler(self):
+        """Test read_many_with_context handler with readable and missing files."""
+        from unittest.mock import AsyncMock
+
+        server = CrossFileContextMCPServer()
+
+        with TemporaryDirectory() as tmpdir:
+            first = Path(tmpdir) / "first.py"
+            first.write_text("x = 1\n")
+            second = Path(tmpdir) / "second.py"
+            second.write_text("y = 2\n")
+            missing = str(Path(tmpdir) / "missing.py")
+
+            mock_ctx = AsyncMock()
+            read_many = server.mcp._tool_manager._tools["read_many_with_context"]
+
+            result = await read_many.fn([str(first), missing, str(second)], mock_ctx)
+
+        assert [entry["file_path"] for entry in result["files"]] == [str(first), str(second)]
+        assert "x = 1" in result["files"][0]["content"]
+        assert result["files"][1]["warnings"] == []
+        assert list(result["errors"]) == [missing]
+        mock_ctx.error.assert_called_once()
+        server.shutdown()
+
     @pytest.mark.asyncio
     async def test_get_relationship_graph_handler_success(self):
         """Test get_relationship_graph handler success."""
@@ -398,6 +424,52 @@ class TestMCPToolHandlers:
                 assert result["nodes"] == [{"file": "test.py"}]
                 assert len(result["relationships"]) == 1
 
+    @pytest.mark.asyncio
+    async def test_get_relationship_graph_handler_paged(self):
+        """Test that paging arguments return a page instead of the full export."""
+        from unittest.mock import AsyncMock, patch
+
+        server = CrossFileContextMCPServer()
+        mock_ctx = AsyncMock()
+        graph_tool = server.mcp._tool_manager._tools["get_relationship_graph"]
+        page = {"relationships": [], "files": [], "next_cursor": None, "metadata": {}}
+
+        with patch.object(
+            server.service, "get_relationship_graph_page", return_value=page
+        ) as get_page, patch.object(server.service, "get_relationship_graph") as get_full:
+            result = await graph_tool.fn(mock_ctx, relationship_types=["import"])
+
+        assert result is page
+        get_page.assert_called_once_with(100, None, None, ["import"], None, 1)
+        get_full.assert_not_called()
+        server.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_export_relationship_graph_handler(self):
+        """Test that the export tool returns only the export summary."""
+        from unittest.mock import AsyncMock, patch
+
+        server = CrossFileContextMCPServer()
+        mock_ctx = AsyncMock()
+        export_tool = server.mcp._tool_manager._tools["export_relationship_graph"]
+        summary = {
+            "path": "/data/exports/graph.ndjson.gz",
+            "files": 2,
+            "relationships": 3,
+            "records": 7,
+            "bytes": 120,
+            "compressed": True,
+        }
+
+        with patch.object(
+            server.service, "export_relationship_graph_to_file", return_value=summary
+        ) as export:
+            result = await export_tool.fn(mock_ctx, compress=True)
+
+        assert result == summary
+        export.assert_called_once_with(True)
+        server.shutdown()
+
     @pytest.mark.asyncio
     async def test_get_relationship_graph_handler_error(self):
         """Test get_relationship_graph handler with error."""
@@ -446,6 +518,44 @@ class TestServerLifecycle:
         assert transport_param is not None
         assert transport_param.default == "stdio"
 
+    def test_run_starts_file_watcher_and_background_updates(self):
+        """Test that run() starts the watcher and graph update worker."""
+        mock_service = Mock(spec=CrossFileContextService)
+        server = CrossFileContextMCPServer(config=Config(), service=mock_service)
+        server.mcp = Mock()
+
+        server.run()
+
+        mock_service.start_file_watcher.assert_called_once()
+        mock_service.start_background_updates.assert_called_once()
+        server.mcp.run.assert_called_once_with(transport="stdio")
+
+    def test_run_without_file_watcher(self):
+        """Test that the watcher can be disabled via configuration."""
+        config = Config()
+        config._config["enable_file_watcher"] = False
+        mock_service = Mock(spec=CrossFileContextService)
+        server = CrossFileContextMCPServer(config=config, service=mock_service)
+        server.mcp = Mock()
+
+        server.run()
+
+        mock_service.start_file_watcher.assert_not_called()
+        mock_service.start_background_updates.assert_not_called()
+
+    def test_run_starts_background_indexing_when_enabled(self):
+        """Test that run() starts background indexing only when configured."""
+        mock_service = Mock(spec=CrossFileContextService)
+        server = CrossFileContextMCPServer(config=Config(), service=mock_service)
+        server.mcp = Mock()
+
+        server.run()
+        mock_service.start_background_indexing.assert_not_called()
+
+        server.config._config["enable_background_indexing"] = True
+        server.run()
+        mock_service.start_background_indexing.assert_called_once()
+
 
 class TestMainEntryPoint:
     """Tests for main() entry point function."""
@@ -456,6 +566,31 @@ class TestMainEntryPoint:
 
         assert callable(main)
 
+    def test_profile_flags_override_config(self, monkeypatch):
+        """Test that profiling flags become configuration overrides."""
+        from xfile_context.mcp_server import get_config_overrides, parse_args
+
+        monkeypatch.setattr("sys.argv", ["xfile-context"])
+        assert get_config_overrides(parse_args()) == {}
+
+        monkeypatch.setattr(
+            "sys.argv",
+            [
+                "xfile-context",
+                "--profile-every",
+                "100",
+                "--profile-slow-ms",
+                "750",
+                "--profile-memory",
+            ],
+        )
+        config = Config(config_path=Path("/nonexistent/config.yml"))
+        config.apply_overrides(get_config_overrides(parse_args()))
+
+        assert config.profile_every_n_requests == 100
+        assert config.profile_slow_request_ms == 750
+        assert config.profile_trace_memory is True
+
 
 class TestServerShutdown:
     """Tests for MCP server shutdown handling (Issue #155)."""
@@ -10,7 +10,7 @@ Tests cover all metrics categories per TDD Section 3.10.1 and Section 3.4.9:
 - Relationship graph metrics
 - Function usage distribution
 - Re-read pattern tracking
-- Performance metrics (parsing time, injection latency)
+- Performance metrics (parsing time, injection latency, read stage latency)
 - Warning statistics
 - Identifier resolution metrics
 - JSONL file writing
@@ -31,12 +31,14 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from xfile_context.io_counters import IO_KINDS, IO_READ, IO_STAT
 from xfile_context.metrics_collector import (
     CachePerformanceMetrics,
     ContextInjectionMetrics,
     FunctionUsageDistribution,
     IdentifierResolutionMetrics,
     MetricsCollector,
+    ReadStageTimer,
     RelationshipGraphMetrics,
     SessionMetrics,
     TokenCountStatistics,
@@ -113,7 +115,7 @@ class TestTokenCountStatistics:
         """Test serialization to dictionary."""
         stats = TokenCountStatistics(min=10, max=100, median=50, p95=90, total_count=50)
         result = stats.to_dict()
-        assert result == {"min": 10, "max": 100, "median": 50, "p95": 90}
+        assert result == {"min": 10, "max": 100, "median": 50, "p95": 90, "p99": 0}
         # total_count is not in to_dict (internal tracking only)
 
     def test_default_values(self) -> None:
@@ -345,8 +347,10 @@ class TestMetricsCollector:
         collector.record_injection_token_count(200)
         collector.record_injection_token_count(150)
 
-        # The collector tracks token counts internally
-        assert collector._token_counts == [100, 200, 150]
+        # The collector tracks the token count distribution internally
+        assert collector._token_counts.get_count() == 3
+        assert collector._token_counts.get_min() == 100
+        assert collector._token_counts.get_max() == 200
 
     def test_record_injection_token_count_with_threshold_exceedance(
         self, collector: MetricsCollector
@@ -364,14 +368,16 @@ class TestMetricsCollector:
         collector.record_parsing_time_ms(20)
         collector.record_parsing_time_ms(15)
 
-        assert collector._parsing_times_ms == [10, 20, 15]
+        assert collector._parsing_times_ms.get_count() == 3
+        assert collector._parsing_times_ms.get_sum() == 45
 
     def test_record_injection_latency(self, collector: MetricsCollector) -> None:
         """Injection latencies should be recorded."""
         collector.record_injection_latency_ms(5)
         collector.record_injection_latency_ms(10)
 
-        assert collector._injection_latencies_ms == [5, 10]
+        assert collector._injection_latencies_ms.get_count() == 2
+        assert collector._injection_latencies_ms.get_sum() == 15
 
     def test_record_file_read(self, collector: MetricsCollector) -> None:
         """File reads should be counted."""
@@ -477,6 +483,63 @@ class TestMetricsCollector:
         assert metrics.token_counts.median == 200
         assert metrics.threshold_exceedances == 1
 
+    def test_percentiles_from_bounded_sketch(self, collector: MetricsCollector) -> None:
+        """Percentiles stay accurate while memory is bounded by the value range."""
+        values = [(i * 7919) % 100_000 for i in range(20_000)]
+        for value in values:
+            collector.record_injection_latency_ms(value)
+
+        metrics = collector.build_session_metrics()
+
+        expected = calculate_percentile_statistics(values)
+        latency = metrics.performance.injection_latency_ms
+        assert (latency.min, latency.max, latency.total_count) == (0, expected.max, 20_000)
+        for actual, exact in [
+            (latency.median, expected.median),
+            (latency.p95, expected.p95),
+            (latency.p99, expected.p99),
+        ]:
+            assert abs(actual - exact) <= exact * 0.002
+        assert collector._injection_latencies_ms.get_bucket_count() < 5000
+        assert latency.sketch is not None
+
+    def test_record_read_stages(self, collector: MetricsCollector) -> None:
+        """Stage durations are accumulated per read and recorded in microseconds."""
+        for _ in range(3):
+            timer = ReadStageTimer()
+            with timer.stage("validation"):
+                pass
+            timer.add("snippet_extraction", 2_000_000)
+            timer.add("snippet_extraction", 1_000_000)
+            timer.add("custom", 5_000)
+            collector.record_read("/path/to/file.py", timer)
+
+        stages = collector.get_read_stage_statistics()
+
+        # Pipeline order, unknown stages last
+        assert list(stages) == ["validation", "snippet_extraction", "custom"]
+        assert stages["snippet_extraction"].median == 3000
+        assert stages["snippet_extraction"].total_count == 3
+        assert stages["custom"].p99 == 5
+        assert collector.get_read_latency_statistics().total_count == 3
+        assert collector.get_re_read_patterns() == [{"file": "/path/to/file.py", "read_count": 3}]
+
+    def test_record_read_io(self, collector: MetricsCollector) -> None:
+        """File-system calls are recorded per read, including kinds with no calls."""
+        for reads in (1, 1, 4):
+            timer = ReadStageTimer()
+            timer.get_io_counters().add(IO_READ, reads)
+            timer.get_io_counters().add(IO_STAT, 2)
+            collector.record_read("/path/to/file.py", timer)
+
+        io = collector.get_read_io_statistics()
+
+        assert list(io) == list(IO_KINDS)
+        assert io["read"].median == 1
+        assert io["read"].max == 4
+        assert io["stat"].total_count == 3
+        assert io["find_spec"].max == 0
+
     def test_collect_warning_metrics(self, collector: MetricsCollector) -> None:
         """Warning metrics should be collected from mock logger."""
         mock_logger = MagicMock()
@@ -575,6 +638,30 @@ class TestMetricsCollector:
         assert metrics.re_read_patterns[0]["file"] == "/path/to/file.py"
         assert metrics.re_read_patterns[0]["read_count"] == 2
 
+    def test_build_session_metrics_log_writers(
+        self, collector: MetricsCollector, temp_dir: Path
+    ) -> None:
+        """Background log writer statistics are included per log."""
+        from xfile_context.async_log_writer import LogWritePolicy
+        from xfile_context.injection_logger import InjectionLogger
+
+        injection_logger = InjectionLogger(log_dir=temp_dir, write_policy=LogWritePolicy())
+        warning_logger = MagicMock()
+        warning_logger.get_writer_statistics.return_value = None
+        warning_logger.get_statistics.return_value = MagicMock(
+            total_warnings=0, by_type={}, files_with_most_warnings=[]
+        )
+        try:
+            metrics = collector.build_session_metrics(
+                injection_logger=injection_logger, warning_logger=warning_logger
+            )
+        finally:
+            injection_logger.close()
+
+        assert list(metrics.log_writers) == ["injections"]
+        assert metrics.log_writers["injections"]["events_dropped"] == 0
+        assert metrics.to_dict()["log_writers"] == metrics.log_writers
+
     def test_write_metrics(self, collector: MetricsCollector, temp_dir: Path) -> None:
         """write_metrics should write JSONL to file."""
         metrics = SessionMetrics(
@@ -807,11 +894,41 @@ class TestReadSessionMetrics:
         assert session.context_injection.total_injections == 3
         assert session.context_injection.token_counts.min == 100
         assert session.context_injection.token_counts.max == 300
+        assert session.context_injection.token_counts.p99 == 300
+        assert session.context_injection.token_counts.sketch["count"] == 3
+        assert session.performance.read_stages_us == {}
+        assert session.performance.read_io == {}
 
         # Verify warnings
         assert session.warnings.total_warnings == 5
         assert session.warnings.by_type["exec_eval"] == 3
 
+    def test_read_rotated_segments_by_time_range(self, temp_dir: Path) -> None:
+        """Sessions are read across segments, skipping those outside the range."""
+        from xfile_context.log_segments import LogRotationPolicy, read_manifest
+
+        collector = MetricsCollector(
+            log_dir=temp_dir, rotation_policy=LogRotationPolicy(max_segment_bytes=1)
+        )
+        for day in range(1, 6):
+            collector.write_metrics(
+                SessionMetrics(
+                    session_id=f"session-{day}",
+                    start_time=f"2025-01-0{day}T10:00:00.000Z",
+                    end_time=f"2025-01-0{day}T12:00:00.000Z",
+                )
+            )
+        log_path = collector.get_log_path()
+
+        # Every write rotated the log
+        assert not log_path.exists()
+        assert len(read_manifest(log_path)) == 5
+        assert [m.session_id for m in read_session_metrics(log_path)] == [
+            f"session-{day}" for day in range(1, 6)
+        ]
+        in_range = read_session_metrics(log_path, since="2025-01-02", until="2025-01-04")
+        assert [m.session_id for m in in_range] == ["session-2", "session-3"]
+
 
 class TestMetricsCollectorContextManager:
     """Tests for MetricsCollector context manager functionality."""
@@ -826,7 +943,7 @@ class TestMetricsCollectorContextManager:
         """Context manager should work for basic usage."""
         with MetricsCollector(log_dir=temp_dir) as collector:
             collector.record_injection_token_count(100)
-            assert collector._token_counts == [100]
+            assert collector._token_counts.get_count() == 1
 
     def test_context_manager_does_not_auto_write(self, temp_dir: Path) -> None:
         """Context manager should NOT auto-write metrics on exit."""
@@ -433,6 +433,36 @@ class TestRelationshipGraph:
         assert "src/retry.py" not in graph._dependencies
         assert "src/retry.py" not in graph._dependents
 
+    def test_remove_relationships_for_files(self):
+        """Test removing relationships for several files in one pass."""
+        graph = RelationshipGraph()
+        edges = [
+            ("src/bot.py", "src/retry.py"),
+            ("src/retry.py", "src/utils.py"),
+            ("src/handlers.py", "src/bot.py"),
+            ("src/handlers.py", "src/utils.py"),
+            ("src/cli.py", "src/handlers.py"),
+        ]
+        for line, (source, target) in enumerate(edges, start=1):
+            graph.add_relationship(
+                Relationship(
+                    source_file=source,
+                    target_file=target,
+                    relationship_type=RelationshipType.IMPORT,
+                    line_number=line,
+                )
+            )
+
+        removed = graph.remove_relationships_for_files(
+            {"src/retry.py"}, outgoing_from={"src/handlers.py"}
+        )
+
+        assert len(removed) == 4
+        remaining = [(r.source_file, r.target_file) for r in graph.get_all_relationships()]
+        assert remaining == [("src/cli.py", "src/handlers.py")]
+        assert graph._dependencies == {"src/cli.py": {"src/handlers.py"}}
+        assert graph._dependents == {"src/handlers.py": {"src/cli.py"}}
+
     def test_file_metadata_operations(self):
         """Test setting and getting file metadata."""
         graph = RelationshipGraph()
@@ -1029,6 +1059,72 @@ class TestRelationshipGraph:
         all_rels = graph.get_all_relationships()
         assert len(all_rels) == 2
 
+    def test_outgoing_index_follows_removals(self):
+        """Test that the relationships-by-source index matches the relationship list."""
+        graph = RelationshipGraph()
+        for source, target in [
+            ("a.py", "b.py"),
+            ("a.py", "c.py"),
+            ("b.py", "c.py"),
+            ("c.py", "d.py"),
+            ("d.py", "a.py"),
+        ]:
+            graph.add_relationship(
+                Relationship(
+                    source_file=source,
+                    target_file=target,
+                    relationship_type=RelationshipType.IMPORT,
+                    line_number=1,
+                )
+            )
+        assert graph.get_sorted_source_files() == ["a.py", "b.py", "c.py", "d.py"]
+
+        graph.remove_relationships_for_file("c.py")
+        assert [r.target_file for r in graph.get_outgoing_relationships("a.py")] == ["b.py"]
+        assert graph.get_sorted_source_files() == ["a.py", "d.py"]
+
+        graph.remove_outgoing_relationships("a.py")
+        graph.remove_relationships_for_files({"b.py"}, outgoing_from={"d.py"})
+        assert graph.get_sorted_source_files() == []
+        assert graph.get_dependencies("d.py") == []
+
+        graph.add_relationship(
+            Relationship(
+                source_file="e.py",
+                target_file="a.py",
+                relationship_type=RelationshipType.IMPORT,
+                line_number=1,
+            )
+        )
+        assert graph.get_sorted_source_files() == ["e.py"]
+        assert graph.get_relationship_count() == 1
+        graph.clear()
+        assert graph.get_outgoing_relationships("e.py") == ()
+
+    def test_get_neighborhood(self):
+        """Test that neighborhoods follow relationships in both directions."""
+        graph = RelationshipGraph()
+        # a -> b -> c -> d, e -> b
+        for source, target in [
+            ("a.py", "b.py"),
+            ("b.py", "c.py"),
+            ("c.py", "d.py"),
+            ("e.py", "b.py"),
+        ]:
+            graph.add_relationship(
+                Relationship(
+                    source_file=source,
+                    target_file=target,
+                    relationship_type=RelationshipType.IMPORT,
+                    line_number=1,
+                )
+            )
+
+        assert graph.get_neighborhood("b.py", 0) == {"b.py"}
+        assert graph.get_neighborhood("b.py", 1) == {"a.py", "b.py", "c.py", "e.py"}
+        assert graph.get_neighborhood("a.py", 2) == {"a.py", "b.py", "c.py", "e.py"}
+        assert graph.get_neighborhood("a.py", 10) == {"a.py", "b.py", "c.py", "d.py", "e.py"}
+
 
 class TestCacheEntry:
     """Tests for CacheEntry dataclass."""
@@ -0,0 +1,89 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Unit tests for the profile_report.py script.
+
+Tests cover:
+- Merging cProfile dumps across session directories
+- Ranking functions and reading the dump manifests
+- Aggregating tracemalloc snapshots
+- Human-readable and JSON output
+"""
+
+import json
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from profile_report import build_report, format_report, main  # type: ignore[import-not-found]
+
+from xfile_context.request_profiler import ProfilingPolicy, RequestProfiler  # noqa: E402
+
+
+def _hot_function() -> int:
+    return sum(i * i for i in range(20_000))
+
+
+def _profile_session(output_dir: Path, requests: int) -> None:
+    """Dump every request of a session, each calling _hot_function."""
+    profiler = RequestProfiler(ProfilingPolicy(every_n_requests=1, trace_memory=True), output_dir)
+    kept: List[bytes] = []
+    for i in range(requests):
+        with profiler.profile("read_file_with_context", f"file_{i}.py"):
+            _hot_function()
+            kept.append(bytes(10_000))
+
+
+class TestProfileReport:
+    """Tests for aggregating profile dumps."""
+
+    @pytest.fixture
+    def profiles_dir(self, tmp_path: Path) -> Path:
+        """Profiles directory with two sessions of 2 and 3 dumps."""
+        _profile_session(tmp_path / "profiles" / "session-a", 2)
+        _profile_session(tmp_path / "profiles" / "session-b", 3)
+        return tmp_path / "profiles"
+
+    def test_merges_dumps_across_sessions(self, profiles_dir: Path) -> None:
+        """Test that functions are summed over every dump they appear in."""
+        report = build_report([profiles_dir], top=50, sort="tottime", memory=True)
+
+        assert report.dumps_analyzed == 5
+        hot = [f for f in report.functions if f.function.endswith("(_hot_function)")]
+        assert len(hot) == 1
+        assert hot[0].calls == 5
+        assert hot[0].dumps == 5
+        tottimes = [f.tottime_ms for f in report.functions]
+        assert tottimes == sorted(tottimes, reverse=True)
+        assert len(report.requests) == 5
+        assert {r["session"] for r in report.requests} == {"session-a", "session-b"}
+        assert report.memory
+        assert report.memory[0][1] >= 10_000
+
+        text = format_report(report, "tottime")
+        assert "Dumps analyzed: 5" in text
+        assert "_hot_function" in text
+
+    def test_single_dump_file(self, profiles_dir: Path) -> None:
+        """Test reporting a single dump without manifest records."""
+        dump = profiles_dir / "session-a" / "0001-read_file_with_context.prof"
+
+        report = build_report([dump])
+
+        assert report.dumps_analyzed == 1
+        assert report.requests == []
+
+    def test_main_json_output(self, profiles_dir: Path, monkeypatch, capsys) -> None:
+        """Test the JSON report and the exit code without dumps."""
+        monkeypatch.setattr(sys, "argv", ["profile_report.py", str(profiles_dir), "--json"])
+        assert main() == 0
+        output = json.loads(capsys.readouterr().out)
+        assert output["dumps_analyzed"] == 5
+        assert output["memory"] == []
+
+        monkeypatch.setattr(sys, "argv", ["profile_report.py", str(profiles_dir / "missing")])
+        assert main() == 1
@@ -0,0 +1,107 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for QuantileSketch.
+
+Tests the streaming quantile sketch including:
+- Exact statistics for small values, matching calculate_percentile_statistics()
+- Relative accuracy and bounded bucket count for large values
+- Merging sketches recorded separately
+- Serialization round trip and validation
+"""
+
+import json
+import random
+
+import pytest
+
+from xfile_context.metrics_collector import calculate_percentile_statistics
+from xfile_context.quantile_sketch import QuantileSketch
+
+
+def _sketch(values) -> QuantileSketch:
+    sketch = QuantileSketch()
+    for value in values:
+        sketch.record(value)
+    return sketch
+
+
+class TestQuantileSketch:
+    """Tests for recording and querying a sketch."""
+
+    @pytest.mark.parametrize(
+        "values", [[42], [10, 20], [50, 10, 30, 20, 40], list(range(1, 101)), [5] * 10]
+    )
+    def test_small_values_are_exact(self, values) -> None:
+        """Test that values below 2**significant_bits give the exact statistics."""
+        sketch = _sketch(values)
+        expected = calculate_percentile_statistics(values)
+
+        assert sketch.get_min() == expected.min
+        assert sketch.get_max() == expected.max
+        assert sketch.median() == expected.median
+        assert sketch.quantile(0.95) == expected.p95
+        assert sketch.quantile(0.99) == expected.p99
+        assert sketch.get_count() == len(values)
+
+    def test_large_values_within_relative_error(self) -> None:
+        """Test accuracy and memory for a long-tailed distribution."""
+        rng = random.Random(44)
+        values = [int(rng.lognormvariate(8, 2)) for _ in range(50_000)]
+        sketch = _sketch(values)
+        ordered = sorted(values)
+
+        for q in (0.5, 0.95, 0.99):
+            exact = ordered[min(int(len(values) * q), len(values) - 1)]
+            assert sketch.quantile(q) == pytest.approx(exact, rel=0.002)
+        assert sketch.get_max() == ordered[-1]
+        assert sketch.get_sum() == sum(values)
+        assert sketch.get_bucket_count() < 10_000
+
+    def test_negative_values_and_empty_sketch(self) -> None:
+        """Test that negative samples count as 0 and an empty sketch returns 0."""
+        sketch = QuantileSketch()
+        assert sketch.quantile(0.95) == 0
+        assert sketch.median() == 0
+
+        sketch.record(-5)
+        assert sketch.get_min() == 0
+        with pytest.raises(ValueError, match="Quantile"):
+            sketch.quantile(1.5)
+
+    def test_merge(self) -> None:
+        """Test that merging gives the same result as recording all values."""
+        rng = random.Random(7)
+        first = [rng.randrange(100_000) for _ in range(1000)]
+        second = [rng.randrange(5000) for _ in range(3000)]
+
+        merged = _sketch(first)
+        merged.merge(_sketch(second))
+
+        assert merged.to_dict() == _sketch(first + second).to_dict()
+        with pytest.raises(ValueError, match="significant bits"):
+            merged.merge(QuantileSketch(significant_bits=7))
+
+    def test_serialization_round_trip(self) -> None:
+        """Test that a sketch survives JSON serialization."""
+        sketch = _sketch([3, 3, 900, 70_000, 123_456])
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.to_dict() == sketch.to_dict()
+        assert restored.quantile(0.99) == sketch.quantile(0.99)
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"count": 1},
+            {"count": 2, "buckets": [[1, 1]]},
+            {"count": 1, "buckets": [[-1, 1]]},
+            {"count": 1, "buckets": [[1, 1]], "significant_bits": 40},
+            {"count": 1, "buckets": "1"},
+        ],
+    )
+    def test_invalid_serialization(self, data) -> None:
+        """Test that malformed sketches are rejected."""
+        with pytest.raises(ValueError):
+            QuantileSketch.from_dict(data)
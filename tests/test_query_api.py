@@ -9,7 +9,9 @@ Tests the QueryAPI class which provides programmatic access to system state:
 - get_dependents(file_path)
 - get_dependencies(file_path)
 - get_session_metrics()
+- get_read_latency()
 - get_cache_statistics()
+- get_indexing_progress()
 
 Related Requirements:
 - FR-29 (query API for injection events)
@@ -544,6 +546,68 @@ class TestQueryAPIFromService:
         service.shutdown()
 
 
+class TestQueryAPIGetIndexingProgress:
+    """Tests for get_indexing_progress() method."""
+
+    def test_get_indexing_progress_without_indexer(self, query_api):
+        """Without a background indexer, progress reports disabled."""
+        assert query_api.get_indexing_progress() == {"state": "disabled"}
+
+    def test_get_indexing_progress_from_service(self, temp_dir):
+        """API created from service reports the service's indexer progress."""
+        from xfile_context.service import CrossFileContextService
+
+        service = CrossFileContextService(config=Config(), project_root=str(temp_dir))
+        api = QueryAPI.from_service(service)
+
+        progress = api.get_indexing_progress()
+        assert progress["state"] == "stopped"
+        assert progress["files_discovered"] == 0
+
+        service.shutdown()
+
+
+class TestQueryAPIGetReadLatency:
+    """Tests for get_read_latency() method."""
+
+    def test_get_read_latency_without_reads(self, query_api):
+        """Before any read, only empty totals are reported."""
+        result = query_api.get_read_latency()
+
+        assert result["stages_us"] == {}
+        assert result["total_ms"]["count"] == 0
+
+    def test_get_read_latency_from_service(self, temp_dir):
+        """Each stage of a read is reported with its percentiles."""
+        from xfile_context.service import CrossFileContextService
+
+        (temp_dir / "utils.py").write_text("def helper():\n    return 42\n")
+        main_path = temp_dir / "main.py"
+        main_path.write_text("from utils import helper\n\nresult = helper()\n")
+        service = CrossFileContextService(config=Config(), project_root=str(temp_dir))
+        api = QueryAPI.from_service(service)
+
+        service.read_file_with_context(str(main_path))
+        result = api.get_read_latency()
+        service.shutdown()
+
+        assert result["total_ms"]["count"] == 1
+        assert list(result["stages_us"]) == [
+            "validation",
+            "file_read",
+            "staleness",
+            "dependency_lookup",
+            "prioritization",
+            "snippet_extraction",
+            "token_counting",
+            "logging",
+        ]
+        for stats in result["stages_us"].values():
+            assert stats["count"] == 1
+            assert stats["min"] <= stats["median"] <= stats["p95"] <= stats["p99"] <= stats["max"]
+        json.dumps(result)
+
+
 class TestQueryAPIJSONCompatibility:
     """Tests to ensure all API returns are JSON-compatible."""
 
@@ -0,0 +1,171 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for the opt-in request profiler.
+
+Tests RequestProfiler including:
+- Dumping every Nth request
+- Dumping only slow requests with a latency threshold
+- tracemalloc snapshots of profiled requests
+- The dump limit, errors in profiled requests and a busy profiler (with the
+  overlap recorded in the manifest)
+- Profiling service reads into the session's profile directory
+"""
+
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from xfile_context.config import Config
+from xfile_context.request_profiler import (
+    PROFILE_MANIFEST,
+    PROFILES_ALL_THREADS,
+    ProfilingPolicy,
+    RequestProfiler,
+)
+
+
+def _manifest(output_dir: Path) -> List[Dict[str, Any]]:
+    with open(output_dir / PROFILE_MANIFEST, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def _work() -> int:
+    return sum(i * i for i in range(1000))
+
+
+class TestRequestProfiler:
+    """Tests for selecting and dumping profiled requests."""
+
+    def test_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test that the default policy profiles nothing and writes nothing."""
+        profiler = RequestProfiler(ProfilingPolicy(), tmp_path / "profiles")
+
+        for _ in range(5):
+            with profiler.profile("read", "a.py"):
+                _work()
+
+        assert not profiler.is_enabled()
+        assert profiler.get_statistics() == {
+            "requests": 5,
+            "profiled": 0,
+            "dumps": 0,
+            "skipped": 0,
+        }
+        assert not (tmp_path / "profiles").exists()
+
+    def test_samples_every_nth_request(self, tmp_path: Path) -> None:
+        """Test that every Nth request is dumped with a manifest record."""
+        profiler = RequestProfiler(ProfilingPolicy(every_n_requests=3), tmp_path)
+
+        for i in range(7):
+            with profiler.profile("read_file_with_context", f"file_{i}.py"):
+                _work()
+
+        records = _manifest(tmp_path)
+        assert [r["target"] for r in records] == ["file_2.py", "file_5.py"]
+        assert [r["reason"] for r in records] == ["sampled", "sampled"]
+        assert records[0]["profile"] == "0001-read_file_with_context.prof"
+        assert records[0]["memory_snapshot"] is None
+        assert records[0]["concurrent_requests"] == 0
+        stats = pstats.Stats(str(tmp_path / records[0]["profile"]))
+        assert any(name == "_work" for _, _, name in stats.stats)  # type: ignore[attr-defined]
+
+    def test_dumps_only_slow_requests(self, tmp_path: Path) -> None:
+        """Test that a latency threshold profiles every request and dumps slow ones."""
+        profiler = RequestProfiler(ProfilingPolicy(slow_request_ms=50), tmp_path)
+
+        with profiler.profile("read", "fast.py"):
+            _work()
+        with profiler.profile("read", "slow.py"):
+            time.sleep(0.06)
+
+        records = _manifest(tmp_path)
+        assert [(r["target"], r["reason"]) for r in records] == [("slow.py", "slow")]
+        assert records[0]["elapsed_ms"] >= 50
+        assert profiler.get_statistics()["profiled"] == 2
+
+    def test_memory_snapshot(self, tmp_path: Path) -> None:
+        """Test that profiled requests dump a snapshot of the memory they kept."""
+        profiler = RequestProfiler(ProfilingPolicy(every_n_requests=1, trace_memory=True), tmp_path)
+        kept: List[bytes] = []
+
+        with profiler.profile("read", "a.py"):
+            kept.append(bytes(200_000))
+
+        record = _manifest(tmp_path)[0]
+        assert record["peak_memory_bytes"] >= 200_000
+        snapshot = tracemalloc.Snapshot.load(str(tmp_path / record["memory_snapshot"]))
+        assert sum(stat.size for stat in snapshot.statistics("filename")) >= 200_000
+        assert not tracemalloc.is_tracing()
+
+    def test_dump_limit_and_failed_requests(self, tmp_path: Path) -> None:
+        """Test that dumps stop at max_dumps and failing requests are still dumped."""
+        profiler = RequestProfiler(ProfilingPolicy(every_n_requests=1, max_dumps=2), tmp_path)
+
+        with pytest.raises(FileNotFoundError), profiler.profile("read", "missing.py"):
+            raise FileNotFoundError("missing.py")
+        for _ in range(3):
+            with profiler.profile("read", "a.py"):
+                _work()
+
+        assert [r["target"] for r in _manifest(tmp_path)] == ["missing.py", "a.py"]
+        assert profiler.get_statistics()["dumps"] == 2
+        assert profiler.get_statistics()["profiled"] == 2
+
+    def test_concurrent_request_not_profiled(self, tmp_path: Path) -> None:
+        """Test that a request arriving while another is profiled runs unprofiled.
+
+        The manifest records the overlap: on Python 3.12+ the unprofiled
+        request's work is in the profile too.
+        """
+        profiler = RequestProfiler(ProfilingPolicy(every_n_requests=1), tmp_path)
+        entered = threading.Event()
+        release = threading.Event()
+
+        def profiled() -> None:
+            with profiler.profile("read", "first.py"):
+                entered.set()
+                release.wait(5)
+
+        thread = threading.Thread(target=profiled)
+        thread.start()
+        assert entered.wait(5)
+        with profiler.profile("read", "second.py"):
+            _work()
+        release.set()
+        thread.join()
+
+        records = _manifest(tmp_path)
+        assert [r["target"] for r in records] == ["first.py"]
+        assert records[0]["concurrent_requests"] == 1
+        assert records[0]["all_threads"] is PROFILES_ALL_THREADS
+        assert profiler.get_statistics()["skipped"] == 1
+
+    def test_service_reads_are_profiled(self, tmp_path: Path) -> None:
+        """Test that service reads are dumped to the session's profile directory."""
+        from xfile_context.service import CrossFileContextService
+
+        (tmp_path / "main.py").write_text("def main():\n    return 1\n")
+        config = Config(config_path=tmp_path / "missing.yml")
+        config.apply_overrides({"profile_every_n_requests": 2})
+        service = CrossFileContextService(
+            config, project_root=str(tmp_path), data_root=tmp_path / "data", session_id="s1"
+        )
+        try:
+            for _ in range(2):
+                service.read_file_with_context(str(tmp_path / "main.py"))
+            service.read_files_with_context([str(tmp_path / "main.py")])
+        finally:
+            service.shutdown()
+
+        records = _manifest(tmp_path / "data" / "profiles" / "s1")
+        assert [(r["request"], r["target"]) for r in records] == [
+            ("read_file_with_context", str(tmp_path / "main.py"))
+        ]
@@ -0,0 +1,116 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for ReadWriteLock.
+
+Tests reader-writer synchronization including:
+- Concurrent readers
+- Exclusive writers
+- Writer preference over newly arriving readers
+- Re-entrant writes and reads nested in writes
+"""
+
+import threading
+import time
+from typing import List
+
+import pytest
+
+from xfile_context.rwlock import ReadWriteLock
+
+
+class TestReadWriteLock:
+    """Tests for ReadWriteLock."""
+
+    def test_readers_do_not_wait_on_each_other(self) -> None:
+        """Test that several threads can hold the read lock at once."""
+        lock = ReadWriteLock()
+        # Only passes if all three readers hold the lock together
+        barrier = threading.Barrier(3, timeout=5)
+        errors: List[Exception] = []
+
+        def reader() -> None:
+            try:
+                with lock.read_lock():
+                    barrier.wait()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=reader) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert errors == []
+
+    def test_writer_excludes_readers(self) -> None:
+        """Test that readers wait while a writer holds the lock."""
+        lock = ReadWriteLock()
+        events: List[str] = []
+
+        def reader() -> None:
+            with lock.read_lock():
+                events.append("read")
+
+        with lock.write_lock():
+            thread = threading.Thread(target=reader)
+            thread.start()
+            time.sleep(0.05)
+            events.append("write done")
+        thread.join(timeout=5)
+
+        assert events == ["write done", "read"]
+
+    def test_waiting_writer_blocks_new_readers(self) -> None:
+        """Test that a queued writer goes before readers that arrive later."""
+        lock = ReadWriteLock()
+        events: List[str] = []
+
+        def writer() -> None:
+            with lock.write_lock():
+                events.append("write")
+
+        def late_reader() -> None:
+            with lock.read_lock():
+                events.append("late read")
+
+        with lock.read_lock():
+            writer_thread = threading.Thread(target=writer)
+            writer_thread.start()
+            while not lock._writers_waiting:
+                time.sleep(0.001)
+            reader_thread = threading.Thread(target=late_reader)
+            reader_thread.start()
+            time.sleep(0.05)
+            assert events == []
+
+        writer_thread.join(timeout=5)
+        reader_thread.join(timeout=5)
+        assert events == ["write", "late read"]
+
+    def test_reentrant_write_and_nested_read(self) -> None:
+        """Test that a writer can re-acquire the lock for writing and reading."""
+        lock = ReadWriteLock()
+
+        with lock.write_lock(), lock.write_lock(), lock.read_lock():
+            pass
+
+        # Fully released: another thread can write
+        acquired = threading.Event()
+
+        def writer() -> None:
+            with lock.write_lock():
+                acquired.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        thread.join(timeout=5)
+        assert acquired.is_set()
+
+    def test_read_lock_cannot_be_upgraded(self) -> None:
+        """Test that acquiring a write lock while reading raises."""
+        lock = ReadWriteLock()
+
+        with lock.read_lock(), pytest.raises(RuntimeError):
+            lock.acquire_write()
@@ -11,14 +11,20 @@ Tests cover:
 - Security validation
 """
 
+import json
+import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
+from typing import List, Tuple
+from unittest.mock import patch
 
 import pytest
 
 from xfile_context.cache import WorkingMemoryCache
 from xfile_context.config import Config
+from xfile_context.metrics_collector import READ_STAGES
 from xfile_context.models import FileMetadata, Relationship, RelationshipGraph, RelationshipType
 from xfile_context.service import CrossFileContextService, ReadResult
 from xfile_context.storage import InMemoryStore
@@ -348,6 +354,61 @@ class TestCrossFileContextServiceGraphOperations:
 
             service.shutdown()
 
+    def test_get_relationship_graph_page(self):
+        """Test paging through the graph with paths relative to the project root."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "pkg").mkdir()
+            (root / "pkg" / "__init__.py").write_text("")
+            (root / "pkg" / "utils.py").write_text("def helper():\n    return 1\n")
+            (root / "pkg" / "core.py").write_text("from pkg.utils import helper\n")
+            (root / "main.py").write_text("from pkg.core import helper\nimport os\n")
+            service = CrossFileContextService(Config(), project_root=tmpdir)
+            service.analyze_directory()
+
+            first = service.get_relationship_graph_page(limit=1)
+            assert len(first["relationships"]) == 1
+            assert first["next_cursor"] is not None
+            second = service.get_relationship_graph_page(limit=100, cursor=first["next_cursor"])
+            total = len(service.get_relationship_graph()["relationships"])
+            assert len(first["relationships"]) + len(second["relationships"]) == total
+            assert second["next_cursor"] is None
+
+            pkg_page = service.get_relationship_graph_page(path_prefix="pkg")
+            assert {r["source_file"] for r in pkg_page["relationships"]} == {
+                str(root / "pkg" / "core.py")
+            }
+            around = service.get_relationship_graph_page(around_file="pkg/utils.py", hops=1)
+            assert {r["source_file"] for r in around["relationships"]} == {
+                str(root / "pkg" / "core.py")
+            }
+
+            with pytest.raises(ValueError, match="Path traversal"):
+                service.get_relationship_graph_page(path_prefix="../outside")
+            service.shutdown()
+
+    def test_export_relationship_graph_to_file(self):
+        """Test streaming the graph to an export file under the data root."""
+        with TemporaryDirectory() as tmpdir, TemporaryDirectory() as data_root:
+            root = Path(tmpdir)
+            (root / "utils.py").write_text("def helper():\n    return 1\n")
+            (root / "main.py").write_text("from utils import helper\n")
+            service = CrossFileContextService(
+                Config(), project_root=tmpdir, data_root=Path(data_root)
+            )
+            service.analyze_directory()
+
+            summary = service.export_relationship_graph_to_file()
+
+            path = Path(summary["path"])
+            assert path.parent == Path(data_root) / "exports"
+            full = service.get_relationship_graph()
+            assert summary["files"] == len(full["files"])
+            assert summary["relationships"] == len(full["relationships"]) > 0
+            records = [json.loads(line) for line in path.read_text().splitlines()]
+            assert records[0]["project_root"] == str(root)
+            service.shutdown()
+
 
 class TestCrossFileContextServiceFileAnalysis:
     """Tests for file analysis operations."""
@@ -406,6 +467,25 @@ class TestCrossFileContextServiceFileAnalysis:
 
             service.shutdown()
 
+    def test_analyze_directory_prunes_ignored_directories(self):
+        """Test that ignored directories are skipped without listing their files."""
+        with TemporaryDirectory() as tmpdir:
+            config = Config()
+            service = CrossFileContextService(config, project_root=tmpdir)
+
+            (Path(tmpdir) / "main.py").write_text("x = 1")
+            site_packages = Path(tmpdir) / ".venv" / "lib" / "site-packages"
+            site_packages.mkdir(parents=True)
+            (site_packages / "vendored.py").write_text("y = 2")
+
+            stats = service.analyze_directory(tmpdir)
+
+            assert stats["total"] == 1
+            assert stats["pruned_dirs"] == 1
+            assert "discovery_ms" in stats
+
+            service.shutdown()
+
 
 class TestCrossFileContextServiceFileWatcher:
     """Tests for FileWatcher integration."""
@@ -436,7 +516,7 @@ class TestCrossFileContextServiceFileWatcher:
             # Simulate some pending changes
             test_file = Path(tmpdir) / "test.py"
             test_file.write_text("x = 1")
-            service._file_watcher.file_event_timestamps[str(test_file)] = 1.0
+            service._file_watcher.update_timestamp(str(test_file))
 
             stats = service.process_pending_changes()
 
@@ -447,6 +527,143 @@ class TestCrossFileContextServiceFileWatcher:
 
             service.shutdown()
 
+    def test_background_updates_apply_watcher_events(self):
+        """Test that the update worker applies file events to the graph."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            (root / "utils.py").write_text("def helper():\n    return 1\n")
+            config = Config()
+            service = CrossFileContextService(config, project_root=str(root))
+            service.analyze_directory(str(root))
+
+            service.start_file_watcher()
+            service.start_background_updates()
+            try:
+                consumer = root / "consumer.py"
+                consumer.write_text("from utils import helper\n\nhelper()\n")
+
+                # Graph is updated without any read or explicit processing call
+                deadline = time.time() + 5.0
+                while not service.get_dependencies(str(consumer)) and time.time() < deadline:
+                    time.sleep(0.05)
+
+                targets = {dep["target_file"] for dep in service.get_dependencies(str(consumer))}
+                assert str(root / "utils.py") in targets
+            finally:
+                service.shutdown()
+
+            assert service._update_worker is None
+
+
+class TestCrossFileContextServiceBackgroundIndexing:
+    """Tests for background indexing."""
+
+    def test_background_indexing_analyzes_project(self):
+        """Test that the indexer builds the graph without any read."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            (root / "utils.py").write_text("def helper():\n    return 1\n")
+            (root / "main.py").write_text("from utils import helper\n\nhelper()\n")
+            venv = root / ".venv"
+            venv.mkdir()
+            (venv / "vendored.py").write_text("x = 1\n")
+            service = CrossFileContextService(Config(), project_root=str(root))
+
+            service.start_background_indexing()
+            try:
+                deadline = time.time() + 5.0
+                while (
+                    service.get_indexing_progress()["state"] != "complete"
+                    and time.time() < deadline
+                ):
+                    time.sleep(0.02)
+
+                progress = service.get_indexing_progress()
+                assert progress["files_discovered"] == 2
+                assert progress["files_current"] == 2
+                targets = {
+                    dep["target_file"] for dep in service.get_dependencies(str(root / "main.py"))
+                }
+                assert str(root / "utils.py") in targets
+            finally:
+                service.shutdown()
+
+            assert service.get_indexing_progress()["state"] == "stopped"
+
+    def test_read_shares_work_with_indexer(self):
+        """Test that a read hands its file to the indexer instead of analyzing it twice."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            (root / "utils.py").write_text("def helper():\n    return 1\n")
+            main = root / "main.py"
+            main.write_text("from utils import helper\n\nhelper()\n")
+            service = CrossFileContextService(Config(), project_root=str(root))
+
+            analyzed = []
+            analyze = service._analyzer.analyze_file_two_phase
+
+            def counting_analyze(file_path, **kwargs):
+                analyzed.append(file_path)
+                return analyze(file_path, **kwargs)
+
+            service._analyzer.analyze_file_two_phase = counting_analyze  # type: ignore[method-assign]
+
+            service.start_background_indexing()
+            try:
+                result = service.read_file_with_context(str(main))
+                assert "utils.py" in result.injected_context
+
+                deadline = time.time() + 5.0
+                while (
+                    service.get_indexing_progress()["state"] != "complete"
+                    and time.time() < deadline
+                ):
+                    time.sleep(0.02)
+            finally:
+                service.shutdown()
+
+            # Each file is analyzed once, whether for the read or by idle indexing
+            assert sorted(analyzed) == sorted({str(main), str(root / "utils.py")})
+
+    def test_indexer_rebuilds_dependents_of_reindexed_file(self):
+        """Test that dependents left pending by indexing a dependency are re-queued."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir).resolve()
+            utils = root / "utils.py"
+            utils.write_text("def helper():\n    return 1\n")
+            main = root / "main.py"
+            main.write_text("from utils import helper\n\nhelper()\n")
+            service = CrossFileContextService(Config(), project_root=str(root))
+
+            def main_imports_utils() -> bool:
+                return str(utils) in {
+                    dep["target_file"] for dep in service.get_dependencies(str(main))
+                }
+
+            service.start_background_indexing()
+            try:
+                deadline = time.time() + 5.0
+                while (
+                    service.get_indexing_progress()["state"] != "complete"
+                    and time.time() < deadline
+                ):
+                    time.sleep(0.02)
+                assert main_imports_utils()
+
+                # Re-indexing the edited dependency only covers its own closure
+                utils.write_text("def helper():\n    return 2\n")
+                future = time.time() + 10
+                os.utime(utils, (future, future))
+                assert service._index_file_in_background(str(utils))
+
+                deadline = time.time() + 5.0
+                while not main_imports_utils() and time.time() < deadline:
+                    time.sleep(0.02)
+                assert main_imports_utils()
+                assert service._graph.get_files_with_pending_relationships() == []
+            finally:
+                service.shutdown()
+
 
 class TestCrossFileContextServiceCache:
     """Tests for cache operations."""
@@ -958,7 +1175,7 @@ class TestCrossFileContextServiceIntegration:
             service.analyze_file(str(test_file))
 
             # Simulate file change
-            service._file_watcher.file_event_timestamps[str(test_file)] = 999999.0
+            service._file_watcher.update_timestamp(str(test_file))
             test_file.write_text("import os\nx = os.getcwd()")
 
             # Process changes
@@ -2816,3 +3033,371 @@ class TestRecentDefinitionsDeduplication:
             assert "my_func" in context, "my_func should be mentioned"
 
             service.shutdown()
+
+
+class TestContextResultMemoization:
+    """Tests for memoized context injection results.
+
+    Re-reading a file whose graph and dependency versions are unchanged should
+    return the memoized context without re-assembling it.
+    """
+
+    def _create_project(self, tmpdir: str) -> Tuple[CrossFileContextService, Path, Path]:
+        """Create a two-file project and return (service, main_path, utils_path)."""
+        utils_path = Path(tmpdir) / "utils.py"
+        main_path = Path(tmpdir) / "main.py"
+        utils_path.write_text("def helper():\n    return 42\n")
+        main_path.write_text("from utils import helper\n\nresult = helper()\n")
+
+        service = CrossFileContextService(Config(), project_root=tmpdir)
+        service.analyze_file(str(utils_path))
+        service.analyze_file(str(main_path))
+        return service, main_path, utils_path
+
+    def test_reread_hits_memoized_context(self):
+        """Test that an unchanged re-read is served from the context cache."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path, _ = self._create_project(tmpdir)
+
+            first = service.read_file_with_context(str(main_path))
+            second = service.read_file_with_context(str(main_path))
+
+            assert "[Cross-File Context]" in first.injected_context
+            assert second.injected_context == first.injected_context
+            stats = service.get_context_cache_statistics()
+            assert stats["hits"] == 1
+            assert stats["misses"] == 1
+
+            service.shutdown()
+
+    def test_memoized_read_still_logs_injections(self):
+        """Test that cache hits are logged like freshly assembled contexts (FR-26)."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path, _ = self._create_project(tmpdir)
+
+            service.read_file_with_context(str(main_path))
+            injections_after_first = service.get_injection_statistics().total_injections
+            service.read_file_with_context(str(main_path))
+
+            assert injections_after_first > 0
+            assert service.get_injection_statistics().total_injections == 2 * injections_after_first
+
+            service.shutdown()
+
+    def test_dependency_edit_invalidates_memoized_context(self):
+        """Test that modifying a dependency rebuilds the context."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path, utils_path = self._create_project(tmpdir)
+
+            first = service.read_file_with_context(str(main_path))
+
+            utils_path.write_text("def helper(value: int) -> int:\n    return value\n")
+            future = time.time() + 10
+            os.utime(utils_path, (future, future))
+
+            second = service.read_file_with_context(str(main_path))
+
+            assert "def helper(value: int) -> int:" in second.injected_context
+            assert second.injected_context != first.injected_context
+            stats = service.get_context_cache_statistics()
+            assert stats["hits"] == 0
+            assert stats["stale"] == 1
+
+            service.shutdown()
+
+    def test_graph_change_invalidates_memoized_context(self):
+        """Test that any graph mutation invalidates memoized contexts."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path, utils_path = self._create_project(tmpdir)
+
+            service.read_file_with_context(str(main_path))
+            service._graph.set_file_metadata(
+                str(utils_path), _create_file_metadata(str(utils_path), 0)
+            )
+            service.read_file_with_context(str(main_path))
+
+            assert service.get_context_cache_statistics()["stale"] == 1
+
+            service.shutdown()
+
+    def test_session_metrics_include_context_cache(self):
+        """Test that memoized context hit rates are reported in session metrics."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path, _ = self._create_project(tmpdir)
+
+            service.read_file_with_context(str(main_path))
+            service.read_file_with_context(str(main_path))
+
+            metrics = service.get_session_metrics().to_dict()
+            assert metrics["context_cache"]["hits"] == 1
+            assert metrics["context_cache"]["hit_rate"] == 0.5
+
+            service.shutdown()
+
+    def test_session_metrics_include_read_stage_latency(self):
+        """Test that every read stage is timed, and memoized reads skip assembly."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path, _ = self._create_project(tmpdir)
+
+            service.read_file_with_context(str(main_path))
+            service.read_file_with_context(str(main_path))
+
+            performance = service.get_session_metrics().to_dict()["performance"]
+            stages = performance["read_stages_us"]
+            assert list(stages) == list(READ_STAGES)
+            counts = {stage: stats["sketch"]["count"] for stage, stats in stages.items()}
+            assert counts == {
+                "validation": 2,
+                "file_read": 2,
+                "staleness": 2,
+                "dependency_lookup": 2,
+                "prioritization": 1,
+                "snippet_extraction": 1,
+                "token_counting": 1,
+                "logging": 2,
+            }
+            assert performance["injection_latency_ms"]["sketch"]["count"] == 2
+            assert performance["parsing_time_ms"]["sketch"]["count"] == 2
+            assert service._metrics_collector.get_re_read_patterns()[0]["read_count"] == 2
+
+            service.shutdown()
+
+    def test_session_metrics_include_read_io(self):
+        """Test that file-system calls are counted per read."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path, utils_path = self._create_project(tmpdir)
+            counts: List[dict] = []
+            record_read = service._metrics_collector.record_read
+
+            def recording_read(file_path, timer):
+                counts.append(timer.get_io_counters().to_dict())
+                record_read(file_path, timer)
+
+            with patch.object(service._metrics_collector, "record_read", recording_read):
+                service.read_file_with_context(str(main_path))
+                service.read_file_with_context(str(main_path))
+                utils_path.write_text("def helper():\n    return 43\n")
+                os.utime(utils_path, (time.time() + 5, time.time() + 5))
+                service.read_file_with_context(str(main_path))
+
+            assembled, unchanged, changed = counts
+            # Validation stat, staleness stats of main.py and utils.py, deletion check
+            assert unchanged == {"stat": 4, "read": 1, "import_probe": 0, "find_spec": 0}
+            # Assembling a context reads the dependency for its snippets
+            assert assembled["read"] > unchanged["read"]
+            # Re-analyzing utils.py reads it again
+            assert changed["read"] > unchanged["read"]
+            assert changed["stat"] > unchanged["stat"]
+
+            io = service.get_session_metrics().to_dict()["performance"]["read_io"]
+            assert io["read"]["min"] == 1
+            assert io["read"]["sketch"]["count"] == 3
+
+            service.shutdown()
+
+
+class TestTokenBudgetedAssembly:
+    """Tests for budget-aware context assembly (enforce_context_token_limit)."""
+
+    def _create_service(self, tmpdir: str, limit: int) -> Tuple[CrossFileContextService, Path]:
+        """Create a project where main.py uses 15 functions from utils.py."""
+        utils_path = Path(tmpdir) / "utils.py"
+        main_path = Path(tmpdir) / "main.py"
+        names = [f"function_{i}" for i in range(15)]
+        utils_path.write_text(
+            "".join(f"def {name}(value: int) -> int:\n    return value\n\n" for name in names)
+        )
+        main_path.write_text(
+            f"from utils import {', '.join(names)}\n\n" + "".join(f"{name}(1)\n" for name in names)
+        )
+
+        config = Config()
+        config._config["enforce_context_token_limit"] = True
+        config._config["context_token_limit"] = limit
+        service = CrossFileContextService(config, project_root=tmpdir)
+        service.analyze_file(str(utils_path))
+        service.analyze_file(str(main_path))
+        return service, main_path
+
+    def test_context_never_exceeds_limit(self):
+        """Test that the injected context stays within context_token_limit."""
+        with TemporaryDirectory() as tmpdir:
+            for limit in (60, 120, 250):
+                service, main_path = self._create_service(tmpdir, limit)
+
+                result = service.read_file_with_context(str(main_path))
+
+                assert result.injected_context.endswith("---")
+                assert service._count_tokens(result.injected_context) <= limit
+                service.shutdown()
+
+    def test_large_budget_is_not_capped_at_ten_snippets(self):
+        """Test that the budget, not a fixed snippet count, bounds the context."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path = self._create_service(tmpdir, 5000)
+
+            result = service.read_file_with_context(str(main_path))
+
+            assert result.injected_context.count("def function_") > 10
+            service.shutdown()
+
+    def test_low_priority_entries_fall_back_to_location_only(self):
+        """Test that entries that do not fit are injected as locations."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path = self._create_service(tmpdir, 250)
+
+            result = service.read_file_with_context(str(main_path))
+            context = result.injected_context
+
+            signatures = context.count("def function_")
+            assert 0 < signatures < 15
+            # Location-only entries name the symbol without its signature
+            assert "(function_" in context
+            service.shutdown()
+
+    def test_frame_exceeding_limit_skips_injection(self):
+        """Test that no context is injected when even the headers do not fit."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path = self._create_service(tmpdir, 5)
+
+            result = service.read_file_with_context(str(main_path))
+
+            assert result.injected_context == ""
+            service.shutdown()
+
+    def test_default_mode_keeps_snippet_cap(self):
+        """Test that without enforcement at most 10 snippets are injected."""
+        with TemporaryDirectory() as tmpdir:
+            service, main_path = self._create_service(tmpdir, 500)
+            service.config._config["enforce_context_token_limit"] = False
+
+            result = service.read_file_with_context(str(main_path))
+
+            assert result.injected_context.count("# Implementation in") == 10
+            service.shutdown()
+
+
+class TestConcurrentReads:
+    """Tests for reads from multiple threads (reader-writer locking)."""
+
+    def _create_project(
+        self, tmpdir: str, count: int
+    ) -> Tuple[CrossFileContextService, List[Path]]:
+        """Create a project where each module imports from a shared utils module."""
+        Path(tmpdir, "utils.py").write_text("def helper():\n    return 42\n")
+        modules = []
+        for i in range(count):
+            module = Path(tmpdir) / f"module_{i}.py"
+            module.write_text(f"from utils import helper\n\nvalue_{i} = helper()\n")
+            modules.append(module)
+
+        service = CrossFileContextService(Config(), project_root=tmpdir)
+        service.analyze_file(str(Path(tmpdir, "utils.py")))
+        for module in modules:
+            service.analyze_file(str(module))
+        return service, modules
+
+    def test_parallel_reads_match_sequential_reads(self):
+        """Test that concurrent reads return the same results as sequential ones."""
+        with TemporaryDirectory() as tmpdir:
+            service, modules = self._create_project(tmpdir, count=6)
+            expected = [service.read_file_with_context(str(m)).injected_context for m in modules]
+            service.invalidate_cache()
+
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                results = list(
+                    executor.map(lambda m: service.read_file_with_context(str(m)), modules * 3)
+                )
+
+            assert [r.injected_context for r in results] == expected * 3
+            service.shutdown()
+
+    def test_fresh_read_does_not_take_write_lock(self):
+        """Test that reading an up-to-date file only takes shared access."""
+        with TemporaryDirectory() as tmpdir:
+            service, modules = self._create_project(tmpdir, count=1)
+            service.read_file_with_context(str(modules[0]))
+
+            with patch.object(
+                service._state_lock, "acquire_write", side_effect=AssertionError("write lock")
+            ):
+                result = service.read_file_with_context(str(modules[0]))
+
+            assert "[Cross-File Context]" in result.injected_context
+            service.shutdown()
+
+
+class TestBatchReads:
+    """Tests for read_files_with_context()."""
+
+    def test_batch_read_matches_single_reads(self):
+        """Test that a batch returns the same contexts as one read per file."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "utils.py").write_text("def helper():\n    return 42\n")
+            (root / "models.py").write_text("from utils import helper\n\nclass Model:\n    pass\n")
+            paths = []
+            for i in range(4):
+                module = root / f"module_{i}.py"
+                module.write_text(
+                    f"from models import Model\nfrom utils import helper\n\nx_{i} = 1\n"
+                )
+                paths.append(str(module))
+
+            expected_service = CrossFileContextService(Config(), project_root=tmpdir)
+            expected = [expected_service.read_file_with_context(p).injected_context for p in paths]
+            expected_service.shutdown()
+
+            service = CrossFileContextService(Config(), project_root=tmpdir)
+            batch = service.read_files_with_context(paths + [paths[0]])
+            service.shutdown()
+
+            assert [r.file_path for r in batch.results] == paths
+            assert [r.injected_context for r in batch.results] == expected
+            assert batch.errors == {}
+
+    def test_batch_read_resolves_staleness_once(self):
+        """Test that shared dependencies are checked and analyzed once per batch."""
+        with TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "utils.py").write_text("def helper():\n    return 42\n")
+            paths = []
+            for i in range(5):
+                module = root / f"module_{i}.py"
+                module.write_text(f"from utils import helper\n\nvalue_{i} = helper()\n")
+                paths.append(str(module))
+            service = CrossFileContextService(Config(), project_root=tmpdir)
+            for path in paths:
+                service.analyze_file(path)
+
+            analyzed: List[str] = []
+            analyze = service._analyzer.analyze_file_two_phase
+
+            def counting_analyze(file_path, **kwargs):
+                analyzed.append(file_path)
+                return analyze(file_path, **kwargs)
+
+            service._analyzer.analyze_file_two_phase = counting_analyze  # type: ignore[method-assign]
+
+            # utils.py is reached through every module but never analyzed yet
+            batch = service.read_files_with_context(paths)
+            service.shutdown()
+
+            assert analyzed == [str(root / "utils.py")]
+            assert all("utils.py" in r.injected_context for r in batch.results)
+
+    def test_batch_read_reports_errors_per_file(self):
+        """Test that unreadable files are reported without failing the batch."""
+        with TemporaryDirectory() as tmpdir:
+            good = Path(tmpdir) / "good.py"
+            good.write_text("x = 1\n")
+            missing = str(Path(tmpdir) / "missing.py")
+            service = CrossFileContextService(Config(), project_root=tmpdir)
+
+            batch = service.read_files_with_context([missing, str(good), "../etc/passwd"])
+            service.shutdown()
+
+            assert [r.file_path for r in batch.results] == [str(good)]
+            assert set(batch.errors) == {missing, "../etc/passwd"}
+            assert "File not found" in batch.errors[missing]
+            assert batch.to_dict()["results"][0]["content"] == "x = 1\n"
@@ -0,0 +1,173 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Unit tests for the session replay script.
+
+Tests cover:
+- Reconstructing reads from injection logs and session transcripts
+- Time compression of the replay schedule
+- Mapping recorded paths into the replayed project
+- Replaying a recorded session from concurrent agents
+"""
+
+import json
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from session_replay import (  # type: ignore[import-not-found]
+    RecordedRead,
+    RecordedSession,
+    filter_reads,
+    load_injection_reads,
+    load_sessions,
+    rewrite_paths,
+    run_replay,
+    schedule,
+)
+from synthetic_project import ProjectSpec, generate_project  # type: ignore[import-not-found]
+
+from xfile_context.config import Config  # noqa: E402
+from xfile_context.service import CrossFileContextService  # noqa: E402
+
+_START = datetime(2025, 12, 11, 10, 0, tzinfo=timezone.utc)
+
+
+def _injection(target: str, total: int, seconds: float) -> Dict[str, Any]:
+    return {
+        "timestamp": (_START + timedelta(seconds=seconds)).isoformat(),
+        "event_type": "context_injection",
+        "source_file": "/p/dep.py",
+        "target_file": target,
+        "context_token_total": total,
+    }
+
+
+def _write_jsonl(path: Path, records: List[Dict[str, Any]]) -> Path:
+    path.write_text("".join(json.dumps(r) + "\n" for r in records))
+    return path
+
+
+class TestRecordedSessions:
+    """Tests for reconstructing recorded read sequences."""
+
+    def test_injection_log_reads(self, tmp_path: Path) -> None:
+        """Test that snippet records of one read are grouped by their running total."""
+        log = _write_jsonl(
+            tmp_path / "2025-12-11-s1.jsonl",
+            [
+                _injection("/p/a.py", 10, 0),
+                _injection("/p/a.py", 25, 0),
+                _injection("/p/b.py", 5, 3),
+                _injection("/p/b.py", 5, 4),
+                _injection("/p/a.py", 10, 9),
+            ],
+        )
+
+        reads = load_injection_reads(log)
+
+        assert [r.file_path for r in reads] == ["/p/a.py", "/p/b.py", "/p/b.py", "/p/a.py"]
+        assert reads[1].timestamp == _START + timedelta(seconds=3)
+
+    def test_load_sessions(self, tmp_path: Path) -> None:
+        """Test that days of one session are merged and transcripts are parsed."""
+        injections = tmp_path / "injections"
+        injections.mkdir()
+        _write_jsonl(injections / "2025-12-12-s1.jsonl", [_injection("/p/c.py", 10, 86400)])
+        _write_jsonl(injections / "2025-12-11-s1.jsonl", [_injection("/p/a.py", 10, 0)])
+
+        def tool_use(name: str, inputs: Dict[str, Any]) -> Dict[str, Any]:
+            return {
+                "type": "assistant",
+                "sessionId": "t1",
+                "timestamp": "2025-12-11T10:00:00Z",
+                "message": {
+                    "content": [{"type": "tool_use", "id": name, "name": name, "input": inputs}]
+                },
+            }
+
+        transcript = _write_jsonl(
+            tmp_path / "transcript.jsonl",
+            [
+                tool_use("mcp__xfile_context__read_with_context", {"file_path": "/p/a.py"}),
+                tool_use(
+                    "mcp__xfile_context__read_many_with_context",
+                    {"file_paths": ["/p/b.py", "/p/c.py"]},
+                ),
+                tool_use("Read", {"file_path": "/p/README.md"}),
+                tool_use("Grep", {"pattern": "x"}),
+            ],
+        )
+
+        sessions = load_sessions([injections, transcript])
+
+        assert [(s.session_id, s.source) for s in sessions] == [
+            ("s1", "injections"),
+            ("t1", "transcript"),
+        ]
+        assert [r.file_path for r in sessions[0].reads] == ["/p/a.py", "/p/c.py"]
+        assert [r.file_path for r in sessions[1].reads] == ["/p/a.py", "/p/b.py", "/p/c.py"]
+
+        filtered = filter_reads(sessions, since=_START + timedelta(hours=1))
+        assert [(s.session_id, len(s.reads)) for s in filtered] == [("s1", 1)]
+
+    def test_schedule_compresses_time(self) -> None:
+        """Test that recorded gaps are divided by the speed and capped."""
+        reads = [RecordedRead(_START + timedelta(seconds=s), "/p/a.py") for s in (0, 10, 20, 500)]
+
+        assert schedule(reads, speed=10, max_gap_s=60) == [0.0, 1.0, 2.0, 8.0]
+        assert schedule(reads, speed=0, max_gap_s=60) == [0.0, 0.0, 0.0, 0.0]
+
+    def test_rewrite_paths(self, tmp_path: Path) -> None:
+        """Test that paths under the recorded root are mapped into the project."""
+        session = RecordedSession(
+            "s1",
+            "injections",
+            [RecordedRead(_START, "/home/ci/app/pkg/a.py"), RecordedRead(_START, "/other/b.py")],
+        )
+
+        rewrite_paths([session], "/home/ci/app/", tmp_path)
+
+        assert [r.file_path for r in session.reads] == [str(tmp_path / "pkg/a.py"), "/other/b.py"]
+
+
+def test_replay_recorded_session(tmp_path: Path) -> None:
+    """Test replaying a session recorded by the service from two agents.
+
+    The project is analyzed before the replay: lazy analysis of newly read
+    files changes the graph generation, which invalidates memoized contexts.
+    """
+    project = generate_project(tmp_path / "project", ProjectSpec(files=30, functions_per_file=2))
+    recorded = tmp_path / "recorded"
+    service = CrossFileContextService(
+        Config(config_path=tmp_path / "missing.yml"),
+        project_root=str(project.root),
+        data_root=recorded,
+        session_id="rec",
+    )
+    try:
+        for index in (10, 20, 10, 29):
+            service.read_file_with_context(project.modules[index])
+    finally:
+        service.shutdown()
+
+    sessions = load_sessions([recorded / "injections"])
+    sessions[0].reads.append(RecordedRead(sessions[0].reads[-1].timestamp, "/missing/x.py"))
+    result = run_replay(
+        project.root, sessions, agents=2, analyze=True, data_root=tmp_path / "replay"
+    )
+
+    assert [(s["session_id"], s["reads"]) for s in result["settings"]["sessions"]] == [("rec", 5)]
+    latency = result["latency"]
+    assert latency["all"]["requests"] == 10
+    assert latency["first_read"]["requests"] == 3
+    assert latency["repeat_read"]["requests"] == 5
+    assert latency["all"]["p50_ms"] <= latency["all"]["p99_ms"]
+    assert result["errors"] == {"FileNotFoundError": 2}
+    context_cache = result["cache_hit_rates"]["context_cache"]
+    assert context_cache["hits"] > 0
+    assert 0 < context_cache["hit_rate"] < 1
+    assert set(result["cache_hit_rates"]) == {"file_cache", "symbol_cache", "context_cache"}
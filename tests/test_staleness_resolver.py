@@ -425,6 +425,80 @@ class TestStalenessResolverBasic:
         # B should be analyzed (it's stale and a dependency of A)
         assert "B" in analyzed_files
 
+    def test_has_stale_files_is_read_only(self):
+        """Test that the staleness check reports stale dependencies without changes."""
+        graph = RelationshipGraph()
+
+        # A -> B, B is stale
+        graph.add_relationship(
+            Relationship(
+                source_file="A",
+                target_file="B",
+                relationship_type=RelationshipType.IMPORT,
+                line_number=1,
+            )
+        )
+        graph.set_file_metadata("A", _create_metadata("A", stale=False))
+        graph.set_file_metadata("B", _create_metadata("B", stale=True))
+        generation = graph.get_generation()
+
+        def needs_analysis(path: str) -> bool:
+            meta = graph.get_file_metadata(path)
+            return meta is None or meta.last_analyzed < time.time()
+
+        def analyze_file(path: str) -> bool:
+            raise AssertionError("has_stale_files() must not analyze")
+
+        resolver = StalenessResolver(graph, needs_analysis, analyze_file)
+
+        assert resolver.has_stale_files("A") is True
+        assert resolver.has_stale_files("B") is True
+        assert graph.get_generation() == generation
+
+        graph.set_file_metadata("B", _create_metadata("B", stale=False))
+        assert resolver.has_stale_files("A") is False
+
+    def test_resolve_staleness_batch_checks_shared_closure_once(self):
+        """Test that a batch checks and analyzes shared dependencies once."""
+        graph = RelationshipGraph()
+
+        # A -> C, B -> C, B -> D; C and D are stale
+        for source, target in [("A", "C"), ("B", "C"), ("B", "D")]:
+            graph.add_relationship(
+                Relationship(
+                    source_file=source,
+                    target_file=target,
+                    relationship_type=RelationshipType.IMPORT,
+                    line_number=1,
+                )
+            )
+        for path in ["A", "B"]:
+            graph.set_file_metadata(path, _create_metadata(path, stale=False))
+        for path in ["C", "D"]:
+            graph.set_file_metadata(path, _create_metadata(path, stale=True))
+
+        checked: List[str] = []
+        analyzed: List[str] = []
+
+        def needs_analysis(path: str) -> bool:
+            checked.append(path)
+            meta = graph.get_file_metadata(path)
+            return meta is None or meta.last_analyzed < time.time()
+
+        def analyze_file(path: str) -> bool:
+            analyzed.append(path)
+            graph.set_file_metadata(path, _create_metadata(path, stale=False))
+            return True
+
+        resolver = StalenessResolver(graph, needs_analysis, analyze_file)
+
+        assert resolver.has_stale_files_batch(["A", "B"]) is True
+        assert sorted(checked) == ["A", "B", "C", "D"]
+
+        resolver.resolve_staleness_batch(["A", "B"])
+        assert sorted(analyzed) == ["C", "D"]
+        assert resolver.has_stale_files_batch(["A", "B"]) is False
+
 
 class TestStalenessResolverTopologicalSort:
     """Tests for topological sort ordering in StalenessResolver."""
@@ -942,6 +1016,73 @@ class TestStalenessResolverDependentRelationshipPreservation:
             "A"
         ), f"Expected A -> B relationship to be rebuilt, but A's deps: {a_deps}"
 
+    def test_dependents_outside_target_chain_rebuilt_on_read(self):
+        """Test that dependents outside the target's closure are rebuilt when read.
+
+        Scenario:
+        - A -> B (A imports B)
+        - B is stale and is itself the target (e.g. analyzed by the background
+          indexer before any read of A)
+        - A is not reachable from B, so resolving B does not touch A: its
+          A -> B relationship was removed when B was re-analyzed and A stays
+          pending until A itself is resolved
+        """
+        from xfile_context.models import FileSymbolData, ReferenceType, SymbolReference
+        from xfile_context.relationship_builder import RelationshipBuilder
+
+        graph = RelationshipGraph()
+        relationship_builder = RelationshipBuilder()
+        graph.add_relationship(
+            Relationship(
+                source_file="A",
+                target_file="B",
+                relationship_type=RelationshipType.IMPORT,
+                line_number=1,
+            )
+        )
+        relationship_builder.add_file_data(
+            FileSymbolData(
+                filepath="A",
+                definitions=[],
+                references=[
+                    SymbolReference(
+                        name="B",
+                        reference_type=ReferenceType.IMPORT,
+                        line_number=1,
+                        resolved_module="B",
+                    )
+                ],
+                parse_time=time.time(),
+                is_valid=True,
+            )
+        )
+        graph.set_file_metadata("A", _create_metadata("A", stale=False))
+        graph.set_file_metadata("B", _create_metadata("B", stale=True))
+
+        def needs_analysis(path: str) -> bool:
+            meta = graph.get_file_metadata(path)
+            return meta is None or meta.last_analyzed < time.time()
+
+        def analyze_file(path: str) -> bool:
+            graph.remove_relationships_for_file(path)
+            graph.set_file_metadata(path, _create_metadata(path, stale=False))
+            return True
+
+        resolver = StalenessResolver(
+            graph, needs_analysis, analyze_file, relationship_builder=relationship_builder
+        )
+        assert resolver.resolve_staleness("B") is True
+
+        assert graph.get_dependencies("A") == []
+        assert graph.get_files_with_pending_relationships() == ["A"]
+
+        # A is not stale, but its pending relationships are work for a read of A
+        assert resolver.has_stale_files("A") is True
+        assert resolver.resolve_staleness("A") is True
+
+        assert {rel.target_file for rel in graph.get_dependencies("A")} == {"B"}
+        assert graph.get_files_with_pending_relationships() == []
+
     def test_multiple_dependents_relationships_rebuilt(self):
         """Test that multiple dependent files' relationships are all rebuilt.
 
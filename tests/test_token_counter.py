@@ -0,0 +1,219 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for TokenCounter.
+
+Tests memoized token counting including:
+- Fallback estimate when tiktoken is unavailable
+- Content-keyed memoization and LRU eviction
+- Batch encoding of uncached texts
+- Joined totals from per-part counts
+- Token budget accounting
+- Background warm-up and offline BPE loading
+"""
+
+import base64
+import threading
+from pathlib import Path
+from typing import Any, List
+
+from xfile_context.token_counter import (
+    TokenBudget,
+    TokenCounter,
+    estimate_tokens,
+    load_encoding_from_file,
+)
+
+
+class FakeEncoder:
+    """Encoder stand-in that tokenizes on characters and records calls."""
+
+    def __init__(self) -> None:
+        self.encode_calls: List[str] = []
+        self.batch_calls: List[List[str]] = []
+
+    def encode(self, text: str, **kwargs: Any) -> List[int]:
+        self.encode_calls.append(text)
+        return list(range(len(text)))
+
+    def encode_batch(self, texts: List[str], **kwargs: Any) -> List[List[int]]:
+        self.batch_calls.append(list(texts))
+        return [list(range(len(text))) for text in texts]
+
+
+class TestEstimateTokens:
+    """Tests for the word-based fallback estimate."""
+
+    def test_empty_text(self) -> None:
+        """Test that empty text has zero tokens."""
+        assert estimate_tokens("") == 0
+
+    def test_words(self) -> None:
+        """Test ~1.3 tokens per word."""
+        assert estimate_tokens("def foo(a, b):") == 4  # ceil(3 * 1.3)
+
+
+class TestTokenCounter:
+    """Tests for TokenCounter memoization and batching."""
+
+    def test_count_uses_encoder(self) -> None:
+        """Test that counts come from the encoder when available."""
+        counter = TokenCounter(encoder=FakeEncoder())  # type: ignore[arg-type]
+
+        assert counter.count("abcd") == 4
+
+    def test_repeated_text_is_memoized(self) -> None:
+        """Test that a repeated text is not re-encoded."""
+        encoder = FakeEncoder()
+        counter = TokenCounter(encoder=encoder)  # type: ignore[arg-type]
+
+        counter.count("def helper():")
+        counter.count("def helper():")
+
+        assert encoder.encode_calls == ["def helper():"]
+        stats = counter.get_statistics()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_count_many_batches_uncached_texts(self) -> None:
+        """Test that first-time texts are encoded in a single batch."""
+        encoder = FakeEncoder()
+        counter = TokenCounter(encoder=encoder)  # type: ignore[arg-type]
+        counter.count("cached")
+
+        counts = counter.count_many(["cached", "new one", "another"])
+
+        assert counts == [6, 7, 7]
+        assert encoder.batch_calls == [["new one", "another"]]
+
+    def test_count_joined_adds_separator_overhead(self) -> None:
+        """Test that joined totals are per-part counts plus separators."""
+        counter = TokenCounter(encoder=FakeEncoder())  # type: ignore[arg-type]
+
+        parts = ["abc", "", "de"]
+
+        assert counter.count_joined(parts) == len("\n".join(parts))
+        assert counter.count_joined([]) == 0
+
+    def test_lru_eviction(self) -> None:
+        """Test that least recently used counts are evicted at the limit."""
+        encoder = FakeEncoder()
+        counter = TokenCounter(max_entries=2, encoder=encoder)  # type: ignore[arg-type]
+
+        counter.count("a")
+        counter.count("b")
+        counter.count("a")  # Touch "a" so "b" is least recently used
+        counter.count("c")
+        counter.count("b")
+
+        assert encoder.encode_calls == ["a", "b", "c", "b"]
+        assert counter.get_statistics()["entries"] == 2
+
+    def test_fallback_when_encoder_unavailable(self, monkeypatch: Any) -> None:
+        """Test that a failed encoder load falls back to the estimate once."""
+        calls: List[str] = []
+
+        def failing_get_encoding(name: str) -> Any:
+            calls.append(name)
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(
+            "xfile_context.token_counter.tiktoken.get_encoding", failing_get_encoding
+        )
+        counter = TokenCounter()
+
+        assert counter.count("one two three") == estimate_tokens("one two three")
+        assert counter.count("four five") == estimate_tokens("four five")
+        assert len(calls) == 1
+        assert counter.get_statistics()["exact"] is False
+
+
+class TestTokenizerWarmup:
+    """Tests for background encoder warm-up and offline loading."""
+
+    def test_counts_use_estimate_until_warm(self, monkeypatch: Any) -> None:
+        """Test that counting never blocks on a slow encoder load."""
+        release = threading.Event()
+
+        def slow_get_encoding(name: str) -> Any:
+            release.wait(timeout=5)
+            return FakeEncoder()
+
+        monkeypatch.setattr("xfile_context.token_counter.tiktoken.get_encoding", slow_get_encoding)
+        counter = TokenCounter()
+        counter.start_warmup()
+
+        # Encoder still loading: fallback estimate, not memoized
+        assert counter.is_warming
+        assert counter.count("one two three") == estimate_tokens("one two three")
+        assert counter.get_statistics()["entries"] == 0
+
+        release.set()
+        assert counter.wait_until_warm(timeout=5)
+        assert counter.count("one two three") == len("one two three")
+        assert counter.get_statistics()["exact"] is True
+
+    def test_failed_warmup_falls_back(self, monkeypatch: Any) -> None:
+        """Test that a failed warm-up leaves the counter on the estimate."""
+
+        def failing_get_encoding(name: str) -> Any:
+            raise RuntimeError("offline")
+
+        monkeypatch.setattr(
+            "xfile_context.token_counter.tiktoken.get_encoding", failing_get_encoding
+        )
+        counter = TokenCounter()
+        counter.start_warmup()
+
+        assert counter.wait_until_warm(timeout=5) is False
+        assert counter.count("four five") == estimate_tokens("four five")
+
+    def test_load_encoding_from_file(self, tmp_path: Path) -> None:
+        """Test building the encoder from a local BPE ranks file."""
+        bpe_path = tmp_path / "tiny.tiktoken"
+        lines = [f"{base64.b64encode(bytes([i])).decode()} {i}" for i in range(256)]
+        bpe_path.write_text("\n".join(lines) + "\n")
+
+        encoder = load_encoding_from_file(str(bpe_path))
+        counter = TokenCounter(bpe_path=str(bpe_path))
+
+        assert len(encoder.encode("abc")) == 3
+        assert counter.count("abc") == 3
+        assert counter.get_statistics()["exact"] is True
+
+
+class TestTokenBudget:
+    """Tests for TokenBudget accounting."""
+
+    def test_try_add_rejects_parts_over_limit(self) -> None:
+        """Test that parts are accepted only while they fit."""
+        counter = TokenCounter(encoder=FakeEncoder())  # type: ignore[arg-type]
+        budget = TokenBudget(counter, limit=10)
+
+        assert budget.try_add(["abcd"])
+        assert budget.used == 4
+        assert budget.try_add(["abc"])  # 3 tokens plus one separator
+        assert budget.used == 8
+        assert not budget.try_add(["abc"])
+        assert budget.used == 8
+
+    def test_used_matches_joined_count(self) -> None:
+        """Test that accepted groups cost the same as the joined parts."""
+        counter = TokenCounter(encoder=FakeEncoder())  # type: ignore[arg-type]
+        budget = TokenBudget(counter, limit=100)
+
+        budget.try_add(["ab", ""])
+        budget.try_add(["cde"])
+
+        assert budget.used == counter.count_joined(["ab", "", "cde"])
+
+    def test_try_replace_charges_difference(self) -> None:
+        """Test that replacing parts charges only the extra cost."""
+        counter = TokenCounter(encoder=FakeEncoder())  # type: ignore[arg-type]
+        budget = TokenBudget(counter, limit=12)
+        budget.try_add(["ab"])
+
+        assert budget.try_replace(["ab"], ["abcd", "ef"])
+        assert budget.used == counter.count_joined(["abcd", "ef"])
+        assert not budget.try_replace(["abcd", "ef"], ["abcdefghijklm"])
+        assert budget.used == 7
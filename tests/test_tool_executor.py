@@ -0,0 +1,124 @@
+# Copyright (c) 2025 Henru Wang
+# All rights reserved.
+
+"""Tests for ToolExecutor.
+
+Tests off-loop execution of service calls including:
+- Running calls on worker threads
+- Single-flight sharing of concurrent calls with the same key
+- Shared exceptions
+- Cancelled waiters not cancelling the shared computation
+"""
+
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from xfile_context.tool_executor import ToolExecutor
+
+
+class TestToolExecutor:
+    """Tests for ToolExecutor."""
+
+    async def test_run_uses_worker_thread(self) -> None:
+        """Test that calls do not run on the event loop thread."""
+        executor = ToolExecutor(max_workers=2)
+        try:
+            thread_name = await executor.run(lambda: threading.current_thread().name)
+        finally:
+            executor.shutdown()
+
+        assert thread_name.startswith("xfile-tool")
+
+    async def test_same_key_shares_one_computation(self) -> None:
+        """Test that concurrent calls with the same key run once."""
+        executor = ToolExecutor(max_workers=4)
+        release = threading.Event()
+        calls: List[str] = []
+
+        def compute(path: str) -> str:
+            calls.append(path)
+            release.wait(timeout=5)
+            return f"content of {path}"
+
+        try:
+            tasks = [
+                asyncio.create_task(executor.run_single_flight(("read", "a.py"), compute, "a.py"))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*tasks)
+        finally:
+            executor.shutdown()
+
+        assert calls == ["a.py"]
+        assert results == ["content of a.py"] * 5
+        stats = executor.get_statistics()
+        assert stats["started"] == 1
+        assert stats["shared"] == 4
+        assert stats["in_flight"] == 0
+
+    async def test_different_keys_run_in_parallel(self) -> None:
+        """Test that calls for different keys run concurrently."""
+        executor = ToolExecutor(max_workers=3)
+        # Only passes if all three calls are running at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        def compute(path: str) -> str:
+            barrier.wait()
+            return path
+
+        try:
+            results = await asyncio.gather(
+                *(executor.run_single_flight(path, compute, path) for path in ["a", "b", "c"])
+            )
+        finally:
+            executor.shutdown()
+
+        assert results == ["a", "b", "c"]
+
+    async def test_exception_is_shared(self) -> None:
+        """Test that all waiters see the exception from the shared call."""
+        executor = ToolExecutor(max_workers=2)
+        release = threading.Event()
+
+        def fail() -> None:
+            release.wait(timeout=5)
+            raise FileNotFoundError("missing.py")
+
+        try:
+            tasks = [
+                asyncio.create_task(executor.run_single_flight("missing", fail)) for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            release.set()
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            executor.shutdown()
+
+        assert all(isinstance(result, FileNotFoundError) for result in results)
+
+    async def test_cancelled_waiter_does_not_cancel_computation(self) -> None:
+        """Test that cancelling one waiter leaves the shared call running."""
+        executor = ToolExecutor(max_workers=2)
+        release = threading.Event()
+
+        def compute() -> str:
+            release.wait(timeout=5)
+            return "done"
+
+        try:
+            first = asyncio.create_task(executor.run_single_flight("key", compute))
+            second = asyncio.create_task(executor.run_single_flight("key", compute))
+            await asyncio.sleep(0.01)
+            first.cancel()
+            release.set()
+
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            assert await second == "done"
+        finally:
+            executor.shutdown()
@@ -22,6 +22,7 @@ from unittest import mock
 
 import pytest
 
+from xfile_context.async_log_writer import LogWritePolicy
 from xfile_context.warning_formatter import StructuredWarning, WarningEmitter
 from xfile_context.warning_logger import (
     DEFAULT_WARNING_LOG_FILE,
@@ -207,6 +208,48 @@ class TestWarningLogger:
 
         logger.close()
 
+    def test_background_writes(
+        self, temp_log_dir: Path, sample_warnings: list[StructuredWarning]
+    ) -> None:
+        """Test that with a write policy, warnings are written by a background writer."""
+        log_path = temp_log_dir / DEFAULT_WARNING_LOG_FILE
+
+        with WarningLogger(
+            log_dir=temp_log_dir,
+            write_policy=LogWritePolicy(flush_every_events=0, flush_interval_ms=0),
+        ) as logger:
+            logger.log_warning(sample_warnings[0])
+            logger.log_warnings(sample_warnings[1:])
+            assert logger.get_statistics().total_warnings == len(sample_warnings)
+
+        # Closing writes the queued warnings
+        warnings = read_warnings_from_log(log_path)
+        assert [w.type for w in warnings] == [w.type for w in sample_warnings]
+        writer_stats = logger.get_writer_statistics()
+        assert writer_stats is not None
+        assert writer_stats["events_written"] == len(sample_warnings)
+        assert writer_stats["flushes"] == 1
+
+    def test_size_rotation(
+        self, temp_log_dir: Path, sample_warnings: list[StructuredWarning]
+    ) -> None:
+        """Test that the log is rotated into segments that readers still see."""
+        from xfile_context.log_segments import LogRotationPolicy, read_manifest
+
+        log_path = temp_log_dir / DEFAULT_WARNING_LOG_FILE
+        with WarningLogger(
+            log_dir=temp_log_dir, rotation_policy=LogRotationPolicy(max_segment_bytes=400)
+        ) as logger:
+            for _ in range(4):
+                logger.log_warnings(sample_warnings)
+
+        segments = read_manifest(log_path)
+        assert len(segments) >= 2
+        assert segments[0]["first_timestamp"] == "2025-11-25T10:30:00.123Z"
+        warnings = read_warnings_from_log(log_path)
+        assert [w.type for w in warnings] == [w.type for w in sample_warnings] * 4
+        assert len(read_warnings_from_log(log_path, since="2025-11-25T10:30:01Z")) == 8
+
     def test_context_manager(self, temp_log_dir: Path, sample_warning: StructuredWarning) -> None:
         """Test context manager usage."""
         log_path = temp_log_dir / DEFAULT_WARNING_LOG_FILE